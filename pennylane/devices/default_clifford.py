@@ -16,6 +16,7 @@ This module contains the Clifford simulator using ``stim``.
 """
 
 import concurrent.futures
+from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import replace
 from functools import partial
@@ -177,6 +178,169 @@ def _pl_obs_to_linear_comb(meas_obs):
     return coeffs, paulis
 
 
+def _outcome_subspace(tableau_simulator, wires) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the affine subspace of the outcomes of measuring ``wires`` in the computational
+    basis that have a non-zero probability.
+
+    The wires are measured one after the other on a copy of the simulator. The outcomes give the
+    offset of the subspace. The kickback of a measurement with a random outcome is a Pauli operator
+    that flips its outcome, and the outcomes of the later measurements of the wires on which it
+    acts with :math:`X` or :math:`Y`. These flipped outcomes form the generators of the subspace.
+
+    Args:
+        tableau_simulator (stim.TableauSimulator): the simulator of the state to measure
+        wires (Sequence[int]): the measured wires
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: the offset of shape ``(len(wires),)`` and the :math:`k`
+        generators of shape ``(k, len(wires))`` with their first non-zero entries at increasing
+        positions, such that all the outcomes with a non-zero probability have the probability
+        :math:`2^{-k}`
+    """
+    simulator = tableau_simulator.copy()
+    offset = np.zeros(len(wires), dtype=np.uint8)
+    generators = []
+    for idx, wire in enumerate(wires):
+        offset[idx], kickback = simulator.measure_kickback(wire)
+        if kickback is not None:
+            generator = np.zeros(len(wires), dtype=np.uint8)
+            generator[idx] = 1
+            for jdx, later_wire in enumerate(wires[idx + 1 :], start=idx + 1):
+                # anticommutes with Z when the Pauli is X (1) or Y (2)
+                generator[jdx] = later_wire < len(kickback) and kickback[later_wire] in (1, 2)
+            generators.append(generator)
+    return offset, np.array(generators, dtype=np.uint8).reshape(-1, len(wires))
+
+
+# Parity of the number of set bits of every byte
+_BYTE_PARITY = np.array([bin(byte).count("1") % 2 for byte in range(256)], dtype=np.uint8)
+
+# Maximum number of bytes of the parity tables computed at once for the expectation values
+_PARITY_TABLE_SIZE = 2**24
+
+
+class _PauliSampler:
+    """Samples the outcomes of Pauli words measured on the final state of a stim circuit.
+
+    The Pauli words of all the observables added to the sampler are greedily grouped into
+    qubit-wise commuting sets. Each set is sampled once, from a single compiled sampler of the
+    stim circuit followed by the change of basis and the measurement of all the wires of the set,
+    and its samples are shared by all the words and measurements in the set.
+
+    Args:
+        stim_circuit (stim.Circuit): the circuit preparing the state to sample from
+        shots (int): the number of samples of each set
+        seed (int): the seed used to draw the seeds of the compiled samplers
+    """
+
+    def __init__(self, stim_circuit, shots, seed):
+        self._stim_circuit = stim_circuit
+        self._shots = shots
+        self._rng = np.random.default_rng(seed)
+        self._bases = []  # the wire -> Pauli letter basis of every group
+        self._groups = {}  # the group of every word
+        self._samples = {}  # the bit-packed samples of every sampled group
+        self._expvals = {}
+
+    def _add_word(self, word):
+        """Add a Pauli word, given as a tuple of ``(wire, letter)`` pairs, to the first group it
+        commutes qubit-wise with. Groups that were already sampled cannot measure new wires."""
+        if not word or word in self._groups:
+            return
+        for idx, basis in enumerate(self._bases):
+            if all(basis.get(wire, letter) == letter for wire, letter in word) and (
+                idx not in self._samples or all(wire in basis for wire, _ in word)
+            ):
+                basis.update(word)
+                self._groups[word] = idx
+                return
+        self._groups[word] = len(self._bases)
+        self._bases.append(dict(word))
+
+    def add(self, obs):
+        """Add the Pauli words of an observable to the sampler.
+
+        Returns:
+            tuple[array, list[tuple], Optional[array]]: the coefficients and Pauli words of the
+            observable, and the basis state of a :class:`~.BasisStateProjector`
+        """
+        if isinstance(obs, BasisStateProjector):
+            word = tuple((wire, "Z") for wire in obs.wires)
+            self._add_word(word)
+            return np.array([1.0]), [word], obs.data[0]
+
+        coeffs, paulis = _pl_obs_to_linear_comb(obs)
+        words = [
+            tuple((wire, letter) for letter, wire in zip(pauli, wires) if letter != "I")
+            for pauli, wires in paulis
+        ]
+        for word in words:
+            self._add_word(word)
+        return coeffs, words, None
+
+    def _sample_group(self, idx):
+        """The bit-packed samples of a group, drawn from a single compiled sampler."""
+        if idx not in self._samples:
+            basis = self._bases[idx]
+            stim_circuit = self._stim_circuit.copy()
+            for letter, gate in (("X", "H"), ("Y", "H_YZ")):
+                targets = [wire for wire, pauli in basis.items() if pauli == letter]
+                if targets:
+                    stim_circuit.append(gate, targets)
+            stim_circuit.append("M", list(basis))
+            sampler = stim_circuit.compile_sampler(seed=int(self._rng.integers(2**31 - 1)))
+            self._samples[idx] = sampler.sample(shots=self._shots, bit_packed=True)
+        return self._samples[idx]
+
+    def bits(self, word):
+        """The measured bits of the wires of a Pauli word, with one row per shot."""
+        self._add_word(word)
+        if not word:
+            return np.zeros((self._shots, 0), dtype=int)
+        idx = self._groups[word]
+        columns = list(self._bases[idx])
+        bits = np.unpackbits(self._sample_group(idx), axis=1, count=len(columns), bitorder="little")
+        return bits[:, [columns.index(wire) for wire, _ in word]].astype(int)
+
+    def expvals(self, words):
+        """The expectation values of Pauli words, computed from the parities of the bit-packed
+        samples of their groups."""
+        by_group = defaultdict(list)
+        for word in dict.fromkeys(words):
+            if word not in self._expvals:
+                self._add_word(word)
+                if word:
+                    by_group[self._groups[word]].append(word)
+                else:
+                    self._expvals[word] = 1.0
+
+        for idx, group_words in by_group.items():
+            packed = self._sample_group(idx)
+            columns = {wire: col for col, wire in enumerate(self._bases[idx])}
+            masks = np.zeros((len(group_words), len(columns)), dtype=bool)
+            for row, word in enumerate(group_words):
+                masks[row, [columns[wire] for wire, _ in word]] = True
+            masks = np.packbits(masks, axis=1, bitorder="little")
+
+            chunk = max(1, _PARITY_TABLE_SIZE // max(self._shots, 1))
+            for start in range(0, len(group_words), chunk):
+                chunk_masks = masks[start : start + chunk]
+                parities = np.zeros((self._shots, len(chunk_masks)), dtype=np.uint8)
+                for byte in range(masks.shape[1]):
+                    parities ^= packed[:, byte, None] & chunk_masks[None, :, byte]
+                means = 1 - 2 * np.mean(_BYTE_PARITY[parities], axis=0)
+                self._expvals.update(zip(group_words[start : start + chunk], means))
+
+        return np.array([self._expvals[word] for word in words])
+
+    def expval(self, terms):
+        """The expectation value of an observable from the terms returned by :meth:`add`."""
+        coeffs, words, basis_state = terms
+        if basis_state is not None:
+            return np.mean(np.all(self.bits(words[0]) == basis_state, axis=1))
+        return qml.math.dot(coeffs, self.expvals(words))
+
+
 # pylint:disable = too-many-instance-attributes
 @simulator_tracking
 @single_tape_support
@@ -544,10 +708,25 @@ class DefaultClifford(Device):
         circuit = circuit.map_to_standard_wires()
 
         # Build a stim circuit, tableau and simulator
-        stim_circuit = stim.Circuit()
+        stim_circuit, global_phase = self._build_stim_circuit(circuit, debugger=debugger)
         tableau_simulator = stim.TableauSimulator()
         if self.wires is not None:
             tableau_simulator.set_num_qubits(len(self.wires))
+        tableau_simulator.do_circuit(stim_circuit)
+
+        # Perform measurements based on whether shots are provided
+        if circuit.shots:
+            meas_results = self.measure_statistical(circuit, stim_circuit, seed=seed)
+        else:
+            meas_results = self.measure_analytical(
+                circuit, stim_circuit, tableau_simulator, global_phase
+            )
+
+        return meas_results[0] if len(meas_results) == 1 else tuple(meas_results)
+
+    def _build_stim_circuit(self, circuit, debugger=None):
+        """Build the stim circuit of a circuit with standard wires, and its global phase."""
+        stim_circuit = stim.Circuit()
 
         # Account for state preparation operation
         prep = None
@@ -576,18 +755,47 @@ class DefaultClifford(Device):
                 if isinstance(op, qml.Snapshot):
                     self._apply_snapshot(circuit, stim_circuit, op, global_phase_ops, debugger)
 
-        tableau_simulator.do_circuit(stim_circuit)
         global_phase = qml.GlobalPhase(qml.math.sum(op.data[0] for op in global_phase_ops))
+        return stim_circuit, global_phase
 
-        # Perform measurements based on whether shots are provided
-        if circuit.shots:
-            meas_results = self.measure_statistical(circuit, stim_circuit, seed=seed)
-        else:
-            meas_results = self.measure_analytical(
-                circuit, stim_circuit, tableau_simulator, global_phase
-            )
+    def probability_support(self, circuit: QuantumScript) -> tuple[np.ndarray, np.ndarray, float]:
+        r"""Compute the computational basis states measured with a non-zero probability by the
+        ``qml.probs`` measurement of a circuit, without building the :math:`2^n` probabilities.
 
-        return meas_results[0] if len(meas_results) == 1 else tuple(meas_results)
+        The outcomes of measuring a stabilizer state in the computational basis are uniformly
+        distributed over an affine subspace :math:`\{o \oplus a G : a \in \{0, 1\}^k\}` of
+        :math:`\{0, 1\}^n`, and each of them has the probability :math:`2^{-k}`. The offset
+        :math:`o` and the generators :math:`G` only take :math:`\mathcal{O}(n^2)` memory, so that
+        the support of the probabilities can be computed for circuits with hundreds of qubits.
+
+        Args:
+            circuit (QuantumScript): A circuit with Clifford operations supported by the device and
+                a single analytic :func:`~pennylane.probs` measurement.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, float]: the offset :math:`o` of shape ``(n,)``, the
+            generators :math:`G` of shape ``(k, n)``, which are linearly independent and whose
+            first non-zero entries are at increasing positions, and the probability
+            :math:`2^{-k}` of every state in the support
+
+        **Example**
+
+        >>> ops = [qml.Hadamard(0)] + [qml.CNOT([i, i + 1]) for i in range(99)]
+        >>> qs = qml.tape.QuantumScript(ops, [qml.probs(wires=range(100))])
+        >>> offset, generators, prob = qml.device("default.clifford").probability_support(qs)
+        >>> offset.shape, generators.shape, prob
+        ((100,), (1, 100), 0.5)
+        """
+        if len(circuit.measurements) != 1 or not isinstance(circuit.measurements[0], ProbabilityMP):
+            raise ValueError("The circuit must have a single probs measurement.")
+        circuit = circuit.map_to_standard_wires()
+        meas = circuit.measurements[0]
+
+        stim_circuit, _ = self._build_stim_circuit(circuit)
+        meas_wires = self._probability_wires(meas, circuit)
+        simulator = self._diagonalized_simulator(meas, stim_circuit)
+        offset, generators = _outcome_subspace(simulator, meas_wires)
+        return offset, generators, 2.0 ** -len(generators)
 
     @property
     def _analytical_measurement_map(self):
@@ -650,55 +858,58 @@ class DefaultClifford(Device):
             debugger.snapshots[operation.tag or len(debugger.snapshots)] = snap_result
 
     @staticmethod
-    def _measure_observable_sample(meas_obs, stim_circuit, shots, sample_seed):
-        """Compute sample output from a stim circuit for a given Pauli observable"""
-        meas_dict = {"X": "MX", "Y": "MY", "Z": "MZ", "_": "M"}
-
-        if isinstance(meas_obs, BasisStateProjector):
-            stim_circ = stim_circuit.copy()
-            stim_circ.append_from_stim_program_text("M " + " ".join(map(str, meas_obs.wires)))
-            sampler = stim_circ.compile_sampler(seed=sample_seed)
-            return [qml.math.array(sampler.sample(shots=shots), dtype=int)], qml.math.array([1.0])
-
-        coeffs, paulis = _pl_obs_to_linear_comb(meas_obs)
-
-        samples = []
-        for pauli, wire in paulis:
-            stim_circ = stim_circuit.copy()
-            for op, wr in zip(pauli, wire):
-                if op != "I":
-                    stim_circ.append(meas_dict[op], wr)
-            sampler = stim_circ.compile_sampler(seed=sample_seed)
-            samples.append(qml.math.array(sampler.sample(shots=shots), dtype=int))
-
-        return samples, qml.math.array(coeffs)
+    def _sampled_observables(meas, stim_circuit):
+        """The observables whose Pauli words are sampled for a statistical measurement."""
+        if isinstance(meas, (ClassicalShadowMP, ShadowExpvalMP)):
+            return []
+        if isinstance(meas, ExpectationMP):
+            return [meas.obs]
+        if isinstance(meas, VarianceMP):
+            # use the naive formula for variance, i.e., Var(Q) = ⟨𝑄^2⟩−⟨𝑄⟩^2
+            obs = meas.obs.simplify()
+            return [obs, (obs**2).simplify()]
+        meas_wires = meas.wires if meas.wires else range(stim_circuit.num_qubits)
+        return [meas.obs or qml.prod(*[qml.Z(idx) for idx in meas_wires])]
 
     # pylint:disable=protected-access
     def measure_statistical(self, circuit, stim_circuit, seed=None):
-        """Given a circuit, compute samples and return the statistical measurement results."""
+        """Given a circuit, compute samples and return the statistical measurement results.
+
+        The Pauli words of the observables of all the measurements are grouped into qubit-wise
+        commuting sets, and each set is sampled once from a single compiled sampler.
+        """
         # Compute samples via circuits from tableau
         num_shots = circuit.shots.total_shots
         sample_seed = seed if isinstance(seed, int) else self._rng.integers(2**31 - 1, size=1)[0]
 
+        pauli_sampler = _PauliSampler(stim_circuit, num_shots, sample_seed)
+        meas_terms = [
+            [pauli_sampler.add(obs) for obs in self._sampled_observables(meas, stim_circuit)]
+            for meas in circuit.measurements
+        ]
+
         results = []
-        for meas in circuit.measurements:
+        for meas, terms in zip(circuit.measurements, meas_terms):
             measurement_func = self._statistical_measurement_map.get(type(meas), None)
             if measurement_func is not None:
-                res = measurement_func(meas, stim_circuit, shots=num_shots, seed=sample_seed)
+                res = measurement_func(
+                    meas,
+                    stim_circuit=stim_circuit,
+                    shots=num_shots,
+                    seed=sample_seed,
+                    pauli_sampler=pauli_sampler,
+                    terms=terms,
+                )
             else:
                 # Decide wire order
-                meas_wires = meas.wires if meas.wires else range(stim_circuit.num_qubits)
                 wire_order = {wire: idx for idx, wire in enumerate(meas.wires)}
-                # Decide measurement op
-                meas_op = meas.obs or qml.prod(*[qml.Z(idx) for idx in meas_wires])
-                samples = self._measure_observable_sample(
-                    meas_op, stim_circuit, num_shots, sample_seed
-                )[0]
+                words = terms[0][1]
                 # Check if the rotation was permissible
-                if len(samples) > 1:
+                if len(words) > 1:
                     raise qml.QuantumFunctionError(
-                        f"Observable {meas_op.name} is not supported for rotating probabilities on {self.name}."
+                        f"Observable {meas.obs.name} is not supported for rotating probabilities on {self.name}."
                     )
+                samples = [pauli_sampler.bits(words[0])]
                 # Process the result from samples
                 res = meas.process_samples(samples=np.array(samples), wire_order=wire_order)
                 # Post-processing for special cases
@@ -897,46 +1108,18 @@ class DefaultClifford(Device):
         return entropy / qml.math.log(log_base)
 
     # pylint: disable=too-many-branches, too-many-statements
-    def _measure_probability(self, meas, _, **kwargs):
-        r"""Measure the probability of each computational basis state.
-
-        Computes the probability for each of the computational basis state vector iteratively
-        according to the follow pseudocode.
-
-        1. First, a complete basis set is built based on measured wires' length `l` by transforming
-           integers :math:`[0, 2^l)` to their corresponding binary vector form, if the selective
-           target states for computing probabilities have not been specified in the ``kwargs``.
-        2. Second, We then build a `stim.TableauSimulator` based on the input circuit. If an observable
-           `obs` is given, an additional diagonalizing circuit is appended to the input circuit for
-           rotating the computational basis based on the `diagonalizing_gates` method of the observable.
-        3. Finally, for every basis state, we iterate over each measured qubit `q_i` and peek if it can
-           be collapsed to the state :math:`|0\rangle` / :math:`\rangle`1` corresponding to the bit
-           `0` / `1` in the basis state vector at `i`th index.
-        4. If the qubit can be collapsed to the correct state, we do the post-selection and continue. If not,
-           we identify it as an `unattainable` state and assign them with a zero probability. We do so for all
-           the other basis states with the same `i`th index and keep this information stored in a visit-array.
-        5. Alternatively, if the qubit is in a superposition state, then it can collapse to either of the states
-           :math:`|0\rangle` / :math:`\rangle`1`. We identify this as a `branching` scenario. We half the
-           current probability and post-select based on the `i`th index of the basis state we are iterating.
-        """
-        circuit = kwargs.get("circuit")
-
-        # Set the target states
-        tgt_states = kwargs.get("prob_states", None)
-
-        # Obtain the measurement wires for getting the basis states
+    @staticmethod
+    def _probability_wires(meas, circuit):
+        """The wires of the computational basis states of a probability measurement."""
         mobs_wires = meas.obs.wires if meas.obs else meas.wires
-        meas_wires = mobs_wires if mobs_wires else circuit.wires
-
-        # Build the complete computational basis,
-        # this will be expensive for larger circuits (> 24 qubits onwards)
-        if tgt_states is None:
-            num_wires = len(meas_wires)
-            basis_vec = np.arange(2**num_wires)[:, np.newaxis]
-            tgt_states = (((basis_vec & (1 << np.arange(num_wires)[::-1]))) > 0).astype(int)
+        return mobs_wires if mobs_wires else circuit.wires
 
+    @staticmethod
+    def _diagonalized_simulator(meas, stim_circuit):
+        """A tableau simulator of a stim circuit followed by the diagonalizing gates of the
+        observable of a measurement."""
         # Rotate the circuit basis to computational basis
-        diagonalizing_cit = kwargs.get("stim_circuit").copy()
+        diagonalizing_cit = stim_circuit.copy()
         diagonalizing_ops = [] if not meas.obs else meas.obs.diagonalizing_gates()
         for diag_op in diagonalizing_ops:
             # Check if it is Clifford
@@ -952,88 +1135,69 @@ class DefaultClifford(Device):
         # Build the Tableau simulator from the diagonalized circuit
         circuit_simulator = stim.TableauSimulator()
         circuit_simulator.do_circuit(diagonalizing_cit)
+        return circuit_simulator
+
+    def _measure_probability(self, meas, _, **kwargs):
+        r"""Measure the probability of each computational basis state.
+
+        The outcomes of measuring a stabilizer state in the computational basis are uniformly
+        distributed over an affine subspace, which is computed with the following steps.
+
+        1. First, we build a `stim.TableauSimulator` based on the input circuit. If an observable
+           `obs` is given, an additional diagonalizing circuit is appended to the input circuit for
+           rotating the computational basis based on the `diagonalizing_gates` method of the observable.
+        2. Second, we measure the measured qubits `q_i` one after the other on a copy of the simulator.
+           The first outcome gives the offset of the subspace. Every measurement with a random outcome
+           also gives a generator of the subspace, made of the outcomes that are flipped together with
+           its own by its kickback, see :func:`~._outcome_subspace`.
+        3. Finally, the :math:`2^k` states of the subspace spanned by the :math:`k` generators have the
+           probability :math:`2^{-k}`, and all the other states have a zero probability. If selective
+           target states have been specified in the ``kwargs``, the probability of each of them is
+           found by reducing it with the generators instead, without building the complete basis.
+        """
+        circuit = kwargs.get("circuit")
+
+        # Set the target states
+        tgt_states = kwargs.get("prob_states", None)
+
+        # Obtain the measurement wires for getting the basis states
+        meas_wires = self._probability_wires(meas, circuit)
+
+        circuit_simulator = self._diagonalized_simulator(meas, kwargs.get("stim_circuit"))
         if not self._tableau:
             state = self._measure_state(meas, circuit_simulator, circuit=circuit)
             return meas.process_state(state, wire_order=circuit.wires)
 
-        if len(meas_wires) >= tgt_states.shape[1]:
-            meas_wires = meas_wires[: tgt_states.shape[1]]
-        else:  # pragma: no cover
-            cgc_states = []
-            for state in tgt_states:
-                if list(state[meas_wires]) not in cgc_states:
-                    cgc_states.append(list(state[meas_wires]))
-            tgt_states = np.array(cgc_states)
-
-        # Maintain a representaiton of basis states to build a visit-array
-        tgt_integs = np.array([int("".join(map(str, tgt_state)), 2) for tgt_state in tgt_states])
-
-        # Iterate over the required basis states and for each of them compute the probability
-        # If an impossible branch occur keep a note of it via a visit-array
-        # Worst case complexity O(B * M * N), where N is #measured_qubits and B is #basis_states.
-        visited_probs = []
-        prob_res = np.ones(tgt_states.shape[0])
-        for tgt_index, (tgt_integ, tgt_state) in enumerate(zip(tgt_integs, tgt_states)):
-            if tgt_integ in visited_probs:
-                continue
-            prob_sim = circuit_simulator.copy()
-            for idx, wire in enumerate(meas_wires):
-                expectation = prob_sim.peek_z(wire)
-                # (Eig --> Res) | -1 --> 1 | 1 --> 0 | 0 --> 0 / 1 |
-                outcome = int(0.5 * (1 - expectation))
-                if not expectation:
-                    prob_res[tgt_index] /= 2.0
-                else:
-                    nope_idx = (
-                        np.where(
-                            np.squeeze(np.all(tgt_states[:, :idx] == tgt_state[:idx], axis=-1))
-                            & tgt_states[:, idx]
-                            != outcome
-                        )[0]
-                        if idx
-                        else np.where(tgt_states[:, idx] != outcome)[0]
-                    )
-                    nope_idx = np.setdiff1d(nope_idx, visited_probs)
-                    prob_res[nope_idx] = 0.0
-                    visited_probs.extend(tgt_integs[nope_idx])
+        offset, generators = _outcome_subspace(circuit_simulator, meas_wires)
+        prob = 2.0 ** -len(generators)
 
-                    if tgt_state[idx] != outcome:
-                        prob_res[tgt_index] = 0.0
-                        break
+        if tgt_states is not None:
+            # Reduce the difference to the offset of every target state with the generators
+            diffs = np.array(tgt_states, dtype=np.uint8) ^ offset
+            for generator in generators:
+                diffs[diffs[:, np.argmax(generator)] == 1] ^= generator
+            return np.where(diffs.any(axis=1), 0.0, prob)
 
-                prob_sim.postselect_z(wire, desired_value=tgt_state[idx])
-            visited_probs.append(tgt_integ)
+        # Enumerate the support, with the first measured wire as the most significant bit
+        powers = 1 << np.arange(len(meas_wires), dtype=np.int64)[::-1]
+        support = np.array([offset @ powers])
+        for generator in generators:
+            support = np.concatenate([support, support ^ (generator @ powers)])
+
+        prob_res = np.zeros(2 ** len(meas_wires))
+        prob_res[support] = prob
         return prob_res
 
-    def _sample_expectation(self, meas, stim_circuit, shots, seed):
+    @staticmethod
+    def _sample_expectation(_, **kwargs):
         """Measure the expectation value with respect to samples from simulator device."""
-        # Get the observable for the expectation value measurement
-        meas_op = meas.obs
+        return kwargs["pauli_sampler"].expval(kwargs["terms"][0])
 
-        samples, coeffs = self._measure_observable_sample(meas_op, stim_circuit, shots, seed)
-
-        if isinstance(meas_op, BasisStateProjector):
-            matches = np.where((samples[0] == meas_op.data[0]).all(axis=1))[0]
-            return len(matches) / shots
-
-        expecs = [
-            qml.math.mean(qml.math.power([-1] * shots, qml.math.sum(sample, axis=1)))
-            for sample in samples
-        ]
-
-        return qml.math.dot(coeffs, expecs)
-
-    def _sample_variance(self, meas, stim_circuit, shots, seed):
+    @staticmethod
+    def _sample_variance(_, **kwargs):
         """Measure the variance with respect to samples from simulator device."""
-        # Get the observable for the expectation value measurement
-        meas_obs1 = meas.obs.simplify()
-        meas_obs2 = (meas_obs1**2).simplify()
-
-        # use the naive formula for variance, i.e., Var(Q) = ⟨𝑄^2⟩−⟨𝑄⟩^2
-        return (
-            self._sample_expectation(qml.expval(meas_obs2), stim_circuit, shots, seed)
-            - self._sample_expectation(qml.expval(meas_obs1), stim_circuit, shots, seed) ** 2
-        )
+        pauli_sampler, (terms, squared_terms) = kwargs["pauli_sampler"], kwargs["terms"]
+        return pauli_sampler.expval(squared_terms) - pauli_sampler.expval(terms) ** 2
 
     @staticmethod
     def _measure_single_sample(stim_ct, meas_ops, meas_idx, meas_wire):
@@ -1044,7 +1208,7 @@ class DefaultClifford(Device):
         res = [int(r) for r in res]
         return stim_sm.measure_observable(stim.PauliString(res))
 
-    def _sample_classical_shadow(self, meas, stim_circuit, shots, seed):
+    def _sample_classical_shadow(self, meas, stim_circuit, shots, seed, **_):
         """Measures classical shadows from the state of simulator device"""
         meas_seed = meas.seed or seed
         meas_wire = stim_circuit.num_qubits
@@ -1064,7 +1228,7 @@ class DefaultClifford(Device):
 
         return np.asarray(bits, dtype=int), np.asarray(recipes, dtype=int)
 
-    def _sample_expval_shadow(self, meas, stim_circuit, shots, seed):
+    def _sample_expval_shadow(self, meas, stim_circuit, shots, seed, **_):
         """Measures expectation value of a Pauli observable using
         classical shadows from the state of simulator device."""
         bits, recipes = self._sample_classical_shadow(meas, stim_circuit, shots, seed)
@@ -200,9 +200,14 @@ class DefaultMixed(Device):
         r_dtype (numpy.dtype): Real datatype to use for computations. Default is np.float64.
         c_dtype (numpy.dtype): Complex datatype to use for computations. Default is np.complex128.
         readout_prob (float): Probability of readout error for qubit measurements. Must be in :math:`[0,1]`.
+        max_fused_wires (int): If provided, runs of neighbouring gates and channels are fused into
+            superoperators acting on at most ``max_fused_wires`` wires before simulation, which
+            reduces the number of passes over the density matrix for noisy circuits. Default is
+            ``None``, which applies every operation separately.
     """
 
-    _device_options = ("rng", "prng_key")  # tuple of string names for all the device options.
+    # tuple of string names for all the device options.
+    _device_options = ("rng", "prng_key", "max_fused_wires")
 
     @property
     def name(self):
@@ -217,6 +222,7 @@ class DefaultMixed(Device):
         shots=None,
         seed="global",
         readout_prob=None,
+        max_fused_wires=None,
     ) -> None:
 
         if isinstance(wires, int) and wires > 23:
@@ -233,6 +239,9 @@ class DefaultMixed(Device):
                 )
             if self.readout_err < 0 or self.readout_err > 1:
                 raise ValueError("The readout error probability should be in the range [0,1].")
+        if max_fused_wires is not None and max_fused_wires < 1:
+            raise ValueError(f"max_fused_wires must be a positive integer, got {max_fused_wires}.")
+        self._max_fused_wires = max_fused_wires
         super().__init__(wires=wires, shots=shots)
 
         # Seed setting
@@ -274,6 +283,10 @@ class DefaultMixed(Device):
         circuits: QuantumScript,
         execution_config: Optional[ExecutionConfig] = None,
     ) -> Union[Result, ResultBatch]:
+        execution_config = execution_config or ExecutionConfig()
+        max_fused_wires = execution_config.device_options.get(
+            "max_fused_wires", self._max_fused_wires
+        )
         return tuple(
             simulate(
                 c,
@@ -282,6 +295,7 @@ class DefaultMixed(Device):
                 debugger=self._debugger,
                 interface=execution_config.interface,
                 readout_errors=self.readout_err,
+                max_fused_wires=max_fused_wires,
             )
             for c in circuits
         )
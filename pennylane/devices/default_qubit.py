@@ -48,9 +48,15 @@ from .preprocess import (
     validate_multiprocessing_workers,
     validate_observables,
 )
-from .qubit.adjoint_jacobian import adjoint_jacobian, adjoint_jvp, adjoint_vjp
+from .qubit.adjoint_jacobian import (
+    adjoint_jacobian,
+    adjoint_jvp,
+    adjoint_vjp,
+    multi_parameter_expansions,
+)
 from .qubit.sampling import jax_random_split
 from .qubit.simulate import get_final_state, measure_final_state, simulate
+from .qubit.trajectories import accepted_trajectory_measurement, simulate_trajectories
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -77,6 +83,12 @@ def stopping_condition(op: qml.operation.Operator) -> bool:
     )
 
 
+def stopping_condition_trajectories(op: qml.operation.Operator) -> bool:
+    """Specify whether or not an Operator object is supported by the device when simulating
+    quantum trajectories, which also supports channels."""
+    return isinstance(op, qml.operation.Channel) or stopping_condition(op)
+
+
 def stopping_condition_shots(op: qml.operation.Operator) -> bool:
     """Specify whether or not an Operator object is supported by the device with shots."""
     return (
@@ -165,6 +177,19 @@ def _conditional_broastcast_expand(tape):
     return (tape,), null_postprocessing
 
 
+@qml.transform
+def _validate_trajectory_trainable_params(tape):
+    """Raises an error if a channel has trainable parameters, since the derivatives of the averages
+    over quantum trajectories with respect to them are not available."""
+    for op in tape.operations:
+        if isinstance(op, qml.operation.Channel) and qml.operation.is_trainable(op):
+            raise qml.QuantumFunctionError(
+                f"Differentiating with respect to the parameters of {op.name} is not supported "
+                "with quantum trajectories. Mark the parameters of the channels as non-trainable."
+            )
+    return (tape,), null_postprocessing
+
+
 @qml.transform
 def no_counts(tape):
     """Throws an error on counts measurements."""
@@ -223,6 +248,7 @@ def adjoint_ops(op: qml.operation.Operator) -> bool:
         op.num_params == 0
         or not qml.operation.is_trainable(op)
         or (op.num_params == 1 and op.has_generator)
+        or type(op) in multi_parameter_expansions
     )
 
 
@@ -273,9 +299,39 @@ def _add_adjoint_transforms(program: TransformProgram, device_vjp=False) -> None
     program.add_transform(validate_adjoint_trainable_params)
 
 
+def _add_trajectory_transforms(
+    program: TransformProgram, device_name: str, gradient_method=None
+) -> None:
+    """Private helper function for ``preprocess`` that adds the transforms specific
+    for simulating quantum trajectories.
+
+    Args:
+        program (TransformProgram): where we will add the trajectory transforms
+        device_name (str): the name of the device
+        gradient_method (Union[str, TransformDispatcher, None]): the gradient method of the
+            execution
+
+    Side Effects:
+        Adds transforms to the input program.
+
+    """
+
+    name = f"trajectories + {device_name}"
+    program.add_transform(no_sampling, name=name)
+    program.add_transform(
+        decompose, stopping_condition=stopping_condition_trajectories, name=device_name
+    )
+    program.add_transform(
+        validate_measurements, analytic_measurements=accepted_trajectory_measurement, name=name
+    )
+    if gradient_method is not None:
+        program.add_transform(_validate_trajectory_trainable_params)
+    program.add_transform(qml.transforms.broadcast_expand)
+
+
 @simulator_tracking
 @single_tape_support
-class DefaultQubit(Device):
+class DefaultQubit(Device):  # pylint: disable=too-many-instance-attributes
     """A PennyLane device written in Python and capable of backpropagation derivatives.
 
     Args:
@@ -296,6 +352,41 @@ class DefaultQubit(Device):
             using a pool of at most ``max_workers`` processes. If ``max_workers`` is ``None``,
             only the current process executes tapes. If you experience any
             issue, say using JAX, TensorFlow, Torch, try setting ``max_workers`` to ``None``.
+        executor_type (str): The type of worker pool used when ``max_workers`` is not ``None``.
+            Either ``"process"`` (default) for a ``ProcessPoolExecutor`` or ``"thread"`` for a
+            ``ThreadPoolExecutor``. The pool is created on first use and kept alive by the device
+            until :meth:`~.DefaultQubit.shutdown` is called.
+        chunksize (int): The number of tapes sent to a worker at a time. If ``None``, the batch is
+            split evenly into a few chunks per worker to amortize pickling costs.
+        max_fused_wires (int): If provided, runs of neighbouring gates are fused into dense blocks
+            acting on at most ``max_fused_wires`` wires before simulation, which reduces the number
+            of passes over the state vector for deep circuits. Default is ``None``, which applies
+            every gate separately.
+        inplace (bool): Whether to apply gates in place on two preallocated state buffers when
+            executing with NumPy parameters and no backpropagation. This keeps the peak memory
+            of the simulation at twice the size of the state vector. Default is ``False``.
+        checkpoint_interval (int): If provided, adjoint differentiation stores the state before
+            every ``checkpoint_interval`` gates in a forward pass and recomputes the states of the
+            reverse sweep from these checkpoints instead of undoing every gate. Default is
+            ``None``, which undoes the gates unless ``max_checkpoint_bytes`` is given.
+        max_checkpoint_bytes (int): If provided without a ``checkpoint_interval``, adjoint
+            differentiation uses the checkpoint interval that stores the fewest states if these
+            states fit into ``max_checkpoint_bytes`` bytes. Default is ``None``.
+        histogram_sampling (bool): Whether to compute ``expval``, ``var``, ``probs`` and ``counts``
+            of diagonal observables from a multinomial histogram of the outcomes on the measured
+            wires instead of drawing individual samples. Memory then scales with the number of
+            outcomes instead of the number of shots. Default is ``False``.
+        num_trajectories (int): If provided, circuits containing channels are simulated on state
+            vectors by averaging analytic ``expval``, ``var``, ``probs`` and ``density_matrix``
+            measurements over ``num_trajectories`` quantum trajectories, in which every channel
+            applies one of its Kraus operators chosen at random. The standard errors of the
+            estimates are recorded by :class:`~.Tracker` under ``"standard_errors"``. Derivatives
+            are only available through the parameter-shift rules of the gates, since the random
+            choice of the Kraus operators is not differentiable. Default is ``None``, which does
+            not support channels.
+        trajectory_batch_size (int): The maximum number of trajectories that are simulated at
+            once as a batch of state vectors. Default is ``None``, which simulates all
+            trajectories at once.
 
     **Example:**
 
@@ -399,6 +490,17 @@ class DefaultQubit(Device):
 
         where the last two are specific to the MKL and OpenBLAS libraries specifically.
 
+        The worker pool is owned by the device and reused across calls to :meth:`~.execute` and the
+        derivative methods, so the workers only need to be started once. The pool can be released
+        explicitly with :meth:`~.shutdown`, or by using the device as a context manager:
+
+        >>> with DefaultQubit(max_workers=5) as dev:
+        ...     results = dev.execute(new_batch, execution_config=execution_config)
+
+        Setting ``executor_type="thread"`` uses a ``ThreadPoolExecutor`` instead, which avoids
+        process startup and pickling altogether. This is most useful for large circuits, where
+        NumPy releases the GIL during the bulk of the simulation.
+
         .. warning::
 
             Multiprocessing may fail depending on your platform and environment (Python shell,
@@ -461,12 +563,31 @@ class DefaultQubit(Device):
     subsequent calls to ``compute_vjp``. ``None`` indicates that no caching is required.
     """
 
-    _device_options = ("max_workers", "rng", "prng_key")
+    _device_options = (
+        "max_workers",
+        "rng",
+        "prng_key",
+        "max_fused_wires",
+        "inplace",
+        "checkpoint_interval",
+        "max_checkpoint_bytes",
+        "histogram_sampling",
+        "num_trajectories",
+        "trajectory_batch_size",
+    )
     """
     tuple of string names for all the device options.
     """
 
-    # pylint:disable = too-many-arguments
+    _executor_types = {
+        "process": concurrent.futures.ProcessPoolExecutor,
+        "thread": concurrent.futures.ThreadPoolExecutor,
+    }
+    """
+    dict mapping the supported ``executor_type`` values to their ``concurrent.futures`` executor.
+    """
+
+    # pylint:disable = too-many-arguments, too-many-positional-arguments
     @debug_logger_init
     def __init__(
         self,
@@ -474,9 +595,53 @@ class DefaultQubit(Device):
         shots=None,
         seed="global",
         max_workers=None,
+        executor_type="process",
+        chunksize=None,
+        max_fused_wires=None,
+        inplace=False,
+        checkpoint_interval=None,
+        max_checkpoint_bytes=None,
+        histogram_sampling=False,
+        num_trajectories=None,
+        trajectory_batch_size=None,
     ) -> None:
         super().__init__(wires=wires, shots=shots)
+        if executor_type not in self._executor_types:
+            raise ValueError(
+                f"executor_type must be one of {tuple(self._executor_types)}, got {executor_type}."
+            )
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+        if max_fused_wires is not None and max_fused_wires < 1:
+            raise ValueError(f"max_fused_wires must be a positive integer, got {max_fused_wires}.")
+        if checkpoint_interval is not None and checkpoint_interval < 1:
+            raise ValueError(
+                f"checkpoint_interval must be a positive integer, got {checkpoint_interval}."
+            )
+        if max_checkpoint_bytes is not None and max_checkpoint_bytes < 0:
+            raise ValueError(
+                f"max_checkpoint_bytes must be a non-negative integer, got {max_checkpoint_bytes}."
+            )
+        if num_trajectories is not None and num_trajectories < 1:
+            raise ValueError(
+                f"num_trajectories must be a positive integer, got {num_trajectories}."
+            )
+        if trajectory_batch_size is not None and trajectory_batch_size < 1:
+            raise ValueError(
+                f"trajectory_batch_size must be a positive integer, got {trajectory_batch_size}."
+            )
         self._max_workers = max_workers
+        self._executor_type = executor_type
+        self._chunksize = chunksize
+        self._max_fused_wires = max_fused_wires
+        self._inplace = inplace
+        self._checkpoint_interval = checkpoint_interval
+        self._max_checkpoint_bytes = max_checkpoint_bytes
+        self._histogram_sampling = histogram_sampling
+        self._num_trajectories = num_trajectories
+        self._trajectory_batch_size = trajectory_batch_size
+        self._executor = None
+        self._executor_workers = None
         seed = np.random.randint(0, high=10000000) if seed == "global" else seed
         if qml.math.get_interface(seed) == "jax":
             self._prng_seed = seed
@@ -488,6 +653,67 @@ class DefaultQubit(Device):
             self._rng = np.random.default_rng(seed)
         self._debugger = None
 
+    def _checkpoint_kwargs(self, execution_config):
+        """The checkpointing options of the adjoint method in the device options."""
+        return {
+            name: execution_config.device_options.get(name, getattr(self, f"_{name}"))
+            for name in ("checkpoint_interval", "max_checkpoint_bytes")
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def __getstate__(self):
+        # worker pools cannot be pickled or copied, a copy starts its own pool on first use
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_executor_workers"] = None
+        return state
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool owned by the device, if one has been started.
+
+        The device remains usable afterwards. A new pool is started the next time a batch is
+        executed with ``max_workers`` set.
+
+        Args:
+            wait (bool): Whether to block until all pending work is complete and the workers
+                have exited.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        self._executor = None
+        self._executor_workers = None
+
+    def _get_executor(self, max_workers: int) -> concurrent.futures.Executor:
+        """Return the device-owned worker pool, creating it on first use.
+
+        The pool is recreated if ``max_workers`` differs from the size of the existing pool,
+        for example when it is overridden through the execution config device options.
+        """
+        if self._executor is None or self._executor_workers != max_workers:
+            self.shutdown()
+            self._executor = self._executor_types[self._executor_type](max_workers=max_workers)
+            self._executor_workers = max_workers
+        return self._executor
+
+    def _map(self, max_workers: int, fn, *iterables) -> tuple:
+        """Map ``fn`` over ``iterables`` using the device-owned worker pool.
+
+        Tapes are sent to the workers in chunks. Unless a ``chunksize`` was provided on
+        construction, each worker receives about four chunks per batch, which limits the number
+        of round trips between processes while still balancing uneven workloads.
+        """
+        executor = self._get_executor(max_workers)
+        chunksize = self._chunksize
+        if chunksize is None:
+            num_items = len(iterables[0])
+            chunksize = max(1, num_items // (4 * max_workers))
+        return tuple(executor.map(fn, *iterables, chunksize=chunksize))
+
     @debug_logger
     def supports_derivatives(
         self,
@@ -510,6 +736,14 @@ class DefaultQubit(Device):
         if execution_config is None:
             return True
 
+        if (
+            execution_config.device_options.get("num_trajectories", self._num_trajectories)
+            is not None
+        ):
+            # the renormalized Kraus operators chosen for every trajectory do not account for the
+            # dependence of their probabilities on the parameters
+            return False
+
         no_max_workers = (
             execution_config.device_options.get("max_workers", self._max_workers) is None
         )
@@ -561,6 +795,10 @@ class DefaultQubit(Device):
         transform_program.add_transform(
             mid_circuit_measurements, device=self, mcm_config=config.mcm_config
         )
+        if config.device_options.get("num_trajectories", None) is not None:
+            _add_trajectory_transforms(transform_program, self.name, config.gradient_method)
+            return transform_program, config
+
         transform_program.add_transform(
             decompose,
             stopping_condition=stopping_condition,
@@ -636,8 +874,21 @@ class DefaultQubit(Device):
                 if option == "max_workers" and value is not None:
                     raise qml.DeviceError("Cannot set 'max_workers' if program capture is enabled.")
 
+        num_trajectories = execution_config.device_options.get(
+            "num_trajectories", self._num_trajectories
+        )
         gradient_method = execution_config.gradient_method
-        if execution_config.gradient_method == "best":
+        if num_trajectories is not None and gradient_method in (
+            "backprop",
+            "finite-diff",
+            qml.gradients.finite_diff,
+        ):
+            raise qml.DeviceError(
+                "Backpropagation and finite-difference derivatives are not supported with quantum "
+                "trajectories, since the random choice of the Kraus operators is not differentiable "
+                "and differs between executions. Use diff_method='parameter-shift' instead."
+            )
+        if execution_config.gradient_method == "best" and num_trajectories is None:
             no_max_workers = (
                 execution_config.device_options.get("max_workers", self._max_workers) is None
             ) or qml.capture.enabled()
@@ -693,12 +944,42 @@ class DefaultQubit(Device):
     ) -> Union[Result, ResultBatch]:
         self.reset_prng_key()
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        max_fused_wires = execution_config.device_options.get(
+            "max_fused_wires", self._max_fused_wires
+        )
+        inplace = execution_config.device_options.get("inplace", self._inplace)
+        histogram_sampling = execution_config.device_options.get(
+            "histogram_sampling", self._histogram_sampling
+        )
         self._state_cache = {} if execution_config.use_device_jacobian_product else None
         interface = (
             execution_config.interface
             if execution_config.gradient_method in {"backprop", None}
             else None
         )
+        num_trajectories = execution_config.device_options.get(
+            "num_trajectories", self._num_trajectories
+        )
+        if num_trajectories is not None:
+            batch_size = execution_config.device_options.get(
+                "trajectory_batch_size", self._trajectory_batch_size
+            )
+            results = []
+            for c in circuits:
+                res, errors = simulate_trajectories(
+                    c,
+                    num_trajectories,
+                    batch_size=batch_size,
+                    debugger=self._debugger,
+                    rng=self._rng,
+                    interface=interface,
+                    max_fused_wires=max_fused_wires,
+                )
+                if self.tracker.active:
+                    self.tracker.update(standard_errors=errors)
+                results.append(res)
+            return tuple(results)
+
         prng_keys = [self.get_prng_keys()[0] for _ in range(len(circuits))]
 
         if (
@@ -727,6 +1008,9 @@ class DefaultQubit(Device):
                         "prng_key": _key,
                         "mcm_method": execution_config.mcm_config.mcm_method,
                         "postselect_mode": execution_config.mcm_config.postselect_mode,
+                        "max_fused_wires": max_fused_wires,
+                        "inplace": inplace,
+                        "histogram_sampling": histogram_sampling,
                     },
                 )
                 for c, _key in zip(circuits, prng_keys)
@@ -740,13 +1024,14 @@ class DefaultQubit(Device):
                 "prng_key": _key,
                 "mcm_method": execution_config.mcm_config.mcm_method,
                 "postselect_mode": execution_config.mcm_config.postselect_mode,
+                "max_fused_wires": max_fused_wires,
+                "inplace": inplace,
+                "histogram_sampling": histogram_sampling,
             }
             for _rng, _key in zip(seeds, prng_keys)
         ]
 
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            exec_map = executor.map(_simulate_wrapper, vanilla_circuits, simulate_kwargs)
-            results = tuple(exec_map)
+        results = self._map(max_workers, _simulate_wrapper, vanilla_circuits, simulate_kwargs)
 
         # reset _rng to mimic serial behaviour
         self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -760,13 +1045,16 @@ class DefaultQubit(Device):
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        checkpoint_kwargs = self._checkpoint_kwargs(execution_config)
         if max_workers is None:
-            return tuple(adjoint_jacobian(circuit) for circuit in circuits)
+            return tuple(adjoint_jacobian(circuit, **checkpoint_kwargs) for circuit in circuits)
 
         vanilla_circuits = convert_to_numpy_parameters(circuits)[0]
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            exec_map = executor.map(adjoint_jacobian, vanilla_circuits)
-            res = tuple(exec_map)
+        res = self._map(
+            max_workers,
+            partial(adjoint_jacobian, **checkpoint_kwargs),
+            vanilla_circuits,
+        )
 
         # reset _rng to mimic serial behaviour
         self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -781,18 +1069,19 @@ class DefaultQubit(Device):
     ):
         self.reset_prng_key()
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        checkpoint_kwargs = self._checkpoint_kwargs(execution_config)
         if max_workers is None:
-            results = tuple(_adjoint_jac_wrapper(c, debugger=self._debugger) for c in circuits)
+            results = tuple(
+                _adjoint_jac_wrapper(c, debugger=self._debugger, **checkpoint_kwargs)
+                for c in circuits
+            )
         else:
             vanilla_circuits = convert_to_numpy_parameters(circuits)[0]
-
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = tuple(
-                    executor.map(
-                        _adjoint_jac_wrapper,
-                        vanilla_circuits,
-                    )
-                )
+            results = self._map(
+                max_workers,
+                partial(_adjoint_jac_wrapper, **checkpoint_kwargs),
+                vanilla_circuits,
+            )
 
         return tuple(zip(*results))
 
@@ -824,12 +1113,20 @@ class DefaultQubit(Device):
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        checkpoint_kwargs = self._checkpoint_kwargs(execution_config)
         if max_workers is None:
-            return tuple(adjoint_jvp(circuit, tans) for circuit, tans in zip(circuits, tangents))
+            return tuple(
+                adjoint_jvp(circuit, tans, **checkpoint_kwargs)
+                for circuit, tans in zip(circuits, tangents)
+            )
 
         vanilla_circuits = convert_to_numpy_parameters(circuits)[0]
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            res = tuple(executor.map(adjoint_jvp, vanilla_circuits, tangents))
+        res = self._map(
+            max_workers,
+            partial(adjoint_jvp, **checkpoint_kwargs),
+            vanilla_circuits,
+            tangents,
+        )
 
         # reset _rng to mimic serial behaviour
         self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -845,22 +1142,20 @@ class DefaultQubit(Device):
     ):
         self.reset_prng_key()
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        checkpoint_kwargs = self._checkpoint_kwargs(execution_config)
         if max_workers is None:
             results = tuple(
-                _adjoint_jvp_wrapper(c, t, debugger=self._debugger)
+                _adjoint_jvp_wrapper(c, t, debugger=self._debugger, **checkpoint_kwargs)
                 for c, t in zip(circuits, tangents)
             )
         else:
             vanilla_circuits = convert_to_numpy_parameters(circuits)[0]
-
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = tuple(
-                    executor.map(
-                        _adjoint_jvp_wrapper,
-                        vanilla_circuits,
-                        tangents,
-                    )
-                )
+            results = self._map(
+                max_workers,
+                partial(_adjoint_jvp_wrapper, **checkpoint_kwargs),
+                vanilla_circuits,
+                tangents,
+            )
 
         return tuple(zip(*results))
 
@@ -931,6 +1226,7 @@ class DefaultQubit(Device):
 
         """
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        checkpoint_kwargs = self._checkpoint_kwargs(execution_config)
         if max_workers is None:
 
             def _state(circuit):
@@ -939,13 +1235,22 @@ class DefaultQubit(Device):
                 )
 
             return tuple(
-                adjoint_vjp(circuit, cots, state=_state(circuit))
+                adjoint_vjp(
+                    circuit,
+                    cots,
+                    state=_state(circuit),
+                    **checkpoint_kwargs,
+                )
                 for circuit, cots in zip(circuits, cotangents)
             )
 
         vanilla_circuits = convert_to_numpy_parameters(circuits)[0]
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            res = tuple(executor.map(adjoint_vjp, vanilla_circuits, cotangents))
+        res = self._map(
+            max_workers,
+            partial(adjoint_vjp, **checkpoint_kwargs),
+            vanilla_circuits,
+            cotangents,
+        )
 
         # reset _rng to mimic serial behaviour
         self._rng = np.random.default_rng(self._rng.integers(2**31 - 1))
@@ -961,22 +1266,20 @@ class DefaultQubit(Device):
     ):
         self.reset_prng_key()
         max_workers = execution_config.device_options.get("max_workers", self._max_workers)
+        checkpoint_kwargs = self._checkpoint_kwargs(execution_config)
         if max_workers is None:
             results = tuple(
-                _adjoint_vjp_wrapper(c, t, debugger=self._debugger)
+                _adjoint_vjp_wrapper(c, t, debugger=self._debugger, **checkpoint_kwargs)
                 for c, t in zip(circuits, cotangents)
             )
         else:
             vanilla_circuits = convert_to_numpy_parameters(circuits)[0]
-
-            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = tuple(
-                    executor.map(
-                        _adjoint_vjp_wrapper,
-                        vanilla_circuits,
-                        cotangents,
-                    )
-                )
+            results = self._map(
+                max_workers,
+                partial(_adjoint_vjp_wrapper, **checkpoint_kwargs),
+                vanilla_circuits,
+                cotangents,
+            )
 
         return tuple(zip(*results))
 
@@ -1053,25 +1356,25 @@ def _simulate_wrapper(circuit, kwargs):
     return simulate(circuit, **kwargs)
 
 
-def _adjoint_jac_wrapper(c, debugger=None):
+def _adjoint_jac_wrapper(c, debugger=None, **checkpoint_kwargs):
     c = c.map_to_standard_wires()
     state, is_state_batched = get_final_state(c, debugger=debugger)
-    jac = adjoint_jacobian(c, state=state)
+    jac = adjoint_jacobian(c, state=state, **checkpoint_kwargs)
     res = measure_final_state(c, state, is_state_batched)
     return res, jac
 
 
-def _adjoint_jvp_wrapper(c, t, debugger=None):
+def _adjoint_jvp_wrapper(c, t, debugger=None, **checkpoint_kwargs):
     c = c.map_to_standard_wires()
     state, is_state_batched = get_final_state(c, debugger=debugger)
-    jvp = adjoint_jvp(c, t, state=state)
+    jvp = adjoint_jvp(c, t, state=state, **checkpoint_kwargs)
     res = measure_final_state(c, state, is_state_batched)
     return res, jvp
 
 
-def _adjoint_vjp_wrapper(c, t, debugger=None):
+def _adjoint_vjp_wrapper(c, t, debugger=None, **checkpoint_kwargs):
     c = c.map_to_standard_wires()
     state, is_state_batched = get_final_state(c, debugger=debugger)
-    vjp = adjoint_vjp(c, t, state=state)
+    vjp = adjoint_vjp(c, t, state=state, **checkpoint_kwargs)
     res = measure_final_state(c, state, is_state_batched)
     return res, vjp
@@ -15,8 +15,8 @@
 This module contains the default.tensor device to perform tensor network simulations of quantum circuits using ``quimb``.
 """
 # pylint: disable=protected-access
-import copy
 import warnings
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import replace
 from functools import singledispatch
@@ -28,6 +28,7 @@ import numpy as np
 import pennylane as qml
 from pennylane.devices import DefaultExecutionConfig, Device, ExecutionConfig
 from pennylane.devices.modifiers import simulator_tracking, single_tape_support
+from pennylane.devices.qubit.sampling import _group_measurements
 from pennylane.devices.preprocess import (
     decompose,
     validate_device_wires,
@@ -35,13 +36,16 @@ from pennylane.devices.preprocess import (
     validate_observables,
 )
 from pennylane.measurements import (
+    CountsMP,
     ExpectationMP,
     MeasurementProcess,
+    SampleMeasurement,
+    Shots,
     StateMeasurement,
     StateMP,
     VarianceMP,
 )
-from pennylane.operation import Observable, Operation
+from pennylane.operation import Observable, Operation, _operator_key
 from pennylane.ops import LinearCombination, Prod, SProd, Sum
 from pennylane.tape import QuantumScript, QuantumScriptOrBatch
 from pennylane.templates.subroutines.trotter import _recursive_expression
@@ -148,6 +152,13 @@ _gate_contract_tn = frozenset(
     {"auto-split-gate", "split-gate", "reduce-split", "swap-split-gate", "split", True, False}
 )
 # The set of supported gate contraction methods for the TN method.
+
+_MARGINAL_GROUP_SIZE = 10
+# The number of wires sampled at once from their marginal distribution with the TN method.
+
+_MPS_SAMPLING_MEMORY = 2**22
+# The maximum number of entries of the batched environments of the samples drawn at once from an MPS.
+
 _PAULI_MATRICES = {
     "I": qml.Identity(0).matrix(),
     "X": qml.PauliX(0).matrix(),
@@ -188,6 +199,101 @@ def _warn_unused_kwarg_tn(max_bond_dim: None, cutoff: None):
         warnings.warn("The keyword argument 'cutoff' is not used for the 'tn' method. ")
 
 
+class _PrefixNode:  # pylint: disable=too-few-public-methods
+    """A node of the prefix tree of the operations of a batch of circuits.
+
+    Args:
+        op (Operator): the operation applied when going from the parent node to this node
+    """
+
+    __slots__ = ("op", "children", "circuits", "size")
+
+    def __init__(self, op=None):
+        self.op = op
+        self.children = {}
+        # the indices of the circuits whose operations end at this node
+        self.circuits = []
+        # the number of circuits whose operations pass through this node
+        self.size = 0
+
+
+def _mps_arrays(psi: "qtn.MatrixProductState") -> list[np.ndarray]:
+    """Return the tensors of an MPS as arrays with the indices (left bond, physical, right bond),
+    where the bonds at the ends of the chain have dimension one."""
+    arrays = []
+    for i in range(psi.L):
+        left = [psi.bond(i - 1, i)] if i > 0 else []
+        right = [psi.bond(i, i + 1)] if i < psi.L - 1 else []
+        tensor = psi[psi.site_tag(i)].transpose(*left, psi.site_ind(i), *right)
+        data = np.asarray(tensor.data)
+        arrays.append(np.reshape(data, (data.shape[0] if left else 1, 2, -1)))
+    return arrays
+
+
+def _right_canonicalize(arrays: list[np.ndarray]) -> list[np.ndarray]:
+    """Bring the tensors of an MPS into right-canonical form with a sweep of QR decompositions,
+    leaving the norm of the state in the first tensor."""
+    arrays = list(arrays)
+    for i in range(len(arrays) - 1, 0, -1):
+        left, phys, right = arrays[i].shape
+        q, r = np.linalg.qr(np.reshape(arrays[i], (left, phys * right)).T)
+        arrays[i] = np.reshape(q.T, (-1, phys, right))
+        arrays[i - 1] = np.tensordot(arrays[i - 1], r.T, axes=1)
+    return arrays
+
+
+def sample_mps(arrays: list[np.ndarray], sites: list[int], shots: int, rng=None) -> np.ndarray:
+    r"""Draw samples of the computational basis outcomes on ``sites`` from an MPS.
+
+    The samples are drawn by perfect sampling: the chain is brought into right-canonical form, and
+    the outcomes of the sites are sampled one after the other from their distribution conditioned
+    on the outcomes of the previous sites. Since the right part of the chain is an isometry, the
+    conditional probabilities only require the left environment of every sample, which is updated
+    with the sampled outcome at each site. All samples are processed together as a batch, so the
+    cost is :math:`\mathcal{O}(n \chi^2)` per sample for :math:`n` sites with bond dimension
+    :math:`\chi`, and the sites after the last sampled one are never visited.
+
+    Args:
+        arrays (list[array]): the tensors of the MPS, with the indices (left bond, physical, right
+            bond) and bonds of dimension one at the ends of the chain
+        sites (list[int]): the sites to sample
+        shots (int): the number of samples
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter for ``numpy.random.default_rng``.
+
+    Returns:
+        array[int]: the samples, with shape ``(shots, len(sites))``
+
+    **Example**
+
+    >>> bell = [np.array([[[1, 0], [0, 1]]]), np.array([[[1], [0]], [[0], [1]]])]
+    >>> sample_mps(bell, [0, 1], shots=4, rng=42)
+    array([[0, 0],
+           [1, 1],
+           [0, 0],
+           [0, 0]])
+    """
+    rng = np.random.default_rng(rng)
+    arrays = _right_canonicalize(arrays)
+    last = max(sites)
+    samples = np.empty((shots, last + 1), dtype=np.int64)
+
+    batch_size = max(1, _MPS_SAMPLING_MEMORY // max(a.shape[2] for a in arrays[: last + 1]))
+    for start in range(0, shots, batch_size):
+        num_samples = min(batch_size, shots - start)
+        rows = np.arange(num_samples)
+        env = np.ones((num_samples, 1), dtype=arrays[0].dtype)
+        for site in range(last + 1):
+            branches = np.einsum("sl,lpr->spr", env, arrays[site])
+            probs = np.sum(np.abs(branches) ** 2, axis=2)
+            thresholds = rng.random(num_samples) * np.sum(probs, axis=1)
+            outcomes = (thresholds < probs[:, 1]).astype(np.int64)
+            samples[start : start + num_samples, site] = outcomes
+            env = branches[rows, outcomes] / np.sqrt(probs[rows, outcomes])[:, np.newaxis]
+
+    return samples[:, sites]
+
+
 @simulator_tracking
 @single_tape_support
 class DefaultTensor(Device):
@@ -199,9 +305,11 @@ class DefaultTensor(Device):
     The backend uses the ``quimb`` library to perform the tensor network operations, and different methods can be used to simulate the quantum circuit.
     The supported methods are Matrix Product State (MPS) and Tensor Network (TN).
 
-    This device does not currently support finite-shots or differentiation with ``diff_method`` set to ``"backprop"``, ``"adjoint"``, or ``"device"``. `Other differentiation methods <https://docs.pennylane.ai/en/stable/code/qml_gradients.html>`_ such as
+    This device does not currently support differentiation with ``diff_method`` set to ``"backprop"``, ``"adjoint"``, or ``"device"``. `Other differentiation methods <https://docs.pennylane.ai/en/stable/code/qml_gradients.html>`_ such as
     ``parameter-shift`` and ``hadamard_grad`` are compatible with all devices, including ``default.tensor``.
-    At present, the supported measurement types are expectation values, variances, and state measurements.
+    At present, the supported analytic measurement types are expectation values, variances, and state measurements.
+    With finite shots, samples, counts, probabilities, expectation values and variances are computed from samples drawn directly from the
+    tensor network, with perfect sampling of the MPS for the MPS method and with marginal sampling for the TN method.
     Finally, ``UserWarnings`` from the ``cotengra`` package may appear when using this device.
 
     Args:
@@ -210,6 +318,13 @@ class DefaultTensor(Device):
             (e.g., ``['aux_wire', 'q1', 'q2']``).
         method (str): Supported method. The supported methods are ``"mps"`` (Matrix Product State) and ``"tn"`` (Tensor Network).
         c_dtype (type): Complex data type for the tensor representation. Must be one of ``numpy.complex64`` or ``numpy.complex128``.
+        shots (int, Sequence[int], Sequence[Union[int, Sequence[int]]]): The default number of shots to use in executions involving
+            this device.
+        seed (Union[str, None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+            seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``, or
+            a request to seed from numpy's global random number generator.
+            The default, ``seed="global"`` pulls a seed from NumPy's global generator. ``seed=None``
+            will pull a seed from the OS entropy.
         **kwargs: Keyword arguments for the device, passed to the ``quimb`` backend.
 
     Keyword Args:
@@ -223,6 +338,10 @@ class DefaultTensor(Device):
             For the TN method, the options are ``"auto-split-gate"``, ``"split-gate"``, ``"reduce-split"``, ``"swap-split-gate"``, ``"split"``, ``True``, and ``False``.
             For details, see the `quimb's tensor_core documentation <https://quimb.readthedocs.io/en/latest/autoapi/quimb/tensor/tensor_core/index.html#quimb.tensor.tensor_core.tensor_network_gate_inds>`_.
             Default is ``"auto-split-gate"``.
+        prefix_cache_size (int): The number of states after a common prefix of operations that are
+            kept across executions, so that circuits starting with the same operations as a previous
+            execution only simulate their remaining operations. Setting it to ``0`` disables the
+            cache. Default is ``8``.
         contraction_optimizer (str): The contraction path optimizer to use for the computation of local expectation values.
             For more information on the optimizer options accepted by ``quimb``, see the
             `quimb's tensor_contract documentation <https://quimb.readthedocs.io/en/latest/autoapi/quimb/tensor/tensor_core/index.html#quimb.tensor.tensor_core.tensor_contract>`_.
@@ -378,13 +497,17 @@ class DefaultTensor(Device):
         "local_simplify",
         "max_bond_dim",
         "method",
+        "prefix_cache_size",
     )
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         wires=None,
         method="mps",
         c_dtype=np.complex128,
+        shots=None,
+        seed="global",
         **kwargs,
     ) -> None:
         if not has_quimb:
@@ -403,10 +526,12 @@ class DefaultTensor(Device):
                 f"Unsupported type: {c_dtype}. Supported types are numpy.complex64 and numpy.complex128."
             )
 
-        super().__init__(wires=wires, shots=None)
+        super().__init__(wires=wires, shots=shots)
 
         self._method = method
         self._c_dtype = c_dtype
+        seed = np.random.randint(0, high=10000000) if seed == "global" else seed
+        self._rng = np.random.default_rng(seed)
 
         # options for MPS
         self._max_bond_dim = kwargs.get("max_bond_dim", None)
@@ -417,6 +542,14 @@ class DefaultTensor(Device):
 
         # options for both MPS and TN
         self._contraction_optimizer = kwargs.get("contraction_optimizer", "auto-hq")
+        self._prefix_cache_size = kwargs.get("prefix_cache_size", 8)
+        if self._prefix_cache_size < 0:
+            raise ValueError(
+                "prefix_cache_size must be a non-negative integer, "
+                f"got {self._prefix_cache_size}."
+            )
+        # the states after the operation prefixes of previous executions, see ``_restore_prefix``
+        self._prefix_cache = OrderedDict()
         self._contract = None
 
         if method == "mps":
@@ -431,12 +564,6 @@ class DefaultTensor(Device):
         # that access it as soon as the device is created before running a circuit.
         self._quimb_circuit = self._initial_quimb_circuit(self.wires)
 
-        shots = kwargs.pop("shots", None)
-        if shots is not None:
-            raise qml.DeviceError(
-                "default.tensor only supports analytic simulations with shots=None."
-            )
-
         for arg in kwargs:
             if arg not in self._device_options:
                 raise TypeError(
@@ -625,7 +752,6 @@ class DefaultTensor(Device):
 
         This device currently:
 
-        * Does not support finite shots.
         * Does not support derivatives.
         * Does not support vector-Jacobian products.
         """
@@ -663,7 +789,8 @@ class DefaultTensor(Device):
             TensorLike, tuple[TensorLike], tuple[tuple[TensorLike]]: A numeric result of the computation.
         """
 
-        results = []
+        rng = execution_config.device_options.get("rng", self._rng)
+        mapped_circuits = []
         for circuit in circuits:
             if self.wires is not None and not self.wires.contains_wires(circuit.wires):
                 # quimb raises a cryptic error if the circuit has wires that are not in the device,
@@ -673,56 +800,180 @@ class DefaultTensor(Device):
                     f"Circuit has wires {circuit.wires.tolist()}. "
                     f"Tensor on device has wires {self.wires.tolist()}"
                 )
-            circuit = circuit.map_to_standard_wires()
-            results.append(self.simulate(circuit))
+            mapped_circuits.append(circuit.map_to_standard_wires())
 
-        return tuple(results)
+        return self.simulate_batch(mapped_circuits, rng=rng)
 
-    def simulate(self, circuit: QuantumScript) -> Result:
+    def simulate(self, circuit: QuantumScript, rng=None) -> Result:
         """Simulate a single quantum script. This function assumes that all operations provide matrices.
 
         Args:
             circuit (QuantumScript): The single circuit to simulate.
+            rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+                seed-like parameter for ``numpy.random.default_rng`` used to draw the samples of
+                circuits with finite shots.
 
         Returns:
             Tuple[TensorLike]: The results of the simulation.
         """
+        return self.simulate_batch([circuit], rng=rng)[0]
+
+    def simulate_batch(self, circuits: list[QuantumScript], rng=None) -> ResultBatch:
+        """Simulate a batch of quantum scripts, sharing the simulation of their common operation
+        prefixes.
+
+        The operations of the circuits are arranged in a prefix tree, so that operations shared
+        by the beginning of several circuits, such as those of the shifted circuits of a gradient,
+        are applied only once. The tree is traversed depth first, and the state at a branching
+        point is copied for every branch but the one with the most circuits, which continues with
+        the state itself. The number of states held at once is therefore logarithmic in the
+        number of circuits. The state after the longest prefix common to all circuits is also
+        kept in a least-recently-used cache of ``prefix_cache_size`` states, from which later
+        executions with the same prefix resume.
 
-        # The state is reset every time a new circuit is executed, and number of wires
+        Args:
+            circuits (list[QuantumScript]): The circuits to simulate.
+            rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A
+                seed-like parameter for ``numpy.random.default_rng`` used to draw the samples of
+                circuits with finite shots.
+
+        Returns:
+            tuple: The results of the simulation of each circuit.
+        """
+        rng = np.random.default_rng(rng)
+        results = [None] * len(circuits)
+        # The state is reset for every circuit, and the number of wires
         # is established at runtime to match the circuit if not provided.
-        wires = circuit.wires if self.wires is None else self.wires
-        operations = copy.deepcopy(circuit.operations)
-        if operations and isinstance(operations[0], qml.BasisState):
-            op = operations.pop(0)
-            self._quimb_circuit = self._initial_quimb_circuit(
+        roots = {}
+        for idx, circuit in enumerate(circuits):
+            wires = circuit.wires if self.wires is None else self.wires
+            operations = list(circuit.operations)
+            prep = None
+            if operations and isinstance(operations[0], (qml.BasisState, qml.StatePrep)):
+                prep = operations.pop(0)
+            root_key = (tuple(wires), None if prep is None else _operator_key(prep))
+            if root_key not in roots:
+                roots[root_key] = (_PrefixNode(), wires, prep)
+            node = roots[root_key][0]
+            node.size += 1
+            for op in operations:
+                node = node.children.setdefault(_operator_key(op), _PrefixNode(op))
+                node.size += 1
+            node.circuits.append(idx)
+
+        last_state = None
+        for root_key, (root, wires, prep) in roots.items():
+            node, quimb_circuit = self._restore_prefix(root_key, root, wires, prep)
+            last_state = self._simulate_prefix_tree(
+                node, quimb_circuit, circuits, results, rng, last_state
+            )
+
+        self._quimb_circuit = last_state
+        return tuple(results)
+
+    def _initial_state(self, wires: qml.wires.Wires, prep=None):
+        """Create the quimb circuit in the state prepared by ``prep``, or in the zero state."""
+        if isinstance(prep, qml.BasisState):
+            return self._initial_quimb_circuit(
                 wires,
                 psi0=self._initial_mps(
-                    op.wires,
+                    prep.wires,
                     basis_state="".join(
-                        str(int(b)) for b in op.parameters[0].astype(self._c_dtype)
+                        str(int(b)) for b in prep.parameters[0].astype(self._c_dtype)
                     ),
                 ),
             )
-        elif operations and isinstance(operations[0], qml.StatePrep):
-            op = operations.pop(0)
-            self._quimb_circuit = self._initial_quimb_circuit(
+        if isinstance(prep, qml.StatePrep):
+            return self._initial_quimb_circuit(
                 wires,
                 psi0=qtn.MatrixProductState.from_dense(
-                    op.state_vector(wire_order=wires).astype(self._c_dtype)
+                    prep.state_vector(wire_order=wires).astype(self._c_dtype)
                 ),
             )
-        else:
-            self._quimb_circuit = self._initial_quimb_circuit(wires)
+        return self._initial_quimb_circuit(wires)
+
+    def _restore_prefix(self, root_key, root, wires, prep) -> tuple:
+        """Simulate the operations shared by all circuits of a prefix tree, resuming from the
+        longest of them cached by previous executions.
+
+        Returns:
+            tuple[_PrefixNode, CircuitMPS or Circuit]: the node at the end of the common
+            operations, at which the circuits branch or end, and the state after them
+        """
+        # the nodes of the operations shared by all circuits, and the keys of their prefixes
+        chain, prefix_keys, hashes = [root], [root_key], [hash(root_key)]
+        while len(chain[-1].children) == 1 and not chain[-1].circuits:
+            key, child = next(iter(chain[-1].children.items()))
+            chain.append(child)
+            prefix_keys.append(key)
+            hashes.append(hash((hashes[-1], key)))
+
+        depth, quimb_circuit = 0, None
+        for i in range(len(chain) - 1, 0, -1):
+            cached = self._prefix_cache.get(hashes[i])
+            if cached is not None and cached[0] == tuple(prefix_keys[: i + 1]):
+                self._prefix_cache.move_to_end(hashes[i])
+                depth, quimb_circuit = i, cached[1].copy()
+                break
+
+        if quimb_circuit is None:
+            quimb_circuit = self._initial_state(wires, prep)
+        self._quimb_circuit = quimb_circuit
+        for node in chain[depth + 1 :]:
+            self._apply_operation(node.op)
+
+        end = len(chain) - 1
+        if self._prefix_cache_size > 0 and end > depth:
+            self._prefix_cache[hashes[end]] = (tuple(prefix_keys), quimb_circuit.copy())
+            while len(self._prefix_cache) > self._prefix_cache_size:
+                self._prefix_cache.popitem(last=False)
+
+        return chain[-1], quimb_circuit
+
+    # pylint: disable=too-many-arguments
+    def _simulate_prefix_tree(self, node, quimb_circuit, circuits, results, rng, last_state):
+        """Simulate the circuits of a prefix tree from the state at its root ``node``.
+
+        Branches are simulated on copies of the state, in increasing order of their number of
+        circuits, and the largest branch continues with the state itself.
 
-        for op in operations:
-            self._apply_operation(op)
+        Returns:
+            CircuitMPS or Circuit: the final state of the last circuit of the batch, or
+            ``last_state`` if it is not part of the tree
+        """
+        while True:
+            self._quimb_circuit = quimb_circuit
+            for idx in node.circuits:
+                results[idx] = self._measure(circuits[idx], rng)
+                if idx == len(circuits) - 1:
+                    last_state = quimb_circuit.copy()
+            if not node.children:
+                return last_state
+
+            *branches, largest = sorted(node.children.values(), key=lambda child: child.size)
+            for child in branches:
+                self._quimb_circuit = quimb_circuit.copy()
+                self._apply_operation(child.op)
+                last_state = self._simulate_prefix_tree(
+                    child, self._quimb_circuit, circuits, results, rng, last_state
+                )
+            self._quimb_circuit = quimb_circuit
+            self._apply_operation(largest.op)
+            node = largest
 
+    def _measure(self, circuit: QuantumScript, rng) -> Result:
+        """Compute the measurements of a circuit from the current state."""
         if not circuit.shots:
             if len(circuit.measurements) == 1:
                 return self.measurement(circuit.measurements[0])
             return tuple(self.measurement(mp) for mp in circuit.measurements)
 
-        raise NotImplementedError  # pragma: no cover
+        results = self.measure_with_samples(circuit.measurements, circuit.shots, rng=rng)
+        if len(circuit.measurements) == 1:
+            if circuit.shots.has_partitioned_shots:
+                return tuple(res[0] for res in results)
+            return results[0]
+        return results
 
     def _apply_operation(self, op: qml.operation.Operator) -> None:
         """Apply a single operator to the circuit.
@@ -843,6 +1094,140 @@ class DefaultTensor(Device):
 
         return float(np.real(exp_val))
 
+    def measure_with_samples(
+        self, measurements: list[SampleMeasurement], shots: Shots, rng=None
+    ) -> tuple:
+        """Compute sample-based measurements from samples of the current state.
+
+        The measurements are grouped as in ``default.qubit``, so that measurements with
+        qubit-wise commuting observables share the same samples. For each group, the diagonalizing
+        gates are applied to a copy of the circuit, and the outcomes on the measured wires are
+        sampled with :func:`~.sample_mps` for the MPS method, or from the marginal distributions
+        of the exact tensor network for the TN method.
+
+        Args:
+            measurements (list[SampleMeasurement]): the measurements to compute
+            shots (Shots): the number of shots
+            rng (numpy.random.Generator): the random number generator used to draw the samples
+
+        Returns:
+            tuple[TensorLike]: the measurement results, with the shot vector axis before the
+            measurement axis for partitioned shots
+        """
+        groups, indices = _group_measurements(list(measurements))
+        all_res = []
+        for group in groups:
+            if isinstance(group[0], ExpectationMP) and isinstance(group[0].obs, Sum):
+                all_res.append(self._measure_sum_with_samples(group[0], shots, rng))
+            else:
+                all_res.extend(self._measure_group_with_samples(group, shots, rng))
+
+        flat_indices = [_i for i in indices for _i in i]
+        sorted_res = tuple(
+            res for _, res in sorted(enumerate(all_res), key=lambda r: flat_indices[r[0]])
+        )
+
+        # put the shot vector axis before the measurement axis
+        if shots.has_partitioned_shots:
+            sorted_res = tuple(zip(*sorted_res))
+
+        return sorted_res
+
+    def _measure_sum_with_samples(self, mp: ExpectationMP, shots: Shots, rng) -> TensorLike:
+        """Measure the expectation value of a sum by measuring each of its terms separately."""
+        coeffs, ops = mp.obs.terms()
+        results = tuple(
+            sum(
+                c * res
+                for c, res in zip(
+                    coeffs,
+                    self.measure_with_samples([ExpectationMP(o) for o in ops], Shots(s), rng),
+                )
+            )
+            for s in shots
+        )
+        return results if shots.has_partitioned_shots else results[0]
+
+    def _measure_group_with_samples(
+        self, mps: list[SampleMeasurement], shots: Shots, rng
+    ) -> list[TensorLike]:
+        """Measure a group of measurements that can be computed from the same samples."""
+        if len(mps) == 1:
+            diagonalizing_gates = mps[0].diagonalizing_gates()
+        elif all(mp.obs for mp in mps):
+            diagonalizing_gates = qml.pauli.diagonalize_qwc_pauli_words([mp.obs for mp in mps])[0]
+        else:
+            diagonalizing_gates = []
+
+        quimb_circuit = self._quimb_circuit
+        if diagonalizing_gates:
+            quimb_circuit = quimb_circuit.copy()
+            for op in diagonalizing_gates:
+                quimb_circuit.apply_gate(
+                    qml.matrix(op).astype(self._c_dtype), *op.wires, parametrize=None
+                )
+
+        if any(len(mp.wires) == 0 for mp in mps):
+            wires = list(range(quimb_circuit.N))
+        else:
+            wires = sorted(set().union(*(mp.wires.tolist() for mp in mps)))
+
+        if self.method == "mps":
+            samples = sample_mps(_mps_arrays(quimb_circuit.psi), wires, shots.total_shots, rng)
+        else:
+            samples = self._sample_marginals(quimb_circuit, wires, shots.total_shots, rng)
+
+        wire_order = qml.wires.Wires(wires)
+        processed_samples = []
+        for lower, upper in shots.bins():
+            processed = []
+            for mp in mps:
+                res = mp.process_samples(samples[lower:upper], wire_order)
+                processed.append(res if isinstance(mp, CountsMP) else qml.math.squeeze(res))
+            processed_samples.append(tuple(processed))
+
+        if shots.has_partitioned_shots:
+            return list(zip(*processed_samples))
+        return list(processed_samples[0])
+
+    def _sample_marginals(self, quimb_circuit, wires: list[int], shots: int, rng) -> np.ndarray:
+        """Sample the outcomes on ``wires`` from the marginal distributions of a tensor network.
+
+        The wires are sampled in groups of ``_MARGINAL_GROUP_SIZE``, each from its marginal
+        distribution conditioned on the outcomes of the previous groups. The samples that share
+        the same previous outcomes are drawn together from a single marginal distribution, so the
+        number of contractions is bounded by the number of distinct outcomes instead of the
+        number of shots.
+        """
+        samples = np.empty((shots, len(wires)), dtype=np.int64)
+        # the rows of the samples for each distinct outcome on the previous groups of wires
+        prefixes = {(): np.arange(shots)}
+
+        for start in range(0, len(wires), _MARGINAL_GROUP_SIZE):
+            group = wires[start : start + _MARGINAL_GROUP_SIZE]
+            powers = 2 ** np.arange(len(group) - 1, -1, -1)
+            new_prefixes = {}
+            for prefix, rows in prefixes.items():
+                fix = {w: str(b) for w, b in zip(wires[:start], prefix)}
+                probs = quimb_circuit.compute_marginal(
+                    group,
+                    fix=fix or None,
+                    optimize=self._contraction_optimizer,
+                    dtype=self._c_dtype.__name__,
+                    simplify_sequence=self._local_simplify,
+                    simplify_atol=0.0,
+                )
+                probs = np.maximum(np.real(np.asarray(probs)).ravel(), 0)
+                outcomes = rng.choice(len(probs), size=len(rows), p=probs / np.sum(probs))
+                bits = (outcomes[:, np.newaxis] // powers) % 2
+                samples[rows, start : start + len(group)] = bits
+                for outcome in np.unique(outcomes):
+                    selected = outcomes == outcome
+                    new_prefixes[prefix + tuple(bits[selected][0])] = rows[selected]
+            prefixes = new_prefixes
+
+        return samples
+
     # pylint: disable=unused-argument
     def supports_derivatives(
         self,
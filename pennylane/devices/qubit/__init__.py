@@ -23,11 +23,17 @@ at your own discretion.
 
     create_initial_state
     apply_operation
+    apply_operation_inplace
+    fuse_operations
     measure
+    measure_pauli_expvals
     measure_with_samples
+    pauli_word_expvals
     sample_probs
     sample_state
     simulate
+    simulate_trajectories
+    apply_channel_trajectories
     adjoint_jacobian
     adjoint_jvp
     adjoint_vjp
@@ -35,7 +41,10 @@ at your own discretion.
 
 from .adjoint_jacobian import adjoint_jacobian, adjoint_jvp, adjoint_vjp
 from .apply_operation import apply_operation
+from .apply_operation_inplace import apply_operation_inplace
+from .gate_fusion import fuse_operations
 from .initialize_state import create_initial_state
-from .measure import measure
+from .measure import measure, measure_pauli_expvals, pauli_word_expvals
 from .sampling import measure_with_samples, sample_probs, sample_state
 from .simulate import get_final_state, measure_final_state, simulate
+from .trajectories import apply_channel_trajectories, simulate_trajectories
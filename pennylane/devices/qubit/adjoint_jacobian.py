@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Functions to apply adjoint jacobian differentiation"""
+
 import logging
 from numbers import Number
 
@@ -19,7 +20,6 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.logging import debug_logger
-from pennylane.operation import operation_derivative
 from pennylane.tape import QuantumScript
 
 from .apply_operation import apply_operation
@@ -39,6 +39,173 @@ def _dot_product_real(bra, ket, num_wires):
     return qml.math.real(qml.math.sum(qml.math.conj(bra) * ket, axis=sum_axes))
 
 
+_pauli_ops = {"X": qml.X, "Y": qml.Y, "Z": qml.Z}
+
+
+def _rot_expansion(op):
+    """``Rot(phi, theta, omega) = RZ(omega) RY(theta) RZ(phi)``"""
+    phi, theta, omega = op.data
+    wires = op.wires
+    return [(qml.RZ(phi, wires), 0, 1), (qml.RY(theta, wires), 1, 1), (qml.RZ(omega, wires), 2, 1)]
+
+
+def _u2_expansion(op):
+    """``U2(phi, delta) = PhaseShift(phi) PhaseShift(delta) Rot(delta, pi/2, -delta)``"""
+    phi, delta = op.data
+    wires = op.wires
+    return [
+        (qml.RZ(delta, wires), 1, 1),
+        (qml.RY(np.pi / 2, wires), None, 1),
+        (qml.RZ(-delta, wires), 1, -1),
+        (qml.PhaseShift(delta, wires), 1, 1),
+        (qml.PhaseShift(phi, wires), 0, 1),
+    ]
+
+
+def _u3_expansion(op):
+    """``U3(theta, phi, delta) = PhaseShift(phi) PhaseShift(delta) Rot(delta, theta, -delta)``"""
+    theta, phi, delta = op.data
+    wires = op.wires
+    return [
+        (qml.RZ(delta, wires), 2, 1),
+        (qml.RY(theta, wires), 0, 1),
+        (qml.RZ(-delta, wires), 2, -1),
+        (qml.PhaseShift(delta, wires), 2, 1),
+        (qml.PhaseShift(phi, wires), 1, 1),
+    ]
+
+
+# Multi-parameter operations differentiated natively. Each function returns a sequence of
+# ``(gate, param_idx, factor)`` whose product is the operation, where ``gate`` is either
+# constant (``param_idx=None``) or has a generator and the parameter ``factor * op.data[param_idx]``.
+multi_parameter_expansions = {qml.Rot: _rot_expansion, qml.U2: _u2_expansion, qml.U3: _u3_expansion}
+
+
+def _derivative_expansion(op, first_param, trainable_idx):
+    """Split an operation into gates with at most one trainable parameter each.
+
+    Args:
+        op (Operator): the operation
+        first_param (int): tape index of the first parameter of ``op``
+        trainable_idx (dict[int, int]): map from the tape index of the trainable
+            parameters to their position in ``tape.trainable_params``
+
+    Returns:
+        list[tuple[Operator, Union[int, None], float]]: sequence of gates in the order they are
+        applied, together with the position of their parameter in the trainable parameters (or
+        ``None`` if constant) and the derivative of their parameter with respect to it
+    """
+    op_params = [trainable_idx.get(first_param + i) for i in range(op.num_params)]
+    if all(idx is None for idx in op_params):
+        return [(op, None, 1)]
+    if op.num_params == 1:
+        return [(op, op_params[0], 1)]
+    return [
+        (gate, None if param is None else op_params[param], factor)
+        for gate, param, factor in multi_parameter_expansions[type(op)](op)
+    ]
+
+
+def _apply_generator(op, state):
+    r"""Apply :math:`iG` to a state, where :math:`G` is the generator of ``op``.
+
+    For :math:`U(\theta) = e^{i\theta G}`, this gives :math:`\partial_\theta U |\psi\rangle`
+    from :math:`U|\psi\rangle` without building the matrix of the derivative. Pauli generators are
+    applied one Pauli operator at a time.
+    """
+    generator = qml.generator(op, format="observable")
+    pauli_rep = generator.pauli_rep
+    if pauli_rep is None:
+        return 1j * apply_operation(generator, state)
+
+    result = 0
+    for pw, coeff in pauli_rep.items():
+        term = state
+        for wire, pauli in pw.items():
+            term = apply_operation(_pauli_ops[pauli](wire), term)
+        result = result + coeff * term
+    return 1j * result
+
+
+def _tape_gates(tape):
+    """The operations of a tape after its state preparation, split into gates with at most one
+    trainable parameter each by :func:`_derivative_expansion`."""
+    trainable_idx = {p: i for i, p in enumerate(tape.trainable_params)}
+    param_number = sum(op.num_params for op in tape.operations[: tape.num_preps])
+
+    gates = []
+    for op in tape.operations[tape.num_preps :]:
+        if not isinstance(op, qml.Snapshot):
+            gates.extend(_derivative_expansion(op, param_number, trainable_idx))
+        param_number += op.num_params
+    return gates
+
+
+def _checkpoint_interval(num_gates, state_nbytes, max_checkpoint_bytes):
+    r"""The checkpoint interval :math:`k = \lceil \sqrt{n} \rceil` for :math:`n` gates, which
+    stores the fewest states, or ``None`` if these states do not fit into ``max_checkpoint_bytes``.
+    """
+    if max_checkpoint_bytes < 0:
+        raise ValueError(
+            f"max_checkpoint_bytes must be a non-negative integer, got {max_checkpoint_bytes}."
+        )
+    if num_gates == 0:
+        return None
+    interval = int(np.ceil(np.sqrt(num_gates)))
+    num_states = -(-num_gates // interval) + interval
+    return interval if num_states * state_nbytes <= max_checkpoint_bytes else None
+
+
+def _reversed_kets(tape, gates, ket, checkpoint_interval=None, max_checkpoint_bytes=None):
+    r"""Yield the state after every gate, from the last gate to the first one.
+
+    Without checkpointing, the states are obtained by applying the adjoint of every gate to the
+    final state. With a ``checkpoint_interval`` of :math:`k`, the state before every :math:`k`-th
+    gate is stored during a forward pass, and the states of each segment of :math:`k` gates are
+    recomputed from its checkpoint during the reverse sweep. At most
+    :math:`\lceil n / k \rceil + k` states are stored at once for :math:`n` gates, and the states
+    are never obtained by undoing gates.
+
+    If only ``max_checkpoint_bytes`` is provided, the interval that stores the fewest states is
+    used if these states fit into the budget, and the states are obtained by undoing gates
+    otherwise.
+    """
+    if checkpoint_interval is None and max_checkpoint_bytes is not None:
+        checkpoint_interval = _checkpoint_interval(
+            len(gates), np.asarray(ket).nbytes, max_checkpoint_bytes
+        )
+
+    if checkpoint_interval is None:
+        for gate, _, _ in reversed(gates):
+            yield ket
+            ket = apply_operation(qml.adjoint(gate), ket)
+        return
+
+    if checkpoint_interval < 1:
+        raise ValueError(
+            f"checkpoint_interval must be a positive integer, got {checkpoint_interval}."
+        )
+
+    preps = tape.operations[: tape.num_preps]
+    state = create_initial_state(tape.wires, preps[0] if preps else None)
+    for prep in preps[1:]:
+        state = apply_operation(prep, state)
+
+    checkpoints = []
+    for i, (gate, _, _) in enumerate(gates):
+        if i % checkpoint_interval == 0:
+            checkpoints.append(state)
+        state = apply_operation(gate, state)
+
+    for start in reversed(range(0, len(gates), checkpoint_interval)):
+        state = checkpoints.pop()
+        segment = []
+        for gate, _, _ in gates[start : start + checkpoint_interval]:
+            state = apply_operation(gate, state)
+            segment.append(state)
+        yield from reversed(segment)
+
+
 def _adjoint_jacobian_state(tape: QuantumScript):
     """Calculate the full jacobian for a circuit that returns the state.
 
@@ -50,30 +217,30 @@ def _adjoint_jacobian_state(tape: QuantumScript):
 
     See ``adjoint_jacobian.md`` for details on the algorithm.
     """
-    jacobian = []
+    jacobian = {}
 
     has_state_prep = isinstance(tape[0], qml.operation.StatePrepBase)
     state = create_initial_state(tape.wires, tape[0] if has_state_prep else None)
+    trainable_idx = {p: i for i, p in enumerate(tape.trainable_params)}
 
-    param_idx = has_state_prep
+    param_idx = int(has_state_prep)
     for op in tape.operations[has_state_prep:]:
-        jacobian = [apply_operation(op, jac) for jac in jacobian]
+        for gate, idx, factor in _derivative_expansion(op, param_idx, trainable_idx):
+            jacobian = {i: apply_operation(gate, jac) for i, jac in jacobian.items()}
+            state = apply_operation(gate, state)
 
-        if op.num_params == 1:
-            if param_idx in tape.trainable_params:
-                d_op_matrix = operation_derivative(op)
-                jacobian.append(
-                    apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), state)
-                )
+            if idx is not None:
+                jacobian[idx] = jacobian.get(idx, 0) + factor * _apply_generator(gate, state)
 
-            param_idx += 1
-        state = apply_operation(op, state)
+        param_idx += op.num_params
 
-    return tuple(jac.flatten() for jac in jacobian)
+    return tuple(jacobian[i].flatten() for i in sorted(jacobian))
 
 
 @debug_logger
-def adjoint_jacobian(tape: QuantumScript, state=None):
+def adjoint_jacobian(
+    tape: QuantumScript, state=None, checkpoint_interval=None, max_checkpoint_bytes=None
+):
     """Implements the adjoint method outlined in
     `Jones and Gacon <https://arxiv.org/abs/2009.02823>`__ to differentiate an input tape.
 
@@ -94,6 +261,15 @@ def adjoint_jacobian(tape: QuantumScript, state=None):
         tape (QuantumTape): circuit that the function takes the gradient of
         state (TensorLike): the final state of the circuit; if not provided,
             the final state will be computed by executing the tape
+        checkpoint_interval (int): if provided, the state is stored before every
+            ``checkpoint_interval`` gates in a forward pass, and the states needed by the reverse
+            sweep are recomputed from these checkpoints instead of by applying adjoint gates.
+            This bounds the number of stored states by ``n_gates / checkpoint_interval +
+            checkpoint_interval`` and avoids accumulating rounding errors on deep circuits.
+        max_checkpoint_bytes (int): if provided without a ``checkpoint_interval``, the interval
+            is chosen as the square root of the number of gates, which stores the fewest states,
+            provided that these states fit into ``max_checkpoint_bytes`` bytes. Otherwise, the
+            reverse sweep applies adjoint gates.
 
     Returns:
         array or tuple[array]: the derivative of the tape with respect to trainable parameters.
@@ -115,25 +291,15 @@ def adjoint_jacobian(tape: QuantumScript, state=None):
 
     jac = np.zeros((len(tape.observables), len(tape.trainable_params)))
 
-    param_number = len(tape.get_parameters(trainable_only=False, operations_only=True)) - 1
-    trainable_param_number = len(tape.trainable_params) - 1
-    for op in reversed(tape.operations[tape.num_preps :]):
-        if isinstance(op, qml.Snapshot):
-            continue
-        adj_op = qml.adjoint(op)
-        ket = apply_operation(adj_op, ket)
-
-        if op.num_params == 1:
-            if param_number in tape.trainable_params:
-                d_op_matrix = operation_derivative(op)
-                ket_temp = apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
-                jac[:, trainable_param_number] = _dot_product_real(bras, ket_temp, len(tape.wires))
-
-                trainable_param_number -= 1
-            param_number -= 1
+    gates = _tape_gates(tape)
+    kets = _reversed_kets(tape, gates, ket, checkpoint_interval, max_checkpoint_bytes)
+    for (gate, idx, factor), ket in zip(reversed(gates), kets):
+        if idx is not None:
+            ket_temp = _apply_generator(gate, ket)
+            jac[:, idx] += factor * _dot_product_real(bras, ket_temp, len(tape.wires))
 
-        for kk in range(n_obs):
-            bras[kk, ...] = apply_operation(adj_op, bras[kk, ...])
+        # all the bras are updated at once as a batched state
+        bras = apply_operation(qml.adjoint(gate), bras, is_state_batched=True)
 
     # Post-process the Jacobian matrix for the new return
     jac = np.squeeze(jac)
@@ -149,7 +315,13 @@ def adjoint_jacobian(tape: QuantumScript, state=None):
 
 
 @debug_logger
-def adjoint_jvp(tape: QuantumScript, tangents: tuple[Number], state=None):
+def adjoint_jvp(
+    tape: QuantumScript,
+    tangents: tuple[Number],
+    state=None,
+    checkpoint_interval=None,
+    max_checkpoint_bytes=None,
+):
     """The jacobian vector product used in forward mode calculation of derivatives.
 
     Implements the adjoint method outlined in
@@ -171,6 +343,11 @@ def adjoint_jvp(tape: QuantumScript, tangents: tuple[Number], state=None):
         tangents (Tuple[Number]): gradient vector for input parameters.
         state (TensorLike): the final state of the circuit; if not provided,
             the final state will be computed by executing the tape
+        checkpoint_interval (int): if provided, the states of the reverse sweep are recomputed
+            from checkpoints stored every ``checkpoint_interval`` gates, as in
+            :func:`~.adjoint_jacobian`
+        max_checkpoint_bytes (int): if provided without a ``checkpoint_interval``, the memory
+            budget of the checkpoints, as in :func:`~.adjoint_jacobian`
 
     Returns:
         Tuple[Number]: gradient vector for output parameters
@@ -188,33 +365,19 @@ def adjoint_jvp(tape: QuantumScript, tangents: tuple[Number], state=None):
     for i, obs in enumerate(tape.observables):
         bras[i] = apply_operation(obs, ket)
 
-    param_number = len(tape.get_parameters(trainable_only=False, operations_only=True)) - 1
-    trainable_param_number = len(tape.trainable_params) - 1
-
     tangents_out = np.zeros(n_obs)
 
-    for op in reversed(tape.operations[tape.num_preps :]):
-        adj_op = qml.adjoint(op)
-        ket = apply_operation(adj_op, ket)
-
-        if op.num_params == 1:
-            if param_number in tape.trainable_params:
-                # don't do anything if the tangent is 0
-                if not np.allclose(tangents[trainable_param_number], 0):
-                    d_op_matrix = operation_derivative(op)
-                    ket_temp = apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
-
-                    tangents_out += (
-                        2
-                        * _dot_product_real(bras, ket_temp, len(tape.wires))
-                        * tangents[trainable_param_number]
-                    )
-
-                trainable_param_number -= 1
-            param_number -= 1
+    gates = _tape_gates(tape)
+    kets = _reversed_kets(tape, gates, ket, checkpoint_interval, max_checkpoint_bytes)
+    for (gate, idx, factor), ket in zip(reversed(gates), kets):
+        # don't do anything if the tangent is 0
+        if idx is not None and not np.allclose(tangents[idx], 0):
+            ket_temp = _apply_generator(gate, ket)
+            tangents_out += (
+                2 * factor * _dot_product_real(bras, ket_temp, len(tape.wires)) * tangents[idx]
+            )
 
-        for i in range(n_obs):
-            bras[i] = apply_operation(adj_op, bras[i])
+        bras = apply_operation(qml.adjoint(gate), bras, is_state_batched=True)
 
     if n_obs == 1:
         return np.array(tangents_out[0])
@@ -323,7 +486,13 @@ def _get_vjp_bras(tape, cotangents, ket):
 
 
 @debug_logger
-def adjoint_vjp(tape: QuantumScript, cotangents: tuple[Number, ...], state=None):
+def adjoint_vjp(
+    tape: QuantumScript,
+    cotangents: tuple[Number, ...],
+    state=None,
+    checkpoint_interval=None,
+    max_checkpoint_bytes=None,
+):
     """The vector jacobian product used in reverse-mode differentiation.
 
     Implements the adjoint method outlined in
@@ -353,6 +522,11 @@ def adjoint_vjp(tape: QuantumScript, cotangents: tuple[Number, ...], state=None)
 
         state (TensorLike): the final state of the circuit; if not provided,
             the final state will be computed by executing the tape
+        checkpoint_interval (int): if provided, the states of the reverse sweep are recomputed
+            from checkpoints stored every ``checkpoint_interval`` gates, as in
+            :func:`~.adjoint_jacobian`
+        max_checkpoint_bytes (int): if provided without a ``checkpoint_interval``, the memory
+            budget of the checkpoints, as in :func:`~.adjoint_jacobian`
 
     Returns:
         Tuple[Number]: gradient vector for input parameters
@@ -384,35 +558,26 @@ def adjoint_vjp(tape: QuantumScript, cotangents: tuple[Number, ...], state=None)
         def real_if_expval(val):
             return np.real(val)
 
-    param_number = len(tape.get_parameters(trainable_only=False, operations_only=True)) - 1
-    trainable_param_number = len(tape.trainable_params) - 1
-
     res_shape = (
         (len(tape.trainable_params),)
         if batch_size is None
         else (len(tape.trainable_params), batch_size)
     )
-    cotangents_in = np.empty(res_shape, dtype=tape.measurements[0].numeric_type)
+    cotangents_in = np.zeros(res_shape, dtype=tape.measurements[0].numeric_type)
     summing_axis = None if batch_size is None else tuple(range(1, np.ndim(bras)))
 
-    for op in reversed(tape.operations[tape.num_preps :]):
-        adj_op = qml.adjoint(op)
-        ket = apply_operation(adj_op, ket)
-
-        if op.num_params == 1:
-            if param_number in tape.trainable_params:
-                d_op_matrix = operation_derivative(op)
-                ket_temp = apply_operation(qml.QubitUnitary(d_op_matrix, wires=op.wires), ket)
-
-                # Pad cotangent in with zeros for batch number with zero cotangents
-                cot_in = real_if_expval(np.sum(np.conj(bras) * ket_temp, axis=summing_axis))
-                for i in null_batch_indices:
-                    cot_in = np.insert(cot_in, i, 0.0)
-                cotangents_in[trainable_param_number] = cot_in
+    gates = _tape_gates(tape)
+    kets = _reversed_kets(tape, gates, ket, checkpoint_interval, max_checkpoint_bytes)
+    for (gate, idx, factor), ket in zip(reversed(gates), kets):
+        if idx is not None:
+            ket_temp = _apply_generator(gate, ket)
 
-                trainable_param_number -= 1
-            param_number -= 1
+            # Pad cotangent in with zeros for batch number with zero cotangents
+            cot_in = real_if_expval(np.sum(np.conj(bras) * ket_temp, axis=summing_axis))
+            for i in null_batch_indices:
+                cot_in = np.insert(cot_in, i, 0.0)
+            cotangents_in[idx] += factor * cot_in
 
-        bras = apply_operation(adj_op, bras, is_state_batched=bool(batch_size))
+        bras = apply_operation(qml.adjoint(gate), bras, is_state_batched=bool(batch_size))
 
     return tuple(cotangents_in)
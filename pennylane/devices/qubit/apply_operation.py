@@ -14,7 +14,7 @@
 """Functions to apply an operation to a state vector."""
 # pylint: disable=unused-argument, too-many-arguments
 
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from string import ascii_letters as alphabet
 
 import numpy as np
@@ -60,6 +60,24 @@ def _get_slice(index, axis, num_axes):
     return tuple(idx)
 
 
+@lru_cache(maxsize=1024)
+def _einsum_indices(total_indices: int, wires: tuple) -> str:
+    """Build the ``einsum`` subscripts for applying an operator on ``wires`` to a state with
+    ``total_indices`` non-batch dimensions. Cached since the same gate layouts are applied
+    repeatedly, both within a circuit and across executions."""
+    num_indices = len(wires)
+    state_indices = alphabet[:total_indices]
+    affected_indices = "".join(alphabet[i] for i in wires)
+
+    new_indices = alphabet[total_indices : total_indices + num_indices]
+
+    new_state_indices = state_indices
+    for old, new in zip(affected_indices, new_indices):
+        new_state_indices = new_state_indices.replace(old, new)
+
+    return f"...{new_indices}{affected_indices},...{state_indices}->...{new_state_indices}"
+
+
 def apply_operation_einsum(op: qml.operation.Operator, state, is_state_batched: bool = False):
     """Apply ``Operator`` to ``state`` using ``einsum``. This is more efficent at lower qubit
     numbers.
@@ -82,19 +100,7 @@ def apply_operation_einsum(op: qml.operation.Operator, state, is_state_batched:
 
     total_indices = len(state.shape) - is_state_batched
     num_indices = len(op.wires)
-
-    state_indices = alphabet[:total_indices]
-    affected_indices = "".join(alphabet[i] for i in op.wires)
-
-    new_indices = alphabet[total_indices : total_indices + num_indices]
-
-    new_state_indices = state_indices
-    for old, new in zip(affected_indices, new_indices):
-        new_state_indices = new_state_indices.replace(old, new)
-
-    einsum_indices = (
-        f"...{new_indices}{affected_indices},...{state_indices}->...{new_state_indices}"
-    )
+    einsum_indices = _einsum_indices(total_indices, tuple(op.wires))
 
     new_mat_shape = [2] * (num_indices * 2)
     dim = 2**num_indices
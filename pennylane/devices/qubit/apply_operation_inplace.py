@@ -0,0 +1,179 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Functions to apply operations to a NumPy state vector without allocating new states."""
+# pylint: disable=unused-argument
+from functools import singledispatch
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.measurements import MidMeasureMP
+from pennylane.ops import Conditional
+
+from .apply_operation import _einsum_indices, _get_slice
+
+
+def supports_inplace(op: qml.operation.Operator) -> bool:
+    """Whether ``op`` can be applied with :func:`~.apply_operation_inplace`.
+
+    Operations that depend on the state beyond a matrix multiplication, such as mid-circuit
+    measurements, postselection or snapshots, as well as broadcasted operations, are not
+    supported.
+    """
+    if isinstance(op, (MidMeasureMP, Conditional, qml.Projector, qml.Snapshot)):
+        return False
+    return op.batch_size is None and (op.has_matrix or len(op.wires) == 0)
+
+
+@singledispatch
+def apply_operation_inplace(op: qml.operation.Operator, state: np.ndarray, out: np.ndarray):
+    """Apply an operator to a NumPy state, writing the result into preallocated memory.
+
+    Args:
+        op (Operator): The operation to apply to ``state``. Must satisfy :func:`~.supports_inplace`.
+        state (numpy.ndarray): The starting state, with shape ``[2]*num_wires``. It may be
+            overwritten.
+        out (numpy.ndarray): A buffer with the same shape and dtype as ``state`` that may be
+            overwritten with the result. Must not share memory with ``state``.
+
+    Returns:
+        numpy.ndarray: the output state, which is either ``state`` or ``out``
+
+    Diagonal operations are applied to ``state`` in place, while other operations write their
+    result into ``out``. Callers should therefore keep two buffers and swap them whenever the
+    returned array is ``out``, so that the peak memory is twice the size of the state.
+
+    .. warning::
+
+        ``apply_operation_inplace`` is an internal function, and thus subject to change without a
+        deprecation cycle. It assumes that the wires of the operator correspond to indices of the
+        state and that neither ``state`` nor ``out`` is batched.
+
+    This is a ``functools.singledispatch`` function, so additional specialized kernels
+    for specific operations can be registered in the same way as for :func:`~.apply_operation`.
+
+    **Example:**
+
+    >>> state = np.zeros((2, 2), dtype=complex)
+    >>> state[0, 0] = 1
+    >>> out = np.empty_like(state)
+    >>> new_state = apply_operation_inplace(qml.X(0), state, out)
+    >>> new_state is out
+    True
+    >>> new_state
+    array([[0.+0.j, 0.+0.j],
+           [1.+0.j, 0.+0.j]])
+    """
+    mat = np.asarray(op.matrix(), dtype=state.dtype)
+    mat = np.reshape(mat, [2] * (2 * len(op.wires)))
+    return np.einsum(_einsum_indices(state.ndim, tuple(op.wires)), mat, state, out=out)
+
+
+@apply_operation_inplace.register
+def _apply_identity(op: qml.Identity, state, out):
+    return state
+
+
+@apply_operation_inplace.register
+def _apply_global_phase(op: qml.GlobalPhase, state, out):
+    state *= np.exp(-1j * op.data[0])
+    return state
+
+
+@apply_operation_inplace.register
+def _apply_paulix(op: qml.X, state, out):
+    axis = op.wires[0]
+    sl_0 = _get_slice(0, axis, state.ndim)
+    sl_1 = _get_slice(1, axis, state.ndim)
+    out[sl_0] = state[sl_1]
+    out[sl_1] = state[sl_0]
+    return out
+
+
+@apply_operation_inplace.register
+def _apply_cnot(op: qml.CNOT, state, out):
+    n_dim = state.ndim
+    control, target = op.wires
+    sl_0 = _get_slice(0, control, n_dim)
+    out[sl_0] = state[sl_0]
+
+    sl_10 = [slice(None)] * n_dim
+    sl_10[control], sl_10[target] = 1, 0
+    sl_11 = list(sl_10)
+    sl_11[target] = 1
+    out[tuple(sl_10)] = state[tuple(sl_11)]
+    out[tuple(sl_11)] = state[tuple(sl_10)]
+    return out
+
+
+@apply_operation_inplace.register
+def _apply_swap(op: qml.SWAP, state, out):
+    np.copyto(out, np.swapaxes(state, *op.wires))
+    return out
+
+
+def _apply_diagonal(state, axis, phase_0, phase_1):
+    """Multiply the slices of ``state`` along ``axis`` by the given phases in place."""
+    if phase_0 != 1:
+        state[_get_slice(0, axis, state.ndim)] *= phase_0
+    state[_get_slice(1, axis, state.ndim)] *= phase_1
+    return state
+
+
+@apply_operation_inplace.register
+def _apply_pauliz(op: qml.Z, state, out):
+    return _apply_diagonal(state, op.wires[0], 1, -1)
+
+
+@apply_operation_inplace.register
+def _apply_S(op: qml.S, state, out):
+    return _apply_diagonal(state, op.wires[0], 1, 1j)
+
+
+@apply_operation_inplace.register
+def _apply_T(op: qml.T, state, out):
+    return _apply_diagonal(state, op.wires[0], 1, np.exp(0.25j * np.pi))
+
+
+@apply_operation_inplace.register
+def _apply_phaseshift(op: qml.PhaseShift, state, out):
+    return _apply_diagonal(state, op.wires[0], 1, np.exp(1j * op.data[0]))
+
+
+@apply_operation_inplace.register
+def _apply_rz(op: qml.RZ, state, out):
+    phase = np.exp(0.5j * op.data[0])
+    return _apply_diagonal(state, op.wires[0], np.conj(phase), phase)
+
+
+def apply_operations_inplace(operations, state: np.ndarray) -> np.ndarray:
+    """Apply a sequence of operations to a NumPy state using two ping-pong buffers.
+
+    Args:
+        operations (Iterable[Operator]): the operations to apply. Each must satisfy
+            :func:`~.supports_inplace`.
+        state (numpy.ndarray): The starting state, with shape ``[2]*num_wires``. It is
+            overwritten during the computation.
+
+    Returns:
+        numpy.ndarray: the final state, which shares memory with either ``state`` or the single
+        additional buffer allocated by this function
+    """
+    state = np.asarray(state, dtype=np.result_type(state.dtype, np.complex64))
+    out = np.empty_like(state)
+    for op in operations:
+        new_state = apply_operation_inplace(op, state, out)
+        if new_state is out:
+            state, out = out, state
+    return state
@@ -0,0 +1,134 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Functions to fuse runs of small gates into dense blocks before simulation."""
+
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import pennylane as qml
+from pennylane import math
+from pennylane.measurements import MidMeasureMP
+from pennylane.operation import Operator, StatePrepBase
+from pennylane.ops import Conditional
+
+FUSION_PLAN_CACHE_SIZE = 128
+"""int: The maximum number of fusion plans kept by :func:`~.fusion_plan`."""
+
+
+def _is_fusable(op: Operator, max_wires: int) -> bool:
+    """Whether ``op`` may be merged into a dense block of at most ``max_wires`` wires."""
+    if isinstance(op, (MidMeasureMP, Conditional, StatePrepBase, qml.Projector, qml.Snapshot)):
+        return False
+    return 0 < len(op.wires) <= max_wires and op.batch_size is None and op.has_matrix
+
+
+@lru_cache(maxsize=FUSION_PLAN_CACHE_SIZE)
+def fusion_plan(structure: tuple, max_wires: int) -> tuple:
+    """Compute how a sequence of operations is grouped into fused blocks.
+
+    The plan only depends on the wires of the operations and on which of them may be fused, so it
+    is shared between all circuits with the same structure, regardless of their parameters.
+
+    Args:
+        structure (tuple[Optional[tuple]]): For every operation, the tuple of its wires if the
+            operation can be fused, and ``None`` otherwise.
+        max_wires (int): The maximum number of wires of a fused block.
+
+    Returns:
+        tuple[tuple[tuple, tuple[int]]]: The blocks in the order they are applied. Each block is
+        a pair of the wires it acts on and the indices of the operations it contains. Operations
+        that are not fused form a block of their own.
+
+    Operations are merged greedily. An operation joins the open blocks that touch its wires if the
+    combined block does not exceed ``max_wires`` wires. Otherwise, the blocks touching its wires
+    are closed and a new block is opened. As blocks on disjoint wires commute, this preserves the
+    order of the operations acting on each wire. Operations that cannot be fused close all open
+    blocks, since they may depend on the full state, for example through mid-circuit measurements.
+
+    >>> fusion_plan(((0,), (1,), (0, 1), (2,), None), max_wires=2)
+    (((0, 1), (0, 1, 2)), ((2,), (3,)), (None, (4,)))
+    """
+    plan = []
+    open_blocks = []  # list of (wires, indices), with wires in order of first use
+
+    def close(blocks):
+        for block in blocks:
+            open_blocks.remove(block)
+            plan.append((tuple(block[0]), tuple(block[1])))
+
+    for i, wires in enumerate(structure):
+        if wires is None:
+            close(list(open_blocks))
+            plan.append((None, (i,)))
+            continue
+
+        touching = [block for block in open_blocks if not set(block[0]).isdisjoint(wires)]
+        new_wires = list(dict.fromkeys([w for block in touching for w in block[0]] + list(wires)))
+        if len(new_wires) > max_wires:
+            close(touching)
+            open_blocks.append((list(wires), [i]))
+            continue
+
+        for block in touching:
+            open_blocks.remove(block)
+        indices = sorted(j for block in touching for j in block[1]) + [i]
+        open_blocks.append((new_wires, indices))
+
+    close(list(open_blocks))
+    return tuple(plan)
+
+
+def _fused_matrix(ops: Sequence[Operator], wires: tuple):
+    """Compute the matrix of applying ``ops`` in order on ``wires``."""
+    mat = ops[0].matrix(wire_order=wires)
+    for op in ops[1:]:
+        mat = math.matmul(op.matrix(wire_order=wires), mat)
+    return mat
+
+
+def fuse_operations(operations: Sequence[Operator], max_wires: Optional[int] = 2) -> list:
+    """Fuse runs of neighbouring gates into dense blocks acting on at most ``max_wires`` wires.
+
+    Each block containing more than one operation is replaced by a single
+    :class:`~.QubitUnitary`, so that the number of passes over the full state vector is reduced.
+    Matrices are combined with ``qml.math``, so the fused blocks remain differentiable with
+    the autodiff framework of the operation parameters.
+
+    Args:
+        operations (Sequence[Operator]): the operations to fuse
+        max_wires (Optional[int]): the maximum number of wires of a fused block. If ``None``,
+            the operations are returned unchanged.
+
+    Returns:
+        list[Operator]: the fused operations
+
+    **Example:**
+
+    >>> ops = [qml.RX(0.1, 0), qml.RY(0.2, 1), qml.CNOT((0, 1)), qml.RZ(0.3, 2)]
+    >>> fuse_operations(ops)
+    [QubitUnitary(array(...), wires=[0, 1]), RZ(0.3, wires=[2])]
+    """
+    if max_wires is None:
+        return list(operations)
+
+    structure = tuple(tuple(op.wires) if _is_fusable(op, max_wires) else None for op in operations)
+    new_ops = []
+    with qml.QueuingManager.stop_recording():
+        for wires, indices in fusion_plan(structure, max_wires):
+            if len(indices) == 1:
+                new_ops.append(operations[indices[0]])
+                continue
+            block = [operations[i] for i in indices]
+            new_ops.append(qml.QubitUnitary(_fused_matrix(block, wires), wires=wires))
+    return new_ops
@@ -14,8 +14,11 @@
 """
 Code relevant for performing measurements on a state.
 """
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 
+import numpy as np
+from scipy.linalg import hadamard
 from scipy.sparse import csr_matrix
 
 from pennylane import math
@@ -32,6 +35,11 @@ from pennylane.wires import Wires
 
 from .apply_operation import apply_operation
 
+# maximum number of partial sums evaluated at once in ``pauli_word_expvals``
+_BLOCK_SIZE = 2**22
+# maximum number of bits of the basis state indices contracted with one table of signs
+_MAX_CHUNK_BITS = 10
+
 
 def flatten_state(state, num_wires):
     """
@@ -162,6 +170,130 @@ def sum_of_terms_method(
     )
 
 
+@lru_cache
+def _sign_table(num_bits: int) -> np.ndarray:
+    r"""Signs :math:`(-1)^{|i \wedge j|}` for all pairs of ``num_bits``-bit integers."""
+    return hadamard(2**num_bits).astype(np.float64)
+
+
+def pauli_word_expvals(words, state: TensorLike, is_state_batched: bool = False) -> np.ndarray:
+    r"""Compute the expectation values of many Pauli words on a NumPy state in one vectorized pass.
+
+    A Pauli word with the bit masks :math:`x` and :math:`z` of its :math:`X`/:math:`Y` and
+    :math:`Y`/:math:`Z` wires acts on a computational basis state as
+    :math:`P|j\rangle = i^{n_Y} (-1)^{|j \wedge z|} |j \oplus x\rangle`. The expectation value is
+    therefore a signed sum over the product of the state with its bit-flipped copy, which is
+    computed once for every distinct :math:`x`. The signs factorize over chunks of the bits of
+    :math:`j`, so the product is contracted chunk by chunk with rows of small Hadamard matrices
+    for all the words sharing :math:`x` at once.
+
+    Args:
+        words (Sequence[PauliWord]): Pauli words acting on the integer wires of the state
+        state (TensorLike): the state to measure
+        is_state_batched (bool): whether the state is batched or not
+
+    Returns:
+        np.ndarray: the complex expectation values with shape ``(len(words),)``, or
+        ``(batch_size, len(words))`` for a batched state
+    """
+    num_wires = len(state.shape) - is_state_batched
+    state = math.toarray(state).reshape(-1, 2**num_wires)
+    batch_size = state.shape[0]
+
+    x = np.zeros(len(words), dtype=np.int64)
+    z = np.zeros(len(words), dtype=np.int64)
+    num_y = np.zeros(len(words), dtype=np.int64)
+    for i, pw in enumerate(words):
+        for wire, op in pw.items():
+            bit = 1 << (num_wires - 1 - wire)
+            if op in "XY":
+                x[i] |= bit
+            if op in "YZ":
+                z[i] |= bit
+            num_y[i] += op == "Y"
+
+    # split the bits of the basis state indices into chunks, starting from the most significant
+    num_chunks = max(1, -(-num_wires // _MAX_CHUNK_BITS))
+    chunks = [len(c) for c in np.array_split(np.arange(num_wires), num_chunks)]
+    shifts = num_wires - np.cumsum(chunks)
+    z_chunks = [(z >> shift) & (2**bits - 1) for bits, shift in zip(chunks, shifts)]
+
+    indices = np.arange(2**num_wires, dtype=np.int64)
+    block = max(1, _BLOCK_SIZE // 2 ** (num_wires - chunks[0]))
+    res = np.empty((batch_size, len(words)), dtype=np.result_type(state.dtype, np.complex64))
+    for x_mask in np.unique(x):
+        selected = np.flatnonzero(x == x_mask)
+        flipped = math.conj(state[:, indices ^ x_mask]) * state
+        for start in range(0, len(selected), block):
+            cols = selected[start : start + block]
+            signs = _sign_table(chunks[0])[z_chunks[0][cols]].astype(flipped.real.dtype)
+            # (k, 2**c) @ (batch, 2**c, rest) -> (batch, k, rest)
+            partial_sums = signs @ flipped.reshape(batch_size, 2 ** chunks[0], -1)
+            for bits, z_chunk in zip(chunks[1:], z_chunks[1:]):
+                signs = _sign_table(bits)[z_chunk[cols]].astype(flipped.real.dtype)
+                partial_sums = partial_sums.reshape(batch_size, len(cols), 2**bits, -1)
+                partial_sums = np.einsum("bkir,ki->bkr", partial_sums, signs)
+            res[:, cols] = partial_sums[..., 0]
+
+    res *= 1j ** (num_y % 4)
+    return res if is_state_batched else res[0]
+
+
+def _is_pauli_expval(measurementprocess: MeasurementProcess, state: TensorLike) -> bool:
+    """Whether the measurement is the expectation value of a Pauli sentence that can be computed
+    with :func:`~.pauli_word_expvals`."""
+    return (
+        isinstance(measurementprocess, ExpectationMP)
+        and measurementprocess.mv is None
+        and measurementprocess.obs is not None
+        and measurementprocess.obs.pauli_rep is not None
+        and math.get_interface(state, *measurementprocess.obs.data) == "numpy"
+    )
+
+
+def measure_pauli_expvals(
+    measurements: Sequence[MeasurementProcess], state: TensorLike, is_state_batched: bool = False
+) -> list[TensorLike]:
+    """Apply several measurement processes to the same state, computing the expectation values of
+    all Pauli sentences together.
+
+    The distinct Pauli words of all the measured Pauli sentences are evaluated once with
+    :func:`~.pauli_word_expvals`, and the results of the measurements are recombined from their
+    coefficients. This is faster than measuring every term of many-term Hamiltonians separately.
+    Measurements that are not expectation values of Pauli sentences, or that need
+    backpropagation, are computed with :func:`~.measure`, as are all measurements if there are
+    fewer than two Pauli words to evaluate.
+
+    Args:
+        measurements (Sequence[MeasurementProcess]): measurement processes to apply to the state
+        state (TensorLike): the state to measure
+        is_state_batched (bool): whether the state is batched or not
+
+    Returns:
+        list[TensorLike]: the results of the measurements
+    """
+    pauli_mps = {i for i, mp in enumerate(measurements) if _is_pauli_expval(mp, state)}
+    word_index = {}
+    for i in sorted(pauli_mps):
+        for pw in measurements[i].obs.pauli_rep:
+            word_index.setdefault(pw, len(word_index))
+    if len(word_index) < 2:
+        return [measure(mp, state, is_state_batched=is_state_batched) for mp in measurements]
+
+    expvals = pauli_word_expvals(list(word_index), state, is_state_batched=is_state_batched)
+
+    results = []
+    for i, mp in enumerate(measurements):
+        if i not in pauli_mps:
+            results.append(measure(mp, state, is_state_batched=is_state_batched))
+            continue
+        ps = mp.obs.pauli_rep
+        cols = [word_index[pw] for pw in ps]
+        coeffs = np.array(list(ps.values()), dtype=complex)
+        results.append(math.real(expvals[..., cols] @ coeffs))
+    return results
+
+
 # pylint: disable=too-many-return-statements,too-many-branches
 def get_measurement_function(
     measurementprocess: MeasurementProcess, state: TensorLike
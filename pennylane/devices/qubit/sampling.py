@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Functions to sample a state."""
+from functools import partial
 from typing import Union
 
 import numpy as np
@@ -21,9 +22,11 @@ from pennylane.measurements import (
     ClassicalShadowMP,
     CountsMP,
     ExpectationMP,
+    ProbabilityMP,
     SampleMeasurement,
     ShadowExpvalMP,
     Shots,
+    VarianceMP,
 )
 from pennylane.ops import LinearCombination, Prod, SProd, Sum
 from pennylane.typing import TensorLike
@@ -212,6 +215,7 @@ def measure_with_samples(
     rng=None,
     prng_key=None,
     mid_measurements: dict = None,
+    histogram_sampling: bool = False,
 ) -> list[TensorLike]:
     """
     Returns the samples of the measurement process performed on the given state.
@@ -230,6 +234,9 @@ def measure_with_samples(
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
         mid_measurements (None, dict): Dictionary of mid-circuit measurements
+        histogram_sampling (bool): Whether to compute ``expval``, ``var``, ``probs`` and ``counts``
+            of diagonal observables from a multinomial histogram of the outcomes on the measured
+            wires instead of individual samples. Only used for NumPy states.
 
     Returns:
         List[TensorLike[Any]]: Sample measurement results
@@ -248,7 +255,9 @@ def measure_with_samples(
             measure_fn = _measure_classical_shadow
         else:
             # measure with the usual method (rotate into the measurement basis)
-            measure_fn = _measure_with_samples_diagonalizing_gates
+            measure_fn = partial(
+                _measure_with_samples_diagonalizing_gates, histogram_sampling=histogram_sampling
+            )
 
         prng_key, key = jax_random_split(prng_key)
         all_res.extend(
@@ -282,6 +291,7 @@ def _measure_with_samples_diagonalizing_gates(
     is_state_batched: bool = False,
     rng=None,
     prng_key=None,
+    histogram_sampling: bool = False,
 ) -> TensorLike:
     """
     Returns the samples of the measurement process performed on the given state,
@@ -298,6 +308,8 @@ def _measure_with_samples_diagonalizing_gates(
             If no value is provided, a default RNG will be used.
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
+        histogram_sampling (bool): Whether to draw a histogram of the outcomes on the measured
+            wires instead of individual samples when all measurements support it
 
     Returns:
         TensorLike[Any]: Sample measurement results
@@ -308,10 +320,20 @@ def _measure_with_samples_diagonalizing_gates(
     total_indices = len(state.shape) - is_state_batched
     wires = qml.wires.Wires(range(total_indices))
 
+    # the statistics of diagonal measurements can be computed from the integer representation
+    # of the samples, without unpacking them into bits
+    packed = prng_key is None and qml.math.get_interface(state) == "numpy"
+    packed = packed and all(_supports_packed_samples(mp) for mp in mps)
+    if packed and histogram_sampling:
+        return _measure_with_histogram(mps, state, shots, is_state_batched, rng)
+
     def _process_single_shot(samples):
         processed = []
         for mp in mps:
-            res = mp.process_samples(samples, wires)
+            if packed:
+                res = _process_packed_samples(mp, samples, wires)
+            else:
+                res = mp.process_samples(samples, wires)
             if not isinstance(mp, CountsMP):
                 res = qml.math.squeeze(res)
 
@@ -328,15 +350,26 @@ def _measure_with_samples_diagonalizing_gates(
             wires=wires,
             rng=rng,
             prng_key=prng_key,
+            packed=packed,
         )
     except ValueError as e:
         if "probabilities contain nan" not in str(e).lower():
             raise e
-        samples = qml.math.full((shots.total_shots, len(wires)), 0)
+        shape = (shots.total_shots,) if packed else (shots.total_shots, len(wires))
+        samples = qml.math.full(shape, 0)
 
     processed_samples = []
+    # the result of a single shot only depends on its outcome, so it is computed once per outcome
+    single_shot_results = {}
     for lower, upper in shots.bins():
-        shot = _process_single_shot(samples[..., lower:upper, :])
+        bin_samples = samples[..., lower:upper] if packed else samples[..., lower:upper, :]
+        if upper - lower == 1 and isinstance(bin_samples, np.ndarray):
+            outcome = bin_samples.tobytes()
+            if outcome not in single_shot_results:
+                single_shot_results[outcome] = _process_single_shot(bin_samples)
+            shot = single_shot_results[outcome]
+        else:
+            shot = _process_single_shot(bin_samples)
         processed_samples.append(shot)
 
     if shots.has_partitioned_shots:
@@ -345,6 +378,162 @@ def _measure_with_samples_diagonalizing_gates(
     return processed_samples[0]
 
 
+def _supports_packed_samples(mp) -> bool:
+    """Whether the result of a measurement can be computed from packed integer samples."""
+    if mp.mv is not None:
+        return False
+    if isinstance(mp, (ExpectationMP, VarianceMP)):
+        return len(mp.wires) > 0
+    return isinstance(mp, (ProbabilityMP, CountsMP))
+
+
+def _marginal_indices(samples: np.ndarray, positions: list[int], num_wires: int) -> np.ndarray:
+    """Integer representation of the samples restricted to the wires at ``positions``."""
+    if positions == list(range(num_wires)):
+        return samples
+    indices = np.zeros_like(samples)
+    for position in positions:
+        indices = (indices << 1) | ((samples >> (num_wires - 1 - position)) & 1)
+    return indices
+
+
+def _process_packed_samples(mp, samples: np.ndarray, wire_order: qml.wires.Wires):
+    """Compute the result of a diagonal measurement from packed integer samples.
+
+    Args:
+        mp (SampleMeasurement): an expectation value, variance, probability or counts measurement
+        samples (np.ndarray[int]): samples of shape ``(shots,)`` or ``(batch_size, shots)`` whose
+            binary representation gives the outcome on each wire of ``wire_order``
+        wire_order (Wires): the sampled wires
+
+    Returns:
+        The same result as ``mp.process_samples`` for the unpacked samples.
+    """
+    positions = wire_order.indices(mp.wires) if mp.wires else list(range(len(wire_order)))
+    indices = _marginal_indices(samples, positions, len(wire_order))
+
+    if isinstance(mp, CountsMP):
+        return _packed_counts(mp, indices, len(positions), mp.eigvals())
+
+    if isinstance(mp, ProbabilityMP):
+        dim = 2 ** len(positions)
+        batch_shape, shots = indices.shape[:-1], indices.shape[-1]
+        offsets = dim * np.arange(int(np.prod(batch_shape))).reshape(batch_shape + (1,))
+        probs = np.bincount((indices + offsets).ravel(), minlength=dim * offsets.size)
+        return probs.reshape(batch_shape + (dim,)) / shots
+
+    eigvals = np.asarray(mp.eigvals(), dtype="float64")[indices]
+    if isinstance(mp, ExpectationMP):
+        return np.mean(eigvals, axis=-1)
+    return np.var(eigvals, axis=-1)
+
+
+def _packed_counts(mp: CountsMP, indices: np.ndarray, num_wires: int, eigvals=None):
+    """Counts of the outcomes of packed integer samples."""
+    if indices.ndim > 1:
+        return [_packed_counts(mp, batch, num_wires, eigvals) for batch in indices]
+
+    if eigvals is not None:
+        outcomes, counts = np.unique(np.asarray(eigvals)[indices], return_counts=True)
+        base = {k: qml.math.int64(0) for k in eigvals} if mp.all_outcomes else {}
+        return base | dict(zip(outcomes, counts))
+
+    outcomes, counts = np.unique(indices, return_counts=True)
+    keys = (f"{i:0{num_wires}b}" for i in (range(2**num_wires) if mp.all_outcomes else outcomes))
+    result = {k: qml.math.int64(0) for k in keys}
+    result.update(
+        (f"{outcome:0{num_wires}b}", count) for outcome, count in zip(outcomes.tolist(), counts)
+    )
+    return result
+
+
+def _measure_with_histogram(mps, state, shots, is_state_batched, rng):
+    """Compute diagonal measurements from multinomial histograms of the outcomes on the
+    measured wires, without drawing individual samples."""
+    num_wires = len(state.shape) - is_state_batched
+    if all(mp.wires for mp in mps):
+        measured = sorted({w for mp in mps for w in mp.wires.tolist()})
+    else:
+        measured = list(range(num_wires))
+    wire_order = qml.wires.Wires(measured)
+
+    probs = np.abs(state) ** 2
+    unmeasured = tuple(i + is_state_batched for i in range(num_wires) if i not in measured)
+    probs = np.sum(probs, axis=unmeasured).reshape(probs.shape[:is_state_batched] + (-1,))
+
+    rng = np.random.default_rng(rng)
+    processed = []
+    for shot in shots:
+        try:
+            histogram = sample_histogram(probs, shot, is_state_batched, rng)
+        except ValueError as e:
+            if "probabilities contain nan" not in str(e).lower():
+                raise e
+            histogram = np.zeros(probs.shape, dtype=np.int64)
+            histogram[..., 0] = shot
+        results = []
+        for mp in mps:
+            res = _process_histogram(mp, histogram, wire_order)
+            if not isinstance(mp, CountsMP):
+                res = qml.math.squeeze(res)
+            results.append(res)
+        processed.append(tuple(results))
+
+    if shots.has_partitioned_shots:
+        return tuple(zip(*processed))
+
+    return processed[0]
+
+
+def _process_histogram(mp, histogram: np.ndarray, wire_order: qml.wires.Wires):
+    """Compute the result of a diagonal measurement from a histogram of the outcomes on
+    ``wire_order``, with the same output as ``mp.process_samples``."""
+    num_wires = len(wire_order)
+    positions = wire_order.indices(mp.wires) if mp.wires else list(range(num_wires))
+    batch_shape = histogram.shape[:-1]
+    batch_dims = len(batch_shape)
+
+    histogram = histogram.reshape(batch_shape + (2,) * num_wires)
+    unmeasured = tuple(i + batch_dims for i in range(num_wires) if i not in positions)
+    histogram = np.sum(histogram, axis=unmeasured)
+    # order the remaining axes like the measured wires
+    order = np.argsort(np.argsort(positions))
+    histogram = np.transpose(histogram, tuple(range(batch_dims)) + tuple(order + batch_dims))
+    histogram = histogram.reshape(batch_shape + (-1,))
+    shots = np.sum(histogram, axis=-1)
+
+    if isinstance(mp, CountsMP):
+        return _histogram_counts(mp, histogram, len(positions), mp.eigvals())
+
+    if isinstance(mp, ProbabilityMP):
+        return histogram / shots[..., np.newaxis]
+
+    eigvals = np.asarray(mp.eigvals(), dtype="float64")
+    mean = histogram @ eigvals / shots
+    if isinstance(mp, ExpectationMP):
+        return mean
+    return histogram @ eigvals**2 / shots - mean**2
+
+
+def _histogram_counts(mp: CountsMP, histogram: np.ndarray, num_wires: int, eigvals=None):
+    """Counts dictionary of a histogram of outcomes."""
+    if histogram.ndim > 1:
+        return [_histogram_counts(mp, h, num_wires, eigvals) for h in histogram]
+
+    (outcomes,) = np.nonzero(histogram)
+    if eigvals is not None:
+        result = {k: qml.math.int64(0) for k in eigvals} if mp.all_outcomes else {}
+        for outcome in outcomes:
+            key = eigvals[outcome]
+            result[key] = result.get(key, 0) + histogram[outcome]
+        return dict(sorted(result.items())) if not mp.all_outcomes else result
+
+    keys = range(2**num_wires) if mp.all_outcomes else outcomes
+    result = {f"{i:0{num_wires}b}": qml.math.int64(0) for i in keys}
+    result.update((f"{i:0{num_wires}b}", histogram[i]) for i in outcomes)
+    return result
+
+
 def _measure_classical_shadow(
     mp: list[Union[ClassicalShadowMP, ShadowExpvalMP]],
     state: np.ndarray,
@@ -453,6 +642,8 @@ def sample_state(
     wires=None,
     rng=None,
     prng_key=None,
+    packed: bool = False,
+    dtype=np.int64,
 ) -> np.ndarray:
     """
     Returns a series of samples of a state.
@@ -467,9 +658,14 @@ def sample_state(
             If no value is provided, a default RNG will be used
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
+        packed (bool): If ``True``, every sample is returned as the integer whose binary
+            representation gives the outcomes on the sampled wires
+        dtype (type): The data type of the returned samples, e.g. ``np.uint8`` for a compact
+            array of bits
 
     Returns:
-        ndarray[int]: Sample values of the shape (shots, num_wires)
+        ndarray[int]: Sample values of the shape (shots, num_wires), or of the shape (shots,) if
+        ``packed=True``
     """
 
     total_indices = len(state.shape) - is_state_batched
@@ -483,10 +679,15 @@ def sample_state(
         probs = qml.probs(wires=wires_to_sample).process_state(flat_state, state_wires)
         # Keep same interface (e.g. jax) as in the device
 
-    return sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key)
+    return sample_probs(
+        probs, shots, num_wires, is_state_batched, rng, prng_key, packed=packed, dtype=dtype
+    )
 
 
-def sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key=None):
+# pylint: disable=too-many-arguments
+def sample_probs(
+    probs, shots, num_wires, is_state_batched, rng, prng_key=None, packed=False, dtype=np.int64
+):
     """
     Sample from given probabilities, dispatching between JAX and NumPy implementations.
 
@@ -500,14 +701,80 @@ def sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key=None):
             If no value is provided, a default RNG will be used
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
+        packed (bool): If ``True``, every sample is returned as the integer whose binary
+            representation gives the outcomes on the sampled wires
+        dtype (type): The data type of the returned samples
+
+    Returns:
+        array[int]: Sample values of the shape (shots, num_wires), or of the shape (shots,) if
+        ``packed=True``
     """
     if qml.math.get_interface(probs) == "jax" or prng_key is not None:
-        return _sample_probs_jax(probs, shots, num_wires, is_state_batched, prng_key, seed=rng)
+        samples = _sample_probs_jax(
+            probs, shots, num_wires, is_state_batched, prng_key, seed=rng, packed=packed
+        )
+        return samples.astype(dtype)
+
+    samples = _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng, packed=True)
+    if packed:
+        return samples.astype(dtype, copy=False)
+    return _unpack_samples(samples, num_wires, dtype)
 
-    return _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng)
 
+def _unpack_samples(samples: np.ndarray, num_wires: int, dtype=np.int64) -> np.ndarray:
+    """Convert integer samples into arrays of bits, with the most significant bit first."""
+    as_bytes = samples.astype(">u8")[..., None].view(np.uint8)
+    bits = np.unpackbits(as_bytes, axis=-1)[..., 64 - num_wires :]
+    return bits.astype(dtype, copy=False)
 
-def _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng):
+
+def _normalize_probs(probs, is_state_batched):
+    """Check that the probabilities sum to one up to a small error and renormalize them."""
+    norm = qml.math.sum(probs, axis=-1)
+    norm_err = qml.math.abs(norm - 1.0)
+    cutoff = 1e-07
+
+    norm_err = norm_err[..., np.newaxis] if not is_state_batched else norm_err
+    if qml.math.any(norm_err > cutoff):
+        raise ValueError("probabilities do not sum to 1")
+    if qml.math.any(qml.math.isnan(norm)):
+        raise ValueError("probabilities contain NaN")
+
+    if is_state_batched:
+        probs = probs / norm[:, np.newaxis] if norm.shape else probs / norm
+    else:
+        probs = probs / norm
+    return np.asarray(probs, dtype=np.float64)
+
+
+def sample_histogram(probs, shots, is_state_batched, rng=None):
+    """Draw the number of times every outcome occurs in ``shots`` samples of ``probs``.
+
+    The histogram is drawn from a multinomial distribution, so that the memory used scales
+    with the number of outcomes rather than with the number of shots.
+
+    Args:
+        probs (array): The probabilities of the outcomes
+        shots (int): The number of samples to take
+        is_state_batched (bool): whether the probabilities are batched or not
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]):
+            A seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
+            If no value is provided, a default RNG will be used
+
+    Returns:
+        ndarray[int]: The counts of every outcome, with the same shape as ``probs``
+
+    **Example**
+
+    >>> sample_histogram(np.array([0.5, 0, 0, 0.5]), 1000, False, rng=42)
+    array([487,   0,   0, 513])
+    """
+    rng = np.random.default_rng(rng)
+    probs = _normalize_probs(probs, is_state_batched)
+    return rng.multinomial(shots, probs)
+
+
+def _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng, packed=False):
     """
     Sample from given probabilities using NumPy's random number generator.
 
@@ -519,30 +786,35 @@ def _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng):
         rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]):
             A seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
             If no value is provided, a default RNG will be used
+        packed (bool): If ``True``, the samples are returned as integers of shape ``(shots,)``
+            instead of bits of shape ``(shots, num_wires)``
     """
     rng = np.random.default_rng(rng)
-    norm = qml.math.sum(probs, axis=-1)
-    norm_err = qml.math.abs(norm - 1.0)
-    cutoff = 1e-07
+    probs = _normalize_probs(probs, is_state_batched)
 
-    norm_err = norm_err[..., np.newaxis] if not is_state_batched else norm_err
-    if qml.math.any(norm_err > cutoff):
-        raise ValueError("probabilities do not sum to 1")
-
-    basis_states = np.arange(2**num_wires)
+    # inverse transform sampling, drawing the same samples as ``rng.choice(..., p=probs)``
+    cdf = np.cumsum(probs, axis=-1)
+    cdf /= cdf[..., -1:]
+    uniform_samples = rng.random(cdf.shape[:-1] + (shots,))
     if is_state_batched:
-        probs = probs / norm[:, np.newaxis] if norm.shape else probs / norm
-        samples = np.stack([rng.choice(basis_states, shots, p=p) for p in probs])
+        samples = np.stack(
+            [np.searchsorted(c, u, side="right") for c, u in zip(cdf, uniform_samples)]
+        )
     else:
-        probs = probs / norm
-        samples = rng.choice(basis_states, shots, p=probs)
+        samples = np.searchsorted(cdf, uniform_samples, side="right")
+
+    if packed:
+        return samples
 
     powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
     states_sampled_base_ten = samples[..., None] & powers_of_two
     return (states_sampled_base_ten > 0).astype(np.int64)
 
 
-def _sample_probs_jax(probs, shots, num_wires, is_state_batched, prng_key=None, seed=None):
+# pylint: disable=too-many-arguments
+def _sample_probs_jax(
+    probs, shots, num_wires, is_state_batched, prng_key=None, seed=None, packed=False
+):
     """
     Returns a series of samples of a state for the JAX interface based on the PRNG.
 
@@ -555,9 +827,12 @@ def _sample_probs_jax(probs, shots, num_wires, is_state_batched, prng_key=None,
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
         seed (Optional[int]): A seed for the random number generator. This is only used if ``prng_key``
             is not provided.
+        packed (bool): If ``True``, the samples are returned as integers of shape ``(shots,)``
+            instead of bits of shape ``(shots, num_wires)``
 
     Returns:
-        ndarray[int]: Sample values of the shape (shots, num_wires)
+        ndarray[int]: Sample values of the shape (shots, num_wires), or of the shape (shots,) if
+        ``packed=True``
     """
     # pylint: disable=import-outside-toplevel
     import jax
@@ -580,6 +855,9 @@ def _sample_probs_jax(probs, shots, num_wires, is_state_batched, prng_key=None,
         _, key = jax_random_split(prng_key)
         samples = jax.random.choice(key, basis_states, shape=(shots,), p=probs)
 
+    if packed:
+        return samples
+
     powers_of_two = 1 << jnp.arange(num_wires, dtype=int)[::-1]
     states_sampled_base_ten = samples[..., None] & powers_of_two
     return (states_sampled_base_ten > 0).astype(int)
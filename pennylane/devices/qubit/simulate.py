@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Simulate a quantum script."""
+
 import logging
 
 # pylint: disable=protected-access
@@ -38,8 +39,10 @@ from pennylane.transforms.dynamic_one_shot import gather_mcm
 from pennylane.typing import Result
 
 from .apply_operation import apply_operation
+from .apply_operation_inplace import apply_operations_inplace, supports_inplace
+from .gate_fusion import fuse_operations
 from .initialize_state import create_initial_state
-from .measure import measure
+from .measure import measure_pauli_expvals
 from .sampling import jax_random_split, measure_with_samples
 
 logger = logging.getLogger(__name__)
@@ -144,6 +147,16 @@ def _postselection_postprocess(state, is_state_batched, shots, **execution_kwarg
     return state, shots
 
 
+def _can_apply_inplace(operations, state, is_state_batched) -> bool:
+    """Whether the operations can be applied to the state with the in-place NumPy kernels."""
+    return (
+        not is_state_batched
+        and qml.math.get_interface(state) == "numpy"
+        and qml.math.get_deep_interface([op.data for op in operations]) == "numpy"
+        and all(supports_inplace(op) for op in operations)
+    )
+
+
 @debug_logger
 def get_final_state(circuit, debugger=None, **execution_kwargs):
     """
@@ -164,6 +177,14 @@ def get_final_state(circuit, debugger=None, **execution_kwargs):
         postselect_mode (str): Configuration for handling shots with mid-circuit measurement
             postselection. Use ``"hw-like"`` to discard invalid shots and ``"fill-shots"`` to
             keep the same number of shots. Default is ``None``.
+        max_fused_wires (Optional[int]): If provided, runs of neighbouring gates are fused into
+            dense blocks acting on at most this many wires before being applied to the state.
+            See :func:`~.fuse_operations`. Default is ``None``, which applies every operation
+            separately.
+        inplace (bool): Whether to apply the operations in place on two preallocated state
+            buffers. This is only used if the state and all operation parameters are NumPy arrays
+            and all operations are supported by :func:`~.apply_operation_inplace`, and falls back
+            to :func:`~.apply_operation` otherwise. Default is ``False``.
 
     Returns:
         Tuple[TensorLike, bool]: A tuple containing the final state of the quantum script and
@@ -171,6 +192,8 @@ def get_final_state(circuit, debugger=None, **execution_kwargs):
 
     """
     prng_key = execution_kwargs.pop("prng_key", None)
+    max_fused_wires = execution_kwargs.pop("max_fused_wires", None)
+    inplace = execution_kwargs.pop("inplace", False)
     interface = execution_kwargs.get("interface", None)
 
     prep = None
@@ -184,7 +207,12 @@ def get_final_state(circuit, debugger=None, **execution_kwargs):
     is_state_batched = bool(prep and prep.batch_size is not None)
     key = prng_key
 
-    for op in circuit.operations[bool(prep) :]:
+    operations = fuse_operations(circuit.operations[bool(prep) :], max_wires=max_fused_wires)
+    if inplace and _can_apply_inplace(operations, state, is_state_batched):
+        state = apply_operations_inplace(operations, state)
+        operations = []
+
+    for op in operations:
         if isinstance(op, MidMeasureMP):
             prng_key, key = jax_random_split(prng_key)
         state = apply_operation(
@@ -236,6 +264,8 @@ def measure_final_state(circuit, state, is_state_batched, **execution_kwargs) ->
             If None, the default ``sample_state`` function and a ``numpy.random.default_rng``
             will be used for sampling.
         mid_measurements (None, dict): Dictionary of mid-circuit measurements
+        histogram_sampling (bool): Whether to evaluate diagonal measurements from a multinomial
+            histogram of the outcomes instead of individual samples. Default is ``False``.
 
     Returns:
         Tuple[TensorLike]: The measurement results
@@ -244,18 +274,17 @@ def measure_final_state(circuit, state, is_state_batched, **execution_kwargs) ->
     rng = execution_kwargs.get("rng", None)
     prng_key = execution_kwargs.get("prng_key", None)
     mid_measurements = execution_kwargs.get("mid_measurements", None)
+    histogram_sampling = execution_kwargs.get("histogram_sampling", False)
 
     # analytic case
     if not circuit.shots:
         if mid_measurements is not None:
             raise TypeError("Native mid-circuit measurements are only supported with finite shots.")
 
-        if len(circuit.measurements) == 1:
-            return measure(circuit.measurements[0], state, is_state_batched=is_state_batched)
-
-        return tuple(
-            measure(mp, state, is_state_batched=is_state_batched) for mp in circuit.measurements
+        results = measure_pauli_expvals(
+            circuit.measurements, state, is_state_batched=is_state_batched
         )
+        return results[0] if len(circuit.measurements) == 1 else tuple(results)
 
     # finite-shot case
     rng = default_rng(rng)
@@ -267,6 +296,7 @@ def measure_final_state(circuit, state, is_state_batched, **execution_kwargs) ->
         rng=rng,
         prng_key=prng_key,
         mid_measurements=mid_measurements,
+        histogram_sampling=histogram_sampling,
     )
 
     if len(circuit.measurements) == 1:
@@ -308,6 +338,13 @@ def simulate(
             the device will use ``"tree-traversal"`` if specified and the ``"one-shot"`` method
             otherwise. For usage details, please refer to the
             :doc:`dynamic quantum circuits page </introduction/dynamic_quantum_circuits>`.
+        max_fused_wires (Optional[int]): The maximum number of wires of the dense blocks that
+            neighbouring gates are fused into before simulation. ``None`` disables gate fusion.
+        inplace (bool): Whether to apply the operations in place on preallocated NumPy state
+            buffers when no autodifferentiation is required. Default is ``False``.
+        histogram_sampling (bool): Whether to evaluate ``expval``, ``var``, ``probs`` and
+            ``counts`` of diagonal observables from a multinomial histogram of the outcomes on
+            the measured wires instead of individual samples. Default is ``False``.
 
     Returns:
         tuple(TensorLike): The results of the simulation
@@ -332,8 +369,11 @@ def simulate(
 
         results = []
         aux_circ = circuit.copy(shots=[1])
+        if prng_key is None:
+            return simulate_shot_branching_mcm(circuit, debugger=debugger, **execution_kwargs)
+
         keys = jax_random_split(prng_key, num=circuit.shots.total_shots)
-        if qml.math.get_deep_interface(circuit.data) == "jax" and prng_key is not None:
+        if qml.math.get_deep_interface(circuit.data) == "jax":
             # pylint: disable=import-outside-toplevel
             import jax
 
@@ -960,3 +1000,115 @@ def simulate_one_shot_native_mcm(
         mid_measurements=mid_measurements,
         **execution_kwargs,
     )
+
+
+def _split_shots(mcm, state, shots, rng, postselect_mode=None):
+    """Split the shots reaching a mid-circuit measurement between its two outcomes."""
+    if postselect_mode == "fill-shots" and mcm.postselect is not None:
+        return (0, shots) if mcm.postselect else (shots, 0)
+
+    slices = [slice(None)] * qml.math.ndim(state)
+    slices[mcm.wires.toarray()[0]] = 0
+    prob0 = qml.math.real(qml.math.norm(state[tuple(slices)])) ** 2
+    shots1 = int(rng.binomial(shots, qml.math.clip(1 - prob0, 0.0, 1.0)))
+    return shots - shots1, shots1
+
+
+@debug_logger
+def simulate_shot_branching_mcm(
+    circuit: qml.tape.QuantumScript, debugger=None, **execution_kwargs
+) -> Result:
+    """Simulate all the shots of a single quantum script with native mid-circuit measurements
+    by branching on the mid-circuit measurement outcomes.
+
+    Assumes that the circuit has been transformed by ``dynamic_one_shot``. The results are
+    distributed like those of :func:`simulate_one_shot_native_mcm` executed once per shot, but
+    the state is only propagated once per distinct sequence of mid-circuit measurement
+    outcomes. At every mid-circuit measurement, the shots of a branch are split between its two
+    outcomes by drawing from a binomial distribution, so that the cost scales with the number
+    of reachable branches rather than with the number of shots.
+
+    Args:
+        circuit (QuantumTape): The circuit to simulate, with one shot per shot of the
+            original circuit
+        debugger (_Debugger): The debugger to use
+        rng (Optional[numpy.random._generator.Generator]): A NumPy random number generator.
+        interface (str): The machine learning interface to create the initial state with
+        postselect_mode (str): Configuration for handling shots with mid-circuit measurement
+            postselection. Use ``"hw-like"`` to discard invalid shots and ``"fill-shots"`` to
+            keep the same number of shots. Default is ``None``.
+
+    Returns:
+        tuple(Result): The results of every shot, in random order
+    """
+    execution_kwargs.pop("prng_key", None)
+    execution_kwargs.pop("max_fused_wires", None)
+    execution_kwargs.pop("inplace", None)
+    rng = default_rng(execution_kwargs.pop("rng", None))
+    postselect_mode = execution_kwargs.get("postselect_mode", None)
+    interface = get_canonical_interface_name(execution_kwargs.get("interface", None))
+
+    prep = None
+    if len(circuit) > 0 and isinstance(circuit[0], qml.operation.StatePrepBase):
+        prep = circuit[0]
+    state = create_initial_state(circuit.wires, prep, like=interface.get_like())
+
+    # every branch is a tuple ``(state, number of shots, mid-circuit measurement outcomes)``
+    branches = [(state, circuit.shots.total_shots, {})]
+    for op in circuit.operations[bool(prep) :]:
+        if not isinstance(op, MidMeasureMP):
+            branches = [
+                (
+                    apply_operation(
+                        op,
+                        state,
+                        debugger=debugger,
+                        mid_measurements=mcm_values,
+                        rng=rng,
+                        **execution_kwargs,
+                    ),
+                    shots,
+                    mcm_values,
+                )
+                for state, shots, mcm_values in branches
+            ]
+            continue
+
+        new_branches = []
+        for state, shots, mcm_values in branches:
+            for outcome, outcome_shots in enumerate(
+                _split_shots(op, state, shots, rng, postselect_mode)
+            ):
+                if outcome_shots:
+                    new_state = branch_state(state, outcome, op)
+                    new_branches.append((new_state, outcome_shots, mcm_values | {op: outcome}))
+        branches = new_branches
+
+    results = []
+    for state, shots, mcm_values in branches:
+        if shots == 1:
+            results.append(
+                measure_final_state(
+                    circuit.copy(shots=[1]),
+                    state,
+                    False,
+                    rng=rng,
+                    mid_measurements=mcm_values,
+                    **execution_kwargs,
+                )
+            )
+            continue
+        mid_measurements = {k: np.full(shots, v) for k, v in mcm_values.items()}
+        results.extend(
+            measure_final_state(
+                circuit.copy(shots=[1] * shots),
+                state,
+                False,
+                rng=rng,
+                mid_measurements=mid_measurements,
+                **execution_kwargs,
+            )
+        )
+
+    # shots are grouped by branch, shuffle them so that shot vectors and samples are unbiased
+    return tuple(results[i] for i in rng.permutation(len(results)))
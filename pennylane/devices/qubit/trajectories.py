@@ -0,0 +1,272 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Simulate noisy circuits on state vectors by sampling quantum trajectories."""
+
+from typing import Optional
+
+import numpy as np
+from numpy.random import default_rng
+
+import pennylane as qml
+from pennylane import math
+from pennylane.math.interface_utils import get_canonical_interface_name
+from pennylane.measurements import (
+    DensityMatrixMP,
+    ExpectationMP,
+    MeasurementProcess,
+    ProbabilityMP,
+    VarianceMP,
+)
+from pennylane.operation import Channel
+from pennylane.typing import Result
+
+from .apply_operation import apply_operation
+from .gate_fusion import fuse_operations
+from .initialize_state import create_initial_state
+from .measure import measure_pauli_expvals
+
+
+def accepted_trajectory_measurement(m: MeasurementProcess) -> bool:
+    """Specifies whether a measurement can be estimated from quantum trajectories.
+
+    Only measurements that are linear in the density matrix of the circuit, and the variance of an
+    observable, can be averaged over trajectories.
+    """
+    return isinstance(m, (ExpectationMP, VarianceMP, ProbabilityMP, DensityMatrixMP))
+
+
+def _unitary_mixture(op: Channel) -> Optional[tuple]:
+    """Return the probabilities and unitaries of a channel whose Kraus matrices are all
+    proportional to unitaries, so that the probability of each Kraus matrix does not depend on
+    the state. Returns ``None`` for other channels and for channels with trainable or abstract
+    parameters."""
+    if qml.operation.is_trainable(op) or any(math.is_abstract(d) for d in op.data):
+        return None
+    kraus = [np.asarray(math.unwrap(k), dtype=complex) for k in op.kraus_matrices()]
+    probs, unitaries = [], []
+    for k in kraus:
+        k_dag_k = k.conj().T @ k
+        p = np.real(k_dag_k[0, 0])
+        if not np.allclose(k_dag_k, p * np.eye(len(k)), atol=1e-10):
+            return None
+        probs.append(p)
+        unitaries.append(k / np.sqrt(p) if p > 0 else None)
+    probs = np.array(probs)
+    return probs / np.sum(probs), unitaries
+
+
+# pylint: disable=too-many-arguments
+def _apply_unitary_mixture(op, probs, unitaries, state, rng, debugger=None):
+    """Apply one unitary of a unitary mixture to every trajectory, chosen with the
+    state-independent probabilities ``probs``. Only the trajectories that picked a unitary that is
+    not the identity are updated."""
+    choices = rng.choice(len(probs), size=math.shape(state)[0], p=probs)
+    in_place = math.get_interface(state) == "numpy"
+    if in_place:
+        state = state.copy()
+    for k, u in enumerate(unitaries):
+        mask = choices == k
+        if u is None or not np.any(mask) or np.allclose(u, u[0, 0] * np.eye(len(u))):
+            continue
+        u_op = qml.QubitUnitary(u, wires=op.wires)
+        if in_place:
+            rows = np.flatnonzero(mask)
+            state[rows] = apply_operation(
+                u_op, state[rows], is_state_batched=True, debugger=debugger
+            )
+        else:
+            branch = apply_operation(u_op, state, is_state_batched=True, debugger=debugger)
+            mask = np.reshape(mask, (-1,) + (1,) * (len(math.shape(state)) - 1))
+            state = math.where(math.convert_like(mask, state), branch, state)
+    return state
+
+
+def apply_channel_trajectories(op: Channel, state, rng=None, debugger=None):
+    r"""Apply a channel to a batch of state vectors by sampling one of its Kraus matrices
+    :math:`K_k` for every state with probability :math:`\|K_k|\psi\rangle\|^2`.
+
+    The first dimension of ``state`` indexes the trajectories. The Kraus matrices are applied one
+    at a time to all trajectories, so at most three batches of states are held in memory. Channels
+    whose Kraus matrices are proportional to unitaries, such as Pauli and depolarizing channels,
+    are sampled from their fixed probabilities instead, and only the trajectories that picked a
+    non-identity unitary are updated.
+
+    Args:
+        op (Channel): the channel to apply
+        state (TensorLike): the batch of states, with the trajectories along the first dimension
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A seed-like
+            parameter for ``numpy.random.default_rng`` used to choose the Kraus matrices.
+        debugger (_Debugger): The debugger to use
+
+    Returns:
+        TensorLike: the normalized states after the channel
+    """
+    rng = default_rng(rng)
+    with qml.QueuingManager.stop_recording():
+        if (mixture := _unitary_mixture(op)) is not None:
+            return _apply_unitary_mixture(op, *mixture, state, rng, debugger=debugger)
+
+        num_trajectories = math.shape(state)[0]
+        broadcast_shape = (-1,) + (1,) * (len(math.shape(state)) - 1)
+        sum_axes = tuple(range(1, len(math.shape(state))))
+
+        thresholds = rng.random(num_trajectories)
+        cumulative = np.zeros(num_trajectories)
+        selected = np.zeros(num_trajectories, dtype=bool)
+        new_state = math.zeros_like(state)
+
+        kraus = op.kraus_matrices()
+        for i, k in enumerate(kraus):
+            branch = apply_operation(
+                qml.QubitUnitary(k, wires=op.wires), state, is_state_batched=True, debugger=debugger
+            )
+            probs = math.real(math.sum(math.abs(branch) ** 2, axis=sum_axes))
+            cumulative = cumulative + math.unwrap(math.to_numpy(probs))
+            chosen = ~selected if i == len(kraus) - 1 else ~selected & (thresholds < cumulative)
+            selected = selected | chosen
+            if not np.any(chosen):
+                continue
+            norms = math.sqrt(math.where(math.convert_like(chosen, probs), probs, 1.0))
+            branch = branch / math.reshape(norms, broadcast_shape)
+            mask = math.convert_like(np.reshape(chosen, broadcast_shape), state)
+            new_state = math.where(mask, branch, new_state)
+    return new_state
+
+
+def _mean_and_standard_error(values):
+    """The mean over the first axis and its standard error, which is ``None`` for a single
+    trajectory."""
+    num_trajectories = math.shape(values)[0]
+    mean = math.mean(values, axis=0)
+    if num_trajectories < 2:
+        return mean, None
+    sq_deviations = math.sum(math.abs(values - mean) ** 2, axis=0)
+    return mean, math.sqrt(sq_deviations / (num_trajectories * (num_trajectories - 1)))
+
+
+# pylint: disable=too-many-arguments
+def _simulate_trajectory_batch(circuit, num_trajectories, rng, debugger, interface, max_wires):
+    """Evolve a batch of trajectories and return the per-trajectory measurement results."""
+    prep = None
+    if len(circuit) > 0 and isinstance(circuit[0], qml.operation.StatePrepBase):
+        prep = circuit[0]
+
+    state = create_initial_state(sorted(circuit.op_wires), prep, like=interface.get_like())
+    state = math.stack([state] * num_trajectories)
+
+    for op in fuse_operations(circuit.operations[bool(prep) :], max_wires=max_wires):
+        if isinstance(op, Channel):
+            state = apply_channel_trajectories(op, state, rng=rng, debugger=debugger)
+        else:
+            state = apply_operation(op, state, is_state_batched=True, debugger=debugger)
+
+    for _ in range(circuit.num_wires - len(circuit.op_wires)):
+        state = math.stack([state, math.zeros_like(state)], axis=-1)
+
+    # the variance of an observable is recovered from the per-trajectory variances and means
+    measurements = list(circuit.measurements)
+    measurements += [
+        qml.expval(mp.obs) for mp in circuit.measurements if isinstance(mp, VarianceMP)
+    ]
+    return measure_pauli_expvals(measurements, state, is_state_batched=True)
+
+
+def simulate_trajectories(
+    circuit: qml.tape.QuantumScript,
+    num_trajectories: int,
+    batch_size: Optional[int] = None,
+    debugger=None,
+    **execution_kwargs,
+) -> tuple[Result, tuple]:
+    r"""Simulate a circuit containing channels by averaging over quantum trajectories.
+
+    Each trajectory evolves a state vector, and every channel is replaced by one of its Kraus
+    matrices chosen at random with the probability given by the current state, see
+    :func:`~.apply_channel_trajectories`. The trajectories are simulated as batched states of at
+    most ``batch_size`` trajectories, so that the memory required is that of ``batch_size`` state
+    vectors instead of a density matrix.
+
+    Expectation values, probabilities and reduced density matrices are averaged over the
+    trajectories. Variances are computed from the averages of the per-trajectory variances and
+    expectation values.
+
+    The averages are not differentiable with backpropagation, since the derivatives of the
+    probabilities with which the Kraus operators are chosen are not accounted for.
+
+    Args:
+        circuit (QuantumScript): The single circuit to simulate. Its measurements must be analytic
+            ``expval``, ``var``, ``probs`` or ``density_matrix`` measurements.
+        num_trajectories (int): The number of trajectories to average over
+        batch_size (Optional[int]): The maximum number of trajectories simulated at once. Defaults
+            to ``num_trajectories``.
+        debugger (_Debugger): The debugger to use
+
+    Keyword Args:
+        rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]): A seed-like
+            parameter for ``numpy.random.default_rng`` used to sample the trajectories.
+        interface (str): The machine learning interface to create the initial state with
+        max_fused_wires (Optional[int]): The maximum number of wires of the dense blocks that
+            neighbouring gates between channels are fused into. ``None`` disables gate fusion.
+
+    Returns:
+        tuple[Result, tuple]: The results of the simulation, and the standard errors of the
+        averaged results in the same structure. The standard error of a variance or of a
+        simulation with a single trajectory is ``None``.
+
+    **Example**
+
+    >>> ops = [qml.Hadamard(0), qml.DepolarizingChannel(0.2, 0), qml.AmplitudeDamping(0.1, 0)]
+    >>> qs = qml.tape.QuantumScript(ops, [qml.expval(qml.X(0))])
+    >>> simulate_trajectories(qs, num_trajectories=1000, rng=42)
+    (0.7062..., 0.0223...)
+    """
+    if num_trajectories < 1:
+        raise ValueError(f"num_trajectories must be a positive integer, got {num_trajectories}.")
+    if circuit.shots:
+        raise qml.DeviceError("Quantum trajectories only support analytic measurements.")
+    for mp in circuit.measurements:
+        if not accepted_trajectory_measurement(mp):
+            raise qml.DeviceError(f"Measurement {mp} is not supported with quantum trajectories.")
+
+    rng = default_rng(execution_kwargs.get("rng", None))
+    interface = get_canonical_interface_name(execution_kwargs.get("interface", None))
+    max_wires = execution_kwargs.get("max_fused_wires", None)
+    circuit = circuit.map_to_standard_wires()
+
+    batch_size = batch_size or num_trajectories
+    batches = []
+    for start in range(0, num_trajectories, batch_size):
+        size = min(batch_size, num_trajectories - start)
+        batches.append(
+            _simulate_trajectory_batch(circuit, size, rng, debugger, interface, max_wires)
+        )
+    values = [math.concatenate(vals, axis=0) for vals in zip(*batches)]
+
+    num_measurements = len(circuit.measurements)
+    expvals_of_variances = iter(values[num_measurements:])
+    results, errors = [], []
+    for mp, vals in zip(circuit.measurements, values):
+        if isinstance(mp, VarianceMP):
+            expvals = next(expvals_of_variances)
+            second_moment = math.mean(vals + expvals**2, axis=0)
+            results.append(second_moment - math.mean(expvals, axis=0) ** 2)
+            errors.append(None)
+            continue
+        mean, error = _mean_and_standard_error(vals)
+        results.append(mean)
+        errors.append(None if isinstance(mp, DensityMatrixMP) else error)
+
+    if num_measurements == 1:
+        return results[0], errors[0]
+    return tuple(results), tuple(errors)
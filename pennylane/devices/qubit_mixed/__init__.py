@@ -27,9 +27,12 @@ at your own discretion.
     measure_with_samples
     sample_state
     simulate
+    fuse_channels
+    SuperOperator
 """
 from .apply_operation import apply_operation
 from .initialize_state import create_initial_state
 from .measure import measure
 from .sampling import sample_state, measure_with_samples
 from .simulate import get_final_state, measure_final_state, simulate
+from .superoperator_fusion import SuperOperator, fuse_channels
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Functions to apply operations to a qubit mixed state."""
+
 # pylint: disable=unused-argument
 
 from functools import singledispatch
@@ -27,6 +28,7 @@ from pennylane.operation import Channel
 from pennylane.ops.qubit.attributes import diagonal_in_z_basis
 
 from .einsum_manpulation import get_einsum_mapping
+from .superoperator_fusion import SuperOperator
 
 alphabet_array = np.array(list(alphabet))
 
@@ -214,7 +216,7 @@ def apply_operation_einsum(
     if isinstance(op, Channel):
         kraus = op.kraus_matrices()
     else:
-        kraus = [math.cast_like(op.matrix(), state)]
+        kraus = [op.matrix()]
 
     # Shape kraus operators
     kraus_shape = [len(kraus)] + [2] * num_ch_wires * 2
@@ -660,6 +662,89 @@ def apply_diagonal_unitary(op, state, is_state_batched: bool = False, debugger=N
     return math.einsum(einsum_indices, eigvals, state, math.conj(eigvals))
 
 
+def apply_diagonal_channel(op, state, is_state_batched: bool = False, debugger=None, **_):
+    r"""Applies a channel with diagonal Kraus operators, such as a dephasing channel, by
+    multiplying the density matrix elementwise with :math:`\sum_k K_k[i, i] K_k[j, j]^*` on the
+    wires of the channel."""
+    if op.batch_size is not None:
+        return _apply_operation_default(op, state, is_state_batched, debugger, **_)
+
+    channel_wires = op.wires
+    num_wires = int((len(math.shape(state)) - is_state_batched) / 2)
+
+    diagonals = math.stack([math.diagonal(k) for k in op.kraus_matrices()])
+    mask = math.einsum("ki,kj->ij", diagonals, math.conj(diagonals))
+    mask = math.cast_like(math.reshape(mask, [2] * 2 * len(channel_wires)), state)
+
+    state_indices = alphabet[: 2 * num_wires + is_state_batched]
+    row_wires_list = [w + is_state_batched for w in channel_wires.tolist()]
+    col_wires_list = [w + num_wires for w in row_wires_list]
+    mask_indices = "".join(alphabet_array[row_wires_list + col_wires_list].tolist())
+
+    return math.einsum(f"{mask_indices},{state_indices}->{state_indices}", mask, state)
+
+
+# Probabilities of the I, X, Y and Z errors of single-qubit Pauli channels, where ``None``
+# marks errors that do not occur
+_PAULI_CHANNEL_PROBS = {
+    qml.BitFlip: lambda p: (1 - p, p, None, None),
+    qml.DepolarizingChannel: lambda p: (1 - p, p / 3, p / 3, p / 3),
+}
+
+
+def apply_pauli_channel(op, state, is_state_batched: bool = False, debugger=None, **_):
+    r"""Applies a single-qubit Pauli channel :math:`\rho \mapsto \sum_P p_P P \rho P` with
+    elementwise operations. :math:`Z \rho Z` flips the signs of the entries whose row and column
+    bits differ, :math:`X \rho X` rolls both axes of the wire, and :math:`Y \rho Y` is
+    :math:`X (Z \rho Z) X`."""
+    if op.batch_size is not None:
+        return _apply_operation_default(op, state, is_state_batched, debugger, **_)
+
+    num_wires = int((len(math.shape(state)) - is_state_batched) / 2)
+    axis_left = op.wires[0] + is_state_batched
+    axis_right = axis_left + num_wires
+
+    p = op.parameters[0]
+    if math.get_interface(state) == "tensorflow":
+        # TensorFlow does not promote real tensors multiplied with complex ones
+        p = math.cast_like(p, state)
+    p_i, p_x, p_y, p_z = _PAULI_CHANNEL_PROBS[type(op)](p)
+
+    new_state = p_i * state
+    flipped = p_x * state
+    if p_y is not None or p_z is not None:
+        z_state = _phase_shift(_phase_shift(state, axis_left), axis_right)
+        if p_z is not None:
+            new_state = new_state + p_z * z_state
+        if p_y is not None:
+            flipped = flipped + p_y * z_state
+    return new_state + math.roll(math.roll(flipped, 1, axis_left), 1, axis_right)
+
+
+for _channel_class in (qml.PhaseFlip, qml.PhaseDamping):
+    apply_operation.register(_channel_class)(apply_diagonal_channel)
+for _channel_class in _PAULI_CHANNEL_PROBS:
+    apply_operation.register(_channel_class)(apply_pauli_channel)
+
+
+@apply_operation.register
+def apply_superoperator(
+    op: SuperOperator, state, is_state_batched: bool = False, debugger=None, **_
+):
+    """Applies a :class:`~.SuperOperator` by contracting its matrix with the row and column axes
+    of the wires it acts on."""
+    num_wires = int((len(math.shape(state)) - is_state_batched) / 2)
+    num_op_wires = len(op.wires)
+
+    mat = math.cast_like(math.reshape(op.data[0], [2] * 4 * num_op_wires), state)
+    row_wires_list = [w + is_state_batched for w in op.wires.tolist()]
+    col_wires_list = [w + num_wires for w in row_wires_list]
+    in_axes = list(range(2 * num_op_wires, 4 * num_op_wires))
+
+    new_state = math.tensordot(mat, state, axes=[in_axes, row_wires_list + col_wires_list])
+    return math.moveaxis(new_state, list(range(2 * num_op_wires)), row_wires_list + col_wires_list)
+
+
 @apply_operation.register
 def apply_snapshot(
     op: qml.Snapshot, state, is_state_batched: bool = False, debugger=None, **execution_kwargs
@@ -26,6 +26,7 @@ from .apply_operation import apply_operation
 from .initialize_state import create_initial_state
 from .measure import measure
 from .sampling import measure_with_samples
+from .superoperator_fusion import fuse_channels
 
 
 def get_final_state(circuit, debugger=None, **execution_kwargs):
@@ -46,6 +47,9 @@ def get_final_state(circuit, debugger=None, **execution_kwargs):
         prng_key (Optional[jax.random.PRNGKey]): A key for the JAX pseudo-random number
             generator. Used only for simulations with JAX. If None, a ``numpy.random.default_rng``
             is used for sampling.
+        max_fused_wires (Optional[int]): If provided, runs of neighbouring gates and channels are
+            fused into superoperators acting on at most this many wires with
+            :func:`~.fuse_channels` before they are applied.
 
     Returns:
         tuple[TensorLike, bool]: A tuple containing the final state of the quantum script and
@@ -54,6 +58,7 @@ def get_final_state(circuit, debugger=None, **execution_kwargs):
     """
 
     prng_key = execution_kwargs.pop("prng_key", None)
+    max_fused_wires = execution_kwargs.pop("max_fused_wires", None)
     interface = execution_kwargs.get("interface", None)
 
     prep = None
@@ -67,7 +72,8 @@ def get_final_state(circuit, debugger=None, **execution_kwargs):
     is_state_batched = bool(prep and prep.batch_size is not None)
     key = prng_key
 
-    for op in circuit.operations[bool(prep) :]:
+    ops = fuse_channels(circuit.operations[bool(prep) :], max_wires=max_fused_wires)
+    for op in ops:
         state = apply_operation(
             op,
             state,
@@ -114,6 +120,8 @@ def measure_final_state(circuit, state, is_state_batched, **execution_kwargs) ->
             used for sampling during JAX-based simulations. If None, a default NumPy RNG is used.
         readout_errors (List[Callable]): A list of quantum channels (callable functions) applied
             to each wire during measurement to simulate readout errors.
+        max_fused_wires (Optional[int]): If provided, runs of neighbouring gates and channels are
+            fused into superoperators acting on at most this many wires before simulation.
 
     Returns:
         Tuple[TensorLike]: The measurement results. If the circuit specifies only one measurement,
@@ -0,0 +1,134 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Functions to fuse runs of gates and channels into superoperators before simulation."""
+from typing import Optional, Sequence
+
+import pennylane as qml
+from pennylane import math
+from pennylane.devices.qubit.gate_fusion import _fused_matrix, fusion_plan
+from pennylane.measurements import MidMeasureMP
+from pennylane.operation import Channel, Operator, StatePrepBase
+from pennylane.ops import Conditional
+from pennylane.typing import TensorLike
+
+
+class SuperOperator(Operator):
+    r"""A quantum channel given by its superoperator matrix.
+
+    The superoperator :math:`S = \sum_k K_k \otimes K_k^*` of a channel with the Kraus operators
+    :math:`K_k` acts on the row-major vectorization of the density matrix restricted to its
+    wires, :math:`\text{vec}(\rho) \mapsto S\, \text{vec}(\rho)`. It is created by
+    :func:`~.fuse_channels` and only meant to be applied by ``default.mixed``.
+
+    Args:
+        matrix (TensorLike): the :math:`4^k \times 4^k` superoperator matrix of a channel
+            acting on :math:`k` wires
+        wires (Sequence[int]): the wires the channel acts on
+    """
+
+    resource_keys = {"num_wires"}
+
+    grad_method = None
+
+    def __init__(self, matrix, wires, id=None):
+        super().__init__(matrix, wires=wires, id=id)
+
+    @property
+    def resource_params(self) -> dict:
+        return {"num_wires": len(self.wires)}
+
+
+def superoperator(op: Operator, wires: Sequence) -> TensorLike:
+    r"""Compute the superoperator matrix :math:`\sum_k K_k \otimes K_k^*` of a gate or channel
+    acting on ``wires``.
+
+    Args:
+        op (Operator): a gate with a matrix or a :class:`~.Channel`
+        wires (Sequence): the wires of the superoperator, which must contain the wires of ``op``
+
+    Returns:
+        TensorLike: the :math:`4^k \times 4^k` superoperator matrix for :math:`k` wires
+
+    **Example:**
+
+    >>> superoperator(qml.PhaseFlip(0.1, wires=0), wires=[0])
+    array([[1. +0.j, 0. +0.j, 0. +0.j, 0. +0.j],
+           [0. +0.j, 0.8+0.j, 0. +0.j, 0. +0.j],
+           [0. +0.j, 0. +0.j, 0.8+0.j, 0. +0.j],
+           [0. +0.j, 0. +0.j, 0. +0.j, 1. +0.j]])
+    """
+    if isinstance(op, Channel):
+        kraus = [
+            math.expand_matrix(math.cast(k, complex), op.wires, wire_order=wires)
+            for k in op.kraus_matrices()
+        ]
+    else:
+        kraus = [math.cast(op.matrix(wire_order=wires), complex)]
+    return sum(math.kron(k, math.conj(k)) for k in kraus)
+
+
+def _is_fusable(op: Operator, max_wires: int) -> bool:
+    """Whether ``op`` may be merged into a superoperator of at most ``max_wires`` wires."""
+    if isinstance(op, (MidMeasureMP, Conditional, StatePrepBase, qml.Projector, qml.Snapshot)):
+        return False
+    return (
+        0 < len(op.wires) <= max_wires
+        and op.batch_size is None
+        and (isinstance(op, Channel) or op.has_matrix)
+    )
+
+
+def fuse_channels(operations: Sequence[Operator], max_wires: Optional[int] = 2) -> list:
+    """Fuse runs of neighbouring gates and channels into blocks acting on at most ``max_wires``
+    wires.
+
+    Blocks are formed with the same greedy plan as :func:`~.fuse_operations`. Each block of
+    unitary gates is replaced by a single :class:`~.QubitUnitary`, and each block containing a
+    channel by a single :class:`~.SuperOperator`, so that noisy circuits with a channel after
+    every gate need far fewer passes over the full density matrix. Matrices are combined with
+    ``qml.math``, so the fused blocks remain differentiable.
+
+    Args:
+        operations (Sequence[Operator]): the operations to fuse
+        max_wires (Optional[int]): the maximum number of wires of a fused block. If ``None``,
+            the operations are returned unchanged.
+
+    Returns:
+        list[Operator]: the fused operations
+
+    **Example:**
+
+    >>> ops = [qml.RX(0.1, 0), qml.DepolarizingChannel(0.01, 0), qml.CNOT((0, 1)), qml.RZ(0.3, 2)]
+    >>> fuse_channels(ops)
+    [SuperOperator(array(...), wires=[0, 1]), RZ(0.3, wires=[2])]
+    """
+    if max_wires is None:
+        return list(operations)
+
+    structure = tuple(tuple(op.wires) if _is_fusable(op, max_wires) else None for op in operations)
+    new_ops = []
+    with qml.QueuingManager.stop_recording():
+        for wires, indices in fusion_plan(structure, max_wires):
+            if len(indices) == 1:
+                new_ops.append(operations[indices[0]])
+                continue
+            block = [operations[i] for i in indices]
+            if not any(isinstance(op, Channel) for op in block):
+                new_ops.append(qml.QubitUnitary(_fused_matrix(block, wires), wires=wires))
+                continue
+            mat = superoperator(block[0], wires)
+            for op in block[1:]:
+                mat = math.matmul(superoperator(op, wires), mat)
+            new_ops.append(SuperOperator(mat, wires=wires))
+    return new_ops
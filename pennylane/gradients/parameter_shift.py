@@ -28,6 +28,7 @@ from pennylane.typing import PostprocessingFn
 
 from .finite_difference import finite_diff
 from .general_shift_rules import (
+    _copy_and_shift_params,
     _iterate_shift_rule,
     frequencies_to_period,
     generate_shifted_tapes,
@@ -228,6 +229,85 @@ def _evaluate_gradient(tape_specs, res, data, r0, batch_size):
     )
 
 
+FULL_BROADCAST_MEMORY = 2**30
+"""int: The default memory budget in bytes for the batched state vector of a single tape created
+with ``broadcast="full"``, which determines how many shifted evaluations are packed into one tape
+if no ``max_batch_size`` is given."""
+
+
+def _full_broadcast_batch_size(tape, max_batch_size=None):
+    """The maximum batch size of the tapes created with ``broadcast="full"``. If not provided, it
+    is the number of complex state vectors of the tape that fit into ``FULL_BROADCAST_MEMORY``."""
+    if max_batch_size is not None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer, got {max_batch_size}.")
+        return max_batch_size
+    return max(1, FULL_BROADCAST_MEMORY // (16 * 2**tape.num_wires))
+
+
+def _can_fully_broadcast(tape, idx):
+    """Whether the shifts of the trainable parameter ``idx`` can be broadcasted together with the
+    shifts of other parameters, which requires a scalar parameter of a gate."""
+    op, op_idx, p_idx = tape.get_operation(idx)
+    return (
+        op_idx < len(tape.operations)
+        and op.ndim_params[p_idx] == 0
+        and qml.math.ndim(op.data[p_idx]) == 0
+    )
+
+
+def _generate_full_broadcast_tapes(tape, slots, max_batch_size):
+    """Pack the shifted evaluations ``slots`` of all parameters into broadcasted tapes.
+
+    Each slot is a tuple ``(idx, multiplier, shift)`` of a trainable parameter index and one term
+    of its shift rule. Consecutive slots are distributed over the broadcasting dimension of tapes
+    of at most ``max_batch_size`` evaluations. In each tape, every parameter that is shifted in
+    one of its slots is broadcasted, taking the shifted value in its own slots and the unshifted
+    value in all others, while all other parameters are left unchanged. A single remaining slot
+    is evaluated with an unbroadcasted tape.
+    """
+    tapes = []
+    for start in range(0, len(slots), max_batch_size):
+        chunk = slots[start : start + max_batch_size]
+        if len(chunk) == 1:
+            idx, multiplier, shift = chunk[0]
+            tapes.append(_copy_and_shift_params(tape, [idx], [shift], [multiplier]))
+            continue
+        indices = sorted({idx for idx, _, _ in chunk})
+        multipliers = {idx: np.ones(len(chunk)) for idx in indices}
+        shifts = {idx: np.zeros(len(chunk)) for idx in indices}
+        for i, (idx, multiplier, shift) in enumerate(chunk):
+            multipliers[idx][i] = multiplier
+            shifts[idx][i] = shift
+        tapes.append(
+            _copy_and_shift_params(
+                tape,
+                indices,
+                [shifts[idx] for idx in indices],
+                [multipliers[idx] for idx in indices],
+            )
+        )
+    return tapes
+
+
+def _concatenate_batches(results, batch_sizes):
+    """Concatenate the results of tapes with the same measurements along their broadcasting
+    dimension. Results of unbroadcasted tapes, with a batch size of ``None``, are added as a
+    single entry."""
+    if isinstance(results[0], (tuple, list)):
+        return tuple(_concatenate_batches(r, batch_sizes) for r in zip(*results))
+    return qml.math.concatenate(
+        [r if b is not None else qml.math.expand_dims(r, 0) for r, b in zip(results, batch_sizes)]
+    )
+
+
+def _slice_batch(result, start, stop):
+    """Slice the broadcasting dimension of a (nested) broadcasted result."""
+    if isinstance(result, tuple):
+        return tuple(_slice_batch(r, start, stop) for r in result)
+    return result[start:stop]
+
+
 def _get_operation_recipe(tape, t_idx, shifts, order=1):
     """Utility function to return the parameter-shift rule
     of the operation corresponding to trainable parameter
@@ -320,7 +400,13 @@ def _make_zero_rep(g, single_measure, has_partitioned_shots, par_shapes=None):
 
 
 def expval_param_shift(
-    tape, argnum=None, shifts=None, gradient_recipes=None, f0=None, broadcast=False
+    tape,
+    argnum=None,
+    shifts=None,
+    gradient_recipes=None,
+    f0=None,
+    broadcast=False,
+    max_batch_size=None,
 ):
     r"""Generate the parameter-shift tapes and postprocessing methods required
         to compute the gradient of a gate parameter with respect to an
@@ -345,8 +431,13 @@ def expval_param_shift(
             f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
                 and the gradient recipe contains an unshifted term, this value is used,
                 saving a quantum evaluation.
-            broadcast (bool): Whether or not to use parameter broadcasting to create the
+            broadcast (bool or str): Whether or not to use parameter broadcasting to create the
                 a single broadcasted tape per operation instead of one tape per shift angle.
+                If ``"full"``, the shifted evaluations of all parameters are packed into as few
+                broadcasted tapes as possible.
+            max_batch_size (int or None): The maximum batch size of the tapes created with
+                ``broadcast="full"``. If ``None``, it is chosen such that the batched state
+                vector of a tape fits into ``FULL_BROADCAST_MEMORY`` bytes.
 
         Returns:
             tuple[list[QuantumTape], function]: A tuple containing a
@@ -363,6 +454,12 @@ def expval_param_shift(
     gradient_data = []
     # Keep track of whether there is at least one unshifted term in all the parameter-shift rules
     at_least_one_unshifted = False
+    # With broadcast="full", the (idx, multiplier, shift) of all packed shifted evaluations, and
+    # the offset of the evaluations of each packed parameter
+    full_slots = []
+    full_offsets = {}
+    fully_broadcast = isinstance(broadcast, str) and broadcast == "full"
+    broadcast = bool(broadcast) and not fully_broadcast
 
     for idx, _ in enumerate(tape.trainable_params):
         if idx not in argnum:
@@ -398,6 +495,13 @@ def expval_param_shift(
         )
         coeffs, multipliers, op_shifts = recipe.T
 
+        if fully_broadcast and len(op_shifts) > 0 and _can_fully_broadcast(tape, idx):
+            full_offsets[idx] = len(full_slots)
+            full_slots.extend((idx, m, s) for m, s in zip(multipliers, op_shifts))
+            num_slots = len(op_shifts)
+            gradient_data.append((num_slots, coeffs, None, unshifted_coeff, num_slots))
+            continue
+
         g_tapes = generate_shifted_tapes(tape, idx, op_shifts, multipliers, broadcast)
         gradient_tapes.extend(g_tapes)
         # If broadcast=True, g_tapes only contains one tape. If broadcast=False, all returned
@@ -406,6 +510,13 @@ def expval_param_shift(
         batch_size = g_tapes[0].batch_size if broadcast and g_tapes else None
         gradient_data.append((len(g_tapes), coeffs, None, unshifted_coeff, batch_size))
 
+    # The packed evaluations of broadcast="full" come after all other gradient tapes
+    full_tapes = []
+    if full_slots:
+        batch_size = _full_broadcast_batch_size(tape, max_batch_size)
+        full_tapes = _generate_full_broadcast_tapes(tape, full_slots, batch_size)
+        gradient_tapes.extend(full_tapes)
+
     num_measurements = len(tape.measurements)
     single_measure = num_measurements == 1
     num_params = len(tape.trainable_params)
@@ -413,9 +524,20 @@ def expval_param_shift(
 
     def processing_fn(results):
         start, r0 = (1, results[0]) if at_least_one_unshifted and f0 is None else (0, f0)
+        full_results = None
+        if full_tapes:
+            full_results = _concatenate_batches(
+                results[len(results) - len(full_tapes) :], [t.batch_size for t in full_tapes]
+            )
         grads = []
-        for data in gradient_data:
+        for idx, data in enumerate(gradient_data):
             num_tapes, *_, unshifted_coeff, batch_size = data
+            if idx in full_offsets:
+                offset = full_offsets[idx]
+                res = _slice_batch(full_results, offset, offset + num_tapes)
+                g = _evaluate_gradient(tape_specs, res, data, r0, batch_size)
+                grads.append(g)
+                continue
             if num_tapes == 0:
                 if unshifted_coeff is None:
                     # parameter has zero gradient. We don't know the output shape yet, so just
@@ -642,7 +764,9 @@ def _get_non_involuntory_indices(tape, var_indices):
     return non_involutory_indices
 
 
-def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None, broadcast=False):
+def var_param_shift(
+    tape, argnum, shifts=None, gradient_recipes=None, f0=None, broadcast=False, max_batch_size=None
+):
     r"""Generate the parameter-shift tapes and postprocessing methods required
     to compute the gradient of a gate parameter with respect to a
     variance value.
@@ -664,8 +788,12 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None, b
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the gradient recipe contains an unshifted term, this value is used,
             saving a quantum evaluation.
-        broadcast (bool): Whether or not to use parameter broadcasting to create the
+        broadcast (bool or str): Whether or not to use parameter broadcasting to create the
             a single broadcasted tape per operation instead of one tape per shift angle.
+            If ``"full"``, the shifted evaluations of all parameters are packed into as few
+            broadcasted tapes as possible.
+        max_batch_size (int or None): The maximum batch size of the tapes created with
+            ``broadcast="full"``.
 
     Returns:
         tuple[list[QuantumTape], function]: A tuple containing a
@@ -705,7 +833,7 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None, b
 
     # evaluate the analytic derivative of <A>
     pdA_tapes, pdA_fn = expval_param_shift(
-        expval_tape, argnum, shifts, gradient_recipes, f0, broadcast
+        expval_tape, argnum, shifts, gradient_recipes, f0, broadcast, max_batch_size
     )
     gradient_tapes = [] if pdA_fn.first_result_unshifted else [expval_tape]
     gradient_tapes.extend(pdA_tapes)
@@ -739,7 +867,13 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None, b
         # may be non-zero. Here, we calculate the analytic derivatives of the <A^2>
         # observables.
         pdA2_tapes, pdA2_fn = expval_param_shift(
-            tape_with_obs_squared_expval, argnum, shifts, gradient_recipes, f0, broadcast
+            tape_with_obs_squared_expval,
+            argnum,
+            shifts,
+            gradient_recipes,
+            f0,
+            broadcast,
+            max_batch_size,
         )
         gradient_tapes.extend(pdA2_tapes)
 
@@ -773,6 +907,7 @@ def _expand_transform_param_shift(
     fallback_fn=finite_diff,
     f0=None,
     broadcast=False,
+    max_batch_size=None,
 ) -> tuple[QuantumScriptBatch, PostprocessingFn]:
     """Expand function to be applied before parameter shift."""
     [new_tape], postprocessing = qml.devices.preprocess.decompose(
@@ -813,6 +948,7 @@ def param_shift(
     fallback_fn=finite_diff,
     f0=None,
     broadcast=False,
+    max_batch_size=None,
 ) -> tuple[QuantumScriptBatch, PostprocessingFn]:
     r"""Transform a circuit to compute the parameter-shift gradient of all gate
     parameters with respect to its inputs.
@@ -845,8 +981,13 @@ def param_shift(
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the gradient recipe contains an unshifted term, this value is used,
             saving a quantum evaluation.
-        broadcast (bool): Whether or not to use parameter broadcasting to create
+        broadcast (bool or str): Whether or not to use parameter broadcasting to create
             a single broadcasted tape per operation instead of one tape per shift angle.
+            If ``"full"``, the shifted evaluations of all parameters are packed into as few
+            broadcasted tapes as possible, see the usage details below.
+        max_batch_size (int or None): The maximum batch size of the tapes created with
+            ``broadcast="full"``. If ``None``, it is chosen such that the batched state vector of
+            a tape fits into ``qml.gradients.parameter_shift.FULL_BROADCAST_MEMORY`` bytes.
 
     Returns:
         qnode (QNode) or tuple[List[QuantumTape], function]:
@@ -1116,6 +1257,25 @@ def param_shift(
         batch_size of the created tapes.
 
         Shot vectors and multiple return measurements are supported with ``broadcast=True``.
+
+        With ``broadcast="full"``, the shifted evaluations of *all* trainable parameters are
+        distributed over the broadcasting dimension of a few tapes instead of creating one tape
+        per parameter. In each tape, every parameter with a shifted evaluation is broadcasted,
+        taking its shifted value in its own entries and its unshifted value in all others:
+
+        >>> gradient_tapes, fn = qml.gradients.param_shift(tape, broadcast="full")
+        >>> len(gradient_tapes)
+        1
+        >>> [t.batch_size for t in gradient_tapes]
+        [6]
+
+        The number of evaluations per tape is limited by ``max_batch_size``, or by default by the
+        memory required for the batched state vector, so that circuits with hundreds of
+        parameters are differentiated with a handful of device executions:
+
+        >>> gradient_tapes, fn = qml.gradients.param_shift(tape, broadcast="full", max_batch_size=4)
+        >>> [t.batch_size for t in gradient_tapes]
+        [4, 2]
     """
 
     transform_name = "parameter-shift rule"
@@ -1151,9 +1311,13 @@ def param_shift(
         gradient_recipes = [None] * len(argnum)
 
     if any(isinstance(m, VarianceMP) for m in tape.measurements):
-        g_tapes, fn = var_param_shift(tape, argnum, shifts, gradient_recipes, f0, broadcast)
+        g_tapes, fn = var_param_shift(
+            tape, argnum, shifts, gradient_recipes, f0, broadcast, max_batch_size
+        )
     else:
-        g_tapes, fn = expval_param_shift(tape, argnum, shifts, gradient_recipes, f0, broadcast)
+        g_tapes, fn = expval_param_shift(
+            tape, argnum, shifts, gradient_recipes, f0, broadcast, max_batch_size
+        )
 
     gradient_tapes.extend(g_tapes)
 
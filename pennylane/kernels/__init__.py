@@ -23,4 +23,4 @@ from .postprocessing import (
     mitigate_depolarizing_noise,
     threshold_matrix,
 )
-from .utils import kernel_matrix, square_kernel_matrix
+from .utils import kernel_matrix, square_kernel_matrix, state_kernel_matrix
@@ -16,10 +16,33 @@ This file contains functionalities that simplify working with kernels.
 """
 from itertools import product
 
+import numpy as np
+
 import pennylane as qml
 
 
-def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
+def _evaluate_in_chunks(fn, X, indices, batch_size):
+    """Evaluate ``fn`` on the datapoints of ``X`` selected by one or two index arrays, passing
+    at most ``batch_size`` datapoints per call along a leading batch dimension."""
+    results = []
+    for start in range(0, len(indices[0]), batch_size):
+        args = [
+            qml.math.take(x, idx[start : start + batch_size], axis=0) for x, idx in zip(X, indices)
+        ]
+        results.append(fn(*args))
+    return qml.math.concatenate(results, axis=0)
+
+
+def _assemble_matrix(values, index, shape):
+    """Arrange kernel values into a matrix according to an array of indices into ``values``."""
+    matrix = qml.math.take(values, np.ravel(index), axis=0)
+    if qml.math.ndim(values) == 1:
+        return qml.math.reshape(matrix, shape)
+    size = qml.math.size(values[0])
+    return qml.math.moveaxis(qml.math.reshape(matrix, shape + (size,)), -1, 0)
+
+
+def square_kernel_matrix(X, kernel, assume_normalized_kernel=False, batch_size=None):
     r"""Computes the square matrix of pairwise kernel values for a given dataset.
 
     Args:
@@ -29,6 +52,10 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
         assume_normalized_kernel (bool, optional): Assume that the kernel is normalized, in
             which case the diagonal of the kernel matrix is set to 1, avoiding unnecessary
             computations.
+        batch_size (int, optional): If provided, the kernel is called with up to ``batch_size``
+            pairs of datapoints at once, stacked along a leading batch dimension, and must return
+            one kernel value per pair. This allows a kernel based on a QNode to evaluate many
+            pairs with a single broadcasted execution.
 
     Returns:
         array[float]: The square matrix of kernel values.
@@ -62,6 +89,9 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
     if assume_normalized_kernel and N == 1:
         return qml.math.eye(1, like=qml.math.get_interface(X))
 
+    if batch_size is not None:
+        return _square_kernel_matrix_batched(X, kernel, assume_normalized_kernel, batch_size)
+
     matrix = [None] * N**2
 
     # Compute all off-diagonal kernel values, using symmetry of the kernel matrix
@@ -86,13 +116,33 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
     return qml.math.moveaxis(qml.math.reshape(qml.math.stack(matrix), shape), -1, 0)
 
 
-def kernel_matrix(X1, X2, kernel):
+def _square_kernel_matrix_batched(X, kernel, assume_normalized_kernel, batch_size):
+    """Computes the square kernel matrix with a kernel evaluated on batches of pairs."""
+    N = qml.math.shape(X)[0]
+    X = qml.math.stack(X)
+    rows, cols = np.triu_indices(N, k=int(assume_normalized_kernel))
+    values = _evaluate_in_chunks(kernel, (X, X), (rows, cols), batch_size)
+
+    index = np.zeros((N, N), dtype=int)
+    index[rows, cols] = index[cols, rows] = np.arange(len(rows))
+    if assume_normalized_kernel:
+        # the diagonal refers to an additional entry of ones
+        values = qml.math.concatenate([values, qml.math.ones_like(values[:1])], axis=0)
+        np.fill_diagonal(index, len(rows))
+
+    return _assemble_matrix(values, index, (N, N))
+
+
+def kernel_matrix(X1, X2, kernel, batch_size=None):
     r"""Computes the matrix of pairwise kernel values for two given datasets.
 
     Args:
         X1 (list[datapoint]): List of datapoints (first argument)
         X2 (list[datapoint]): List of datapoints (second argument)
         kernel ((datapoint, datapoint) -> float): Kernel function that maps datapoints to kernel value.
+        batch_size (int, optional): If provided, the kernel is called with up to ``batch_size``
+            pairs of datapoints at once, stacked along a leading batch dimension, and must return
+            one kernel value per pair.
 
     Returns:
         array[float]: The matrix of kernel values.
@@ -126,13 +176,97 @@ def kernel_matrix(X1, X2, kernel):
 
     As we can see, for :math:`n` and :math:`m` datapoints in the first and second
     dataset respectively, the output matrix has the shape :math:`n\times m`.
+
+    If the kernel supports parameter broadcasting, many pairs of datapoints can be evaluated
+    in a single execution by passing ``batch_size``. The kernel then receives stacked
+    datapoints and returns one value per pair:
+
+    >>> batched_kernel = lambda x1, x2: circuit(x1, x2)[..., 0]
+    >>> qml.kernels.kernel_matrix(X_train, X_test, batched_kernel, batch_size=100)
+    tensor([[0.88875298, 0.90655175, 0.89926447],
+            [0.93762197, 0.98163781, 0.93076383],
+            [0.91977339, 0.9799841 , 0.91582698],
+            [0.80376818, 0.98720925, 0.79349212]], requires_grad=True)
     """
     N = qml.math.shape(X1)[0]
     M = qml.math.shape(X2)[0]
 
+    if batch_size is not None:
+        rows, cols = np.divmod(np.arange(N * M), M)
+        X = (qml.math.stack(X1), qml.math.stack(X2))
+        values = _evaluate_in_chunks(kernel, X, (rows, cols), batch_size)
+        return _assemble_matrix(values, np.arange(N * M), (N, M))
+
     matrix = qml.math.stack([kernel(x, y) for x, y in product(X1, X2)])
 
     if qml.math.ndim(matrix[0]) == 0:
         return qml.math.reshape(matrix, (N, M))
 
     return qml.math.moveaxis(qml.math.reshape(matrix, (N, M, qml.math.size(matrix[0]))), -1, 0)
+
+
+def state_kernel_matrix(X1, X2, state_fn, batch_size=None):
+    r"""Computes the matrix of fidelity kernel values from the embedded states of the datapoints.
+
+    The fidelity kernel of an embedding :math:`x\mapsto|\psi(x)\rangle` is given by
+
+    .. math ::
+
+        k(x_1, x_2) = |\langle\psi(x_1)|\psi(x_2)\rangle|^2,
+
+    or by :math:`\operatorname{Tr}(\rho(x_1)\rho(x_2))` for embeddings into mixed states.
+    Instead of executing one circuit per pair of datapoints, the state of every datapoint is
+    computed once and the kernel matrix is obtained from a single matrix product.
+
+    Args:
+        X1 (list[datapoint]): List of datapoints (first argument)
+        X2 (list[datapoint]): List of datapoints (second argument). If ``None``, the square kernel
+            matrix of ``X1`` is computed.
+        state_fn (datapoint -> array[complex]): Function that maps a datapoint to its embedded
+            state vector or density matrix, for example a QNode returning :func:`~.state`.
+        batch_size (int, optional): If provided, ``state_fn`` is called with up to ``batch_size``
+            datapoints at once, stacked along a leading batch dimension, and must return one
+            state per datapoint.
+
+    Returns:
+        array[float]: The matrix of kernel values.
+
+    **Example:**
+
+    .. code-block :: python
+
+        dev = qml.device('default.qubit', wires=2)
+
+        @qml.qnode(dev)
+        def embedding(x):
+            qml.templates.AngleEmbedding(x, wires=dev.wires)
+            return qml.state()
+
+    The kernel matrix is the same as the one of the kernel
+    ``lambda x1, x2: circuit(x1, x2)[0]`` from :func:`~.kernels.kernel_matrix`, but it only
+    requires one execution per datapoint:
+
+    >>> X_train = np.array([[0.1, 0.2], [0.4, 1.3], [2.1, 0.7], [1.5, 2.8]])
+    >>> X_test = np.array([[0.3, 0.9], [1.8, 1.1], [2.5, 2.2]])
+    >>> qml.kernels.state_kernel_matrix(X_train, X_test, embedding)
+    tensor([[0.87362626, 0.35316861, 0.03833088],
+            [0.95813117, 0.57915321, 0.20073662],
+            [0.38254783, 0.93908016, 0.51423787],
+            [0.23048043, 0.42585054, 0.70289216]], requires_grad=True)
+    """
+
+    def _states(X):
+        if batch_size is None:
+            return qml.math.stack([state_fn(x) for x in X])
+        X = qml.math.stack(X)
+        indices = np.arange(qml.math.shape(X)[0])
+        return _evaluate_in_chunks(state_fn, (X,), (indices,), batch_size)
+
+    states1 = _states(X1)
+    states2 = states1 if X2 is None else _states(X2)
+
+    if qml.math.ndim(states1) == 3:
+        return qml.math.real(qml.math.einsum("aij,bji->ab", states1, states2))
+
+    overlaps = qml.math.tensordot(qml.math.conj(states1), states2, axes=[[1], [1]])
+    return qml.math.abs(overlaps) ** 2
@@ -169,12 +169,14 @@ def center(
     if all(isinstance(x, PauliWord) or len(x.pauli_rep) == 1 for x in g):
         return _center_pauli_words(g, pauli)
 
-    adjoint_repr = structure_constants(g, pauli)
+    # The sparse adjoint representation holds ad_x in the rows x * d to (x + 1) * d
+    d = len(g)
+    adjoint_repr = structure_constants(g, pauli, sparse=True)
     # Start kernels intersection with kernel of first DLA element
-    kernel_intersection = null_space(adjoint_repr[0])
-    for ad_x in adjoint_repr[1:]:
+    kernel_intersection = null_space(adjoint_repr[:d].toarray())
+    for x in range(1, d):
         # Compute the next kernel and intersect it with previous intersection
-        next_kernel = null_space(ad_x)
+        next_kernel = null_space(adjoint_repr[x * d : (x + 1) * d].toarray())
         kernel_intersection = _intersect_bases(kernel_intersection, next_kernel)
 
         # If the intersection is zero-dimensional, exit early
@@ -17,6 +17,8 @@ import copy
 from itertools import combinations, combinations_with_replacement
 from typing import Iterable, List, Union
 
+import numpy as np
+from scipy import sparse as sp
 from scipy.linalg import null_space, sqrtm
 
 import pennylane as qml
@@ -90,6 +92,7 @@ def horizontal_cartan_subalgebra(
         k (List[Union[PauliSentence, TensorLike]]): Vertical space :math:`\mathfrak{k}` from Cartan decomposition :math:`\mathfrak{g} = \mathfrak{k} \oplus \mathfrak{m}`.
         m (List[Union[PauliSentence, TensorLike]]): Horizontal space :math:`\mathfrak{m}` from Cartan decomposition :math:`\mathfrak{g} = \mathfrak{k} \oplus \mathfrak{m}`.
         adj (Array): The :math:`|\mathfrak{g}| \times |\mathfrak{g}| \times |\mathfrak{g}|` dimensional adjoint representation of :math:`\mathfrak{g}`.
+            The sparse adjoint representation returned by :func:`~structure_constants` with ``sparse=True`` is accepted as well.
             When ``None`` is provided, :func:`~structure_constants` is used internally by default to compute the adjoint representation.
         start_idx (bool): Indicates from which element in ``m`` the CSA computation starts.
         tol (float): Numerical tolerance for linear independence check.
@@ -243,7 +246,7 @@ def horizontal_cartan_subalgebra(
         for h_i in np_a:
 
             # obtain adjoint rep of candidate h_i
-            adjoint_of_h_i = qml.math.tensordot(adj, h_i, axes=[[1], [0]])
+            adjoint_of_h_i = _contract_adjoint_rep(adj, h_i)
             # compute kernel of adjoint
             new_kernel = null_space(adjoint_of_h_i, rcond=tol)
 
@@ -287,6 +290,18 @@ def horizontal_cartan_subalgebra(
     return newg, k, mtilde, a, new_adj
 
 
+def _contract_adjoint_rep(adj, vec):
+    """Contract the middle index of the (possibly sparse) adjoint representation with ``vec``."""
+    if not sp.issparse(adj):
+        return qml.math.tensordot(adj, vec, axes=[[1], [0]])
+
+    # row gamma * d + alpha and column beta of the sparse matrix hold adj[gamma, alpha, beta]
+    d = adj.shape[1]
+    adj = adj.tocoo()
+    gamma, alpha = np.divmod(adj.row, d)
+    return sp.coo_array((adj.data * vec[alpha], (gamma, adj.col)), shape=(d, d)).toarray()
+
+
 def adjvec_to_op(adj_vecs, basis, is_orthogonal=True):
     r"""Transform adjoint vector representations back into operator format.
 
@@ -296,7 +311,8 @@ def adjvec_to_op(adj_vecs, basis, is_orthogonal=True):
     .. seealso:: :func:`~op_to_adjvec`
 
     Args:
-        adj_vecs (TensorLike): collection of vectors with shape ``(batch, len(basis))``
+        adj_vecs (TensorLike): collection of vectors with shape ``(batch, len(basis))``, which may be
+            a ``scipy.sparse`` array
         basis (List[Union[PauliSentence, Operator, TensorLike]]): collection of basis operators
         is_orthogonal (bool): Whether the ``basis`` consists of orthogonal elements.
 
@@ -314,6 +330,9 @@ def adjvec_to_op(adj_vecs, basis, is_orthogonal=True):
 
     """
 
+    if sp.issparse(adj_vecs):
+        adj_vecs = adj_vecs.toarray()
+
     assert qml.math.shape(adj_vecs)[1] == len(basis)
 
     if all(isinstance(op, PauliSentence) for op in basis):
@@ -483,7 +502,8 @@ def change_basis_ad_rep(adj: TensorLike, basis_change: TensorLike):
     with the basis transformation matrix :math:`T` using ``change_basis_ad_rep``.
 
     Args:
-        adj (TensorLike): Adjoint representation in old basis.
+        adj (TensorLike): Adjoint representation in old basis. The sparse adjoint representation
+            returned by :func:`~structure_constants` with ``sparse=True`` is accepted as well.
         basis_change (TensorLike): Basis change matrix from old to new basis.
 
     Returns:
@@ -513,6 +533,13 @@ def change_basis_ad_rep(adj: TensorLike, basis_change: TensorLike):
     >>> np.allclose(new_adj, new_adj_re)
     True
     """
+    if sp.issparse(adj):
+        # Contract the last index with the sparse matrix product, "mnp,jp->mnj"
+        d = adj.shape[1]
+        new_adj = qml.math.reshape(adj @ qml.math.transpose(basis_change), (d, d, -1))
+        new_adj = qml.math.einsum("mnp,im->inp", new_adj, qml.math.linalg.pinv(basis_change.T))
+        return qml.math.einsum("mnp,in->mip", new_adj, basis_change)
+
     # Perform the einsum contraction "mnp, hm, in, jp -> hij" via three einsum steps
     new_adj = qml.math.einsum("mnp,im->inp", adj, qml.math.linalg.pinv(basis_change.T))
     new_adj = qml.math.einsum("mnp,in->mip", new_adj, basis_change)
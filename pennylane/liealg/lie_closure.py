@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A function to compute the Lie closure of a set of operators"""
+import time
 import warnings
 from copy import copy
 
 # pylint: disable=too-many-arguments
 from itertools import product
-from typing import Iterable, Union
+from typing import Callable, Iterable, Union
 
 import numpy as np
 
@@ -35,6 +36,7 @@ def lie_closure(
     pauli: bool = False,
     matrix: bool = False,
     tol: float = None,
+    callback: Callable = None,
 ) -> Iterable[Union[PauliWord, PauliSentence, Operator, np.ndarray]]:
     r"""Compute the (dynamical) Lie algebra from a set of generators.
 
@@ -54,6 +56,10 @@ def lie_closure(
         matrix (bool): Whether or not matrix representations should be used and returned in the Lie closure computation. This can help
             speed up the computation when using sums of Paulis with many terms. Default is ``False``.
         tol (float): Numerical tolerance for the linear independence check used in :class:`~.PauliVSpace`.
+        callback (Callable): Function called after every epoch with a dictionary of progress metrics. The
+            dictionary contains the ``"epoch"``, the DLA dimension ``"dim"``, the number ``"num_new"`` of operators
+            added in the epoch, the number ``"num_commutators"`` of commutators computed in the epoch and the
+            ``"time"`` in seconds since the start of the computation. Default is ``None``.
 
     Returns:
         Union[list[:class:`~.PauliSentence`], list[:class:`~.Operator`], np.ndarray]: A basis of either :class:`~.PauliSentence`,
@@ -139,9 +145,17 @@ def lie_closure(
          1.0 * (X(0) @ Y(1)),
          1.0 * (Y(0) @ Y(1))]
 
+        The progress of long computations can be monitored with the ``callback`` keyword argument,
+        which is called with a dictionary of metrics after every epoch.
+
+        >>> metrics = []
+        >>> dla = qml.lie_closure(ops, callback=metrics.append)
+        >>> [(m["epoch"], m["dim"], m["num_new"]) for m in metrics]
+        [(1, 5, 2), (2, 6, 1), (3, 6, 0)]
+
     """
     if matrix:
-        return _lie_closure_matrix(generators, max_iterations, verbose, tol)
+        return _lie_closure_matrix(generators, max_iterations, verbose, tol, callback)
 
     if not all(isinstance(op, (PauliSentence, PauliWord)) for op in generators):
         if pauli:
@@ -154,6 +168,7 @@ def lie_closure(
             for op in generators
         ]
 
+    start_time = time.perf_counter()
     vspace = PauliVSpace(generators, tol=tol)
 
     epoch = 0
@@ -168,7 +183,9 @@ def lie_closure(
         # and all original generators. This limits the number of commutators added in each
         # iteration, but it gives us a correspondence between the while loop iteration and the
         # nesting level of the commutators.
+        num_commutators = 0
         for ps1, ps2 in product(vspace.basis[old_length:], vspace.basis[:initial_length]):
+            num_commutators += 1
             com = ps1.commutator(ps2)
             com.simplify(tol=vspace.tol)
 
@@ -187,6 +204,9 @@ def lie_closure(
         new_length = len(vspace)
         epoch += 1
 
+        if callback is not None:
+            callback(_epoch_metrics(epoch, old_length, new_length, num_commutators, start_time))
+
         if epoch == max_iterations:
             warnings.warn(f"reached the maximum number of iterations {max_iterations}", UserWarning)
 
@@ -200,6 +220,17 @@ def lie_closure(
     return res
 
 
+def _epoch_metrics(epoch, old_length, new_length, num_commutators, start_time):
+    """Progress metrics of an epoch of the Lie closure passed to the ``callback``."""
+    return {
+        "epoch": epoch,
+        "dim": new_length,
+        "num_new": new_length - old_length,
+        "num_commutators": num_commutators,
+        "time": time.perf_counter() - start_time,
+    }
+
+
 def _hermitian_basis(matrices: Iterable[np.ndarray], tol: float = None, subbasis_length: int = 0):
     """Find a linearly independent basis of a list of (skew-) Hermitian matrices
 
@@ -244,6 +275,7 @@ def _lie_closure_matrix(
     max_iterations: int = 10000,
     verbose: bool = False,
     tol: float = None,
+    callback: Callable = None,
 ):
     r"""Compute the dynamical Lie algebra :math:`\mathfrak{g}` from a set of generators using their matrix representation.
 
@@ -263,6 +295,8 @@ def _lie_closure_matrix(
         verbose (bool): whether to print out progress updates during Lie closure
             calculation. Default is ``False``.
         tol (float): Numerical tolerance for the linear independence check between algebra elements
+        callback (Callable): Function called after every epoch with a dictionary of progress metrics,
+            see :func:`~lie_closure`.
 
     Returns:
         numpy.ndarray: The ``(dim(g), 2**n, 2**n)`` array containing the linearly independent basis of the DLA :math:`\mathfrak{g}` as matrices.
@@ -307,6 +341,7 @@ def _lie_closure_matrix(
     chi = qml.math.shape(generators[0])[0]
     assert qml.math.shape(generators) == (len(generators), chi, chi)
 
+    start_time = time.perf_counter()
     epoch = 0
     old_length = 0
     vspace = _hermitian_basis(generators, tol, old_length)
@@ -343,6 +378,9 @@ def _lie_closure_matrix(
         new_length = len(vspace)
         epoch += 1
 
+        if callback is not None:
+            callback(_epoch_metrics(epoch, old_length, new_length, len(all_coms), start_time))
+
         if epoch == max_iterations:
             warnings.warn(f"reached the maximum number of iterations {max_iterations}", UserWarning)
 
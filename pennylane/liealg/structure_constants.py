@@ -16,12 +16,17 @@ from itertools import combinations, combinations_with_replacement
 from typing import Union
 
 import numpy as np
+from scipy import sparse as sp
 
 import pennylane as qml
 from pennylane.operation import Operator
 from pennylane.pauli import PauliSentence, PauliWord
+from pennylane.pauli.packed_pauli import _anticommutes, _op_to_bits, _pack_bits, _product_phase
 from pennylane.typing import TensorLike
 
+# maximum number of pairs of Pauli words whose commutator is computed at once
+_BLOCK_PAIRS = 2**20
+
 
 def _all_commutators(ops):
     commutators = {}
@@ -33,11 +38,111 @@ def _all_commutators(ops):
     return commutators
 
 
+def _pauli_word_basis(g):
+    """Packed symplectic bits and coefficients of a basis of single Pauli words, or ``None`` if
+    not all basis elements are distinct single Pauli words."""
+    if not all(len(op) == 1 for op in g):
+        return None
+    words = [next(iter(op)) for op in g]
+    if len(set(words)) < len(words):
+        return None
+
+    wire_map = {w: i for i, w in enumerate(qml.wires.Wires.all_wires([pw.wires for pw in words]))}
+    bits = np.zeros((2, len(words), len(wire_map)), dtype=bool)
+    for i, pw in enumerate(words):
+        for wire, op in pw.items():
+            bits[:, i, wire_map[wire]] = _op_to_bits[op]
+    coeffs = np.array([next(iter(op.values())) for op in g])
+    return _pack_bits(bits[0]), _pack_bits(bits[1]), coeffs
+
+
+def _pauli_word_structure_constants(x, z, coeffs, norms_squared):
+    r"""Non-zero structure constants :math:`f^\gamma_{\alpha, \beta}` with :math:`\alpha < \beta`
+    of a basis of distinct single Pauli words :math:`G_\alpha = c_\alpha P_\alpha`.
+
+    The commutator of two anticommuting Pauli words is :math:`[P_\alpha, P_\beta] = 2 i^k P`,
+    where :math:`P` is the Pauli word with the symplectic bits :math:`(x_\alpha \oplus x_\beta,
+    z_\alpha \oplus z_\beta)`. The pairs are processed in blocks from the packed bits and
+    :math:`P` is looked up among the basis words with a binary search.
+
+    Returns:
+        tuple[array]: the indices ``gamma``, ``alpha`` and ``beta`` and the structure constants
+    """
+    d = len(x)
+    keys = np.ascontiguousarray(np.concatenate([x, z], axis=1))
+    keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+    sorter = np.argsort(keys)
+    sorted_keys = keys[sorter]
+
+    columns = np.arange(d)
+    block_size = max(1, _BLOCK_PAIRS // max(d, 1))
+    results = []
+    for start in range(0, d, block_size):
+        rows = columns[start : start + block_size]
+        anticommuting = _anticommutes(x[rows, None], z[rows, None], x[None], z[None])
+        alpha, beta = np.nonzero(anticommuting & (columns > rows[:, None]))
+        alpha = rows[alpha]
+
+        product = np.ascontiguousarray(
+            np.concatenate([x[alpha] ^ x[beta], z[alpha] ^ z[beta]], axis=1)
+        )
+        product = product.view(keys.dtype).ravel()
+        position = np.minimum(np.searchsorted(sorted_keys, product), d - 1)
+        in_basis = sorted_keys[position] == product
+        alpha, beta, gamma = alpha[in_basis], beta[in_basis], sorter[position[in_basis]]
+
+        phase = _product_phase(x[alpha], z[alpha], x[beta], z[beta])
+        commutator = 2 * (1j**phase) * coeffs[alpha] * coeffs[beta]
+        values = (1j * coeffs[gamma] * commutator).real / norms_squared[gamma]
+        results.append((gamma, alpha, beta, values))
+
+    if not results:
+        return tuple(np.zeros(0, dtype=dtype) for dtype in (int, int, int, float))
+    return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+
+def _pauli_sentence_structure_constants(g, norms_squared):
+    r"""Non-zero structure constants :math:`f^\gamma_{\alpha, \beta}` with :math:`\alpha < \beta`
+    of a basis of Pauli sentences.
+
+    The overlap of every commutator with the basis is computed from the basis elements that
+    share a Pauli word with the commutator, instead of from all basis elements.
+
+    Returns:
+        tuple[array]: the indices ``gamma``, ``alpha`` and ``beta`` and the structure constants
+    """
+    word_to_basis = {}
+    for i, op in enumerate(g):
+        for pw, coeff in op.items():
+            word_to_basis.setdefault(pw, []).append((i, coeff))
+
+    gamma, alpha, beta, values = [], [], [], []
+    for (j, k), res in _all_commutators(g).items():
+        overlaps = {}
+        for pw, coeff in res.items():
+            for i, basis_coeff in word_to_basis.get(pw, ()):
+                overlaps[i] = overlaps.get(i, 0.0) + basis_coeff * coeff
+        for i, overlap in overlaps.items():
+            # if is_orthogonal is activated, use v = ∑ (v · e_j / ||e_j||^2) * e_j
+            gamma.append(i)
+            alpha.append(j)
+            beta.append(k)
+            values.append((1j * overlap).real / norms_squared[i])
+
+    return (
+        np.array(gamma, dtype=int),
+        np.array(alpha, dtype=int),
+        np.array(beta, dtype=int),
+        np.array(values, dtype=float),
+    )
+
+
 def structure_constants(
     g: list[Union[Operator, PauliWord, PauliSentence]],
     pauli: bool = False,
     matrix: bool = False,
     is_orthogonal: bool = True,
+    sparse: bool = False,
 ) -> TensorLike:
     r"""
     Compute the structure constants that make up the adjoint representation of a Lie algebra.
@@ -59,11 +164,14 @@ def structure_constants(
         g (List[Union[Operator, PauliWord, PauliSentence]]): The (dynamical) Lie algebra for which we want to compute
             the adjoint representation. DLAs can be generated by a set of generators via :func:`~lie_closure`.
         pauli (bool): Indicates whether it is assumed that :class:`~.PauliSentence` or :class:`~.PauliWord` instances are input.
-            This can help with performance to avoid unnecessary conversions to :class:`~pennylane.operation.Operator`
-            and vice versa. Default is ``False``.
+            If ``True``, the inputs are used as they are instead of being checked for and converted to their Pauli
+            representation. Default is ``False``.
         matrix (bool): Whether or not matrix matrix representations are used and output in the structure constants computation. Default is ``False``.
         is_orthogonal (bool): Whether the set of operators in ``g`` is orthogonal with respect to the trace inner product.
             Default is ``True``.
+        sparse (bool): Whether to return the adjoint representation as a ``scipy.sparse.csr_array`` of shape ``(d * d, d)``,
+            where row ``gamma * d + alpha`` and column ``beta`` hold :math:`f^\gamma_{\alpha, \beta}`. Only the non-zero
+            structure constants are computed and stored. Requires an orthogonal set of Pauli operators. Default is ``False``.
 
     Returns:
         TensorLike: The adjoint representation of shape ``(d, d, d)``, corresponding to indices ``(gamma, alpha, beta)``.
@@ -147,6 +255,17 @@ def structure_constants(
     >>> adj.shape
     (12, 12, 12)
 
+    Most structure constants of a basis of Pauli words vanish. For large algebras, the adjoint
+    representation can be returned as a sparse matrix with ``sparse=True``. The adjoint
+    representation :math:`\text{ad}(iG_\gamma)` is given by the rows ``gamma * d`` to
+    ``(gamma + 1) * d`` of this matrix.
+
+    >>> adj_sparse = liealg.structure_constants(dla, sparse=True)
+    >>> adj_sparse.shape, adj_sparse.nnz
+    ((36, 6), 24)
+    >>> math.allclose(adj_sparse.toarray().reshape(6, 6, 6), liealg.structure_constants(dla))
+    True
+
     .. details::
         :title: Mathematical details
 
@@ -193,28 +312,53 @@ def structure_constants(
         be skipped.
 
     """
+    if sparse and (matrix or not is_orthogonal):
+        raise ValueError(
+            "Sparse structure constants can only be computed for orthogonal Pauli operators, "
+            "use structure_constants(.., sparse=True) with matrix=False and is_orthogonal=True."
+        )
+
     if matrix:
         return _structure_constants_matrix(g, is_orthogonal)
 
-    if any((getattr(op, "pauli_rep", None) is None) for op in g):
-        raise ValueError(
-            f"Cannot compute adjoint representation of non-pauli operators. Received {g}. If you want to use matrices, use structure_constants(.., matrix=True)"
-        )
+    if pauli:
+        g = [PauliSentence({op: 1.0}) if isinstance(op, PauliWord) else op for op in g]
+    else:
+        if any((getattr(op, "pauli_rep", None) is None) for op in g):
+            raise ValueError(
+                f"Cannot compute adjoint representation of non-pauli operators. Received {g}. If you want to use matrices, use structure_constants(.., matrix=True)"
+            )
 
-    if not pauli:
         g = [op.pauli_rep for op in g]
+    d = len(g)
 
-    commutators = _all_commutators(g)
+    # if is_orthogonal is activated we will use the norm_squared of the op, otherwise we won't
+    norms_squared = (
+        np.array([(op @ op).trace() for op in g]) if is_orthogonal else np.ones(d, dtype=float)
+    )
 
-    rep = np.zeros((len(g), len(g), len(g)), dtype=float)
-    for i, op in enumerate(g):
-        # if is_orthogonal is activated we will use the norm_squared of the op, otherwise we won't
-        norm_squared = (op @ op).trace() if is_orthogonal else 1
-        for (j, k), res in commutators.items():
-            # if is_orthogonal is activated, use v = ∑ (v · e_j / ||e_j||^2) * e_j
-            value = (1j * (op @ res).trace()).real / norm_squared
-            rep[i, j, k] = value
-            rep[i, k, j] = -value
+    if (pauli_word_basis := _pauli_word_basis(g)) is not None:
+        gamma, alpha, beta, values = _pauli_word_structure_constants(
+            *pauli_word_basis, norms_squared
+        )
+    else:
+        gamma, alpha, beta, values = _pauli_sentence_structure_constants(g, norms_squared)
+
+    if sparse:
+        return sp.csr_array(
+            (
+                np.concatenate([values, -values]),
+                (
+                    np.concatenate([gamma * d + alpha, gamma * d + beta]),
+                    np.concatenate([beta, alpha]),
+                ),
+            ),
+            shape=(d * d, d),
+        )
+
+    rep = np.zeros((d, d, d), dtype=float)
+    rep[gamma, alpha, beta] = values
+    rep[gamma, beta, alpha] = -values
 
     if not is_orthogonal:
         gram = np.zeros((len(g), len(g)), dtype=float)
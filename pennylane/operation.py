@@ -219,6 +219,7 @@ these objects are located in ``pennylane.ops.qubit.attributes``, not ``pennylane
     ~ops.qubit.attributes.symmetric_over_control_wires
 
 """
+
 # pylint:disable=access-member-before-definition,global-statement
 import abc
 import copy
@@ -379,6 +380,63 @@ def _process_data(op):
     return str([id(d) if qml.math.is_abstract(d) else _mod_and_round(d, mod_val) for d in op.data])
 
 
+def _parameter_key(data):
+    """A hashable key of a parameter made of its exact dtype, shape and bytes. Abstract parameters
+    get a new object as key, which is not equal to any other key."""
+    if qml.math.is_abstract(data):
+        return object()
+    data = np.asarray(qml.math.unwrap(data))
+    return data.dtype.str, data.shape, data.tobytes()
+
+
+def _hyperparameter_key(value, data_key):
+    """A hashable key that is equal for two hyperparameters if and only if they are equal.
+
+    Operators, dictionaries, lists and tuples are keyed recursively, arrays with ``data_key`` and
+    all the other values by their type and the value itself. Unhashable values get a new object
+    as key, which is not equal to any other key.
+    """
+    if isinstance(value, Operator):
+        return _operator_key(value, data_key)
+    if isinstance(value, dict):
+        return tuple((k, _hyperparameter_key(v, data_key)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_hyperparameter_key(v, data_key) for v in value)
+    if isinstance(value, TensorLike) and not isinstance(value, (int, float, complex, bytes)):
+        return data_key(value)
+    try:
+        hash(value)
+    except TypeError:
+        return object()
+    return type(value).__name__, value
+
+
+def _operator_key(op, data_key=_parameter_key):
+    """A hashable key that is equal for two operators if and only if they have the same name,
+    wires, hyperparameters and parameters.
+
+    Unlike :attr:`Operator.hash`, which uses the string representation of the hyperparameters and
+    the rounded parameters, the key compares the hyperparameters exactly and the parameters with
+    ``data_key``.
+
+    Args:
+        op (Operator): the operator
+        data_key (Callable): function mapping a parameter or an array valued hyperparameter to a
+            hashable key, by default its exact dtype, shape and bytes
+
+    Returns:
+        tuple: the key of the operator
+    """
+    if isinstance(op, qml.ops.op_math.CompositeOp):
+        return op.name, tuple(_operator_key(o, data_key) for o in op.operands)
+    return (
+        op.name,
+        tuple(op.wires),
+        _hyperparameter_key(op.hyperparameters, data_key),
+        tuple(data_key(d) for d in op.data),
+    )
+
+
 FlatPytree = tuple[Iterable[Any], Hashable]
 
 
@@ -618,15 +618,16 @@ class PauliError(Channel):
                 p = np.cast_like(p, 1j)
 
         ops = {
-            "X": np.convert_like(np.cast_like(np.array([[0, 1], [1, 0]]), p), p),
-            "Y": np.convert_like(np.cast_like(np.array([[0, -1j], [1j, 0]]), p), p),
-            "Z": np.convert_like(np.cast_like(np.array([[1, 0], [0, -1]]), p), p),
+            "X": np.array([[0, 1], [1, 0]]),
+            "Y": np.array([[0, -1j], [1j, 0]]),
+            "Z": np.array([[1, 0], [0, -1]]),
         }
 
         # K1 is composed by Kraus matrices of operators
         K1 = np.sqrt(p + np.eps) * np.convert_like(np.cast_like(np.eye(1), p), p)
         for op in operators[::-1]:
-            K1 = np.multi_dispatch()(np.kron)(ops[op], K1)
+            mat = np.convert_like(np.cast_like(ops[op], p), p)
+            K1 = np.multi_dispatch()(np.kron)(mat, K1)
 
         return [K0, K1]
 
@@ -55,4 +55,8 @@ from .dla import lie_closure, structure_constants, center
 
 from .pauli_vspace import PauliVSpace
 
+from .packed_pauli import PackedPauliSentence
+
+from .matrix_cache import MatrixCache, get_matrix_cache, set_matrix_cache
+
 from .trace_inner_product import trace_inner_product
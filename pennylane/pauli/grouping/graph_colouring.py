@@ -31,15 +31,25 @@ fewest number of colours (lowest "chromatic number") as possible.
 
 import numpy as np
 
+from pennylane.pauli.packed_pauli import _pack_bits
 
-def largest_first(binary_observables, adj):
+# maximum number of uint64 words held by the temporary arrays of a block of conflicts
+_BLOCK_WORDS = 2**22
+
+
+def largest_first(binary_observables, adj=None, grouping_type="qwc"):
     """Performs graph-colouring using the Largest Degree First heuristic. Runtime is quadratic in
     number of vertices.
 
     Args:
         binary_observables (array[int]): the set of Pauli words represented by a column matrix
             of the Pauli words in binary vector representation
-        adj (array[int]): the adjacency matrix of the Pauli graph
+        adj (array[int]): the adjacency matrix of the Pauli graph. If ``None``, the edges are
+            computed from the packed symplectic representation of the Pauli words when they are
+            needed, so that the extra memory is linear in the number of Pauli words.
+        grouping_type (str): the binary relation satisfied by Pauli words of the same colour if
+            ``adj`` is ``None``, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
+            ``'anticommuting'``
 
     Returns:
         dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
@@ -57,30 +67,13 @@ def largest_first(binary_observables, adj):
     >>> largest_first(binary_observables, adj)
     {1: [array([0., 0., 1.])], 2: [array([1., 0., 0.]), array([1., 1., 0.])]}
     """
+    degrees, neighbour_counts = _graph(binary_observables, adj, grouping_type)
+    order = np.argsort(degrees)[::-1]
+    colours = _largest_first_colours(degrees, neighbour_counts, order=order)
+    return _colours_to_terms(binary_observables, colours, order=order)
 
-    n_terms = np.shape(adj)[0]
-    terms = [binary_observables[i] for i in range(n_terms)]
-    rows = adj.sum(axis=0)
-    ind = np.argsort(rows)[::-1]
-    m_array = adj[ind, :][:, ind]
-    colours = {}
-    c_vec = np.zeros(n_terms, dtype=int)
-    k = 0
-    for i in range(n_terms):
-        neighbours = np.argwhere(m_array[i, :])
-        colours_available = set(np.arange(1, k + 1)) - set(c_vec[[x[0] for x in neighbours]])
-        term = terms[ind[i]]
-        if not colours_available:
-            k += 1
-            c_vec[i] = k
-            colours[c_vec[i]] = [term]
-        else:
-            c_vec[i] = min(list(colours_available))
-            colours[c_vec[i]].append(term)
-    return colours
 
-
-def recursive_largest_first(binary_observables, adj):  # pylint:disable=too-many-locals
+def recursive_largest_first(binary_observables, adj=None, grouping_type="qwc"):
     """Performs graph-colouring using the Recursive Largest Degree First heuristic. Often yields a
     lower chromatic number than Largest Degree First, but takes longer (runtime is cubic in number
     of vertices).
@@ -88,7 +81,12 @@ def recursive_largest_first(binary_observables, adj):  # pylint:disable=too-many
     Args:
         binary_observables (array[int]): the set of Pauli words represented by a column matrix of
             the Pauli words in binary vector representation
-        adj (array[int]): the adjacency matrix of the Pauli graph
+        adj (array[int]): the adjacency matrix of the Pauli graph. If ``None``, the edges are
+            computed from the packed symplectic representation of the Pauli words when they are
+            needed, so that the extra memory is linear in the number of Pauli words.
+        grouping_type (str): the binary relation satisfied by Pauli words of the same colour if
+            ``adj`` is ``None``, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
+            ``'anticommuting'``
 
     Returns:
         dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
@@ -106,41 +104,294 @@ def recursive_largest_first(binary_observables, adj):  # pylint:disable=too-many
     >>> recursive_largest_first(binary_observables, adj)
     {1: [array([0., 0., 1.])], 2: [array([1., 1., 0.]), array([1., 0., 0.])]}
     """
+    colours = _recursive_largest_first_colours(*_graph(binary_observables, adj, grouping_type))
+    return _colours_to_terms(binary_observables, colours)
+
+
+def dsatur(binary_observables, grouping_type="qwc"):
+    """Performs graph-colouring of the complement graph of a set of Pauli words using the Degree of
+    Saturation heuristic, without building the adjacency matrix.
+
+    The vertex with the largest number of distinct colours among its neighbours is coloured next,
+    with ties broken by the degree. The edges of the graph are computed from the packed symplectic
+    representation of the Pauli words when they are needed, so that the extra memory is linear in
+    the number of Pauli words. The runtime is quadratic in the number of Pauli words.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix of
+            the Pauli words in binary vector representation
+        grouping_type (str): the binary relation satisfied by Pauli words of the same colour, can
+            be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or ``'anticommuting'``
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 1, 0, 0],
+    ... [1, 0, 0, 0],
+    ... [0, 0, 1, 0],
+    ... [1, 0, 1, 0]])
+    >>> dsatur(binary_observables, "qwc")
+    {1: [array([0, 0, 1, 0])], 2: [array([1, 0, 1, 0])], 3: [array([1, 1, 0, 0]), array([1, 0, 0, 0])]}
+    """
+    return _colours_to_terms(binary_observables, _dsatur_colours(binary_observables, grouping_type))
+
+
+def sorted_insertion(binary_observables, grouping_type="qwc", order=None):
+    """Performs graph-colouring of the complement graph of a set of Pauli words by inserting the
+    Pauli words one at a time into the first colour they are compatible with.
+
+    The Pauli words are inserted in the given order, usually sorted by decreasing magnitude of
+    their coefficients. Qubit-wise commuting colours are represented by the union of their Pauli
+    words, so that a Pauli word is compared to all the colours at once. For the other grouping
+    types, a Pauli word is compared to all the Pauli words coloured before it. No adjacency matrix
+    is built and the extra memory is linear in the number of Pauli words.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix of
+            the Pauli words in binary vector representation
+        grouping_type (str): the binary relation satisfied by Pauli words of the same colour, can
+            be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or ``'anticommuting'``
+        order (Sequence[int]): the order in which the Pauli words are inserted. Defaults to the
+            order of ``binary_observables``.
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1, 1, 0, 0],
+    ... [1, 0, 0, 0],
+    ... [0, 0, 1, 0],
+    ... [1, 0, 1, 0]])
+    >>> sorted_insertion(binary_observables, "qwc", order=[3, 2, 1, 0])
+    {1: [array([1, 0, 1, 0])], 2: [array([0, 0, 1, 0])], 3: [array([1, 1, 0, 0]), array([1, 0, 0, 0])]}
+    """
+    colours = _sorted_insertion_colours(binary_observables, grouping_type, order=order)
+    return _colours_to_terms(binary_observables, colours)
+
+
+def _first_free_colour(neighbour_colours, n_colours):
+    """Smallest colour in ``1, ..., n_colours + 1`` that is not among the colours of the
+    neighbours of a vertex, where a colour of zero denotes an uncoloured neighbour."""
+    taken = np.zeros(n_colours + 2, dtype=bool)
+    taken[neighbour_colours] = True
+    return np.argmin(taken[1:]) + 1
+
+
+def _colours_to_terms(binary_observables, colours, order=None):
+    """Group the Pauli words in binary vector representation by their colour, keeping the given
+    order of the Pauli words within a colour."""
+    order = range(len(colours)) if order is None else order
+    grouped = {}
+    for i in order:
+        grouped.setdefault(int(colours[i]), []).append(binary_observables[i])
+    return dict(sorted(grouped.items()))
+
+
+def _packed_symplectic(binary_observables):
+    """Packed ``x`` and ``z`` bits of Pauli words in binary vector representation."""
+    binary_observables = np.asarray(binary_observables)
+    n_qubits = binary_observables.shape[1] // 2
+    bits = binary_observables.astype(bool)
+    return _pack_bits(bits[:, :n_qubits]), _pack_bits(bits[:, n_qubits:])
+
+
+def _parity(words):
+    """Parity of the number of set bits of every uint64 word."""
+    words = words.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        words ^= words >> np.uint64(shift)
+    return (words & np.uint64(1)).astype(bool)
+
+
+def _conflicts(x_rows, z_rows, x, z, grouping_type):
+    """Edges of the complement graph between the Pauli words ``rows`` and the Pauli words
+    ``(x, z)``, all given by their packed ``x`` and ``z`` bits.
+
+    Args:
+        x_rows (array[uint64]): packed ``x`` bits of one Pauli word or a block of Pauli words
+        z_rows (array[uint64]): packed ``z`` bits of one Pauli word or a block of Pauli words
+        x (array[uint64]): packed ``x`` bits of the Pauli words to compare to
+        z (array[uint64]): packed ``z`` bits of the Pauli words to compare to
+        grouping_type (str): the binary relation that is **not** satisfied by neighbours
+
+    Returns:
+        array[bool]: ``conflicts[i, j]`` is ``True`` iff the Pauli words ``i`` of the rows and
+        ``j`` do not satisfy the relation. The shape is ``(len(x_rows), len(x))``, or
+        ``(len(x),)`` for a single Pauli word.
+    """
+    x_rows, z_rows = x_rows[..., None, :], z_rows[..., None, :]
+    if grouping_type == "qwc":
+        # both Pauli words act non-trivially on a qubit with different Pauli operators
+        differ = ((x_rows ^ x) | (z_rows ^ z)) & (x_rows | z_rows) & (x | z)
+        return differ.any(axis=-1)
+    anticommute = _parity(np.bitwise_xor.reduce((x_rows & z) ^ (z_rows & x), axis=-1))
+    return anticommute if grouping_type == "commuting" else ~anticommute
+
+
+def _conflict_blocks(binary_observables, grouping_type):
+    """Iterate over blocks of rows of the adjacency matrix of the complement graph.
+
+    The blocks are small enough for the temporary arrays to hold at most ``_BLOCK_WORDS``
+    uint64 words, so that the extra memory is linear in the number of Pauli words.
+
+    Yields:
+        tuple[int, array[bool]]: the index of the first row of the block and the block
+    """
+    x, z = _packed_symplectic(binary_observables)
+    n_terms, n_words = x.shape
+    block_size = max(1, _BLOCK_WORDS // (n_terms * n_words)) if n_terms else 1
+    for start in range(0, n_terms, block_size):
+        rows = slice(start, start + block_size)
+        yield start, _conflicts(x[rows], z[rows], x, z, grouping_type)
+
+
+def _degrees(binary_observables, grouping_type):
+    """Degrees of the vertices of the complement graph, computed block by block."""
+    degrees = np.zeros(len(binary_observables), dtype=np.int64)
+    for start, block in _conflict_blocks(binary_observables, grouping_type):
+        degrees[start : start + len(block)] = block.sum(axis=1)
+    if grouping_type == "anticommuting":
+        # every Pauli word commutes with itself
+        degrees -= 1
+    return degrees
+
+
+def _graph(binary_observables, adj, grouping_type):
+    """Degrees of the vertices of the complement graph and a function ``neighbour_counts(rows,
+    cols)`` returning the number of neighbours among the vertices ``rows`` of every vertex in
+    ``cols``, from the adjacency matrix if it is given or else from the packed Pauli words."""
+    if adj is not None:
+        adj = np.array(adj, dtype=bool)
+        np.fill_diagonal(adj, False)
+        return adj.sum(axis=1), lambda rows, cols: adj[np.ix_(rows, cols)].sum(axis=0)
+
+    x, z = _packed_symplectic(binary_observables)
+
+    def neighbour_counts(rows, cols):
+        counts = np.zeros(len(cols), dtype=np.int64)
+        block_size = max(1, _BLOCK_WORDS // max(1, len(cols) * x.shape[1]))
+        for start in range(0, len(rows), block_size):
+            block_rows = rows[start : start + block_size]
+            block = _conflicts(x[block_rows], z[block_rows], x[cols], z[cols], grouping_type)
+            block &= block_rows[:, None] != cols
+            counts += block.sum(axis=0)
+        return counts
+
+    return _degrees(binary_observables, grouping_type), neighbour_counts
+
+
+def _largest_first_colours(degrees, neighbour_counts, order):
+    """Colours of the vertices found by colouring them in the given order, usually by decreasing
+    degree, with the first colour that none of their neighbours has."""
+    vertices = np.arange(len(degrees))
+    colours = np.zeros(len(degrees), dtype=np.int64)
+    n_colours = 0
+    for vertex in order:
+        neighbours = neighbour_counts(np.array([vertex]), vertices) > 0
+        colours[vertex] = _first_free_colour(colours[neighbours], n_colours)
+        n_colours = max(n_colours, colours[vertex])
+    return colours
+
+
+def _recursive_largest_first_colours(degrees, neighbour_counts):
+    """Colours of the vertices found with the Recursive Largest First heuristic.
+
+    A colour is built from the uncoloured vertex of largest degree, adding the vertex that is not
+    adjacent to the colour and has the most neighbours adjacent to it until no vertex can be added.
+    The degrees within the uncoloured vertices and the numbers of neighbours adjacent to the colour
+    are updated from the rows of the adjacency matrix of the vertices that are added to the colour
+    or become adjacent to it, or of the vertices that are not adjacent to it if there are fewer.
+    """
+    degrees = degrees.copy()
+    colours = np.zeros(len(degrees), dtype=np.int64)
+    uncoloured = np.arange(len(degrees))
+    colour = 0
+    while len(uncoloured):
+        colour += 1
+        sub_degrees = degrees[uncoloured]
+        vertex = np.argmax(sub_degrees)
+        in_colour = np.zeros(len(uncoloured), dtype=bool)
+        # uncoloured vertices adjacent to the colour, which can no longer join it
+        blocked = np.zeros(len(uncoloured), dtype=bool)
+        # number of neighbours of every uncoloured vertex that are adjacent to the colour
+        blocked_neighbours = np.zeros(len(uncoloured), dtype=np.int64)
+        while True:
+            in_colour[vertex] = True
+            rows = uncoloured[[vertex]]
+            newly_blocked = (neighbour_counts(rows, uncoloured) > 0) & ~blocked
+            blocked |= newly_blocked
+            if np.count_nonzero(newly_blocked) <= np.count_nonzero(~blocked):
+                blocked_neighbours += neighbour_counts(uncoloured[newly_blocked], uncoloured)
+            else:
+                # fewer rows are needed to count the neighbours that are not adjacent to the colour
+                blocked_neighbours = sub_degrees - neighbour_counts(
+                    uncoloured[~blocked], uncoloured
+                )
+            candidates = ~blocked & ~in_colour
+            if not candidates.any():
+                break
+            vertex = np.argmax(np.where(candidates, blocked_neighbours, -1))
+        colours[uncoloured[in_colour]] = colour
+        degrees[uncoloured] -= neighbour_counts(uncoloured[in_colour], uncoloured)
+        uncoloured = uncoloured[~in_colour]
+    return colours
+
+
+def _dsatur_colours(binary_observables, grouping_type):
+    """Colours of the Pauli words found with the Degree of Saturation heuristic."""
+    x, z = _packed_symplectic(binary_observables)
+    n_terms = len(x)
+    degrees = _degrees(binary_observables, grouping_type)
+    saturation = np.zeros(n_terms, dtype=np.int64)
+    colours = np.zeros(n_terms, dtype=np.int64)
+    # packed masks of the vertices that have a neighbour of each colour
+    neighbours_of_colour = []
+    for _ in range(n_terms):
+        priority = np.where(colours == 0, saturation * (n_terms + 1) + degrees, -1)
+        vertex = np.argmax(priority)
+        neighbours = _conflicts(x[vertex], z[vertex], x, z, grouping_type)
+        neighbours[vertex] = False
+        colour = _first_free_colour(colours[neighbours], len(neighbours_of_colour))
+        colours[vertex] = colour
+        if colour > len(neighbours_of_colour):
+            neighbours_of_colour.append(np.zeros((n_terms + 7) // 8, dtype=np.uint8))
+        mask = neighbours_of_colour[colour - 1]
+        saturation[neighbours & ~np.unpackbits(mask, count=n_terms).astype(bool)] += 1
+        mask |= np.packbits(neighbours)
+    return colours
+
+
+def _sorted_insertion_colours(binary_observables, grouping_type, order=None):
+    """Colours of the Pauli words found by inserting them in the given order into the first
+    compatible colour."""
+    x, z = _packed_symplectic(binary_observables)
+    n_terms = len(x)
+    order = range(n_terms) if order is None else order
+    colours = np.zeros(n_terms, dtype=np.int64)
+    n_colours = 0
+    if grouping_type == "qwc":
+        # a Pauli word is qubit-wise commuting with all the Pauli words of a colour iff it is
+        # qubit-wise commuting with their product, the union of the Pauli words
+        union_x, union_z = np.zeros_like(x), np.zeros_like(z)
+        for vertex in order:
+            conflicts = _conflicts(
+                x[vertex], z[vertex], union_x[:n_colours], union_z[:n_colours], grouping_type
+            )
+            colour = np.argmin(conflicts) if not conflicts.all() else n_colours
+            union_x[colour] |= x[vertex]
+            union_z[colour] |= z[vertex]
+            n_colours = max(n_colours, colour + 1)
+            colours[vertex] = colour + 1
+        return colours
 
-    def n_0(m_array, coloured):
-        m_coloured = m_array[list(coloured)]
-        l_val = m_coloured[-1]
-        for i in range(len(m_coloured) - 1):
-            l_val += m_coloured[i]
-        white_neighbours = np.argwhere(np.logical_not(l_val))
-        return {x[0] for x in white_neighbours} - coloured
-
-    n_terms = np.shape(adj)[0]
-    terms = [binary_observables[i] for i in range(n_terms)]
-    colours = {}
-    c_vec = np.zeros(n_terms, dtype=int)
-    uncoloured = set(np.arange(n_terms))
-    coloured = set()
-    k = 0
-    while uncoloured:
-        decode = np.array(list(uncoloured))
-        k += 1
-        m_array = adj[:, decode][decode, :]
-        v_indices = np.argmax(m_array.sum(axis=1))
-        coloured_sub = {v_indices}
-        uncoloured_sub = set(np.arange(len(decode))) - {v_indices}
-        n0_set = n_0(m_array, coloured_sub)
-        n1_set = uncoloured_sub - n0_set
-        while n0_set:
-            m_uncoloured = m_array[:, list(n1_set)][list(n0_set), :]
-            v_indices = list(n0_set)[np.argmax(m_uncoloured.sum(axis=1))]
-            coloured_sub.add(v_indices)
-            uncoloured_sub -= {v_indices}
-            n0_set = n_0(m_array, coloured_sub)
-            n1_set = uncoloured_sub - n0_set
-        indices = decode[list(coloured_sub)]
-        c_vec[indices] = k
-        colours[k] = [terms[i] for i in indices]
-        coloured |= set(indices)
-        uncoloured = set(np.arange(n_terms)) - coloured
+    for vertex in order:
+        neighbours = _conflicts(x[vertex], z[vertex], x, z, grouping_type)
+        neighbours[vertex] = False
+        colours[vertex] = _first_free_colour(colours[neighbours], n_colours)
+        n_colours = max(n_colours, colours[vertex])
     return colours
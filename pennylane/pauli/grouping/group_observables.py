@@ -27,13 +27,19 @@ import rustworkx as rx
 import pennylane as qml
 from pennylane.pauli.utils import (
     are_identical_pauli_words,
-    binary_to_pauli,
     observables_to_binary_matrix,
 )
 from pennylane.typing import TensorLike
 from pennylane.wires import Wires
 
-from .graph_colouring import recursive_largest_first
+from .graph_colouring import (
+    _conflict_blocks,
+    _dsatur_colours,
+    _graph,
+    _largest_first_colours,
+    _recursive_largest_first_colours,
+    _sorted_insertion_colours,
+)
 
 GROUPING_TYPES = frozenset(["qwc", "commuting", "anticommuting"])
 
@@ -49,7 +55,7 @@ except AttributeError:  # pragma: no cover
     new_rx = False  # pragma: no cover. # This error is raised for versions lower than 0.15.0
     RX_STRATEGIES = {"lf": None}  # pragma: no cover # Only "lf" can be used without a strategy
 
-GRAPH_COLOURING_METHODS = frozenset(RX_STRATEGIES.keys()).union({"rlf"})
+GRAPH_COLOURING_METHODS = frozenset(RX_STRATEGIES.keys()).union({"lf", "rlf", "dsatur", "si"})
 
 
 class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
@@ -77,21 +83,26 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             ``'anticommuting'``.
         graph_colourer (str): The heuristic algorithm to employ for graph
             colouring, can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive
-            Largest First), ``'dsatur'`` (Degree of Saturation), or ``'gis'`` (IndependentSet). Defaults to ``'lf'``.
+            Largest First), ``'dsatur'`` (Degree of Saturation), ``'gis'`` (IndependentSet),
+            or ``'si'`` (Sorted Insertion). Defaults to ``'lf'``.
+        coefficients (Optional[TensorLike]): The coefficients of the Pauli words. If provided,
+            sorted insertion inserts the Pauli words by decreasing magnitude of their
+            coefficients. Otherwise, they are inserted in the given order.
 
     Raises:
         ValueError: If arguments specified for ``grouping_type`` or ``graph_colourer``
             are not recognized.
 
     .. seealso:: `rustworkx.ColoringStrategy <https://www.rustworkx.org/apiref/rustworkx.ColoringStrategy.html#coloringstrategy>`_
-        for more information on the ``('lf', 'dsatur', 'gis')`` strategies.
+        for more information on the ``'gis'`` strategy.
     """
 
     def __init__(
         self,
         observables,
         grouping_type: Literal["qwc", "commuting", "anticommuting"] = "qwc",
-        graph_colourer: Literal["lf", "rlf", "dsatur", "gis"] = "lf",
+        graph_colourer: Literal["lf", "rlf", "dsatur", "gis", "si"] = "lf",
+        coefficients=None,
     ):
         self.graph_colourer = graph_colourer.lower()
         self.grouping_type = grouping_type.lower()
@@ -101,10 +112,10 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
                 f"Grouping type must be one of: {GROUPING_TYPES}, instead got {grouping_type}."
             )
 
-        if self.graph_colourer in ["dsatur", "gis"] and not new_rx:
+        if self.graph_colourer == "gis" and not new_rx:
             raise ValueError(
                 f"The strategy '{graph_colourer}' is not supported in this version of Rustworkx. "
-                "Please install rustworkx>=0.15.0 to access the 'dsatur' and 'gis' colouring strategies."
+                "Please install rustworkx>=0.15.0 to access the 'gis' colouring strategy."
             )
 
         if self.graph_colourer not in GRAPH_COLOURING_METHODS:
@@ -114,6 +125,7 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             )
 
         self.observables = observables
+        self.coefficients = coefficients
         self._wire_map = None
 
     @cached_property
@@ -174,8 +186,7 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
 
         The nodes are the observables (can only be accessed through their integer index).
         """
-        # Use upper triangle since adjacency matrix is symmetric and we have an undirected graph
-        edges = list(zip(*np.where(np.triu(self.adj_matrix, k=1))))
+        edges = _complement_edges(self.binary_observables, grouping_type=self.grouping_type)
         # Create complement graph
         if new_rx:
             # node/edge hinting was introduced on version 0.15
@@ -200,15 +211,7 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             list[list[Operator]]: List of partitions of the Pauli observables made up of mutually (anti-)commuting
             observables.
         """
-        if self.graph_colourer != "rlf":
-            return self.pauli_partitions_from_graph()
-        coloured_binary_paulis = recursive_largest_first(self.binary_observables, self.adj_matrix)
-
-        # Need to convert back from the symplectic representation
-        return [
-            [binary_to_pauli(pauli_word, wire_map=self._wire_map) for pauli_word in grouping]
-            for grouping in coloured_binary_paulis.values()
-        ]
+        return self.pauli_partitions_from_graph()
 
     @cached_property
     def _idx_partitions_dict_from_graph(self) -> dict[int, list[int]]:
@@ -216,31 +219,61 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
 
         Colours the complement graph using a greedy colouring algorithm and groups indices by colour.
 
-        Uses the ``graph_greedy_color`` function from ``Rustworkx`` to colour the graph defined by
-        ``self.complement_graph`` using a specified strategy from ``RX_STRATEGIES``. It then groups the indices
-        (nodes) of the graph by their assigned colours.
+        The ``'lf'``, ``'rlf'``, ``'dsatur'`` and ``'si'`` strategies colour the observables with the
+        functions of :mod:`~.graph_colouring`, which compute the edges from the packed symplectic
+        representation of the observables without building the graph. The ``'si'`` strategy
+        inserts the observables by decreasing magnitude of ``self.coefficients``, or in the given
+        order if there are no coefficients. The ``'gis'`` strategy uses the ``graph_greedy_color``
+        function from ``Rustworkx`` to colour the graph defined by ``self.complement_graph``.
+        The indices (nodes) of the graph are then grouped by their assigned colours.
 
         Returns:
             dict[int, list[int]]: A dictionary where the keys are colours (integers) and the values are lists
                 of indices (nodes) that have been assigned that colour.
         """
         # A dictionary where keys are node indices and the value is the colour
-        if new_rx:
-            # 'strategy' kwarg was implemented in Rustworkx 0.15
+        if self.graph_colourer == "gis":
             colouring_dict = rx.graph_greedy_color(
                 self.complement_graph, strategy=RX_STRATEGIES[self.graph_colourer]
             )
         else:
-            # Default value for <0.15.0 was 'lf'.
-            colouring_dict = rx.graph_greedy_color(self.complement_graph)
+            colouring_dict = dict(enumerate(self._packed_colours().tolist()))
 
         # group together indices (values) of the same colour (keys)
         groups = defaultdict(list)
         for idx, colour in sorted(colouring_dict.items()):
             groups[colour].append(idx)
 
+        if self.graph_colourer == "rlf":
+            # the colours of Recursive Largest First are ordered by construction
+            return dict(sorted(groups.items()))
         return groups
 
+    def _packed_colours(self):
+        """Colours of the observables found with the ``graph_colourer`` heuristic from the packed
+        symplectic representation of the observables."""
+        if self.graph_colourer == "si":
+            return _sorted_insertion_colours(
+                self.binary_observables, self.grouping_type, order=self._insertion_order()
+            )
+        if self.graph_colourer == "dsatur":
+            return _dsatur_colours(self.binary_observables, self.grouping_type)
+
+        degrees, neighbour_counts = _graph(self.binary_observables, None, self.grouping_type)
+        if self.graph_colourer == "lf":
+            # ties are broken by the index, as in the ``Degree`` strategy of Rustworkx
+            order = np.argsort(-degrees, kind="stable")
+            return _largest_first_colours(degrees, neighbour_counts, order=order)
+        return _recursive_largest_first_colours(degrees, neighbour_counts)
+
+    def _insertion_order(self):
+        """The indices of the observables by decreasing magnitude of their coefficients, or
+        ``None`` if the coefficients are not available."""
+        if self.coefficients is None or any(qml.math.is_abstract(c) for c in self.coefficients):
+            return None
+        magnitudes = np.abs([qml.math.unwrap(c) for c in self.coefficients])
+        return np.argsort(-magnitudes, kind="stable")
+
     def idx_partitions_from_graph(self, observables_indices=None) -> tuple[tuple[int, ...], ...]:
         """Use ``Rustworkx`` graph colouring algorithms to partition the indices of the Pauli observables into
         tuples containing the indices of observables satisying the binary relation determined by ``self.grouping_type``.
@@ -340,6 +373,8 @@ def _adj_matrix_from_symplectic(symplectic_matrix: np.ndarray, grouping_type: st
     """Get adjacency matrix of (anti-)commuting graph based on grouping type.
 
     This is the adjacency matrix of the complement graph. Based on symplectic representations and inner product of [1].
+    The matrix is filled block by block from the packed symplectic representation of the observables,
+    so that no temporary array of size ``m x m x n_qubits`` is created.
 
     [1] Andrew Jena (2019). Partitioning Pauli Operators: in Theory and in Practice.
     UWSpace. http://hdl.handle.net/10012/15017
@@ -355,36 +390,42 @@ def _adj_matrix_from_symplectic(symplectic_matrix: np.ndarray, grouping_type: st
         np.ndarray: Adjacency matrix. Binary matrix such that adj_matrix[i,j] = 1 if observables[i]
         observables[j] do **not** (anti-)commute, as determined by the ``grouping_type``.
     """
-
-    n_qubits = symplectic_matrix.shape[1] // 2
-
-    # Convert symplectic representation to integer format.
-    # This is equivalent to the map: {0: I, 1: X, 2:Y, Z:3}
-    pauli_matrix_int = 2 * symplectic_matrix[:, :n_qubits] + symplectic_matrix[:, n_qubits:]
-    pauli_matrix_int = pauli_matrix_int.astype(np.int8)
-    # Broadcast the second dimension, sucht that pauli_matrix_broad.shape = (m, 1, n_qubits)
-    # with m = len(observables). This allows for calculation of all possible combinations of Pauli observable pairs (Pi, Pj).
-    # Something like: result[i, j, k] = pauli_matrix_int[i, k] * pauli_matrix_int[j, k]
-    pauli_matrix_broad = pauli_matrix_int[:, None]
-    # Calculate the symplectic inner product in [1], using the integer representation - hence the difference in the equation form.
-    # qubit_anticommutation_mat[i,j, k] is k=0 if Pi and Pj commute, else k!=0 if they anticommute.
-    qubit_anticommutation_mat = (pauli_matrix_int * pauli_matrix_broad) * (
-        pauli_matrix_int - pauli_matrix_broad
-    )
-    # 'adjacency_mat[i, j]' is True iff Paulis 'i' and 'j' do not (anti-)commute under given grouping_type.
-    if grouping_type == "qwc":
-        # True if any term anti commutes
-        adj_matrix = np.logical_or.reduce(qubit_anticommutation_mat, axis=2)
-    elif grouping_type == "commuting":
-        # True if the number of anti commuting terms is odd (anti commte)
-        adj_matrix = np.logical_xor.reduce(qubit_anticommutation_mat, axis=2)
-    else:
-        # True if the number of anti commuting terms is even (commute)
-        adj_matrix = ~np.logical_xor.reduce(qubit_anticommutation_mat, axis=2)
+    n_terms = len(symplectic_matrix)
+    adj_matrix = np.empty((n_terms, n_terms), dtype=bool)
+    for start, block in _conflict_blocks(symplectic_matrix, grouping_type):
+        adj_matrix[start : start + len(block)] = block
 
     return adj_matrix
 
 
+def _complement_edges(symplectic_matrix: np.ndarray, grouping_type: str) -> list[tuple[int, int]]:
+    """Get the edges ``(i, j)`` with ``i < j`` of the complement graph based on grouping type.
+
+    The edges are computed block by block from the packed symplectic representation of the
+    observables, so that the adjacency matrix is never stored.
+
+    Args:
+        symplectic_matrix (np.ndarray): 2D symplectic matrix. Each row corresponds to the
+        symplectic representation of the Pauli observables.
+        grouping_type (str): the binary relation used to define partitions of
+            the Pauli words, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
+            ``'anticommuting'``.
+
+    Returns:
+        list[tuple[int, int]]: Edges between the observables that do **not** (anti-)commute,
+        as determined by the ``grouping_type``.
+    """
+    columns = np.arange(len(symplectic_matrix))
+    edges = []
+    for start, block in _conflict_blocks(symplectic_matrix, grouping_type):
+        # Use upper triangle since the graph is undirected
+        block &= columns > columns[start : start + len(block), None]
+        rows, cols = np.nonzero(block)
+        edges.extend(zip((rows + start).tolist(), cols.tolist()))
+
+    return edges
+
+
 def compute_partition_indices(
     observables: list, grouping_type: str = "qwc", method: str = "lf"
 ) -> tuple[tuple[int]]:
@@ -398,7 +439,7 @@ def compute_partition_indices(
             It can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``. Defaults to ``'qwc'``.
         method (str): The graph colouring heuristic to use in solving minimum clique cover.
             It can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'`` (Degree of Saturation),
-            or ``'gis'`` (Greedy Independent Set). Defaults to ``'lf'``.
+            ``'gis'`` (Greedy Independent Set), or ``'si'`` (Sorted Insertion). Defaults to ``'lf'``.
 
     Returns:
         tuple[tuple[int]]: A tuple of tuples where each inner tuple contains the indices of
@@ -406,7 +447,7 @@ def compute_partition_indices(
         graph colouring method.
 
     .. seealso:: `rustworkx.ColoringStrategy <https://www.rustworkx.org/apiref/rustworkx.ColoringStrategy.html#coloringstrategy>`_
-        for more information on the ``('lf', 'dsatur', 'gis')`` strategies.
+        for more information on the ``'gis'`` strategy.
 
     **Example**
 
@@ -415,56 +456,23 @@ def compute_partition_indices(
     >>> compute_partition_indices(observables, grouping_type="qwc", method="lf")
     ((0,), (1, 2))
     """
-    if method != "rlf":
-
-        idx_no_wires = [idx for idx, obs in enumerate(observables) if len(obs.wires) == 0]
-
-        if len(idx_no_wires) == len(observables):
-            return (tuple(idx_no_wires),)
-
-        pauli_groupper = PauliGroupingStrategy(
-            observables, grouping_type=grouping_type, graph_colourer=method
-        )
-
-        return pauli_groupper.idx_partitions_from_graph()
-    # 'rlf' method is not compatible with the rx implementation.
-    return _compute_partition_indices_rlf(observables, grouping_type=grouping_type)
-
-
-def _compute_partition_indices_rlf(observables: list, grouping_type: str):
-    """Computes the partition indices of a list of observables using a specified grouping type and 'rlf' method.
-
-    This option is much less efficient so should be avoided.
-    """
-
-    with qml.QueuingManager.stop_recording():
-        obs_groups = group_observables(observables, grouping_type=grouping_type, method="rlf")
+    idx_no_wires = [idx for idx, obs in enumerate(observables) if len(obs.wires) == 0]
 
-    observables = copy(observables)
+    if len(idx_no_wires) == len(observables):
+        return (tuple(idx_no_wires),)
 
-    indices = []
-    available_indices = list(range(len(observables)))
-    for partition in obs_groups:  # pylint:disable=too-many-nested-blocks
-        indices_this_group = []
-        for pauli_word in partition:
-            # find index of this pauli word in remaining original observables,
-            for ind, observable in enumerate(observables):
-                if qml.pauli.are_identical_pauli_words(pauli_word, observable):
-                    indices_this_group.append(available_indices[ind])
-                    # delete this observable and its index, so it cannot be found again
-                    observables.pop(ind)
-                    available_indices.pop(ind)
-                    break
-        indices.append(tuple(indices_this_group))
+    pauli_groupper = PauliGroupingStrategy(
+        observables, grouping_type=grouping_type, graph_colourer=method
+    )
 
-    return tuple(indices)
+    return pauli_groupper.idx_partitions_from_graph()
 
 
 def group_observables(
     observables: list["qml.operation.Operator"],
     coefficients: Optional[TensorLike] = None,
     grouping_type: Literal["qwc", "commuting", "anticommuting"] = "qwc",
-    method: Literal["lf", "rlf", "dsatur", "gis"] = "lf",
+    method: Literal["lf", "rlf", "dsatur", "gis", "si"] = "lf",
 ):
     """Partitions a list of observables (Pauli operations and tensor products thereof) into
     groupings according to a binary relation (qubit-wise commuting, fully-commuting, or
@@ -483,7 +491,11 @@ def group_observables(
             It can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``.
         method (str): The graph colouring heuristic to use in solving minimum clique cover, which
             can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First),
-            ``'dsatur'`` (Degree of Saturation), or ``'gis'`` (IndependentSet). Defaults to ``'lf'``.
+            ``'dsatur'`` (Degree of Saturation), ``'gis'`` (IndependentSet), or ``'si'``
+            (Sorted Insertion). Defaults to ``'lf'``. Sorted insertion inserts the observables by
+            decreasing magnitude of their coefficients, or in the given order if no coefficients
+            are specified, into the first compatible group without building the graph, and is
+            suited to large sets of observables.
 
     Returns:
        tuple:
@@ -499,7 +511,7 @@ def group_observables(
             of Pauli words
 
     .. seealso:: `rustworkx.ColoringStrategy <https://www.rustworkx.org/apiref/rustworkx.ColoringStrategy.html#coloringstrategy>`_
-        for more information on the ``('lf', 'dsatur', 'gis')`` strategies.
+        for more information on the ``'gis'`` strategy.
 
     **Example**
 
@@ -517,13 +529,15 @@ def group_observables(
         raise IndexError("The coefficients list must be the same length as the observables list.")
 
     # Separate observables based on whether they have wires or not.
-    no_wires_obs, wires_obs = [], []
+    no_wires_obs, wires_obs, wires_coeffs = [], [], []
 
-    for ob in observables:
+    for i, ob in enumerate(observables):
         if len(ob.wires) == 0:
             no_wires_obs.append(ob)
         else:
             wires_obs.append(ob)
+            if coefficients is not None:
+                wires_coeffs.append(coefficients[i])
 
     # Handle case where all observables have no wires
     if not wires_obs:
@@ -533,7 +547,10 @@ def group_observables(
 
     # Initialize PauliGroupingStrategy
     pauli_groupper = PauliGroupingStrategy(
-        wires_obs, grouping_type=grouping_type, graph_colourer=method
+        wires_obs,
+        grouping_type=grouping_type,
+        graph_colourer=method,
+        coefficients=None if coefficients is None else wires_coeffs,
     )
 
     partitioned_paulis = pauli_groupper.partition_observables()
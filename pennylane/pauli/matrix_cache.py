@@ -0,0 +1,160 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A memory-bounded cache for the matrices of Pauli sentences."""
+from threading import RLock
+from typing import Optional
+
+import numpy as np
+from cachetools import Cache, LRUCache
+from scipy import sparse
+
+
+def _matrix_nbytes(matrix) -> int:
+    """The approximate number of bytes occupied by a dense or sparse matrix."""
+    if sparse.issparse(matrix):
+        # data and column indices of the non-zero entries, plus the row pointers
+        return matrix.nnz * (matrix.dtype.itemsize + 8) + (matrix.shape[0] + 1) * 8
+    return np.asarray(matrix).nbytes
+
+
+class MatrixCache(LRUCache):
+    """A least-recently-used cache for the matrices of Pauli sentences that is bounded by the
+    memory used by the matrices.
+
+    Matrices are cached by :meth:`.PauliSentence.to_mat` under a key made of the Pauli words and
+    coefficients of the sentence, the wire order and the matrix format, so that the matrix of the
+    same Hamiltonian is only computed once across executions, e.g. by the ``default.mixed``
+    device. Sentences with trainable coefficients are never cached. The number of cache hits,
+    misses and evictions is recorded in the ``hits``, ``misses`` and ``evictions`` attributes.
+    The cache can be used from several threads at once, e.g. by a device executing circuits in a
+    thread pool.
+
+    Args:
+        max_bytes (int): The maximum total size of the cached matrices in bytes. Matrices that
+            are larger than this are not cached. Defaults to 256 megabytes.
+
+    **Example**
+
+    >>> qml.pauli.set_matrix_cache(qml.pauli.MatrixCache(max_bytes=2**20))
+    >>> H = qml.pauli.PauliSentence({qml.pauli.PauliWord({0: "X", 1: "X"}): 0.5})
+    >>> _ = H.to_mat(format="csr")
+    >>> _ = H.to_mat(format="csr")
+    >>> qml.pauli.get_matrix_cache()
+    MatrixCache(currsize=84, max_bytes=1048576, hits=1, misses=1, evictions=0)
+    """
+
+    def __init__(self, max_bytes: int = 2**28):
+        super().__init__(maxsize=max_bytes, getsizeof=_matrix_nbytes)
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(currsize={self.currsize}, max_bytes={self.maxsize}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        with self._lock:
+            return super().__getitem__(key, cache_getitem=cache_getitem)
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        with self._lock:
+            try:
+                super().__setitem__(key, value, cache_setitem=cache_setitem)
+            except ValueError:
+                # the matrix is larger than the whole cache
+                pass
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        with self._lock:
+            super().__delitem__(key, cache_delitem=cache_delitem)
+
+    def popitem(self):
+        """Remove and return the least recently used matrix."""
+        with self._lock:
+            item = super().popitem()
+            self.evictions += 1
+        return item
+
+    def clear(self):
+        """Remove all the cached matrices."""
+        with self._lock:
+            super().clear()
+
+    def get_matrix(self, key, compute):
+        """Return the matrix cached under ``key``, computing and caching it with ``compute()`` if
+        it is not cached yet. The matrix is computed without holding the lock of the cache."""
+        with self._lock:
+            try:
+                matrix = self[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return matrix
+        matrix = compute()
+        self[key] = matrix
+        return matrix
+
+
+_matrix_cache = MatrixCache()
+
+
+def get_matrix_cache() -> Optional[MatrixCache]:
+    """Return the cache used for the matrices of Pauli sentences, or ``None`` if it is disabled.
+
+    **Example**
+
+    >>> qml.pauli.get_matrix_cache()
+    MatrixCache(currsize=0, max_bytes=268435456, hits=0, misses=0, evictions=0)
+    """
+    return _matrix_cache
+
+
+def set_matrix_cache(cache: Optional[MatrixCache]):
+    """Set the cache used for the matrices of Pauli sentences.
+
+    Args:
+        cache (Optional[MatrixCache]): the new cache. If ``None``, matrices are not cached.
+
+    **Example**
+
+    The memory budget of the cache is changed by setting a new cache:
+
+    >>> qml.pauli.set_matrix_cache(qml.pauli.MatrixCache(max_bytes=2**30))
+
+    and caching is disabled with
+
+    >>> qml.pauli.set_matrix_cache(None)
+    """
+    global _matrix_cache  # pylint: disable=global-statement
+    _matrix_cache = cache
+
+
+def _sentence_key(ps) -> Optional[frozenset]:
+    """Hashable key of the Pauli words and coefficients of a Pauli sentence, or ``None`` if any
+    coefficient is not a plain number, e.g. a trainable parameter."""
+    items = []
+    for pw, coeff in ps.items():
+        if getattr(coeff, "requires_grad", False):
+            return None
+        if isinstance(coeff, np.ndarray) and coeff.ndim == 0:
+            coeff = coeff.item()
+        if not isinstance(coeff, (int, float, complex, np.number)):
+            return None
+        items.append((pw, complex(coeff)))
+    return frozenset(items)
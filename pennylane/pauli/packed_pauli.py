@@ -0,0 +1,294 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An array based representation of Pauli sentences using packed symplectic bit matrices"""
+import numpy as np
+
+from pennylane.typing import TensorLike
+from pennylane.wires import Wires
+
+from .pauli_arithmetic import PauliSentence, PauliWord
+
+_op_to_bits = {"X": (1, 0), "Y": (1, 1), "Z": (0, 1)}
+# operator with the bits x + 2 * z
+_code_to_op = {1: "X", 2: "Z", 3: "Y"}
+
+# number of set bits of every byte
+_popcount_table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# powers of the imaginary unit, i^k for k = 0, 1, 2, 3
+_phases = np.array([1, 1j, -1, -1j])
+
+# number of pairwise products of terms computed at once in products and commutators
+_PAIRS_PER_CHUNK = 2**16
+
+
+def _num_words(num_wires):
+    """Number of uint64 words used to store ``num_wires`` bits. At least one word is
+    always used so that the identity on no wires can be represented."""
+    return max(1, -(-num_wires // 64))
+
+
+def _pack_bits(bits):
+    """Pack a boolean matrix of shape ``(n_terms, n_wires)`` into uint64 words of shape
+    ``(n_terms, n_words)``. Wire ``j`` is stored in bit ``j % 64`` of word ``j // 64``."""
+    n_terms, num_wires = bits.shape
+    padded = np.zeros((n_terms, 64 * _num_words(num_wires)), dtype=np.uint8)
+    padded[:, :num_wires] = bits
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+
+
+def _unpack_bits(words, num_wires):
+    """Inverse of :func:`_pack_bits`."""
+    bytes_ = np.ascontiguousarray(words.astype("<u8")).view(np.uint8)
+    return np.unpackbits(bytes_, axis=1, bitorder="little")[:, :num_wires].astype(bool)
+
+
+def _popcount(words):
+    """Number of set bits summed over the last axis of an array of uint64 words."""
+    words = np.ascontiguousarray(words)
+    return _popcount_table[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+def _product_phase(x1, z1, x2, z2):
+    r"""Exponent :math:`k` such that :math:`P_1 P_2 = i^k P_3` for Pauli words in symplectic form.
+
+    On every wire, the cyclic products :math:`XY`, :math:`YZ` and :math:`ZX` contribute a
+    factor of :math:`i` and the anti-cyclic ones a factor of :math:`-i`.
+    """
+    y1, y2 = x1 & z1, x2 & z2
+    only_x1, only_z1 = x1 & ~z1, z1 & ~x1
+    only_x2, only_z2 = x2 & ~z2, z2 & ~x2
+    positive = (only_x1 & y2) | (y1 & only_z2) | (only_z1 & only_x2)
+    negative = (y1 & only_x2) | (only_z1 & y2) | (only_x1 & only_z2)
+    return (_popcount(positive) - _popcount(negative)) % 4
+
+
+def _anticommutes(x1, z1, x2, z2):
+    """Whether pairs of Pauli words in symplectic form anticommute."""
+    return (_popcount((x1 & z2) ^ (z1 & x2)) % 2).astype(bool)
+
+
+class PackedPauliSentence:
+    r"""Array based representation of a linear combination of Pauli words.
+
+    Every Pauli word is stored in symplectic form as two bit strings :math:`x` and :math:`z`,
+    with :math:`(x_j, z_j)` equal to :math:`(1, 0)`, :math:`(1, 1)` and :math:`(0, 1)` for
+    :math:`X`, :math:`Y` and :math:`Z` on wire :math:`j`. The bit strings of all the terms
+    are packed into ``uint64`` matrices of shape ``(n_terms, ceil(n_wires / 64))``, so that
+    products, commutators and merging of duplicate terms are vectorized over all the terms
+    of the sentences instead of iterating over dictionaries.
+
+    Args:
+        x (array[uint64]): packed :math:`x` bits of the Pauli words
+        z (array[uint64]): packed :math:`z` bits of the Pauli words
+        coeffs (array): coefficients of the Pauli words
+        wires (Iterable): wire labels, the bit :math:`j` of a word corresponds to ``wires[j]``
+
+    **Example**
+
+    >>> ps1 = PauliWord({0: "X", 1: "Y"}) + 0.5 * PauliWord({1: "Z"})
+    >>> ps2 = PauliWord({0: "Y"}) - PauliWord({1: "X"})
+    >>> packed1 = PackedPauliSentence.from_pauli_sentence(ps1)
+    >>> packed2 = PackedPauliSentence.from_pauli_sentence(ps2)
+    >>> packed1.commutator(packed2).to_pauli_sentence()
+    -1j * Y(1)
+    + 2j * Y(1) @ Z(0)
+    + 2j * Z(1) @ X(0)
+
+    The coefficients are NumPy arrays, so this representation does not track gradients.
+    """
+
+    def __init__(self, x, z, coeffs, wires):
+        self.wires = Wires(wires)
+        n_words = _num_words(len(self.wires))
+        self.x = np.asarray(x, dtype=np.uint64).reshape(-1, n_words)
+        self.z = np.asarray(z, dtype=np.uint64).reshape(-1, n_words)
+        self.coeffs = np.asarray(coeffs).reshape(-1)
+
+    @classmethod
+    def from_pauli_sentence(cls, ps, wire_order=None):
+        """Create a packed representation of a :class:`~.PauliSentence` or :class:`~.PauliWord`.
+
+        Args:
+            ps (Union[PauliSentence, PauliWord]): the Pauli sentence to pack
+            wire_order (Iterable): wire order of the bit strings, defaults to ``ps.wires``
+
+        Returns:
+            PackedPauliSentence: the packed Pauli sentence
+        """
+        if isinstance(ps, PauliWord):
+            ps = PauliSentence({ps: 1.0})
+
+        wires = ps.wires if wire_order is None else Wires(wire_order)
+        if not wires.contains_wires(ps.wires):
+            raise ValueError(
+                f"The wire order {wires} does not contain all the wires {ps.wires} of the sentence."
+            )
+
+        wire_map = {w: i for i, w in enumerate(wires)}
+        x_bits = np.zeros((len(ps), len(wires)), dtype=bool)
+        z_bits = np.zeros((len(ps), len(wires)), dtype=bool)
+        for row, pw in enumerate(ps):
+            for wire, op in pw.items():
+                x_bits[row, wire_map[wire]], z_bits[row, wire_map[wire]] = _op_to_bits[op]
+
+        return cls(_pack_bits(x_bits), _pack_bits(z_bits), list(ps.values()), wires)
+
+    def to_pauli_sentence(self):
+        """Convert to a :class:`~.PauliSentence`.
+
+        Returns:
+            PauliSentence: the dictionary representation of the sentence
+        """
+        codes = _unpack_bits(self.x, len(self.wires)) + 2 * _unpack_bits(self.z, len(self.wires))
+        wires = self.wires.tolist()
+
+        ps = PauliSentence()
+        for row, coeff in zip(codes.tolist(), self.coeffs.tolist()):
+            pw = PauliWord({wires[j]: _code_to_op[c] for j, c in enumerate(row) if c})
+            if pw in ps:
+                ps[pw] += coeff
+            else:
+                ps[pw] = coeff
+        return ps
+
+    def __len__(self):
+        return len(self.coeffs)
+
+    def __repr__(self):
+        return f"PackedPauliSentence(n_terms={len(self)}, wires={self.wires.tolist()})"
+
+    def map_to_wires(self, wires):
+        """Return the same sentence with its bit strings laid out along ``wires``.
+
+        Args:
+            wires (Iterable): the new wire order, which has to contain all the current wires
+
+        Returns:
+            PackedPauliSentence: the sentence on the new wires
+        """
+        wires = Wires(wires)
+        if wires == self.wires:
+            return self
+        if not wires.contains_wires(self.wires):
+            raise ValueError(f"The wires {wires} do not contain all the wires {self.wires}.")
+
+        cols = wires.indices(self.wires)
+        x_bits = np.zeros((len(self), len(wires)), dtype=bool)
+        z_bits = np.zeros((len(self), len(wires)), dtype=bool)
+        x_bits[:, cols] = _unpack_bits(self.x, len(self.wires))
+        z_bits[:, cols] = _unpack_bits(self.z, len(self.wires))
+        return PackedPauliSentence(_pack_bits(x_bits), _pack_bits(z_bits), self.coeffs, wires)
+
+    def _align(self, other):
+        """Lay out two sentences along the union of their wires."""
+        if self.wires == other.wires:
+            return self, other
+        wires = Wires.all_wires([self.wires, other.wires])
+        return self.map_to_wires(wires), other.map_to_wires(wires)
+
+    def merge(self):
+        """Return a new sentence in which the coefficients of repeated Pauli words are summed.
+
+        The terms are sorted by their packed bit strings.
+        """
+        keys = np.ascontiguousarray(np.concatenate([self.x, self.z], axis=1))
+        keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).reshape(-1)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+        coeffs = np.zeros(len(first), dtype=self.coeffs.dtype)
+        np.add.at(coeffs, inverse.reshape(-1), self.coeffs)
+        return PackedPauliSentence(self.x[first], self.z[first], coeffs, self.wires)
+
+    def simplify(self, tol=1e-8):
+        """Merge repeated Pauli words and remove the terms with coefficients less than the
+        threshold tolerance."""
+        merged = self.merge()
+        keep = np.abs(merged.coeffs) > tol
+        self.x, self.z, self.coeffs = merged.x[keep], merged.z[keep], merged.coeffs[keep]
+
+    def __add__(self, other):
+        """Add two packed sentences, merging the repeated Pauli words."""
+        if not isinstance(other, PackedPauliSentence):
+            return NotImplemented
+        self, other = self._align(other)  # pylint: disable=self-cls-assignment
+        return PackedPauliSentence(
+            np.concatenate([self.x, other.x]),
+            np.concatenate([self.z, other.z]),
+            np.concatenate([self.coeffs, other.coeffs]),
+            self.wires,
+        ).merge()
+
+    def __sub__(self, other):
+        if not isinstance(other, PackedPauliSentence):
+            return NotImplemented
+        return self + -1 * other
+
+    def __mul__(self, other):
+        """Multiply the coefficients by a scalar."""
+        if isinstance(other, TensorLike):
+            if not np.ndim(other) == 0:
+                raise ValueError(
+                    f"Attempting to multiply a PackedPauliSentence with an array of dimension {np.ndim(other)}"
+                )
+            return PackedPauliSentence(self.x, self.z, other * self.coeffs, self.wires)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def _pairwise(self, other, anticommuting=False):
+        """Merged products of all pairs of terms.
+
+        The terms of ``self`` are processed in chunks of about ``_PAIRS_PER_CHUNK`` products and
+        every chunk is merged into the result before the next one is computed, so that the full
+        outer product of the terms is never held in memory. If ``anticommuting`` is ``True``, only
+        the pairs of anticommuting Pauli words are kept, with twice their product.
+        """
+        n_words = self.x.shape[1]
+        rows = max(1, _PAIRS_PER_CHUNK // max(1, len(other)))
+        x2, z2 = other.x[None], other.z[None]
+
+        result = None
+        for start in range(0, max(len(self), 1), rows):
+            x1, z1 = self.x[start : start + rows, None], self.z[start : start + rows, None]
+            phase = _phases[_product_phase(x1, z1, x2, z2)]
+            coeffs = (np.outer(self.coeffs[start : start + rows], other.coeffs) * phase).reshape(-1)
+            x, z = (x1 ^ x2).reshape(-1, n_words), (z1 ^ z2).reshape(-1, n_words)
+            if anticommuting:
+                keep = _anticommutes(x1, z1, x2, z2).reshape(-1)
+                x, z, coeffs = x[keep], z[keep], 2 * coeffs[keep]
+            chunk = PackedPauliSentence(x, z, coeffs, self.wires)
+            result = chunk.merge() if result is None else result + chunk
+        return result
+
+    def __matmul__(self, other):
+        """Product of two packed sentences, computed for chunks of pairs of terms at once."""
+        if not isinstance(other, PackedPauliSentence):
+            return NotImplemented
+        self, other = self._align(other)  # pylint: disable=self-cls-assignment
+        return self._pairwise(other)
+
+    def commutator(self, other):
+        r"""Commutator :math:`[P, O] = PO - OP` with another packed sentence.
+
+        Only the pairs of anticommuting Pauli words contribute, with twice their product.
+
+        Args:
+            other (PackedPauliSentence): the second operator
+
+        Returns:
+            PackedPauliSentence: the commutator
+        """
+        self, other = self._align(other)  # pylint: disable=self-cls-assignment
+        return self._pairwise(other, anticommuting=True)
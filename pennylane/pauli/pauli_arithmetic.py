@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """The Pauli arithmetic abstract reduced representation classes"""
+
 # pylint:disable=protected-access
 from copy import copy
 from functools import lru_cache, reduce
@@ -25,6 +26,8 @@ from pennylane.ops import Identity, PauliX, PauliY, PauliZ, Prod, SProd, Sum
 from pennylane.typing import TensorLike
 from pennylane.wires import Wires, WiresLike
 
+from .matrix_cache import _sentence_key, get_matrix_cache
+
 I = "I"
 X = "X"
 Y = "Y"
@@ -838,9 +841,17 @@ class PauliSentence(dict):
                 return np.zeros((2**n, 2**n))
             return sparse.csr_matrix((2**n, 2**n), dtype="complex128").asformat(format)
 
-        if format == "dense":
-            return self._to_dense_mat(wire_order)
-        return self._to_sparse_mat(wire_order, buffer_size=buffer_size).asformat(format)
+        def _compute_mat():
+            if format == "dense":
+                return self._to_dense_mat(wire_order)
+            return self._to_sparse_mat(wire_order, buffer_size=buffer_size).asformat(format)
+
+        cache = get_matrix_cache()
+        key = None if cache is None else _sentence_key(self)
+        if key is None:
+            return _compute_mat()
+        # the cached matrix is shared, so that a copy is returned
+        return cache.get_matrix((key, wire_order, format), _compute_mat).copy()
 
     def _to_sparse_mat(self, wire_order, buffer_size=None):
         """Compute the sparse matrix of the Pauli sentence by efficiently adding the Pauli words
@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A class for the linearly independent basis of a vector space in operator space."""
+
 # pylint: disable=too-many-arguments
-from copy import copy
+import heapq
 from functools import reduce
 
 import numpy as np
-import scipy
 
 import pennylane as qml
 from pennylane.operation import Operator
@@ -25,7 +25,7 @@ from pennylane.operation import Operator
 from .pauli_arithmetic import PauliSentence
 
 
-class PauliVSpace:
+class PauliVSpace:  # pylint: disable=too-many-instance-attributes
     r"""
     Class representing the linearly independent basis of a vector space in operator space.
 
@@ -59,11 +59,18 @@ class PauliVSpace:
 
     where we have set the numbering based on appearance in the list of generators. This mapping is in general not unique.
 
+    Linear independence is checked against a sparse row echelon form of the basis that is updated
+    every time an operator is added. Each row is stored as a dictionary from
+    :class:`~pennylane.pauli.PauliWord` to coefficient, with a pivot word of coefficient one and
+    without the pivot words of the earlier rows. A candidate operator is reduced by the rows whose pivot
+    words it contains, so that the cost of a check only depends on the number of Pauli words
+    touched by the reduction and not on the dimension of the vector space.
+
     Args:
         generators (Iterable[Union[PauliWord, PauliSentence, Operator]]): Operators that span the vector space.
         dtype (type): ``dtype`` of the underlying DOK sparse matrix ``M``. Default is ``float``.
-        tol (float): Numerical tolerance for the linear independence check. If the norm of the projection of the candidate vector
-            onto :math:`M^\perp` is greater than ``tol``, then it is deemed to be linearly independent.
+        tol (float): Numerical tolerance for the linear independence check. If the norm of the residual of the normalized candidate
+            vector after its reduction by the echelon form is greater than ``tol``, then it is deemed to be linearly independent.
 
     **Example**
 
@@ -125,13 +132,15 @@ class PauliVSpace:
 
         # Initialize PauliVSpace properties trivially
         self._basis = []
-        rank = 0
-
-        self._M = np.zeros((num_pw, rank), dtype=self.dtype)
-        self._rank = rank
+        self._rank = 0
         self._num_pw = num_pw
 
-        self.tol = np.finfo(self._M.dtype).eps * 100 if tol is None else tol
+        # Sparse row echelon form of the basis as (pivot word, row) pairs, and the row index of
+        # every pivot word
+        self._echelon = []
+        self._pivots = {}
+
+        self.tol = np.finfo(np.dtype(self.dtype)).eps * 100 if tol is None else tol
 
         # Add all generators that are linearly independent
         self.add(generators, tol=tol)
@@ -150,6 +159,17 @@ class PauliVSpace:
     def __getitem__(self, idx):
         return self.basis[idx]
 
+    @property
+    def _M(self):
+        """Dense coefficient matrix with the normalized basis vectors as columns and one row
+        per :class:`~pennylane.pauli.PauliWord` in ``_pw_to_idx``."""
+        M = np.zeros((self._num_pw, self._rank), dtype=self.dtype)
+        for i, ps in enumerate(self._basis):
+            for pw, value in ps.items():
+                M[self._pw_to_idx[pw], i] = value
+            M[:, i] /= np.linalg.norm(M[:, i])
+        return M
+
     def add(self, other, tol=None):
         r"""Adding Pauli sentences if they are linearly independent.
 
@@ -188,18 +208,25 @@ class PauliVSpace:
         ]
 
         for ps in other:
-            # TODO: Potential speed-up by computing the maximal linear independent set for all current basis vectors + other, essentially algorithm1 in https://arxiv.org/abs/1012.5256
-            (
-                self._M,
-                self._pw_to_idx,
-                self._rank,
-                self._num_pw,
-                is_independent,
-            ) = self._check_independence(
-                self._M, ps, self._pw_to_idx, self._rank, self._num_pw, tol
+            residual = self._reduce(ps)
+            if not self._is_residual_independent(residual, tol):
+                continue
+
+            for pw in ps:
+                if pw not in self._pw_to_idx:
+                    self._pw_to_idx[pw] = self._num_pw
+                    self._num_pw += 1
+
+            # Use the largest coefficient as pivot to keep the rows well conditioned
+            pivot = max(residual, key=lambda pw, r=residual: abs(r[pw]))
+            pivot_value = residual[pivot]
+            self._pivots[pivot] = len(self._echelon)
+            self._echelon.append(
+                (pivot, {pw: value / pivot_value for pw, value in residual.items()})
             )
-            if is_independent:
-                self._basis.append(ps)
+
+            self._basis.append(ps)
+            self._rank += 1
         return self._basis
 
     def is_independent(self, pauli_sentence, tol=None):
@@ -225,78 +252,46 @@ class PauliVSpace:
         if tol is None:
             tol = self.tol
 
-        _, _, _, _, is_independent = self._check_independence(
-            self._M, pauli_sentence, self._pw_to_idx, self._rank, self._num_pw, tol
-        )
-        return is_independent
+        return self._is_residual_independent(self._reduce(pauli_sentence), tol)
 
-    @staticmethod
-    def _check_independence(
-        M, pauli_sentence, pw_to_idx, rank, num_pw, tol
-    ):  # pylint: disable=too-many-positional-arguments
-        r"""
-        Checks if :class:`~PauliSentence` ``pauli_sentence`` is linearly independent and provides the updated class attributes in case the vector is added.
-
-        This is done in the following way: ``M`` (see description in class) is extended by ``pauli_sentence``.
-        If the added operator has a PauliWord (key) that is new to ``pw_to_idx``, then we have to add a new row
-        and already know that it has to be linearly independent.
-        If it contains the same PauliWords, we need to compute the new rank and compare it with the old rank.
-        If the rank is the same, the operator is linearly dependent and not added. Else, the rank is incrased by 1
-        and the extended M becomes our new M.
+    def _reduce(self, pauli_sentence):
+        r"""Reduce a normalized copy of ``pauli_sentence`` by the rows of the echelon form.
+
+        The pivot words contained in the candidate are eliminated in the order of the rows. Since
+        every row has a zero coefficient at the pivot words of the earlier rows, eliminating a
+        pivot word can only introduce pivot words of later rows, which are eliminated in turn.
 
         Args:
-            M (ndarray): coefficient matrix for current LIS
-            pauli_sentence (`~.PauliSentence`): Pauli sentence for which to add a column if independent
-            pw_to_idx (dict): map from :class:`~pennylane.pauli.PauliWord` to row index in ``M``
-            rank (int): current rank of ``M``, equal to its number of columns
-            num_pw (int): current number of :class:`~pennylane.pauli.PauliWord`\ s, equal to the number of rows in ``M``
-            tol (float): Numerical tolerance for linear independence check.
+            pauli_sentence (`~.PauliSentence`): Candidate Pauli sentence to reduce
 
         Returns:
-            ndarray: updated coefficient matrix for the LIS
-            dict: updated map from :class:`~pennylane.pauli.PauliWord` to row index in ``M``. Includes new :class:`~pennylane.pauli.PauliWord` keys
-                from the input ``pauli_sentence`` if it was linearly independent
-            int: updated rank/number of columns of ``M``
-            int: updated number of :class:`~pennylane.pauli.PauliWord`\ s/number of rows of ``M``
-            bool: whether ``pauli_sentence`` was linearly independent and whether its column was added to ``M``
+            dict: map from :class:`~pennylane.pauli.PauliWord` to coefficient of the component of the
+            normalized candidate that is not spanned by the basis
         """
-        new_pws = [pw for pw in pauli_sentence.keys() if pw not in pw_to_idx]
-        new_num_pw = num_pw + len(new_pws)
+        norm = np.sqrt(sum(abs(value) ** 2 for value in pauli_sentence.values()))
+        if norm == 0:
+            return {}
+        residual = {pw: value / norm for pw, value in pauli_sentence.items()}
+
+        queue = [self._pivots[pw] for pw in residual if pw in self._pivots]
+        queued = set(queue)
+        heapq.heapify(queue)
+        while queue:
+            pivot, row = self._echelon[heapq.heappop(queue)]
+            factor = residual.pop(pivot)
+            for pw, value in row.items():
+                if pw == pivot:
+                    continue
+                residual[pw] = residual.get(pw, 0.0) - factor * value
+                if (row_idx := self._pivots.get(pw)) is not None and row_idx not in queued:
+                    queued.add(row_idx)
+                    heapq.heappush(queue, row_idx)
+        return residual
 
-        if new_num_pw < rank + 1:
-            # Can't span rank+1 independent vectors in fewer than rank+1 dimensions
-            # The input PauliSentence must have been linearly dependent
-            return M, pw_to_idx, rank, num_pw, False
-
-        M = np.pad(M, ((0, new_num_pw - num_pw), (0, 1)))
-
-        # If there are new PauliWords (i.e. new basis vectors), the candidate vector must be linearly independent
-        if new_num_pw > num_pw:
-            new_pw_to_idx = copy(pw_to_idx)
-            for i, pw in enumerate(new_pws, start=num_pw):
-                new_pw_to_idx[pw] = i
-            # Add new PauliSentence entries to matrix
-            for pw, value in pauli_sentence.items():
-                M[new_pw_to_idx[pw], rank] = value
-
-            M[:, rank] /= np.linalg.norm(M[:, rank])
-
-            return M, new_pw_to_idx, rank + 1, new_num_pw, True
-
-        # Add new PauliSentence entries to matrix
-        for pw, value in pauli_sentence.items():
-            M[pw_to_idx[pw], rank] = value
-
-        M[:, rank] /= np.linalg.norm(M[:, rank])
-
-        # Check if new vector is linearly dependent on the current basis
-        s = scipy.linalg.svdvals(M)
-        new_rank = np.count_nonzero(s > tol)
-
-        if rank + 1 == new_rank:
-            return M, pw_to_idx, new_rank, new_num_pw, True
-
-        return M[:num_pw, :rank], pw_to_idx, rank, num_pw, False
+    @staticmethod
+    def _is_residual_independent(residual, tol):
+        """Whether the norm of the residual of a normalized candidate is greater than ``tol``."""
+        return np.sqrt(sum(abs(value) ** 2 for value in residual.values())) > tol
 
     def __repr__(self):
         return str(self.basis)
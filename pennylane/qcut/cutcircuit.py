@@ -29,8 +29,20 @@ from pennylane.wires import Wires
 from .cutstrategy import CutStrategy
 from .kahypar import kahypar_cut
 from .processing import qcut_processing_fn
-from .tapes import _qcut_expand_fn, expand_fragment_tape, graph_to_tape, tape_to_graph
-from .utils import find_and_place_cuts, fragment_graph, replace_wire_cut_nodes
+from .tapes import (
+    _fragment_key,
+    _qcut_expand_fn,
+    expand_fragment_tape,
+    graph_to_tape,
+    tape_to_graph,
+)
+from .utils import (
+    MeasureNode,
+    PrepareNode,
+    find_and_place_cuts,
+    fragment_graph,
+    replace_wire_cut_nodes,
+)
 
 
 def _cut_circuit_expand(
@@ -84,7 +96,9 @@ def cut_circuit(
     into disconnected circuit fragments. Each circuit fragment is then executed multiple times by
     varying the state preparations and measurements at incoming and outgoing cut locations,
     respectively, resulting in a process tensor describing the action of the fragment. The process
-    tensors are then contracted to provide the result of the original uncut circuit.
+    tensors are then contracted to provide the result of the original uncut circuit. Fragments
+    that are identical once mapped to the device wires, such as the repeated blocks of a brickwork
+    circuit, are only executed once and share their process tensor.
 
     .. note::
 
@@ -413,16 +427,25 @@ def cut_circuit(
     fragment_tapes = [
         qml.map_wires(t, dict(zip(t.wires, device_wires)))[0][0] for t in fragment_tapes
     ]
-    expanded = [expand_fragment_tape(t) for t in fragment_tapes]
+
+    # identical fragments, e.g., the repeated blocks of a brickwork circuit, are only expanded
+    # and executed once, and their tensor is reused in the contraction
+    unique_keys = {}
+    fragment_indices = [
+        unique_keys.setdefault(_fragment_key(t), len(unique_keys)) for t in fragment_tapes
+    ]
+    unique_tapes = {}
+    for idx, t in zip(fragment_indices, fragment_tapes):
+        unique_tapes.setdefault(idx, t)
+    configurations = [expand_fragment_tape(t)[0] for t in unique_tapes.values()]
 
     # store the data necessary for classical post processing of results
-    configurations = []
-    prepare_nodes = []
-    measure_nodes = []
-    for tapes, p, m in expanded:
-        configurations.append(tapes)
-        prepare_nodes.append(p)
-        measure_nodes.append(m)
+    prepare_nodes = [
+        [o for o in t.operations if isinstance(o, PrepareNode)] for t in fragment_tapes
+    ]
+    measure_nodes = [
+        [o for o in t.operations if isinstance(o, MeasureNode)] for t in fragment_tapes
+    ]
 
     # flatten out the tapes to be returned
     tapes = tuple(tape for c in configurations for tape in c)
@@ -433,6 +456,7 @@ def cut_circuit(
         prepare_nodes=prepare_nodes,
         measure_nodes=measure_nodes,
         use_opt_einsum=use_opt_einsum,
+        fragment_indices=fragment_indices,
     )
 
 
@@ -17,6 +17,8 @@ Processing functions for circuit cutting.
 
 import string
 from collections.abc import Sequence
+from functools import lru_cache
+from typing import Optional
 
 from networkx import MultiDiGraph
 
@@ -26,12 +28,14 @@ from pennylane import numpy as pnp
 from .utils import MeasureNode, PrepareNode
 
 
-def qcut_processing_fn(
+def qcut_processing_fn(  # pylint: disable=too-many-arguments
     results: Sequence[Sequence],
     communication_graph: MultiDiGraph,
     prepare_nodes: Sequence[Sequence[PrepareNode]],
     measure_nodes: Sequence[Sequence[MeasureNode]],
     use_opt_einsum: bool = False,
+    *,
+    fragment_indices: Optional[Sequence[int]] = None,
 ):
     """Processing function for the :func:`cut_circuit() <pennylane.cut_circuit>` transform.
 
@@ -57,6 +61,11 @@ def qcut_processing_fn(
             for faster tensor contractions of large networks but must be installed separately using,
             e.g., ``pip install opt_einsum``. Both settings for ``use_opt_einsum`` result in a
             differentiable contraction.
+        fragment_indices (Optional[Sequence[int]]): a sequence of size
+            ``len(communication_graph.nodes)`` that gives, for each circuit fragment, the index of
+            the unique fragment whose results it shares. The ``results`` then only contain the
+            expansions of the unique fragments, in the order of their first occurrence. Defaults to
+            all the fragments being distinct.
 
     Returns:
         float or tensor_like: the output of the original uncut circuit arising from contracting
@@ -75,7 +84,19 @@ def qcut_processing_fn(
 
     flat_results = qml.math.concatenate(results)
 
-    tensors = _to_tensors(flat_results, prepare_nodes, measure_nodes)
+    if fragment_indices is None:
+        tensors = _to_tensors(flat_results, prepare_nodes, measure_nodes)
+    else:
+        first_fragments = {}
+        for i, idx in enumerate(fragment_indices):
+            first_fragments.setdefault(idx, i)
+        unique_tensors = _to_tensors(
+            flat_results,
+            [prepare_nodes[i] for i in first_fragments.values()],
+            [measure_nodes[i] for i in first_fragments.values()],
+        )
+        tensors = [unique_tensors[idx] for idx in fragment_indices]
+
     result = contract_tensors(
         tensors, communication_graph, prepare_nodes, measure_nodes, use_opt_einsum
     )
@@ -350,11 +371,27 @@ def contract_tensors(
                         tensor_indxs[i] += symb
 
     eqn = ",".join(tensor_indxs)
-    kwargs = {} if use_opt_einsum else {"like": tensors[0]}
+    if use_opt_einsum:
+        shapes = tuple(tuple(qml.math.shape(t)) for t in tensors)
+        kwargs = {"optimize": _contraction_path(eqn, shapes)}
+    else:
+        kwargs = {"like": tensors[0]}
 
     return contract(eqn, *tensors, **kwargs)
 
 
+@lru_cache(maxsize=128)
+def _contraction_path(eqn: str, shapes: tuple) -> list:
+    """The contraction path found by ``opt_einsum`` for an equation and the shapes of its tensors.
+
+    The equation of :func:`contract_tensors` is determined by the communication graph, so the path
+    is only planned once for the repeated executions of a cut circuit.
+    """
+    from opt_einsum import contract_path  # pylint: disable=import-outside-toplevel
+
+    return contract_path(eqn, *shapes, shapes=True)[0]
+
+
 CHANGE_OF_BASIS = qml.math.array(
     [[1.0, 1.0, 0.0, 0.0], [-1.0, -1.0, 2.0, 0.0], [-1.0, -1.0, 0.0, 2.0], [1.0, -1.0, 0.0, 0.0]]
 )
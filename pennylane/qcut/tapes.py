@@ -25,7 +25,7 @@ from networkx import MultiDiGraph
 import pennylane as qml
 from pennylane import expval
 from pennylane.measurements import ExpectationMP, MeasurementProcess, SampleMP
-from pennylane.operation import Operator
+from pennylane.operation import Operator, _operator_key, _parameter_key
 from pennylane.ops.meta import WireCut
 from pennylane.pauli import string_to_pauli_word
 from pennylane.queuing import WrappedObj
@@ -232,6 +232,31 @@ def _find_new_wire(wires: Wires) -> int:
     return ctr
 
 
+def _data_key(data):
+    """A hashable key of a parameter. Trainable and abstract parameters are keyed by their identity,
+    so that fragments sharing the key also share the derivatives of their results."""
+    if qml.math.is_abstract(data) or qml.math.requires_grad(data):
+        return id(data)
+    return _parameter_key(qml.math.to_numpy(data))
+
+
+def _fragment_key(tape: QuantumScript):
+    """A hashable key of a circuit fragment.
+
+    Fragments with the same key have the same operations, measurements and order of their
+    :class:`~.PrepareNode` and :class:`~.MeasureNode` operations, so that their expansions by
+    :func:`~.expand_fragment_tape` and their tensors coincide. Fragments that are structurally
+    identical up to a relabelling of their wires have the same key once they are mapped to the
+    device wires.
+    """
+    ops = tuple(_operator_key(op, _data_key) for op in tape.operations)
+    measurements = tuple(
+        (type(m).__name__, _operator_key(m.obs, _data_key) if m.obs is not None else tuple(m.wires))
+        for m in tape.measurements
+    )
+    return ops, measurements
+
+
 def _create_prep_list():
     """
     Creates a predetermined list for converting PrepareNodes to an associated Operation for use
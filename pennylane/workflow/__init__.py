@@ -28,6 +28,7 @@ Execution functions and utilities
     ~workflow.construct_execution_config
     ~workflow.get_transform_program
     ~workflow.get_best_diff_method
+    ~workflow.ExecutionCache
 
 Jacobian Product Calculation
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -55,6 +56,6 @@ from .resolution import (
     _resolve_diff_method,
     _resolve_interface,
 )
-from ._cache_transform import _cache_transform
+from ._cache_transform import ExecutionCache, _cache_transform
 from ._setup_transform_program import _setup_transform_program
 from .run import run
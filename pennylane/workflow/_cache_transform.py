@@ -13,9 +13,17 @@
 # limitations under the License.
 """Contains the transform for caching the result of a ``tape``."""
 
+import os
 import warnings
+import weakref
 from collections.abc import MutableMapping
+from numbers import Number
+from typing import Optional
 
+import numpy as np
+from cachetools import Cache, LRUCache
+
+import pennylane as qml
 from pennylane.tape import QuantumScript
 from pennylane.transforms import transform
 from pennylane.typing import Result, ResultBatch
@@ -31,17 +39,198 @@ _CACHED_EXECUTION_WITH_FINITE_SHOTS_WARNINGS = (
 """str: warning message to display when cached execution is used with finite shots"""
 
 
+def _result_nbytes(result) -> int:  # pylint: disable=too-many-return-statements
+    """The approximate number of bytes occupied by the numerical data of a result."""
+    if result is None:
+        return 0
+    if isinstance(result, (tuple, list)):
+        return sum(_result_nbytes(r) for r in result)
+    if isinstance(result, dict):
+        return sum(_result_nbytes(k) + _result_nbytes(v) for k, v in result.items())
+    if isinstance(result, str):
+        return len(result)
+    if isinstance(result, Number):
+        return 8
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    itemsize = getattr(getattr(result, "dtype", None), "itemsize", 8)
+    return int(qml.math.size(result)) * itemsize
+
+
+class _PendingResult:  # pylint: disable=too-few-public-methods
+    """The result of a tape that is executed in the current batch.
+
+    A reference to it is kept by the post-processing functions of all tapes of the batch that read
+    the result, so that it stays available even if the cache evicts the tape.
+    """
+
+    __slots__ = ("result", "__weakref__")
+
+    def __init__(self):
+        self.result = None
+
+
+class ExecutionCache(LRUCache):
+    """A least-recently-used cache for execution results bounded by the memory used by the results.
+
+    The size of every result is estimated from the number of bytes of its numerical data, so
+    that a few large results, such as states or probabilities of many wires, cannot exceed the
+    memory budget of the cache. The number of cache hits, misses and evictions is recorded in the
+    ``hits``, ``misses`` and ``evictions`` attributes, and reported to the
+    :class:`~.Tracker` of the executing device as ``cache_hits``, ``cache_misses`` and
+    ``cache_evictions``. The results of a batch of tapes that is being executed remain available
+    to the duplicate tapes of the batch, even if they are evicted or larger than the whole cache.
+
+    Args:
+        max_bytes (int): The maximum total size of the cached results in bytes. Defaults to
+            one gigabyte.
+        maxsize (Optional[int]): The maximum number of cached results. If ``None``, only the
+            total size of the results is bounded.
+        directory (Optional[str]): If provided, results that are evicted from memory are written
+            to this directory as NumPy files, and loaded back as memory-mapped arrays when they
+            are requested again. Only results consisting of NumPy arrays and numbers are kept on
+            disk.
+
+    **Example**
+
+    .. code-block:: python
+
+        cache = qml.workflow.ExecutionCache(max_bytes=2**20)
+
+        @qml.qnode(qml.device("default.qubit"), cache=cache)
+        def circuit(x):
+            qml.RX(x, 0)
+            return qml.state()
+
+    >>> with qml.Tracker(circuit.device) as tracker:
+    ...     circuit(0.1)
+    ...     circuit(0.1)
+    >>> tracker.totals["cache_hits"], tracker.totals["cache_misses"]
+    (1, 1)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 2**30,
+        maxsize: Optional[int] = None,
+        directory: Optional[str] = None,
+    ):
+        super().__init__(maxsize=max_bytes, getsizeof=_result_nbytes)
+        self.max_entries = maxsize
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._disk = {}
+        self._pending = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(currsize={self.currsize}, max_bytes={self.maxsize}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._disk
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        if not super().__contains__(key) and key in self._disk:
+            paths, structure = self._disk[key]
+            leaves = [np.load(path, mmap_mode="r") for path in paths]
+            return qml.pytrees.unflatten(
+                [leaf if leaf.ndim else leaf[()] for leaf in leaves], structure
+            )
+        return super().__getitem__(key, cache_getitem)
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        if key in self._disk:
+            self._remove_from_disk(key)
+        try:
+            super().__setitem__(key, value, cache_setitem)
+        except ValueError:
+            # the value is larger than the whole cache
+            if super().__contains__(key):
+                super().__delitem__(key)
+            self._store(key, value)
+            return
+
+        while self.max_entries is not None and len(self) > self.max_entries:
+            self.popitem()
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        if super().__contains__(key):
+            super().__delitem__(key, cache_delitem)
+        elif key in self._disk:
+            self._remove_from_disk(key)
+        else:
+            raise KeyError(key)
+
+    def popitem(self):
+        """Remove and return the least recently used result, writing it to disk if enabled."""
+        key, value = super().popitem()
+        self.evictions += 1
+        self._store(key, value)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        for key in list(self._disk):
+            self._remove_from_disk(key)
+
+    def _store(self, key, value):
+        """Write a result to the disk tier of the cache, if there is one."""
+        if self.directory is None or value is None:
+            return
+        leaves, structure = qml.pytrees.flatten(value)
+        if not all(isinstance(leaf, (np.ndarray, Number)) for leaf in leaves):
+            return
+        paths = []
+        for i, leaf in enumerate(leaves):
+            path = os.path.join(self.directory, f"{key}_{i}.npy")
+            np.save(path, leaf)
+            paths.append(path)
+        self._disk[key] = (paths, structure)
+
+    def _remove_from_disk(self, key):
+        for path in self._disk.pop(key)[0]:
+            os.remove(path)
+
+
+def _record_cache_event(cache: MutableMapping, tracker, **stats):
+    """Update the statistics of the cache and report them to the tracker."""
+    if isinstance(cache, ExecutionCache):
+        cache.hits += stats.get("hits", 0)
+        cache.misses += stats.get("misses", 0)
+    stats = {f"cache_{name}": value for name, value in stats.items() if value}
+    if stats and tracker is not None and tracker.active:
+        tracker.update(**stats)
+
+
 @transform
-def _cache_transform(tape: QuantumScript, cache: MutableMapping):
+def _cache_transform(tape: QuantumScript, cache: MutableMapping, tracker=None):
     """Caches the result of ``tape`` using the provided ``cache``.
 
+    If a ``tracker`` is provided, cache hits, misses and evictions are reported to it.
+
     .. note::
 
         This function makes use of :attr:`.QuantumTape.hash` to identify unique tapes.
     """
 
+    pending = getattr(cache, "_pending", None)
+    hit = tape.hash in cache
+
+    # the result, or the pending result of a tape executed in the same batch, is kept by the
+    # post-processing function so that it cannot be evicted from the cache before it is read
+    cached = cache[tape.hash] if hit else None
+    pending_result = pending.get(tape.hash) if hit and pending is not None else None
+
     def cache_hit_postprocessing(_results: ResultBatch) -> Result:
-        result = cache[tape.hash]
+        result = cached if pending_result is None else pending_result.result
+        if result is None:
+            result = cache.get(tape.hash)
         if result is not None:
             if tape.shots and getattr(cache, "_persistent_cache", True):
                 warnings.warn(_CACHED_EXECUTION_WITH_FINITE_SHOTS_WARNINGS, UserWarning)
@@ -52,17 +241,29 @@ def _cache_transform(tape: QuantumScript, cache: MutableMapping):
             "This is likely the result of a race condition."
         )
 
-    if tape.hash in cache:
+    if hit:
+        _record_cache_event(cache, tracker, hits=1)
         return [], cache_hit_postprocessing
 
+    in_flight = _PendingResult()
+    if pending is not None:
+        pending[tape.hash] = in_flight
+
     def cache_miss_postprocessing(results: ResultBatch) -> Result:
         result = results[0]
+        in_flight.result = result
+        evictions = getattr(cache, "evictions", 0)
         cache[tape.hash] = result
+        _record_cache_event(cache, tracker, evictions=getattr(cache, "evictions", 0) - evictions)
         return result
 
     # Adding a ``None`` entry to the cache indicates that a result will eventually be available for
     # the tape. This assumes that post-processing functions are called in the same order in which
     # the transforms are invoked. Otherwise, ``cache_hit_postprocessing()`` may be called before the
     # result of the corresponding tape is placed in the cache by ``cache_miss_postprocessing()``.
+    evictions = getattr(cache, "evictions", 0)
     cache[tape.hash] = None
+    _record_cache_event(
+        cache, tracker, evictions=getattr(cache, "evictions", 0) - evictions, misses=1
+    )
     return [tape], cache_miss_postprocessing
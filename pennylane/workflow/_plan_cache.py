@@ -0,0 +1,245 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Contains structural fingerprints of quantum scripts and the execution plans that
+are cached on a QNode between calls."""
+
+from numbers import Number
+from typing import Optional
+
+import pennylane as qml
+from pennylane.math import Interface
+from pennylane.measurements import MeasurementProcess, MidMeasureMP
+from pennylane.operation import Operator
+from pennylane.tape import QuantumScript, QuantumScriptBatch
+from pennylane.transforms.core import TransformProgram
+from pennylane.typing import ResultBatch
+
+from ._setup_transform_program import _setup_transform_program
+from .resolution import _resolve_execution_config, _resolve_interface
+from .run import run
+
+
+def _structure(obj):
+    """Recursively replace the numerical data of an operator or measurement by its shape."""
+    if isinstance(obj, (Operator, MeasurementProcess)):
+        data, metadata = obj._flatten()  # pylint: disable=protected-access
+        return (type(obj), metadata, tuple(_structure(d) for d in data))
+    if obj is None:
+        return None
+    if isinstance(obj, Number):
+        return ()
+    shape = getattr(obj, "shape", None)
+    return tuple(qml.math.shape(obj) if shape is None else shape)
+
+
+def structural_fingerprint(tape: QuantumScript) -> Optional[int]:
+    """Compute a hash of a quantum script that does not depend on its parameter values.
+
+    Two tapes have the same fingerprint if they contain the same operator and measurement
+    types acting on the same wires with the same hyperparameters, their parameters have the
+    same shapes, and they have the same shots.
+
+    Args:
+        tape (QuantumScript): the quantum script to fingerprint
+
+    Returns:
+        Optional[int]: the structural hash, or ``None`` if the tape contains components
+        without a hashable structure.
+
+    **Example**
+
+    >>> tape1 = qml.tape.QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.Z(0))])
+    >>> tape2 = qml.tape.QuantumScript([qml.RX(0.2, 0)], [qml.expval(qml.Z(0))])
+    >>> structural_fingerprint(tape1) == structural_fingerprint(tape2)
+    True
+    >>> tape1.hash == tape2.hash
+    False
+    """
+    try:
+        return hash(
+            (
+                tuple(_structure(op) for op in tape.operations),
+                tuple(_structure(mp) for mp in tape.measurements),
+                tape.shots,
+            )
+        )
+    except TypeError:
+        return None
+
+
+class ExecutionPlan:
+    """The preprocessed form of a tape that can be re-executed with new parameters.
+
+    A plan stores the tapes produced by the outer transform program together with
+    the corresponding post-processing function, execution configuration and inner
+    transform program. Every parameter of the template tapes is one of the parameters
+    of the original tape, so the plan can be reused for any tape with the same
+    :func:`structural_fingerprint` by rebinding parameters.
+
+    Args:
+        tapes (QuantumScriptBatch): the preprocessed template tapes
+        param_indices (Sequence[Optional[Sequence[int]]]): for every template tape, the positions
+            of its parameters in ``tape.get_parameters(trainable_only=False)`` of the original tape,
+            or ``None`` if the template is structurally identical to the original tape
+        post_processing (Callable): the post-processing function of the outer transform program
+        config (ExecutionConfig): the resolved execution configuration
+        inner_transform_program (TransformProgram): the transforms applied on every execution
+    """
+
+    # pylint: disable=too-many-arguments, too-few-public-methods
+    def __init__(self, tapes, param_indices, post_processing, config, inner_transform_program):
+        self.tapes = tapes
+        self.param_indices = param_indices
+        self.post_processing = post_processing
+        self.config = config
+        self.inner_transform_program = inner_transform_program
+
+    def bind(self, tape: QuantumScript) -> QuantumScriptBatch:
+        """Create the preprocessed tapes for ``tape`` by rebinding the template parameters."""
+        params = tape.get_parameters(trainable_only=False)
+        return tuple(
+            (
+                tape
+                if indices is None
+                else t.bind_new_parameters([params[i] for i in indices], range(len(indices)))
+            )
+            for t, indices in zip(self.tapes, self.param_indices)
+        )
+
+    def __call__(self, tape: QuantumScript, device: "qml.devices.Device") -> ResultBatch:
+        results = run(self.bind(tape), device, self.config, self.inner_transform_program)
+        return self.post_processing(results)
+
+
+def _param_indices(tape: QuantumScript, new_tapes: QuantumScriptBatch, fingerprint: int):
+    """Map the parameters of ``new_tapes`` onto the parameters of ``tape`` by identity.
+
+    Tapes that were passed through the transforms unchanged are marked with ``None``, so that
+    they can be replaced by the original tape without rebinding any parameter.
+
+    Returns ``None`` if a parameter was created or consumed by the transforms, or if the
+    parameters of ``tape`` cannot be distinguished from each other. In both cases the
+    preprocessing depends on the parameter values and cannot be reused.
+    """
+    params = tape.get_parameters(trainable_only=False)
+    positions = {id(p): i for i, p in enumerate(params)}
+    if len(positions) != len(params):
+        return None
+
+    param_indices = []
+    for t in new_tapes:
+        indices = [positions.get(id(p)) for p in t.get_parameters(trainable_only=False)]
+        if None in indices:
+            return None
+        param_indices.append(indices)
+
+    if len({i for indices in param_indices for i in indices}) != len(params):
+        return None
+
+    return [
+        (
+            None
+            if indices == list(range(len(params)))
+            and t.trainable_params == tape.trainable_params
+            and structural_fingerprint(t) == fingerprint
+            else indices
+        )
+        for t, indices in zip(new_tapes, param_indices)
+    ]
+
+
+def plan_key(tape: QuantumScript, interface: Interface) -> Optional[tuple]:
+    """The key under which the execution plan of ``tape`` is cached.
+
+    Returns ``None`` if the preprocessing of the tape cannot be cached.
+    """
+    if any(isinstance(op, MidMeasureMP) for op in tape.operations):
+        return None
+    fingerprint = structural_fingerprint(tape)
+    if fingerprint is None:
+        return None
+    return fingerprint, tuple(tape.trainable_params), _resolve_interface(interface, (tape,))
+
+
+# pylint: disable=too-many-arguments
+def execute_with_plan(
+    tape: QuantumScript,
+    device: "qml.devices.Device",
+    plan_cache,
+    diff_method=None,
+    interface=Interface.AUTO,
+    *,
+    transform_program: TransformProgram = None,
+    grad_on_execution="best",
+    cache=False,
+    cachesize=10000,
+    max_diff=1,
+    device_vjp=False,
+    postselect_mode=None,
+    mcm_method=None,
+    gradient_kwargs=None,
+) -> ResultBatch:
+    """Execute a single tape like :func:`~.execute`, reusing its preprocessing if possible.
+
+    On the first execution of a given tape structure, the execution configuration is
+    resolved and the outer transform program is applied as usual. If the parameters of
+    the resulting tapes can be traced back to the parameters of ``tape``, an
+    :class:`ExecutionPlan` is stored in ``plan_cache``. Later executions of tapes with the
+    same structure only rebind the parameters of the stored tapes.
+
+    Tapes whose preprocessing depends on parameter values are executed normally and
+    their key is cached as ``None`` so that no further attempt is made.
+
+    Returns:
+        ResultBatch: a tuple containing the result of ``tape``
+    """
+    key = plan_key(tape, interface)
+    if key is not None and key in plan_cache:
+        plan = plan_cache[key]
+        if plan is not None:
+            return plan(tape, device)
+        key = None
+
+    config = qml.devices.ExecutionConfig(
+        interface=_resolve_interface(interface, (tape,)),
+        gradient_method=diff_method,
+        grad_on_execution=None if grad_on_execution == "best" else grad_on_execution,
+        use_device_jacobian_product=device_vjp,
+        mcm_config=qml.devices.MCMConfig(postselect_mode=postselect_mode, mcm_method=mcm_method),
+        gradient_keyword_arguments=gradient_kwargs or {},
+        derivative_order=max_diff,
+    )
+    config = _resolve_execution_config(config, device, (tape,), transform_program=transform_program)
+
+    transform_program = transform_program or TransformProgram()
+    outer_transform_program, inner_transform_program = _setup_transform_program(
+        transform_program, device, config, cache, cachesize
+    )
+    tapes, post_processing = outer_transform_program((tape,))
+
+    if outer_transform_program.is_informative:
+        return post_processing(tapes)
+
+    if key is not None:
+        param_indices = _param_indices(tape, tapes, key[0])
+        plan_cache[key] = (
+            None
+            if param_indices is None
+            else ExecutionPlan(
+                tapes, param_indices, post_processing, config, inner_transform_program
+            )
+        )
+
+    results = run(tapes, device, config, inner_transform_program)
+    return post_processing(results)
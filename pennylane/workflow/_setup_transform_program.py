@@ -15,13 +15,11 @@
 
 import warnings
 
-from cachetools import LRUCache
-
 import pennylane as qml
 from pennylane.math import Interface
 from pennylane.transforms.core import TransformProgram
 
-from ._cache_transform import _cache_transform
+from ._cache_transform import ExecutionCache, _cache_transform
 
 
 # pylint: disable=protected-access
@@ -77,7 +75,7 @@ def _setup_transform_program(
         resolved_execution_config (ExecutionConfig): the resolved execution config
         cache (None, bool, dict, Cache): Whether to cache evaluations. This can result in
         a significant reduction in quantum evaluations during gradient computations. Defaults to ``None``.
-        cachesize (int): The size of the cache. Defaults to 10000.
+        cachesize (int): The maximum number of results in the cache. Defaults to 10000.
 
     Returns:
         tuple[TransformProgram, TransformProgram]: tuple containing the outer and inner transform programs.
@@ -104,9 +102,9 @@ def _setup_transform_program(
     # Making sure dynamic_one_shot occurs at most once between the inner and outer transform programs
     _prune_dynamic_transform(full_transform_program, inner_transform_program)
 
-    # If caching is desired but an explicit cache is not provided, use an ``LRUCache``.
+    # If caching is desired but an explicit cache is not provided, use an ``ExecutionCache``.
     if cache is True:
-        cache = LRUCache(maxsize=cachesize)
+        cache = ExecutionCache(maxsize=cachesize)
         setattr(cache, "_persistent_cache", False)
 
     # Ensure that ``cache`` is not a Boolean to simplify downstream code.
@@ -122,6 +120,8 @@ def _setup_transform_program(
     if not interface_data_supported:
         inner_transform_program.add_transform(qml.transforms.convert_to_numpy_parameters)
     if cache is not None:
-        inner_transform_program.add_transform(_cache_transform, cache=cache)
+        inner_transform_program.add_transform(
+            _cache_transform, cache=cache, tracker=getattr(device, "tracker", None)
+        )
 
     return full_transform_program, inner_transform_program
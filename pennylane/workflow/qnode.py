@@ -14,6 +14,7 @@
 """
 This module contains the QNode class and qnode decorator.
 """
+
 import copy
 import functools
 import inspect
@@ -32,6 +33,7 @@ from pennylane.measurements import MidMeasureMP
 from pennylane.tape import QuantumScript
 from pennylane.transforms.core import TransformContainer, TransformDispatcher, TransformProgram
 
+from ._plan_cache import execute_with_plan
 from .resolution import SupportedDiffMethods, _validate_jax_version
 
 logger = logging.getLogger(__name__)
@@ -296,7 +298,8 @@ class QNode:
             If ``True``, a cache with corresponding ``cachesize`` is created for each batch
             execution. If ``False``, no caching is used. You may also pass your own cache
             to be used; this can be any object that implements the special methods
-            ``__getitem__()``, ``__setitem__()``, and ``__delitem__()``, such as a dictionary.
+            ``__getitem__()``, ``__setitem__()``, and ``__delitem__()``, such as a dictionary
+            or an :class:`~.workflow.ExecutionCache` bounded by the memory used by the results.
         cachesize (int): The size of any auto-created caches. Only applies when ``cache=True``.
         max_diff (int): If ``diff_method`` is a gradient transform, this option specifies
             the maximum number of derivatives to support. Increasing this value allows
@@ -319,6 +322,13 @@ class QNode:
         gradient_kwargs (dict): A dictionary of keyword arguments that are passed to the differentiation
             method. Please refer to the :mod:`qml.gradients <.gradients>` module for details
             on supported options for your chosen gradient transform.
+        plan_cache (bool): Whether to cache the preprocessed tapes of the QNode between calls. If
+            ``True``, the transform program and device preprocessing are applied only the first
+            time a circuit with a given structure is executed, and later calls with the same
+            operators, wires, hyperparameters, measurements and shots only rebind the new
+            parameters. Circuits with mid-circuit measurements, transforms with classical
+            cotransforms, and preprocessing that creates or consumes parameters are always
+            executed without the cache. Defaults to ``False``.
         static_argnums (Union[int, Sequence[int]]): *Only applicable when the experimental capture mode is enabled.*
             An ``int`` or collection of ``int``\ s that specify which positional arguments to treat as static.
         autograph (bool): *Only applicable when the experimental capture mode is enabled.* Whether to use AutoGraph to
@@ -541,6 +551,7 @@ class QNode:
         postselect_mode: Literal[None, "hw-like", "fill-shots"] = None,
         mcm_method: Literal[None, "deferred", "one-shot", "tree-traversal"] = None,
         gradient_kwargs: Optional[dict] = None,
+        plan_cache: bool = False,
         static_argnums: Union[int, Iterable[int]] = (),
         autograph: bool = True,
         **kwargs,
@@ -610,6 +621,7 @@ class QNode:
         cache = (max_diff > 1) if cache == "auto" else cache
 
         self.capture_cache = LRUCache(maxsize=1000)
+        self.plan_cache = LRUCache(maxsize=1000) if plan_cache else None
         if isinstance(static_argnums, int):
             static_argnums = (static_argnums,)
         self.static_argnums = sorted(static_argnums)
@@ -638,7 +650,12 @@ class QNode:
     def __copy__(self) -> "QNode":
         copied_qnode = QNode.__new__(QNode)
         for attr, value in vars(self).items():
-            if attr not in {"execute_kwargs", "_transform_program", "gradient_kwargs"}:
+            if attr not in {
+                "execute_kwargs",
+                "_transform_program",
+                "gradient_kwargs",
+                "plan_cache",
+            }:
                 setattr(copied_qnode, attr, value)
 
         copied_qnode.execute_kwargs = dict(self.execute_kwargs)
@@ -646,6 +663,7 @@ class QNode:
             self.transform_program
         )  # pylint: disable=protected-access
         copied_qnode.gradient_kwargs = dict(self.gradient_kwargs)
+        copied_qnode.plan_cache = None if self.plan_cache is None else LRUCache(maxsize=1000)
         return copied_qnode
 
     def __repr__(self) -> str:
@@ -682,6 +700,8 @@ class QNode:
         .. warning:: This is a developer facing feature and is called when a transform is applied on a QNode.
         """
         self._transform_program.push_back(transform_container=transform_container)
+        if self.plan_cache is not None:
+            self.plan_cache.clear()
 
     def update(self, **kwargs) -> "QNode":
         """Returns a new QNode instance but with updated settings (e.g., a different `diff_method`). Any settings not specified will retain their original value.
@@ -844,6 +864,18 @@ class QNode:
         self._tape = tape
         return tape
 
+    def _uses_plan_cache(self) -> bool:
+        """Whether the preprocessing of this QNode can be looked up in the plan cache."""
+        if self.plan_cache is None:
+            return False
+        # a cache created for a single execution must not persist between calls
+        if self.execute_kwargs["cache"] is True:
+            return False
+        return not (
+            self._transform_program.is_informative
+            or self._transform_program.has_classical_cotransform()
+        )
+
     def _impl_call(self, *args, **kwargs) -> qml.typing.Result:
 
         # construct the tape
@@ -852,15 +884,27 @@ class QNode:
         # Calculate the classical jacobians if necessary
         self._transform_program.set_classical_component(self, args, kwargs)
 
-        res = qml.execute(
-            (tape,),
-            device=self.device,
-            diff_method=self.diff_method,
-            interface=self.interface,
-            transform_program=self._transform_program,
-            gradient_kwargs=self.gradient_kwargs,
-            **self.execute_kwargs,
-        )
+        if self._uses_plan_cache():
+            res = execute_with_plan(
+                tape,
+                self.device,
+                self.plan_cache,
+                diff_method=self.diff_method,
+                interface=self.interface,
+                transform_program=self._transform_program,
+                gradient_kwargs=self.gradient_kwargs,
+                **self.execute_kwargs,
+            )
+        else:
+            res = qml.execute(
+                (tape,),
+                device=self.device,
+                diff_method=self.diff_method,
+                interface=self.interface,
+                transform_program=self._transform_program,
+                gradient_kwargs=self.gradient_kwargs,
+                **self.execute_kwargs,
+            )
         res = res[0]
 
         # convert result to the interface in case the qfunc has no parameters
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for default qubit."""
+
 # pylint: disable=import-outside-toplevel, no-member, too-many-arguments
 
+import importlib
 from unittest import mock
 
 import numpy as np
@@ -93,6 +95,106 @@ def test_applied_modifiers():
     ]
 
 
+# pylint: disable=protected-access
+class TestWorkerPool:
+    """Tests for the worker pool owned by DefaultQubit when max_workers is set."""
+
+    def test_invalid_executor_type(self):
+        """Test that an error is raised for an unknown executor type."""
+        with pytest.raises(ValueError, match="executor_type must be one of"):
+            DefaultQubit(max_workers=2, executor_type="mpi")
+
+    def test_invalid_chunksize(self):
+        """Test that an error is raised for a non-positive chunksize."""
+        with pytest.raises(ValueError, match="chunksize must be a positive integer"):
+            DefaultQubit(max_workers=2, chunksize=0)
+
+    def test_pool_not_created_without_max_workers(self):
+        """Test that no pool is started when executing in the current process."""
+        dev = DefaultQubit()
+        qs = qml.tape.QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+        dev.execute((qs,))
+        assert dev._executor is None
+
+    @pytest.mark.parametrize(
+        "executor_type", ["thread", pytest.param("process", marks=pytest.mark.slow)]
+    )
+    def test_pool_is_reused(self, executor_type):
+        """Test that the same pool is reused across executions and derivative calls."""
+        dev = DefaultQubit(max_workers=2, executor_type=executor_type)
+        tapes = tuple(
+            qml.tape.QuantumScript(
+                [qml.RX(x, 0)], [qml.expval(qml.PauliZ(0))], trainable_params=[0]
+            )
+            for x in (0.1, 0.2, 0.3)
+        )
+
+        res = dev.execute(tapes)
+        executor = dev._executor
+        assert executor is not None
+        assert qml.math.allclose(res, np.cos([0.1, 0.2, 0.3]))
+
+        jac = dev.compute_derivatives(tapes)
+        assert dev._executor is executor
+        assert qml.math.allclose(jac, -np.sin([0.1, 0.2, 0.3]))
+
+        dev.shutdown()
+        assert dev._executor is None
+
+    def test_pool_recreated_when_max_workers_changes(self):
+        """Test that overriding max_workers through the device options resizes the pool."""
+        dev = DefaultQubit(max_workers=1, executor_type="thread")
+        qs = qml.tape.QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+
+        dev.execute((qs,))
+        first = dev._executor
+        dev.execute((qs,), ExecutionConfig(device_options={"max_workers": 2}))
+        assert dev._executor is not first
+        assert dev._executor_workers == 2
+        dev.shutdown()
+
+    def test_context_manager_shuts_down_pool(self):
+        """Test that using the device as a context manager releases the pool on exit."""
+        qs = qml.tape.QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+        with DefaultQubit(max_workers=2, executor_type="thread") as dev:
+            res = dev.execute((qs,))
+            assert dev._executor is not None
+
+        assert dev._executor is None
+        assert qml.math.allclose(res[0], np.cos(0.5))
+
+    @pytest.mark.parametrize("chunksize", [None, 1, 5])
+    def test_chunksize(self, chunksize, mocker):
+        """Test that tapes are submitted to the pool in chunks."""
+        dev = DefaultQubit(max_workers=2, executor_type="thread", chunksize=chunksize)
+        tapes = tuple(
+            qml.tape.QuantumScript([qml.RX(x, 0)], [qml.expval(qml.PauliZ(0))])
+            for x in np.linspace(0, 1, 16)
+        )
+        dev.execute(tapes[:1])
+        spy = mocker.spy(dev._executor, "map")
+
+        res = dev.execute(tapes)
+        expected_chunksize = 2 if chunksize is None else chunksize
+        assert spy.call_args.kwargs["chunksize"] == expected_chunksize
+        assert qml.math.allclose(res, np.cos(np.linspace(0, 1, 16)))
+        dev.shutdown()
+
+    def test_copy_does_not_share_pool(self):
+        """Test that a copied device does not share the pool of the original device."""
+        # pylint: disable=import-outside-toplevel
+        import copy
+
+        dev = DefaultQubit(max_workers=2, executor_type="thread")
+        qs = qml.tape.QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+        dev.execute((qs,))
+
+        new_dev = copy.deepcopy(dev)
+        assert new_dev._executor is None
+        assert dev._executor is not None
+        dev.shutdown()
+
+
 class TestSupportsDerivatives:
     """Test that DefaultQubit states what kind of derivatives it supports."""
 
@@ -1201,6 +1303,78 @@ class TestAdjointDifferentiation:
         assert np.isclose(actual_grad[0], expected_grad[0])
         assert np.isclose(actual_grad[1], expected_grad[1])
 
+    @pytest.mark.parametrize(
+        "device_options, arg_index",
+        [({"checkpoint_interval": 2}, 3), ({"max_checkpoint_bytes": 2**20}, 4)],
+    )
+    def test_checkpoint_interval(self, max_workers, device_options, arg_index, mocker):
+        """Tests that the checkpointing options in the device options are used by all the
+        derivative methods."""
+        dev = DefaultQubit(max_workers=max_workers)
+        x = np.array(np.pi / 7)
+        qs = qml.tape.QuantumScript(
+            [qml.RX(x, 0), qml.CNOT([0, 1]), qml.RY(2 * x, 1)],
+            [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(1))],
+        )
+        ec = ExecutionConfig(gradient_method="adjoint", device_options=device_options)
+        if max_workers is None:
+            spy = mocker.spy(
+                importlib.import_module("pennylane.devices.qubit.adjoint_jacobian"),
+                "_reversed_kets",
+            )
+
+        qs = (qs,)
+        expected_jac = dev.compute_derivatives(qs, self.ec)
+        assert qml.math.allclose(dev.compute_derivatives(qs, ec), expected_jac)
+        assert qml.math.allclose(dev.execute_and_compute_derivatives(qs, ec)[1], expected_jac)
+
+        tangents = ((0.5, -0.2),)
+        expected_jvp = dev.compute_jvp(qs, tangents, self.ec)
+        assert qml.math.allclose(dev.compute_jvp(qs, tangents, ec), expected_jvp)
+        assert qml.math.allclose(dev.execute_and_compute_jvp(qs, tangents, ec)[1], expected_jvp)
+
+        cotangents = ((0.3, 0.4),)
+        expected_vjp = dev.compute_vjp(qs, cotangents, self.ec)
+        assert qml.math.allclose(dev.compute_vjp(qs, cotangents, ec), expected_vjp)
+        assert qml.math.allclose(dev.execute_and_compute_vjp(qs, cotangents, ec)[1], expected_vjp)
+
+        if max_workers is None:
+            values = [call.args[arg_index] for call in spy.call_args_list]
+            expected = next(iter(device_options.values()))
+            assert values == [None, expected, expected] * 3
+
+    @pytest.mark.parametrize("option", ["checkpoint_interval", "max_checkpoint_bytes"])
+    def test_checkpoint_device_option(self, max_workers, option, mocker):
+        """Tests that the checkpointing options of the device are used by default."""
+        dev = DefaultQubit(max_workers=max_workers, **{option: 2})
+        config = dev.setup_execution_config(ExecutionConfig(gradient_method="adjoint"))
+        assert config.device_options[option] == 2
+
+        qs = qml.tape.QuantumScript(
+            [qml.RX(np.array(0.4), 0), qml.RX(np.array(0.3), 0)], [qml.expval(qml.PauliZ(0))]
+        )
+        spy = mocker.spy(
+            importlib.import_module("pennylane.devices.qubit.adjoint_jacobian"), "_reversed_kets"
+        )
+        jac = dev.compute_derivatives((qs,), self.ec)
+        assert qml.math.allclose(jac, [-np.sin(0.7), -np.sin(0.7)])
+        if max_workers is None:
+            assert spy.call_args.kwargs == {} and spy.call_args.args[3:] == (
+                (2, None) if option == "checkpoint_interval" else (None, 2)
+            )
+
+    @pytest.mark.parametrize(
+        "option, value, match",
+        [
+            ("checkpoint_interval", 0, "checkpoint_interval must be a positive integer"),
+            ("max_checkpoint_bytes", -1, "max_checkpoint_bytes must be a non-negative integer"),
+        ],
+    )
+    def test_invalid_checkpoint_device_option(self, max_workers, option, value, match):
+        """Tests that invalid checkpointing options of the device raise an error."""
+        with pytest.raises(ValueError, match=match):
+            DefaultQubit(max_workers=max_workers, **{option: value})
+
 
 class TestRandomSeed:
     """Test that the device behaves correctly when provided with a random seed"""
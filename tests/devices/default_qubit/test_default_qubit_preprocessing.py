@@ -658,7 +658,9 @@ class TestPreprocessingIntegration:
         """Test that a tape is expanded correctly if adjoint differentiation is requested"""
         qs = qml.tape.QuantumScript(
             [
-                qml.Rot(qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=0),
+                qml.CRot(
+                    qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=[1, 0]
+                ),
                 qml.CNOT([0, 1]),
             ],
             [qml.expval(qml.PauliZ(1))],
@@ -672,12 +674,10 @@ class TestPreprocessingIntegration:
         expanded_qs = expanded_tapes[0]
 
         expected_qs = qml.tape.QuantumScript(
-            [
-                qml.RZ(qml.numpy.array(0.1), wires=0),
-                qml.RY(qml.numpy.array(0.2), wires=0),
-                qml.RZ(qml.numpy.array(0.3), wires=0),
-                qml.CNOT([0, 1]),
-            ],
+            qml.CRot.compute_decomposition(
+                qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=[1, 0]
+            )
+            + [qml.CNOT([0, 1])],
             [qml.expval(qml.PauliZ(1))],
         )
 
@@ -829,8 +829,9 @@ class TestAdjointDiffTapeValidation:
         """Test that an operation supported on the forward pass but
         not adjoint is decomposed when adjoint is requested."""
 
+        params = [qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3)]
         qs = qml.tape.QuantumScript(
-            [qml.U2(qml.numpy.array(0.1), qml.numpy.array(0.2), wires=[0])],
+            [qml.CRot(*params, wires=[0, 1])],
             [qml.expval(qml.PauliZ(2))],
         )
         batch = (qs,)
@@ -840,11 +841,31 @@ class TestAdjointDiffTapeValidation:
         res, _ = program(batch)
         res = res[0]
         assert isinstance(res, qml.tape.QuantumScript)
-        qml.assert_equal(res[0], qml.RZ(qml.numpy.array(0.2), wires=0))
-        qml.assert_equal(res[1], qml.RY(qml.numpy.array(np.pi / 2), wires=0))
-        qml.assert_equal(res[2], qml.RZ(qml.numpy.array(-0.2), wires=0))
-        qml.assert_equal(res[3], qml.PhaseShift(qml.numpy.array(0.2), wires=0))
-        qml.assert_equal(res[4], qml.PhaseShift(qml.numpy.array(0.1), wires=0))
+        expected = qml.CRot.compute_decomposition(*params, wires=[0, 1])
+        assert len(res.operations) == len(expected)
+        for op, expected_op in zip(res.operations, expected):
+            qml.assert_equal(op, expected_op)
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.Rot(qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=0),
+            qml.U2(qml.numpy.array(0.1), qml.numpy.array(0.2), wires=0),
+            qml.U3(qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=0),
+        ],
+    )
+    def test_multi_parameter_ops_not_decomposed(self, op):
+        """Test that the multi-parameter operations differentiated natively by the adjoint
+        method are not decomposed."""
+        qs = qml.tape.QuantumScript([op], [qml.expval(qml.PauliZ(0))])
+        program = qml.device("default.qubit").preprocess_transforms(
+            ExecutionConfig(gradient_method="adjoint")
+        )
+        res, _ = program((qs,))
+        res = res[0]
+        assert len(res.operations) == 1
+        qml.assert_equal(res[0], op)
+        assert res.trainable_params == qs.trainable_params
 
     def test_trainable_params_decomposed(self):
         """Test that the trainable parameters of a tape are updated when it is expanded"""
@@ -864,35 +885,37 @@ class TestAdjointDiffTapeValidation:
         res = res[0]
 
         assert isinstance(res, qml.tape.QuantumScript)
-        assert len(res.operations) == 8
+        assert len(res.operations) == 6
         qml.assert_equal(res[0], qml.RZ(qml.numpy.array(np.pi / 2), 0))
         qml.assert_equal(res[1], qml.RY(qml.numpy.array(np.pi), 0))
         qml.assert_equal(res[2], qml.RZ(qml.numpy.array(7 * np.pi / 2), 0))
         qml.assert_equal(res[3], qml.GlobalPhase(-np.pi / 2))
         qml.assert_equal(res[4], qml.CNOT([0, 1]))
-        qml.assert_equal(res[5], qml.RZ(qml.numpy.array(0.1), 0))
-        qml.assert_equal(res[6], qml.RY(qml.numpy.array(0.2), 0))
-        qml.assert_equal(res[7], qml.RZ(qml.numpy.array(0.3), 0))
+        qml.assert_equal(
+            res[5],
+            qml.Rot(qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=0),
+        )
         assert res.trainable_params == [0, 1, 2, 3, 4, 5, 6]
 
         qs.trainable_params = [2, 3]
         res, _ = program((qs,))
         res = res[0]
         assert isinstance(res, qml.tape.QuantumScript)
-        assert len(res.operations) == 8
+        assert len(res.operations) == 6
         qml.assert_equal(res[0], qml.RZ(qml.numpy.array(np.pi / 2), 0))
         qml.assert_equal(res[1], qml.RY(qml.numpy.array(np.pi), 0))
         qml.assert_equal(res[2], qml.RZ(qml.numpy.array(7 * np.pi / 2), 0))
         qml.assert_equal(res[3], qml.GlobalPhase(-np.pi / 2))
         qml.assert_equal(res[4], qml.CNOT([0, 1]))
-        qml.assert_equal(res[5], qml.RZ(qml.numpy.array(0.1), 0))
-        qml.assert_equal(res[6], qml.RY(qml.numpy.array(0.2), 0))
-        qml.assert_equal(res[7], qml.RZ(qml.numpy.array(0.3), 0))
+        qml.assert_equal(
+            res[5],
+            qml.Rot(qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=0),
+        )
         assert res.trainable_params == [0, 1, 2, 3, 4, 5, 6]
 
     def test_u3_non_trainable_params(self):
-        """Test that a warning is raised and all parameters are trainable in the expanded
-        tape when not all parameters in U3 are trainable"""
+        """Test that U3 is kept with its trainable parameters when not all of them
+        are trainable"""
         qs = qml.tape.QuantumScript(
             [qml.U3(qml.numpy.array(0.2), qml.numpy.array(0.4), qml.numpy.array(0.6), wires=0)],
             [qml.expval(qml.PauliZ(0))],
@@ -906,9 +929,8 @@ class TestAdjointDiffTapeValidation:
         res = res[0]
         assert isinstance(res, qml.tape.QuantumScript)
 
-        # U3 decomposes into 5 operators
-        assert len(res.operations) == 5
-        assert res.trainable_params == [0, 1, 2, 3, 4]
+        assert len(res.operations) == 1
+        assert res.trainable_params == [0, 2]
 
     def test_trainable_hermitian_warns(self):
         """Test attempting to compute the gradient of a tape that obtains the
@@ -962,8 +984,8 @@ class TestAdjointDiffTapeValidation:
         qs = qml.tape.QuantumScript(
             ops=[
                 prep_op,
-                qml.Rot(
-                    qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=[0]
+                qml.CRot(
+                    qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=[0, 1]
                 ),
             ],
             measurements=[qml.expval(qml.PauliZ(0))],
@@ -977,18 +999,16 @@ class TestAdjointDiffTapeValidation:
         qs_valid, _ = program((qs,))
         qs_valid = qs_valid[0]
 
-        expected_ops = [
-            prep_op,
-            qml.RZ(qml.numpy.array(0.1), wires=[0]),
-            qml.RY(qml.numpy.array(0.2), wires=[0]),
-            qml.RZ(qml.numpy.array(0.3), wires=[0]),
-        ]
+        expected_ops = [prep_op] + qml.CRot.compute_decomposition(
+            qml.numpy.array(0.1), qml.numpy.array(0.2), qml.numpy.array(0.3), wires=[0, 1]
+        )
 
+        assert len(qs_valid.operations) == len(expected_ops)
         for o1, o2 in zip(qs_valid.operations, expected_ops):
             qml.assert_equal(o1, o2)
         for o1, o2 in zip(qs.measurements, qs_valid.measurements):
             qml.assert_equal(o1, o2)
-        assert qs_valid.trainable_params == [0, 1, 2, 3]
+        assert qs_valid.trainable_params == [0, 1, 2, 3, 4, 5]
         assert qs.shots == qs_valid.shots
 
     def test_untrainable_operations(self):
@@ -24,6 +24,7 @@ from scipy.linalg import expm
 from scipy.sparse import csr_matrix
 
 import pennylane as qml
+from pennylane.devices.default_tensor import sample_mps
 from pennylane.qchem import givens_decomposition
 from pennylane.typing import TensorLike
 from pennylane.wires import WireError
@@ -280,11 +281,10 @@ def test_passing_shots_None():
     assert dev.shots == qml.measurements.Shots(None)
 
 
-def test_passing_finite_shots_error():
-    """Test that an error is raised if finite shots are passed on initialization."""
-
-    with pytest.raises(qml.DeviceError, match=r"only supports analytic simulations"):
-        qml.device("default.tensor", shots=10)
+def test_passing_finite_shots():
+    """Test that finite shots can be passed on initialization."""
+    dev = qml.device("default.tensor", shots=10)
+    assert dev.shots == qml.measurements.Shots(10)
 
 
 @pytest.mark.parametrize("method", ["mps", "tn"])
@@ -528,6 +528,191 @@ def test_wire_order_dense_vector(method, num_orbitals):
     assert len(state) == 2 ** (2 * num_orbitals + 1)
 
 
+def test_sample_mps():
+    """Test that perfect sampling of an MPS gives the distribution of the dense state."""
+    rng = np.random.default_rng(42)
+    dims = [1, 2, 4, 2, 1]
+    arrays = [
+        rng.normal(size=(dims[i], 2, dims[i + 1])) + 1j * rng.normal(size=(dims[i], 2, dims[i + 1]))
+        for i in range(4)
+    ]
+    state = arrays[0]
+    for array in arrays[1:]:
+        state = np.tensordot(state, array, axes=1)
+    probs = np.abs(state.reshape((2,) * 4)) ** 2
+    expected = np.sum(probs / np.sum(probs), axis=(1, 3)).T.ravel()
+
+    samples = sample_mps(arrays, [2, 0], shots=100000, rng=42)
+    assert samples.shape == (100000, 2)
+    assert np.allclose(np.bincount(2 * samples[:, 0] + samples[:, 1]) / 100000, expected, atol=0.01)
+
+
+@pytest.mark.parametrize("method", ["mps", "tn"])
+class TestFiniteShots:
+    """Test that default.tensor computes measurements with finite shots from samples."""
+
+    @staticmethod
+    def _ops():
+        return [
+            qml.RX(0.3, 0),
+            qml.Hadamard(1),
+            qml.CNOT([1, 2]),
+            qml.RY(0.7, 3),
+            qml.CRX(1.1, [3, 4]),
+            qml.CNOT([0, 4]),
+        ]
+
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            qml.expval(qml.X(1) @ qml.X(2)),
+            qml.expval(qml.Y(3)),
+            qml.expval(qml.X(0) + 0.5 * qml.Z(4)),
+            qml.var(qml.Z(4)),
+            qml.probs(wires=[4, 0]),
+        ],
+    )
+    def test_statistics(self, method, measurement):
+        """Test that shot-based statistics agree with the analytic results."""
+        qs = qml.tape.QuantumScript(self._ops(), [measurement], shots=20000)
+        dev = qml.device("default.tensor", wires=5, method=method, seed=42)
+        expected = qml.device("default.qubit").execute(qs.copy(shots=None))
+
+        assert np.allclose(dev.execute(qs), expected, atol=0.03)
+
+    def test_sample_and_counts(self, method):
+        """Test that samples and counts are drawn from the state."""
+        qs = qml.tape.QuantumScript(
+            self._ops(),
+            [qml.sample(wires=[1, 2]), qml.counts(wires=[2, 1]), qml.sample()],
+            shots=100,
+        )
+        samples, counts, all_samples = qml.device("default.tensor", method=method).execute(qs)
+
+        assert samples.shape == (100, 2)
+        assert np.all(samples[:, 0] == samples[:, 1])
+        assert set(counts) <= {"00", "11"}
+        assert sum(counts.values()) == 100
+        assert all_samples.shape == (100, 5)
+
+    def test_shot_vector(self, method):
+        """Test that shot vectors are supported."""
+        qs = qml.tape.QuantumScript(
+            self._ops(), [qml.expval(qml.Z(0)), qml.sample(wires=[3])], shots=(10, 10, 20)
+        )
+        res = qml.device("default.tensor", method=method).execute(qs)
+
+        assert len(res) == 3
+        assert [r[1].shape for r in res] == [(10,), (10,), (20,)]
+
+    def test_seed(self, method):
+        """Test that samples are reproducible through the device seed."""
+        qs = qml.tape.QuantumScript(self._ops(), [qml.sample()], shots=50)
+        res1 = qml.device("default.tensor", method=method, seed=123).execute(qs)
+        res2 = qml.device("default.tensor", method=method, seed=123).execute(qs)
+
+        assert np.array_equal(res1, res2)
+
+    def test_qnode(self, method):
+        """Test a QNode with finite shots on default.tensor."""
+        dev = qml.device("default.tensor", wires=2, method=method, shots=10000, seed=42)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, 0)
+            qml.CNOT([0, 1])
+            return qml.expval(qml.Z(1)), qml.counts(wires=0)
+
+        expval, counts = circuit(0.4)
+        assert np.isclose(expval, np.cos(0.4), atol=0.05)
+        assert sum(counts.values()) == 10000
+
+
+@pytest.mark.parametrize("method", ["mps", "tn"])
+class TestPrefixSharing:
+    """Test that default.tensor shares the simulation of common operation prefixes."""
+
+    @staticmethod
+    def _tape(x):
+        ops = [
+            qml.Hadamard(0),
+            qml.CNOT([0, 1]),
+            qml.RX(x[0], 0),
+            qml.RY(x[1], 1),
+            qml.CRX(x[2], [1, 2]),
+            qml.IsingXX(x[3], [2, 3]),
+        ]
+        return qml.tape.QuantumScript(ops, [qml.expval(qml.Z(0) @ qml.Z(2)), qml.var(qml.X(3))])
+
+    def test_gradient_batch(self, method, mocker):
+        """Test that the shifted circuits of a gradient share the simulation of their prefixes."""
+        tapes, fn = qml.gradients.param_shift(self._tape(np.array([0.1, 0.2, 0.3, 0.4])))
+        dev = qml.device("default.tensor", wires=4, method=method)
+        spy = mocker.spy(dev, "_apply_operation")
+
+        res = fn(dev.execute(tapes))
+        expected = fn(qml.device("default.qubit").execute(tapes))
+
+        assert qml.math.allclose(res, expected)
+        assert spy.call_count < sum(len(t.operations) for t in tapes) / 2
+
+    def test_cache_across_executions(self, method, mocker):
+        """Test that a later execution resumes from the state after a cached prefix."""
+        tape = self._tape(np.array([0.1, 0.2, 0.3, 0.4]))
+        dev = qml.device("default.tensor", wires=4, method=method)
+        expected = dev.execute(tape)
+
+        spy = mocker.spy(dev, "_apply_operation")
+        res = dev.execute(tape.copy(measurements=[qml.expval(qml.Z(0) @ qml.Z(2))]))
+        assert spy.call_count == 0
+        assert np.isclose(res, expected[0])
+
+        extended = qml.tape.QuantumScript(
+            tape.operations + [qml.RX(0.5, 3)], [qml.expval(qml.Z(3))]
+        )
+        res = dev.execute(extended)
+        assert spy.call_count == 1
+        assert np.isclose(res, qml.device("default.qubit").execute(extended))
+
+    def test_no_cache(self, method, mocker):
+        """Test that no states are kept with a cache size of zero."""
+        tape = self._tape(np.array([0.1, 0.2, 0.3, 0.4]))
+        dev = qml.device("default.tensor", wires=4, method=method, prefix_cache_size=0)
+        dev.execute(tape)
+
+        spy = mocker.spy(dev, "_apply_operation")
+        dev.execute(tape)
+        assert spy.call_count == len(tape.operations)
+
+    def test_cache_size(self, method):
+        """Test that the cache keeps at most ``prefix_cache_size`` states."""
+        dev = qml.device("default.tensor", wires=4, method=method, prefix_cache_size=2)
+        for x in np.linspace(0, 1, 5):
+            dev.execute(self._tape([x] * 4))
+        assert len(dev._prefix_cache) == 2
+
+    def test_different_initial_states(self, method):
+        """Test that circuits with different state preparations do not share their prefixes."""
+        ops = self._tape(np.array([0.1, 0.2, 0.3, 0.4])).operations
+        tapes = [
+            qml.tape.QuantumScript(ops, [qml.expval(qml.Z(3))]),
+            qml.tape.QuantumScript(
+                [qml.BasisState(np.array([1, 0, 1, 1]), range(4))] + ops, [qml.expval(qml.Z(3))]
+            ),
+            qml.tape.QuantumScript(
+                [qml.StatePrep(np.ones(16) / 4, range(4))] + ops, [qml.expval(qml.Z(3))]
+            ),
+        ]
+        dev = qml.device("default.tensor", wires=4, method=method)
+        assert np.allclose(dev.execute(tapes), qml.device("default.qubit").execute(tapes))
+
+
+def test_invalid_prefix_cache_size():
+    """Test that an error is raised for a negative prefix cache size."""
+    with pytest.raises(ValueError, match="prefix_cache_size must be a non-negative integer"):
+        qml.device("default.tensor", prefix_cache_size=-1)
+
+
 class TestMCMs:
     """Test that default.tensor can handle mid circuit measurements."""
 
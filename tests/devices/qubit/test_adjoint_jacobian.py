@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit and integration tests for the adjoint_jacobian function for DefaultQubit"""
+
 import numpy as np
 import pytest
 
 import pennylane as qml
 from pennylane.devices.qubit import adjoint_jacobian, adjoint_jvp, adjoint_vjp
+from pennylane.devices.qubit.adjoint_jacobian import _checkpoint_interval
 from pennylane.tape import QuantumScript
 
 
@@ -836,3 +838,200 @@ class TestAdjointVJP:
 
         [vjp_adjoint] = adjoint_vjp(qs, cotangent)
         assert qml.math.allclose(vjp_adjoint, -0.5 * np.sin(x))
+
+
+def _multi_param_tape(op, trainable_params, measurements):
+    """A circuit around a multi-parameter operation on the first wire."""
+    ops = [qml.RX(0.4, 0), qml.Hadamard(1), qml.CNOT([0, 1]), op, qml.CRY(0.7, [0, 1])]
+    n_params = op.num_params + 2
+    return QuantumScript(
+        ops, measurements, trainable_params=[1 + p for p in trainable_params if p < n_params]
+    )
+
+
+multi_param_ops = [
+    (qml.Rot(0.3, -1.2, 0.8, wires=0), [0, 1, 2]),
+    (qml.Rot(0.3, -1.2, 0.8, wires=0), [1]),
+    (qml.U2(0.6, -0.4, wires=0), [0, 1]),
+    (qml.U3(0.5, 1.1, -0.7, wires=0), [0, 1, 2]),
+    (qml.U3(0.5, 1.1, -0.7, wires=0), [0, 2]),
+]
+
+
+class TestMultiParameterOps:
+    """Tests for operations with several parameters differentiated without decomposition."""
+
+    @pytest.mark.parametrize("op, trainable", multi_param_ops)
+    def test_jacobian(self, op, trainable, tol):
+        """Test that the jacobian matches finite differences."""
+        qs = _multi_param_tape(
+            op, trainable, [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(0) @ qml.PauliX(1))]
+        )
+        calculated_val = adjoint_jacobian(qs)
+
+        tapes, fn = qml.gradients.finite_diff(qs, h=1e-7)
+        results = tuple(qml.devices.qubit.simulate(t) for t in tapes)
+        numeric_val = fn(results)
+        assert np.allclose(calculated_val, numeric_val, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("op, trainable", multi_param_ops)
+    def test_jvp_and_vjp(self, op, trainable, tol):
+        """Test that the jvp and vjp are consistent with the jacobian."""
+        qs = _multi_param_tape(op, trainable, [qml.expval(qml.PauliZ(0)), qml.expval(qml.X(1))])
+        jac = np.array(adjoint_jacobian(qs)).reshape(2, len(trainable))
+
+        tangents = tuple(np.linspace(0.5, 1.5, len(trainable)))
+        assert np.allclose(adjoint_jvp(qs, tangents), jac @ np.array(tangents), atol=tol)
+
+        cotangents = (0.3, -0.8)
+        assert np.allclose(adjoint_vjp(qs, cotangents), np.array(cotangents) @ jac, atol=tol)
+
+    @pytest.mark.parametrize("op, trainable", multi_param_ops)
+    def test_state_jacobian(self, op, trainable):
+        """Test the derivative of the state, which depends on the global phase of the
+        operations."""
+        qs = _multi_param_tape(op, trainable, [qml.state()])
+        jac = adjoint_jacobian(qs)
+
+        tapes, fn = qml.gradients.finite_diff(qs, h=1e-7)
+        results = tuple(qml.devices.qubit.simulate(t) for t in tapes)
+        assert qml.math.allclose(jac, fn(results), atol=1e-6)
+
+    def test_not_decomposed_on_device(self):
+        """Test that the gradient of a QNode with multi-parameter gates is correct with
+        the adjoint method of default.qubit."""
+        dev = qml.device("default.qubit")
+
+        def circuit(x):
+            qml.Rot(x[0], x[1], x[2], 0)
+            qml.U3(x[3], x[4], x[5], 1)
+            qml.CNOT([0, 1])
+            qml.U2(x[6], x[7], 0)
+            qml.PauliRot(x[8], "XY", [0, 1])
+            return qml.expval(qml.Z(0) @ qml.X(1)), qml.expval(qml.Y(1))
+
+        x = qml.numpy.array(np.linspace(-1, 1.5, 9))
+        jac_adjoint = qml.jacobian(
+            lambda x: qml.math.stack(qml.QNode(circuit, dev, diff_method="adjoint")(x))
+        )(x)
+        jac_backprop = qml.jacobian(
+            lambda x: qml.math.stack(qml.QNode(circuit, dev, diff_method="backprop")(x))
+        )(x)
+        assert np.allclose(jac_adjoint, jac_backprop)
+
+
+def test_bras_are_batched(mocker):
+    """Test that the adjoint gates are applied once to all the bras instead of once per
+    observable."""
+
+    def num_calls(n_obs):
+        spy = mocker.patch(
+            "pennylane.devices.qubit.adjoint_jacobian.apply_operation",
+            side_effect=qml.devices.qubit.apply_operation,
+        )
+        ops = [qml.RX(0.1, 0), qml.CNOT([0, 1]), qml.RY(0.2, 1), qml.IsingXX(0.3, [0, 1])]
+        qs = QuantumScript(ops, [qml.expval(qml.Z(i % 2)) for i in range(n_obs)])
+        adjoint_jacobian(qs, state=qml.devices.qubit.get_final_state(qs)[0])
+        count = spy.call_count
+        mocker.stopall()
+        return count
+
+    # only the initial bras are computed per observable
+    assert num_calls(5) - num_calls(1) == 4
+
+
+class TestCheckpointing:
+    """Tests for the checkpointed reverse sweep."""
+
+    @staticmethod
+    def _tape(measurements):
+        rng = np.random.default_rng(5)
+        ops = [qml.StatePrep(np.array([1.0, 1.0j]) / np.sqrt(2), wires=0)]
+        for _ in range(4):
+            ops += [qml.Rot(*rng.normal(size=3), wires=w) for w in range(3)]
+            ops += [qml.IsingZZ(rng.normal(), [w, w + 1]) for w in range(2)]
+            ops.append(qml.Snapshot())
+        return QuantumScript(ops, measurements, trainable_params=list(range(1, 45)))
+
+    @pytest.mark.parametrize("checkpoint_interval", [1, 4, 7, 1000])
+    def test_matches_uncheckpointed(self, checkpoint_interval):
+        """Test that the jacobian, jvp and vjp do not depend on the checkpointing."""
+        qs = self._tape([qml.expval(qml.PauliZ(0)), qml.expval(qml.X(1) @ qml.Y(2))])
+
+        jac = adjoint_jacobian(qs, checkpoint_interval=checkpoint_interval)
+        assert np.allclose(jac, adjoint_jacobian(qs))
+
+        tangents = tuple(np.linspace(-1, 1, 44))
+        jvp = adjoint_jvp(qs, tangents, checkpoint_interval=checkpoint_interval)
+        assert np.allclose(jvp, adjoint_jvp(qs, tangents))
+
+        cotangents = (0.3, -0.8)
+        vjp = adjoint_vjp(qs, cotangents, checkpoint_interval=checkpoint_interval)
+        assert np.allclose(vjp, adjoint_vjp(qs, cotangents))
+
+    def test_state_vjp(self):
+        """Test the vjp of a state measurement with checkpointing."""
+        qs = self._tape([qml.state()])
+        cotangents = np.linspace(0, 1, 8) + 0.5j
+        vjp = adjoint_vjp(qs, cotangents, checkpoint_interval=3)
+        assert np.allclose(vjp, adjoint_vjp(qs, cotangents))
+
+    def test_ket_is_not_undone(self, mocker):
+        """Test that only the bras are updated with adjoint gates when checkpointing."""
+        qs = self._tape([qml.expval(qml.PauliZ(0))])
+        spy = mocker.patch(
+            "pennylane.devices.qubit.adjoint_jacobian.apply_operation",
+            side_effect=qml.devices.qubit.apply_operation,
+        )
+        adjoint_jacobian(qs, checkpoint_interval=4)
+
+        adjoint_ket_calls = [
+            call
+            for call in spy.call_args_list
+            if isinstance(call.args[0], qml.ops.Adjoint) and not call.kwargs.get("is_state_batched")
+        ]
+        assert len(adjoint_ket_calls) == 0
+
+    @pytest.mark.parametrize(
+        "max_checkpoint_bytes, num_adjoint_ket_calls",
+        [(2**20, 0), (14 * 128, 0), (13 * 128, 43), (0, 43)],
+    )
+    def test_max_checkpoint_bytes(self, max_checkpoint_bytes, num_adjoint_ket_calls, mocker):
+        """Test that the 14 states of 128 bytes needed to checkpoint the 44 gates every 7 gates
+        are only stored if they fit into the memory budget, and that the results do not depend
+        on it."""
+        qs = self._tape([qml.expval(qml.PauliZ(0))])
+        expected = adjoint_jacobian(qs)
+        spy = mocker.patch(
+            "pennylane.devices.qubit.adjoint_jacobian.apply_operation",
+            side_effect=qml.devices.qubit.apply_operation,
+        )
+        jac = adjoint_jacobian(qs, max_checkpoint_bytes=max_checkpoint_bytes)
+        assert np.allclose(jac, expected)
+
+        adjoint_ket_calls = [
+            call
+            for call in spy.call_args_list
+            if isinstance(call.args[0], qml.ops.Adjoint) and not call.kwargs.get("is_state_batched")
+        ]
+        assert len(adjoint_ket_calls) == num_adjoint_ket_calls
+
+    @pytest.mark.parametrize(
+        "num_gates, max_checkpoint_bytes, expected",
+        [(16, 8 * 128, 4), (16, 7 * 128, None), (10, 7 * 128, 4), (0, 2**20, None)],
+    )
+    def test_checkpoint_interval_from_budget(self, num_gates, max_checkpoint_bytes, expected):
+        """Test that the interval storing the fewest states is used if they fit into the budget."""
+        assert _checkpoint_interval(num_gates, 128, max_checkpoint_bytes) == expected
+
+    def test_invalid_max_checkpoint_bytes(self):
+        """Test that an error is raised for a negative memory budget."""
+        qs = self._tape([qml.expval(qml.PauliZ(0))])
+        with pytest.raises(ValueError, match="max_checkpoint_bytes must be a non-negative"):
+            adjoint_jacobian(qs, max_checkpoint_bytes=-1)
+
+    def test_invalid_interval(self):
+        """Test that an error is raised for a checkpoint interval smaller than one."""
+        qs = self._tape([qml.expval(qml.PauliZ(0))])
+        with pytest.raises(ValueError, match="checkpoint_interval must be a positive integer"):
+            adjoint_jacobian(qs, checkpoint_interval=0)
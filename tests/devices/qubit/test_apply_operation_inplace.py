@@ -0,0 +1,243 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for applying operations in place in devices/qubit."""
+
+import importlib
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.devices.qubit import apply_operation, apply_operation_inplace, get_final_state
+from pennylane.devices.qubit.apply_operation_inplace import (
+    apply_operations_inplace,
+    supports_inplace,
+)
+
+# the module is shadowed by the ``simulate`` function in ``pennylane.devices.qubit``
+simulate_module = importlib.import_module("pennylane.devices.qubit.simulate")
+
+in_place_ops = [
+    qml.Identity(1),
+    qml.GlobalPhase(0.4),
+    qml.Z(2),
+    qml.S(0),
+    qml.T(3),
+    qml.PhaseShift(0.7, 1),
+    qml.RZ(1.2, 2),
+]
+
+out_of_place_ops = [
+    qml.X(1),
+    qml.CNOT((2, 0)),
+    qml.CNOT((0, 3)),
+    qml.SWAP((1, 3)),
+    qml.Hadamard(0),
+    qml.RX(0.3, 2),
+    qml.IsingXY(0.5, (3, 1)),
+    qml.Toffoli((2, 0, 1)),
+    qml.QubitUnitary(qml.matrix(qml.Rot(0.1, 0.2, 0.3, 0)), 3),
+]
+
+
+def _random_state(num_wires, seed=42, dtype=np.complex128):
+    rng = np.random.default_rng(seed)
+    state = rng.random(2**num_wires) + 1j * rng.random(2**num_wires)
+    state /= np.linalg.norm(state)
+    return np.reshape(state, (2,) * num_wires).astype(dtype)
+
+
+class TestApplyOperationInplace:
+    """Tests for the individual in-place kernels."""
+
+    @pytest.mark.parametrize("op", in_place_ops)
+    def test_diagonal_ops_modify_state(self, op):
+        """Test that diagonal operations are applied to the state without using the buffer."""
+        state = _random_state(4)
+        expected = apply_operation(op, state)
+
+        out = np.empty_like(state)
+        new_state = apply_operation_inplace(op, state, out)
+        assert new_state is state
+        assert qml.math.allclose(new_state, expected)
+
+    @pytest.mark.parametrize("op", out_of_place_ops)
+    def test_ops_write_to_buffer(self, op):
+        """Test that other operations write their result into the provided buffer."""
+        state = _random_state(4)
+        expected = apply_operation(op, state)
+
+        out = np.empty_like(state)
+        new_state = apply_operation_inplace(op, state, out)
+        assert new_state is out
+        assert qml.math.allclose(new_state, expected)
+
+    @pytest.mark.parametrize(
+        "op, num_wires",
+        [
+            (qml.X(0), 1),
+            (qml.Z(0), 1),
+            (qml.X(1), 2),
+            (qml.CNOT((0, 1)), 2),
+            (qml.CNOT((1, 0)), 2),
+            (qml.SWAP((0, 1)), 2),
+        ],
+    )
+    def test_few_wires(self, op, num_wires):
+        """Test the kernels on states where the slices index every axis."""
+        state = _random_state(num_wires)
+        expected = apply_operation(op, state)
+
+        new_state = apply_operation_inplace(op, state.copy(), np.empty_like(state))
+        assert qml.math.allclose(new_state, expected)
+
+    @pytest.mark.parametrize("op", out_of_place_ops[:3] + in_place_ops[2:5])
+    def test_single_precision(self, op):
+        """Test that complex64 states keep their precision."""
+        state = _random_state(4, dtype=np.complex64)
+        expected = apply_operation(op, state.astype(np.complex128))
+
+        new_state = apply_operation_inplace(op, state, np.empty_like(state))
+        assert new_state.dtype == np.complex64
+        assert qml.math.allclose(new_state, expected, atol=1e-6)
+
+    @pytest.mark.parametrize(
+        "op, expected",
+        [
+            (qml.RX(0.1, 0), True),
+            (qml.GlobalPhase(0.1), True),
+            (qml.RX(np.array([0.1, 0.2]), 0), False),
+            (qml.measurements.MidMeasureMP(0), False),
+            (qml.Projector([1], 0), False),
+            (qml.Snapshot(), False),
+            (qml.ops.Conditional(qml.measure(0), qml.X(1)), False),
+        ],
+    )
+    def test_supports_inplace(self, op, expected):
+        """Test which operations can be applied in place."""
+        assert supports_inplace(op) is expected
+
+
+class TestApplyOperationsInplace:
+    """Tests for applying a sequence of operations with two buffers."""
+
+    def test_sequence(self):
+        """Test that a sequence of operations gives the same state as apply_operation."""
+        ops = out_of_place_ops + in_place_ops + out_of_place_ops[::-1]
+        state = _random_state(4)
+
+        expected = state
+        for op in ops:
+            expected = apply_operation(op, expected)
+
+        result = apply_operations_inplace(ops, state.copy())
+        assert qml.math.allclose(result, expected)
+
+    def test_two_buffers(self, mocker):
+        """Test that only a single buffer is allocated besides the input state."""
+        state = _random_state(3)
+        spy = mocker.spy(np, "empty_like")
+
+        result = apply_operations_inplace([qml.X(0), qml.CNOT((0, 1)), qml.Z(2), qml.X(2)], state)
+        assert spy.call_count == 1
+        buffer = spy.spy_return
+        assert result is state or result is buffer
+
+
+class TestGetFinalStateInplace:
+    """Tests for the inplace option of get_final_state."""
+
+    def test_same_result(self):
+        """Test that the in-place simulation gives the same result."""
+        ops = [qml.Hadamard(0), qml.CNOT((0, 1)), qml.RX(0.4, 2), qml.T(1), qml.SWAP((0, 2))]
+        qs = qml.tape.QuantumScript(ops, [qml.state()])
+
+        expected, _ = get_final_state(qs)
+        state, is_state_batched = get_final_state(qs, inplace=True)
+        assert not is_state_batched
+        assert qml.math.allclose(state, expected)
+
+    def test_with_fusion(self):
+        """Test that in-place simulation can be combined with gate fusion."""
+        ops = [qml.Hadamard(0), qml.CNOT((0, 1)), qml.RX(0.4, 2), qml.T(1), qml.SWAP((0, 2))]
+        qs = qml.tape.QuantumScript(ops, [qml.state()])
+
+        expected, _ = get_final_state(qs)
+        state, _ = get_final_state(qs, inplace=True, max_fused_wires=2)
+        assert qml.math.allclose(state, expected)
+
+    def test_state_prep_not_modified(self):
+        """Test that the data of a state preparation is not modified."""
+        data = _random_state(2).flatten()
+        original = data.copy()
+        qs = qml.tape.QuantumScript([qml.StatePrep(data, (0, 1)), qml.Z(0)], [qml.state()])
+
+        state, _ = get_final_state(qs, inplace=True)
+        assert qml.math.allclose(data, original)
+        assert qml.math.allclose(state.flatten(), original * np.array([1, 1, -1, -1]))
+
+    @pytest.mark.parametrize(
+        "ops",
+        [
+            [qml.RX(np.array([0.1, 0.2]), 0), qml.CNOT((0, 1))],
+            [qml.Hadamard(0), qml.Projector([1], 0), qml.CNOT((0, 1))],
+        ],
+    )
+    def test_fallback(self, ops, mocker):
+        """Test that unsupported circuits fall back to apply_operation."""
+        spy = mocker.spy(simulate_module, "apply_operations_inplace")
+        qs = qml.tape.QuantumScript(ops, [qml.state()])
+
+        expected, expected_batched = get_final_state(qs)
+        state, is_state_batched = get_final_state(qs, inplace=True)
+        spy.assert_not_called()
+        assert is_state_batched == expected_batched
+        assert qml.math.allclose(state, expected)
+
+    @pytest.mark.autograd
+    def test_autograd_fallback(self, mocker):
+        """Test that trainable autograd parameters are not applied in place."""
+        spy = mocker.spy(simulate_module, "apply_operations_inplace")
+        x = qml.numpy.array(0.4, requires_grad=True)
+
+        def f(x):
+            qs = qml.tape.QuantumScript([qml.RX(x, 0)], [qml.expval(qml.Z(0))])
+            return qml.devices.qubit.simulate(qs, inplace=True)
+
+        assert qml.math.allclose(qml.grad(f)(x), -np.sin(0.4))
+        spy.assert_not_called()
+
+    def test_device_option(self):
+        """Test that in-place simulation can be enabled on default.qubit."""
+        ops = [qml.Hadamard(0), qml.CNOT((0, 1)), qml.RX(0.4, 2), qml.T(1)]
+        qs = qml.tape.QuantumScript(ops, [qml.expval(qml.Y(2)), qml.probs(wires=(0, 1))])
+
+        expected = qml.device("default.qubit").execute(qs)
+        res = qml.device("default.qubit", inplace=True).execute(qs)
+        assert qml.math.allclose(res[0], expected[0])
+        assert qml.math.allclose(res[1], expected[1])
+
+    @pytest.mark.parametrize("num_wires", [1, 2])
+    def test_device_few_wires(self, num_wires):
+        """Test that in-place simulation works on devices with one and two wires."""
+
+        def circuit():
+            qml.X(0)
+            if num_wires == 2:
+                qml.CNOT((0, 1))
+            return qml.state()
+
+        dev = qml.device("default.qubit", wires=num_wires, inplace=True)
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=num_wires))()
+        assert qml.math.allclose(qml.QNode(circuit, dev)(), expected)
@@ -0,0 +1,186 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for gate fusion in devices/qubit."""
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.devices.qubit import fuse_operations, get_final_state, simulate
+from pennylane.devices.qubit.gate_fusion import fusion_plan
+
+
+def _layered_ops(params):
+    """A brickwork circuit on four wires."""
+    ops = []
+    for layer in params:
+        ops.extend(qml.RX(p, w) for w, p in enumerate(layer[:4]))
+        ops.extend(qml.RY(p, w) for w, p in enumerate(layer[4:]))
+        ops.extend([qml.CNOT((0, 1)), qml.CZ((2, 3)), qml.IsingXX(layer[0], (1, 2))])
+        ops.append(qml.Toffoli((0, 1, 3)))
+    return ops
+
+
+class TestFusionPlan:
+    """Tests for the structural fusion plan."""
+
+    def test_disjoint_single_qubit_gates(self):
+        """Test that gates on disjoint wires form separate blocks when they cannot be merged."""
+        plan = fusion_plan(((0,), (1,), (2,)), max_wires=1)
+        assert plan == (((0,), (0,)), ((1,), (1,)), ((2,), (2,)))
+
+    def test_merging_open_blocks(self):
+        """Test that a two-qubit gate merges the open blocks on its wires."""
+        plan = fusion_plan(((0,), (1,), (0, 1), (0,), (2,)), max_wires=2)
+        assert plan == (((0, 1), (0, 1, 2, 3)), ((2,), (4,)))
+
+    def test_block_closed_when_too_large(self):
+        """Test that blocks are closed once a gate would exceed the maximum number of wires."""
+        plan = fusion_plan(((0, 1), (1, 2), (2,)), max_wires=2)
+        assert plan == (((0, 1), (0,)), ((1, 2), (1, 2)))
+
+    def test_barrier_closes_all_blocks(self):
+        """Test that an operation that cannot be fused closes all open blocks."""
+        plan = fusion_plan(((0,), (0,), None, (1,), (1,)), max_wires=2)
+        assert plan == (((0,), (0, 1)), (None, (2,)), ((1,), (3, 4)))
+
+    def test_plan_is_cached(self):
+        """Test that the plan is reused for circuits with the same structure."""
+        ops1 = _layered_ops(np.random.random((2, 8)))
+        ops2 = _layered_ops(np.random.random((2, 8)))
+
+        fuse_operations(ops1, max_wires=3)
+        hits = fusion_plan.cache_info().hits
+        fuse_operations(ops2, max_wires=3)
+        assert fusion_plan.cache_info().hits == hits + 1
+
+
+class TestFuseOperations:
+    """Tests for fuse_operations."""
+
+    def test_none_returns_operations(self):
+        """Test that no fusion is performed if max_wires is None."""
+        ops = [qml.RX(0.1, 0), qml.RY(0.2, 0)]
+        assert fuse_operations(ops, max_wires=None) == ops
+
+    def test_single_operation_blocks_unchanged(self):
+        """Test that blocks with a single operation keep the original operation."""
+        ops = [qml.RX(0.1, 0), qml.CNOT((0, 1)), qml.RY(0.2, 2)]
+        new_ops = fuse_operations(ops, max_wires=1)
+        assert new_ops == ops
+
+    def test_fused_block_matrix(self):
+        """Test that a fused block has the matrix of the operations it replaces."""
+        ops = [qml.RX(0.1, 0), qml.RY(0.2, 1), qml.CNOT((0, 1)), qml.RZ(0.3, 1)]
+        new_ops = fuse_operations(ops, max_wires=2)
+
+        assert len(new_ops) == 1
+        assert isinstance(new_ops[0], qml.QubitUnitary)
+        expected = qml.matrix(qml.tape.QuantumScript(ops), wire_order=[0, 1])
+        assert qml.math.allclose(new_ops[0].matrix(wire_order=[0, 1]), expected)
+
+    @pytest.mark.parametrize(
+        "barrier",
+        [
+            qml.measurements.MidMeasureMP(0, id="m0"),
+            qml.Snapshot(),
+            qml.Projector([0], 1),
+            qml.RX(np.array([0.1, 0.2]), 1),
+        ],
+    )
+    def test_barriers_not_fused(self, barrier):
+        """Test that operations that cannot be fused are kept and split the blocks."""
+        ops = [qml.RX(0.1, 0), qml.RY(0.2, 0), barrier, qml.RX(0.3, 0), qml.RY(0.4, 0)]
+        new_ops = fuse_operations(ops, max_wires=2)
+
+        assert len(new_ops) == 3
+        assert new_ops[1] is barrier
+
+    def test_no_queuing(self):
+        """Test that fused operations are not queued."""
+        ops = [qml.RX(0.1, 0), qml.RY(0.2, 0)]
+        with qml.queuing.AnnotatedQueue() as q:
+            fuse_operations(ops)
+        assert len(q) == 0
+
+
+class TestSimulateWithFusion:
+    """Tests that simulating with gate fusion gives the same results as without."""
+
+    @pytest.mark.parametrize("max_fused_wires", [1, 2, 3])
+    def test_final_state(self, max_fused_wires):
+        """Test that the final state is unchanged by gate fusion."""
+        params = np.random.random((3, 8))
+        qs = qml.tape.QuantumScript(_layered_ops(params), [qml.state()])
+
+        expected, _ = get_final_state(qs)
+        state, is_state_batched = get_final_state(qs, max_fused_wires=max_fused_wires)
+        assert not is_state_batched
+        assert qml.math.allclose(state, expected)
+
+    def test_batched_operation(self):
+        """Test that circuits with broadcasted operations give the same results."""
+        ops = [qml.RX(0.1, 0), qml.RY(np.array([0.2, 0.3]), 1), qml.CNOT((0, 1)), qml.RZ(0.4, 0)]
+        qs = qml.tape.QuantumScript(ops, [qml.expval(qml.Z(0)), qml.probs(wires=[0, 1])])
+
+        expected = simulate(qs)
+        res = simulate(qs, max_fused_wires=2)
+        assert qml.math.allclose(res[0], expected[0])
+        assert qml.math.allclose(res[1], expected[1])
+
+    @pytest.mark.autograd
+    def test_autograd_backprop(self):
+        """Test that derivatives can be computed through fused blocks with autograd."""
+        params = qml.numpy.array(np.random.random((2, 8)), requires_grad=True)
+
+        def f(x, max_fused_wires):
+            qs = qml.tape.QuantumScript(_layered_ops(x), [qml.expval(qml.Z(0) @ qml.Z(3))])
+            return simulate(qs, max_fused_wires=max_fused_wires)
+
+        assert qml.math.allclose(f(params, 2), f(params, None))
+        assert qml.math.allclose(qml.grad(f)(params, 2), qml.grad(f)(params, None))
+
+    @pytest.mark.jax
+    def test_jax_backprop(self):
+        """Test that derivatives can be computed through fused blocks with jax."""
+        import jax
+
+        params = jax.numpy.array(np.random.random((2, 8)))
+
+        def f(x, max_fused_wires):
+            qs = qml.tape.QuantumScript(_layered_ops(x), [qml.expval(qml.Z(0) @ qml.Z(3))])
+            return simulate(qs, max_fused_wires=max_fused_wires)
+
+        assert qml.math.allclose(f(params, 2), f(params, None))
+        assert qml.math.allclose(
+            jax.grad(f)(params, 2), jax.grad(f)(params, None)  # pylint: disable=not-callable
+        )
+
+    def test_device_option(self):
+        """Test that gate fusion can be enabled on default.qubit."""
+        params = np.random.random((2, 8))
+        qs = qml.tape.QuantumScript(_layered_ops(params), [qml.expval(qml.Z(0) @ qml.Z(3))])
+
+        expected = qml.device("default.qubit").execute(qs)
+        assert qml.math.allclose(
+            qml.device("default.qubit", max_fused_wires=2).execute(qs), expected
+        )
+
+        config = qml.devices.ExecutionConfig(device_options={"max_fused_wires": 3})
+        assert qml.math.allclose(qml.device("default.qubit").execute(qs, config), expected)
+
+    def test_device_invalid_max_fused_wires(self):
+        """Test that an error is raised for a non-positive number of fused wires."""
+        with pytest.raises(ValueError, match="max_fused_wires must be a positive integer"):
+            qml.device("default.qubit", max_fused_wires=0)
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Unit tests for measure in devices/qubit."""
 
+import importlib
+
 import numpy as np
 import pytest
 from scipy.sparse import csr_matrix
@@ -24,10 +26,14 @@ from pennylane.devices.qubit.measure import (
     full_dot_products,
     get_measurement_function,
     measure,
+    measure_pauli_expvals,
+    pauli_word_expvals,
     state_diagonalizing_gates,
     sum_of_terms_method,
 )
 
+measure_module = importlib.import_module("pennylane.devices.qubit.measure")
+
 
 class TestCurrentlyUnsupportedCases:
     # pylint: disable=too-few-public-methods
@@ -288,6 +294,91 @@ class TestBroadcasting:
         assert np.allclose(res, expected)
 
 
+class TestPauliExpvals:
+    """Tests for evaluating the expectation values of many Pauli sentences together."""
+
+    @staticmethod
+    def random_state(shape, seed=42):
+        """Random normalized state of the given shape."""
+        rng = np.random.default_rng(seed)
+        state = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+        return state / np.linalg.norm(state)
+
+    @pytest.mark.parametrize("num_wires", [1, 3, 12])
+    def test_pauli_word_expvals(self, num_wires, monkeypatch):
+        """Test the expectation values of Pauli words, including states with more wires than
+        fit in a single chunk of signs."""
+        monkeypatch.setattr(measure_module, "_MAX_CHUNK_BITS", 5)
+        rng = np.random.default_rng(7)
+        words = [
+            qml.pauli.PauliWord(dict(zip(range(num_wires), rng.choice(list("IXYZ"), num_wires))))
+            for _ in range(20)
+        ]
+        state = self.random_state((2,) * num_wires)
+
+        res = pauli_word_expvals(words, state)
+        expected = [
+            measure(qml.expval(pw.operation(wire_order=range(num_wires))), state) for pw in words
+        ]
+        assert res.shape == (20,)
+        assert np.allclose(res.real, expected)
+        assert np.allclose(res.imag, 0)
+
+    def test_pauli_word_expvals_broadcasted(self):
+        """Test the expectation values of Pauli words with a batched state."""
+        words = [qml.X(0).pauli_rep, (qml.Y(0) @ qml.Y(2)).pauli_rep, qml.Z(1).pauli_rep]
+        words = [next(iter(ps)) for ps in words]
+        state = self.random_state((3, 2, 2, 2))
+
+        res = pauli_word_expvals(words, state, is_state_batched=True)
+        assert res.shape == (3, 3)
+        for i, pw in enumerate(words):
+            expected = measure(qml.expval(pw.operation()), state, is_state_batched=True)
+            assert np.allclose(res[:, i], expected)
+
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_measure_pauli_expvals(self, is_state_batched):
+        """Test that the results of mixed measurements match measuring them one by one."""
+        H1 = qml.Hamiltonian([0.5, -1.2, 0.3], [qml.X(0) @ qml.X(1), qml.Z(2), qml.Y(0) @ qml.Y(1)])
+        H2 = qml.sum(qml.s_prod(0.7, qml.Z(2)), qml.Y(0) @ qml.Y(1), qml.X(2))
+        mps = [
+            qml.expval(H1),
+            qml.probs(wires=[0, 1]),
+            qml.expval(H2),
+            qml.expval(qml.Hermitian(np.diag([1.0, 2.0]), 0)),
+            qml.var(qml.Z(0)),
+            qml.expval(qml.Z(1)),
+        ]
+        shape = (4, 2, 2, 2) if is_state_batched else (2, 2, 2)
+        state = self.random_state(shape)
+
+        res = measure_pauli_expvals(mps, state, is_state_batched=is_state_batched)
+        assert len(res) == len(mps)
+        for r, mp in zip(res, mps):
+            assert qml.math.allclose(r, measure(mp, state, is_state_batched=is_state_batched))
+
+    def test_measure_pauli_expvals_few_words(self, mocker):
+        """Test that the measurements are dispatched one by one if there are not several Pauli
+        words to evaluate together."""
+        spy = mocker.spy(measure_module, "pauli_word_expvals")
+        state = self.random_state((2, 2))
+        res = measure_pauli_expvals([qml.expval(qml.Z(0)), qml.probs(wires=0)], state)
+
+        spy.assert_not_called()
+        assert np.allclose(res[0], measure(qml.expval(qml.Z(0)), state))
+
+    def test_backprop_measurements_measured_separately(self, mocker):
+        """Test that measurements with trainable coefficients are not evaluated together."""
+        spy = mocker.spy(measure_module, "pauli_word_expvals")
+        coeffs = qml.numpy.array([0.5, 0.2], requires_grad=True)
+        H = qml.dot(coeffs, [qml.X(0), qml.Z(1)])
+        state = self.random_state((2, 2))
+        res = measure_pauli_expvals([qml.expval(H), qml.expval(qml.Y(0))], state)
+
+        spy.assert_not_called()
+        assert qml.math.allclose(res[0], measure(qml.expval(H), state))
+
+
 class TestNaNMeasurements:
     """Tests for state vectors containing nan values."""
 
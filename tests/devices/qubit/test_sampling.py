@@ -20,7 +20,7 @@ import pytest
 
 import pennylane as qml
 from pennylane.devices.qubit import measure_with_samples, sample_state, simulate
-from pennylane.devices.qubit.sampling import sample_probs
+from pennylane.devices.qubit.sampling import sample_histogram, sample_probs
 from pennylane.devices.qubit.simulate import _FlexShots
 from pennylane.measurements import Shots
 
@@ -95,7 +95,7 @@ class TestSampleState:
         # prng_key specified, should call _sample_probs_jax
         _ = sample_state(state, 10, prng_key=jax.random.PRNGKey(15))
 
-        spy.assert_called_once()
+        assert spy.call_count == 2
 
     @pytest.mark.jax
     def test_sample_state_jax(self, seed):
@@ -1364,3 +1364,188 @@ class TestSampleProbs:
         )
         with pytest.raises(ValueError, match=r"(?i)probabilities do not sum to 1"):
             sample_probs(probs, shots=1000, num_wires=1, is_state_batched=True, rng=seed)
+
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_matches_rng_choice(self, is_state_batched, seed):
+        """Test that the samples are the same as the ones drawn with ``rng.choice``."""
+        probs = np.random.default_rng(seed).random((2, 8))
+        probs /= probs.sum(axis=-1, keepdims=True)
+        probs = probs if is_state_batched else probs[0]
+
+        samples = sample_probs(probs, 100, 3, is_state_batched, np.random.default_rng(seed))
+
+        rng = np.random.default_rng(seed)
+        batch = probs if is_state_batched else [probs]
+        expected = np.stack([rng.choice(8, 100, p=p) for p in batch])
+        expected = (expected[..., None] >> np.arange(2, -1, -1)) & 1
+        assert np.array_equal(samples, expected if is_state_batched else expected[0])
+
+    def test_packed_and_dtype(self, seed):
+        """Test that samples can be returned as integers or as a compact array of bits."""
+        probs = np.array([0.1, 0.2, 0.3, 0.4])
+        samples = sample_probs(probs, 50, 2, False, np.random.default_rng(seed))
+        packed = sample_probs(probs, 50, 2, False, np.random.default_rng(seed), packed=True)
+        bits = sample_probs(probs, 50, 2, False, np.random.default_rng(seed), dtype=np.uint8)
+
+        assert packed.shape == (50,)
+        assert np.array_equal(packed, 2 * samples[:, 0] + samples[:, 1])
+        assert bits.dtype == np.uint8
+        assert np.array_equal(bits, samples)
+
+    @pytest.mark.jax
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_packed_jax(self, is_state_batched):
+        """Test that samples drawn with a JAX PRNG key are packed in the same layout as NumPy
+        samples."""
+        import jax
+
+        probs = np.array([0.1, 0.2, 0.3, 0.4])
+        probs = np.stack([probs, probs[::-1]]) if is_state_batched else probs
+        key = jax.random.PRNGKey(5)
+        samples = sample_probs(probs, 50, 2, is_state_batched, None, prng_key=key)
+        packed = sample_probs(probs, 50, 2, is_state_batched, None, prng_key=key, packed=True)
+
+        assert packed.shape == samples.shape[:-1]
+        assert np.array_equal(packed, 2 * samples[..., 0] + samples[..., 1])
+
+
+class TestPackedMeasurements:
+    """Tests that measurements computed from packed samples match the unpacked samples."""
+
+    @staticmethod
+    def _results(monkeypatch, packed):
+        if not packed:
+            monkeypatch.setattr(
+                qml.devices.qubit.sampling, "_supports_packed_samples", lambda mp: False
+            )
+        state = qml.devices.qubit.create_initial_state(range(3))
+        state = qml.devices.qubit.apply_operation(qml.RX(np.array([0.3, 1.2]), 0), state)
+        state = qml.devices.qubit.apply_operation(qml.CNOT([0, 1]), state, is_state_batched=True)
+        state = qml.devices.qubit.apply_operation(qml.Hadamard(2), state, is_state_batched=True)
+        mps = [
+            qml.expval(qml.Z(0)),
+            qml.var(qml.Z(1) @ qml.X(2)),
+            qml.expval(qml.Hermitian(np.diag([1.0, 2.0, 3.0, 4.0]), [2, 1])),
+            qml.probs(wires=[1, 0]),
+            qml.probs(),
+            qml.counts(wires=[2, 0]),
+            qml.counts(qml.Z(1)),
+            qml.counts(all_outcomes=True),
+        ]
+        return measure_with_samples(
+            mps, state, Shots([100, (50, 2)]), is_state_batched=True, rng=np.random.default_rng(42)
+        )
+
+    def test_results_match(self, monkeypatch):
+        """Test that expectation values, variances, probabilities and counts are identical
+        whether they are computed from packed or unpacked samples."""
+        packed = self._results(monkeypatch, packed=True)
+        unpacked = self._results(monkeypatch, packed=False)
+
+        for shot_res1, shot_res2 in zip(packed, unpacked, strict=True):
+            for res1, res2 in zip(shot_res1, shot_res2, strict=True):
+                if isinstance(res1, list):
+                    assert res1 == res2
+                else:
+                    assert np.array_equal(res1, res2)
+                    assert np.shape(res1) == np.shape(res2)
+
+
+class TestHistogramSampling:
+    """Tests for measurements computed from multinomial histograms of the outcomes."""
+
+    def test_sample_histogram(self, seed):
+        """Test that the histogram has the shape of the probabilities and sums to the shots."""
+        probs = np.array([[0.5, 0, 0, 0.5], [0.1, 0.2, 0.3, 0.4]])
+        histogram = sample_histogram(probs, 10000, is_state_batched=True, rng=seed)
+
+        assert histogram.shape == (2, 4)
+        assert np.all(histogram.sum(axis=-1) == 10000)
+        assert histogram[0, 1] == histogram[0, 2] == 0
+        assert np.allclose(histogram / 10000, probs, atol=0.02)
+
+    def test_sample_histogram_not_normalized(self, seed):
+        """Test that an error is raised if the probabilities do not sum to one."""
+        with pytest.raises(ValueError, match="probabilities do not sum to 1"):
+            sample_histogram(np.array([0.5, 0.4]), 10, is_state_batched=False, rng=seed)
+
+    @pytest.mark.parametrize("shots", [10000, [10000, (5000, 2)]])
+    def test_results_match_samples(self, shots, seed):
+        """Test that the results have the same format as with individual samples and agree
+        within the shot noise."""
+        state = qml.devices.qubit.create_initial_state(range(3))
+        state = qml.devices.qubit.apply_operation(qml.RX(np.array([0.3, 1.2]), 0), state)
+        state = qml.devices.qubit.apply_operation(qml.CNOT([0, 1]), state, is_state_batched=True)
+        state = qml.devices.qubit.apply_operation(qml.RY(0.4, 2), state, is_state_batched=True)
+        mps = [
+            qml.expval(qml.Z(0)),
+            qml.var(qml.Z(2) @ qml.X(1)),
+            qml.expval(qml.Hermitian(np.diag([1.0, 2.0, 3.0, 4.0]), [2, 0])),
+            qml.probs(wires=[2, 0]),
+            qml.counts(wires=[1, 0]),
+            qml.counts(qml.Z(0) @ qml.Z(1), all_outcomes=True),
+        ]
+        shots = Shots(shots)
+
+        def _measure(histogram_sampling):
+            results = measure_with_samples(
+                mps,
+                state,
+                shots,
+                is_state_batched=True,
+                rng=seed,
+                histogram_sampling=histogram_sampling,
+            )
+            return results if shots.has_partitioned_shots else (results,)
+
+        for shot_res1, shot_res2 in zip(_measure(True), _measure(False), strict=True):
+            for res1, res2 in zip(shot_res1, shot_res2, strict=True):
+                if isinstance(res1, list):
+                    for counts1, counts2 in zip(res1, res2, strict=True):
+                        assert list(counts1) == list(counts2)
+                        assert sum(counts1.values()) == sum(counts2.values())
+                else:
+                    assert np.shape(res1) == np.shape(res2)
+                    assert np.allclose(res1, res2, atol=0.05)
+
+    def test_marginal_wire_order(self, seed):
+        """Test that the histogram is marginalized in the order of the measured wires."""
+        state = qml.devices.qubit.create_initial_state(range(3))
+        state = qml.devices.qubit.apply_operation(qml.X(2), state)
+        res = measure_with_samples(
+            [qml.probs(wires=[2, 1]), qml.counts(wires=[0, 2])],
+            state,
+            Shots(100),
+            rng=seed,
+            histogram_sampling=True,
+        )
+        assert np.array_equal(res[0], [0, 0, 1, 0])
+        assert res[1] == {"01": 100}
+
+    def test_nan_probabilities(self, seed):
+        """Test that a state with NaN entries falls back to zero outcomes like sampling."""
+        state = np.full((2, 2), np.nan, dtype=np.complex128)
+        res = measure_with_samples(
+            [qml.expval(qml.Z(0)), qml.counts(wires=[0, 1])],
+            state,
+            Shots(10),
+            rng=seed,
+            histogram_sampling=True,
+        )
+        assert res[0] == 1
+        assert res[1] == {"00": 10}
+
+    def test_device_option(self, mocker):
+        """Test that default.qubit draws histograms when ``histogram_sampling=True``."""
+        spy = mocker.spy(qml.devices.qubit.sampling, "_measure_with_histogram")
+        dev = qml.device("default.qubit", shots=10**7, seed=42, histogram_sampling=True)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, 0)
+            return qml.expval(qml.Z(0)), qml.counts(wires=0)
+
+        expval, counts = circuit(0.5)
+        assert spy.call_count == 2
+        assert np.isclose(expval, np.cos(0.5), atol=1e-3)
+        assert counts["0"] + counts["1"] == 10**7
@@ -21,7 +21,12 @@ from dummy_debugger import Debugger
 from stat_utils import fisher_exact_test
 
 import pennylane as qml
-from pennylane.devices.qubit import get_final_state, measure_final_state, simulate
+from pennylane.devices.qubit import (
+    apply_operation,
+    get_final_state,
+    measure_final_state,
+    simulate,
+)
 from pennylane.devices.qubit.simulate import (
     TreeTraversalStack,
     _FlexShots,
@@ -31,6 +36,7 @@ from pennylane.devices.qubit.simulate import (
     find_post_processed_mcms,
     samples_to_counts,
     simulate_one_shot_native_mcm,
+    simulate_shot_branching_mcm,
     simulate_tree_mcm,
     split_circuit_at_mcms,
 )
@@ -1648,3 +1654,101 @@ class TestMidMeasurements:
             )
             expected_sample = simulate(equivalent_tape, rng=rng)
             fisher_exact_test(subset, expected_sample, outcomes=(-1, 1))
+
+    @pytest.mark.local_salt(2)
+    @pytest.mark.parametrize("ml_framework", ml_frameworks_list)
+    @pytest.mark.parametrize(
+        "postselect_mode", [None, "hw-like", "pad-invalid-samples", "fill-shots"]
+    )
+    def test_simulate_shot_branching_mcm(self, ml_framework, postselect_mode, seed):
+        """Test that the shot-branching engine gives the same per-shot statistics as
+        simulating every shot separately."""
+
+        with qml.queuing.AnnotatedQueue() as q:
+            qml.RX(np.pi / 4, wires=0)
+            m = qml.measure(wires=0, postselect=0)
+            qml.RX(np.pi / 4, wires=0)
+
+        n_shots = 1000
+        circuit = qml.tape.QuantumScript(
+            q.queue, [qml.expval(qml.Z(0)), qml.sample(m)], shots=[1] * n_shots
+        )
+
+        rng = np.random.default_rng(seed)
+        results = simulate_shot_branching_mcm(
+            circuit, interface=ml_framework, postselect_mode=postselect_mode, rng=rng
+        )
+        assert len(results) == n_shots
+        terminal_results, mcm_results = zip(*results)
+
+        if postselect_mode == "fill-shots":
+            assert all(ms == 0 for ms in mcm_results)
+            equivalent_tape = qml.tape.QuantumScript(
+                [qml.RX(np.pi / 4, wires=0)], [qml.expval(qml.Z(0))], shots=n_shots
+            )
+            expected_sample = simulate(equivalent_tape, rng=rng)
+            fisher_exact_test(terminal_results, expected_sample, outcomes=(-1, 1))
+
+        else:
+            equivalent_tape = qml.tape.QuantumScript(
+                [qml.RX(np.pi / 4, wires=0)], [qml.sample(wires=0)], shots=n_shots
+            )
+            expected_result = simulate(equivalent_tape, rng=rng)
+            fisher_exact_test(mcm_results, expected_result)
+
+            subset = [ts for ms, ts in zip(mcm_results, terminal_results) if ms == 0]
+            equivalent_tape = qml.tape.QuantumScript(
+                [qml.RX(np.pi / 4, wires=0)], [qml.expval(qml.Z(0))], shots=n_shots
+            )
+            expected_sample = simulate(equivalent_tape, rng=rng)
+            fisher_exact_test(subset, expected_sample, outcomes=(-1, 1))
+
+            subset = [ts for ms, ts in zip(mcm_results, terminal_results) if ms == 1]
+            equivalent_tape = qml.tape.QuantumScript(
+                [qml.X(0), qml.RX(np.pi / 4, wires=0)], [qml.expval(qml.Z(0))], shots=n_shots
+            )
+            expected_sample = simulate(equivalent_tape, rng=rng)
+            fisher_exact_test(subset, expected_sample, outcomes=(-1, 1))
+
+    def test_shot_branching_cost_scales_with_branches(self, mocker, seed):
+        """Test that every operation is applied once per reachable branch and not once per
+        shot, and that the shots are not grouped by branch."""
+        spy = mocker.patch(
+            "pennylane.devices.qubit.simulate.apply_operation", side_effect=apply_operation
+        )
+
+        with qml.queuing.AnnotatedQueue() as q:
+            qml.Hadamard(0)
+            m0 = qml.measure(0)
+            qml.cond(m0, qml.RY)(0.5, 1)
+            qml.Hadamard(0)
+            qml.measure(0)
+
+        circuit = qml.tape.QuantumScript(q.queue, [qml.sample(m0)], shots=[1] * 10000)
+        results = simulate_shot_branching_mcm(circuit, rng=seed)
+
+        # one branch before the first MCM and two branches before the second MCM
+        assert spy.call_count == 1 + 2 * 2
+        mcm_samples = np.array(results)
+        assert 0.45 < mcm_samples.mean() < 0.55
+        assert 0.45 < mcm_samples[:5000].mean() < 0.55
+
+    def test_simulate_uses_shot_branching(self, mocker, seed):
+        """Test that ``simulate`` uses the shot-branching engine for one-shot circuits
+        executed without a JAX PRNG key."""
+        spy = mocker.patch("pennylane.devices.qubit.simulate.simulate_one_shot_native_mcm")
+
+        dev = qml.device("default.qubit", seed=seed)
+
+        @qml.qnode(dev, mcm_method="one-shot")
+        def circuit(x):
+            qml.RX(x, 0)
+            m = qml.measure(0)
+            qml.cond(m, qml.RX)(x, 1)
+            return qml.expval(qml.Z(1)), qml.counts(m)
+
+        expval, counts = circuit(0.8, shots=[5000, 5000])[0]
+        spy.assert_not_called()
+        p1 = np.sin(0.4) ** 2
+        assert np.isclose(expval, 1 - p1 + p1 * np.cos(0.8), atol=0.05)
+        assert sum(counts.values()) == 5000
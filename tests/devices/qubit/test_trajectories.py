@@ -0,0 +1,294 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for simulating quantum trajectories in devices/qubit."""
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.devices.qubit import apply_channel_trajectories, simulate_trajectories
+from pennylane.devices.qubit_mixed import simulate as simulate_mixed
+
+NOISY_OPS = [
+    qml.Hadamard(0),
+    qml.CNOT((0, 1)),
+    qml.DepolarizingChannel(0.2, 0),
+    qml.AmplitudeDamping(0.3, 1),
+    qml.RX(0.4, 1),
+    qml.PhaseDamping(0.2, 0),
+    qml.BitFlip(0.1, 1),
+]
+
+
+def _random_states(num_trajectories, num_wires, seed=42):
+    """A batch of identical random normalized states."""
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2**num_wires) + 1j * rng.normal(size=2**num_wires)
+    state /= np.linalg.norm(state)
+    return np.stack([state.reshape((2,) * num_wires)] * num_trajectories)
+
+
+class TestApplyChannelTrajectories:
+    """Tests for applying a channel to a batch of trajectories."""
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.AmplitudeDamping(0.3, 1),
+            qml.DepolarizingChannel(0.2, 0),
+            qml.PhaseDamping(0.4, 1),
+            qml.ResetError(0.1, 0.2, 0),
+            qml.PauliError("XY", 0.3, (0, 1)),
+        ],
+    )
+    def test_states_are_normalized_kraus_branches(self, op):
+        """Test that every trajectory is one of the normalized Kraus branches of the channel."""
+        states = _random_states(50, 2)
+        res = apply_channel_trajectories(op, states, rng=42)
+
+        assert res.shape == states.shape
+        assert np.allclose(np.linalg.norm(res.reshape(50, -1), axis=1), 1)
+
+        branches = []
+        for k in op.kraus_matrices():
+            branch = qml.math.expand_matrix(k, op.wires, [0, 1]) @ states[0].reshape(-1)
+            if np.linalg.norm(branch) > 1e-12:
+                branches.append(branch / np.linalg.norm(branch))
+        for state in res.reshape(50, -1):
+            assert any(np.isclose(abs(np.vdot(b, state)), 1) for b in branches)
+
+    @pytest.mark.parametrize("op", [qml.AmplitudeDamping(0.3, 1), qml.BitFlip(0.2, 0)])
+    def test_average_is_channel(self, op):
+        """Test that the average over trajectories of the projectors on the states is the density
+        matrix after the channel."""
+        states = _random_states(20000, 2)
+        res = apply_channel_trajectories(op, states, rng=42).reshape(20000, -1)
+        rho = np.einsum("ti,tj->ij", res, res.conj()) / 20000
+
+        psi = states[0].reshape(-1)
+        expected = sum(
+            qml.math.expand_matrix(k, op.wires, [0, 1])
+            @ np.outer(psi, psi.conj())
+            @ qml.math.expand_matrix(k, op.wires, [0, 1]).conj().T
+            for k in op.kraus_matrices()
+        )
+        assert np.allclose(rho, expected, atol=0.02)
+
+    def test_identity_trajectories_unchanged(self):
+        """Test that trajectories that pick the identity of a unitary mixture are not modified."""
+        states = _random_states(100, 2)
+        res = apply_channel_trajectories(qml.PhaseFlip(0.1, 0), states, rng=42)
+        unchanged = np.all(np.isclose(res, states), axis=(1, 2))
+        flipped = np.all(
+            np.isclose(res, qml.math.stack([np.diag([1, -1]) @ s for s in states])), axis=(1, 2)
+        )
+        assert np.all(unchanged | flipped)
+        assert 0 < np.sum(flipped) < 30
+
+
+class TestSimulateTrajectories:
+    """Tests for simulate_trajectories."""
+
+    def test_results_match_density_matrix(self):
+        """Test that the averages over trajectories agree with the density matrix simulation
+        within a few standard errors."""
+        measurements = [
+            qml.expval(qml.X(0) @ qml.X(1)),
+            qml.probs(wires=[0, 1]),
+            qml.expval(qml.Y(0) + 0.5 * qml.Z(1)),
+        ]
+        qs = qml.tape.QuantumScript(NOISY_OPS, measurements)
+        expected = simulate_mixed(qs)
+        res, errors = simulate_trajectories(qs, num_trajectories=10000, rng=42)
+
+        for r, err, exp in zip(res, errors, expected):
+            assert qml.math.shape(err) == qml.math.shape(r)
+            assert np.all(np.abs(r - exp) < 5 * err + 1e-10)
+
+    def test_var_and_density_matrix(self):
+        """Test variances and reduced density matrices, which have no standard errors."""
+        qs = qml.tape.QuantumScript(NOISY_OPS, [qml.var(qml.Z(1)), qml.density_matrix(wires=[1])])
+        expected = simulate_mixed(qs)
+        res, errors = simulate_trajectories(qs, num_trajectories=10000, rng=42)
+
+        assert errors == (None, None)
+        assert np.allclose(res[0], expected[0], atol=0.02)
+        assert np.allclose(res[1], expected[1], atol=0.02)
+
+    def test_batches(self):
+        """Test that simulating the trajectories in batches gives one result per trajectory."""
+        qs = qml.tape.QuantumScript(NOISY_OPS, [qml.expval(qml.Z(1))])
+        res, error = simulate_trajectories(qs, num_trajectories=1000, batch_size=300, rng=42)
+        expected = simulate_mixed(qs)
+
+        assert abs(res - expected) < 5 * error
+
+    def test_single_trajectory(self):
+        """Test that the standard error of a single trajectory is None."""
+        qs = qml.tape.QuantumScript([qml.RX(0.4, 0)], [qml.expval(qml.Z(0))])
+        res, error = simulate_trajectories(qs, num_trajectories=1)
+
+        assert np.isclose(res, np.cos(0.4))
+        assert error is None
+
+    def test_no_channels_exact(self):
+        """Test that circuits without channels give the exact results with zero errors."""
+        qs = qml.tape.QuantumScript(
+            [qml.RX(0.4, 0), qml.CNOT((0, 1))], [qml.expval(qml.Z(1)), qml.probs(wires=[0, 1])]
+        )
+        res, errors = simulate_trajectories(qs, num_trajectories=10)
+        expected = qml.devices.qubit.simulate(qs)
+
+        assert np.allclose(res[0], expected[0])
+        assert np.allclose(res[1], expected[1])
+        assert np.allclose(errors[0], 0)
+
+    def test_invalid_num_trajectories(self):
+        """Test that an error is raised for a non-positive number of trajectories."""
+        qs = qml.tape.QuantumScript([qml.RX(0.4, 0)], [qml.expval(qml.Z(0))])
+        with pytest.raises(ValueError, match="num_trajectories must be a positive integer"):
+            simulate_trajectories(qs, num_trajectories=0)
+
+    def test_shots_not_supported(self):
+        """Test that an error is raised for finite shots."""
+        qs = qml.tape.QuantumScript([qml.RX(0.4, 0)], [qml.expval(qml.Z(0))], shots=10)
+        with pytest.raises(qml.DeviceError, match="only support analytic measurements"):
+            simulate_trajectories(qs, num_trajectories=10)
+
+    def test_state_not_supported(self):
+        """Test that an error is raised for measurements that cannot be averaged."""
+        qs = qml.tape.QuantumScript([qml.RX(0.4, 0)], [qml.state()])
+        with pytest.raises(qml.DeviceError, match="not supported with quantum trajectories"):
+            simulate_trajectories(qs, num_trajectories=10)
+
+
+class TestDefaultQubitTrajectories:
+    """Tests for simulating quantum trajectories with default.qubit."""
+
+    @staticmethod
+    def _circuit(x):
+        qml.RX(x, 0)
+        qml.CNOT((0, 1))
+        qml.AmplitudeDamping(0.3, 1)
+        qml.DepolarizingChannel(0.1, 0)
+        return qml.expval(qml.Z(1)), qml.probs(wires=0)
+
+    def test_device_option(self):
+        """Test that channels are simulated with trajectories and errors are tracked."""
+        dev = qml.device(
+            "default.qubit", num_trajectories=4000, trajectory_batch_size=1000, seed=42
+        )
+        expected = qml.QNode(self._circuit, qml.device("default.mixed"))(0.3)
+
+        with qml.Tracker(dev) as tracker:
+            res = qml.QNode(self._circuit, dev)(0.3)
+
+        errors = tracker.history["standard_errors"]
+        assert len(errors) == 1
+        assert abs(res[0] - expected[0]) < 5 * errors[0][0]
+        assert np.all(np.abs(res[1] - expected[1]) < 5 * errors[0][1])
+
+    def test_execution_config(self):
+        """Test that trajectories can be enabled through the execution config."""
+        qs = qml.tape.QuantumScript(NOISY_OPS, [qml.expval(qml.Z(1))])
+        config = qml.devices.ExecutionConfig(device_options={"num_trajectories": 2000})
+        dev = qml.device("default.qubit", seed=42)
+        program, config = dev.preprocess(config)
+        batch, _ = program([qs])
+
+        res = dev.execute(batch, config)
+        assert np.isclose(res[0], simulate_mixed(qs), atol=0.05)
+
+    def test_broadcasting_and_noise_model(self):
+        """Test that broadcasted circuits and noise models are supported."""
+        dev = qml.device("default.qubit", num_trajectories=2000, seed=42)
+        noise = qml.NoiseModel(
+            {qml.noise.op_eq(qml.RX): qml.noise.partial_wires(qml.PhaseDamping, 0.2)}
+        )
+
+        def circuit(x):
+            qml.Hadamard(0)
+            qml.RX(x, 0)
+            return qml.expval(qml.X(0))
+
+        x = np.array([0.2, 0.5])
+        res = qml.add_noise(qml.QNode(circuit, dev), noise)(x)
+        expected = qml.add_noise(qml.QNode(circuit, qml.device("default.mixed")), noise)(x)
+        assert qml.math.shape(res) == (2,)
+        assert np.allclose(res, expected, atol=0.05)
+
+    def test_channels_rejected_without_trajectories(self):
+        """Test that channels are still not supported without trajectories."""
+        with pytest.raises(qml.DeviceError, match="not supported"):
+            qml.QNode(self._circuit, qml.device("default.qubit"))(0.3)
+
+    def test_shots_not_supported(self):
+        """Test that finite shots are not supported with trajectories."""
+        dev = qml.device("default.qubit", num_trajectories=10, shots=10)
+        with pytest.raises(qml.DeviceError, match="Finite shots are not supported"):
+            qml.QNode(self._circuit, dev)(0.3)
+
+    @pytest.mark.parametrize("option", ["num_trajectories", "trajectory_batch_size"])
+    def test_invalid_options(self, option):
+        """Test that an error is raised for non-positive options."""
+        with pytest.raises(ValueError, match=f"{option} must be a positive integer"):
+            qml.device("default.qubit", **{option: 0})
+
+    @pytest.mark.autograd
+    def test_parameter_shift_gradient(self):
+        """Test that derivatives of the gate parameters are computed with the parameter-shift rule
+        and agree with default.mixed."""
+
+        def circuit(x, p):
+            qml.RX(x, 0)
+            qml.CNOT((0, 1))
+            qml.AmplitudeDamping(p, 1)
+            qml.RY(x, 1)
+            qml.DepolarizingChannel(0.1, 0)
+            qml.PhaseDamping(0.2, 1)
+            return qml.probs(wires=[0, 1])
+
+        dev = qml.device("default.qubit", num_trajectories=4000, seed=42)
+        qnode = qml.QNode(circuit, dev)
+        assert qml.workflow.get_best_diff_method(qnode)(0.4, 0.3) == "parameter-shift"
+
+        x = qml.numpy.array(0.4, requires_grad=True)
+        p = qml.numpy.array(0.3, requires_grad=False)
+        jac = qml.jacobian(qnode, argnum=0)(x, p)
+        expected = qml.jacobian(qml.QNode(circuit, qml.device("default.mixed")), argnum=0)(x, p)
+        assert np.allclose(jac, expected, atol=0.05)
+
+    @pytest.mark.autograd
+    def test_trainable_channel_parameters(self):
+        """Test that an error is raised for derivatives with respect to channel parameters."""
+        dev = qml.device("default.qubit", num_trajectories=10)
+
+        @qml.qnode(dev)
+        def circuit(p):
+            qml.Hadamard(0)
+            qml.AmplitudeDamping(p, 0)
+            return qml.expval(qml.Z(0))
+
+        with pytest.raises(qml.QuantumFunctionError, match="parameters of AmplitudeDamping"):
+            qml.grad(circuit)(qml.numpy.array(0.3, requires_grad=True))
+
+    @pytest.mark.parametrize("diff_method", ["backprop", "finite-diff"])
+    def test_unsupported_diff_methods(self, diff_method):
+        """Test that backprop and finite-diff derivatives are not supported with trajectories."""
+        dev = qml.device("default.qubit", num_trajectories=10)
+        assert not dev.supports_derivatives(qml.devices.ExecutionConfig(gradient_method="backprop"))
+
+        config = qml.devices.ExecutionConfig(gradient_method=diff_method)
+        with pytest.raises(qml.DeviceError, match="are not supported with quantum trajectories"):
+            dev.setup_execution_config(config)
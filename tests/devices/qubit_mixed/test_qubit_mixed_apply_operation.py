@@ -611,6 +611,41 @@ class TestApplyChannel:
         assert math.allclose(res, target_state, atol=tol, rtol=0)
 
 
+class TestChannelFastPaths:
+    """Tests that diagonal and Pauli channels, which are applied without their Kraus matrices,
+    give the same results as the general channel application."""
+
+    channels = [
+        qml.PhaseFlip(0.2, wires=1),
+        qml.PhaseDamping(0.3, wires=2),
+        qml.BitFlip(0.1, wires=0),
+        qml.DepolarizingChannel(0.3, wires=1),
+    ]
+
+    @staticmethod
+    def _random_state(batch_size):
+        """A random three-qubit density matrix in tensor form."""
+        rng = np.random.default_rng(42)
+        shape = (batch_size, 8, 8) if batch_size else (8, 8)
+        a = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+        rho = a @ np.conj(np.swapaxes(a, -1, -2))
+        rho /= np.trace(rho, axis1=-2, axis2=-1)[..., None, None]
+        return rho.reshape(((batch_size,) if batch_size else ()) + (2,) * 6)
+
+    @pytest.mark.parametrize("interface", ml_frameworks_list)
+    @pytest.mark.parametrize("batch_size", [None, 2])
+    @pytest.mark.parametrize("op", channels)
+    def test_fast_path(self, op, batch_size, interface):
+        """Test that the fast path matches applying the Kraus matrices."""
+        is_state_batched = batch_size is not None
+        state = math.asarray(self._random_state(batch_size), like=interface)
+        expected = apply_operation_einsum(op, state, is_state_batched=is_state_batched)
+        res = apply_operation(op, state, is_state_batched=is_state_batched)
+
+        assert math.get_interface(res) == interface
+        assert math.allclose(res, expected)
+
+
 @pytest.mark.parametrize("ml_framework", ml_frameworks_list)
 class TestBroadcasting:  # pylint: disable=too-few-public-methods
     """Tests that broadcasted operations are applied correctly."""
@@ -0,0 +1,190 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for superoperator fusion in devices/qubit_mixed."""
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.devices.qubit_mixed import (
+    SuperOperator,
+    apply_operation,
+    fuse_channels,
+    get_final_state,
+    simulate,
+)
+from pennylane.devices.qubit_mixed.apply_operation import _apply_operation_default
+from pennylane.devices.qubit_mixed.superoperator_fusion import superoperator
+
+
+def _noisy_ops(params, p=0.05):
+    """A brickwork circuit on four wires with a channel after every gate."""
+    ops = []
+    for layer in params:
+        for w, x in enumerate(layer[:4]):
+            ops.extend([qml.RX(x, w), qml.DepolarizingChannel(p, w)])
+        for w, x in enumerate(layer[4:]):
+            ops.extend([qml.RY(x, w), qml.AmplitudeDamping(p, w)])
+        ops.extend([qml.CNOT((0, 1)), qml.PhaseDamping(p, 1), qml.CZ((2, 3)), qml.BitFlip(p, 3)])
+        ops.append(qml.IsingXX(layer[0], (1, 2)))
+    return ops
+
+
+def _random_density_matrix(num_wires, batch_size=None, seed=42):
+    """A random density matrix in tensor form."""
+    rng = np.random.default_rng(seed)
+    dim = 2**num_wires
+    shape = (batch_size, dim, dim) if batch_size else (dim, dim)
+    a = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    rho = a @ np.conj(np.swapaxes(a, -1, -2))
+    rho /= np.trace(rho, axis1=-2, axis2=-1)[..., None, None]
+    return rho.reshape(((batch_size,) if batch_size else ()) + (2,) * (2 * num_wires))
+
+
+class TestSuperoperator:
+    """Tests for the superoperator matrix of gates and channels."""
+
+    def test_unitary(self):
+        """Test the superoperator of a gate is the Kronecker product of its matrix and conjugate."""
+        op = qml.RX(0.3, 1)
+        mat = op.matrix(wire_order=[0, 1])
+        assert np.allclose(superoperator(op, [0, 1]), np.kron(mat, mat.conj()))
+
+    @pytest.mark.parametrize("op", [qml.AmplitudeDamping(0.2, 0), qml.DepolarizingChannel(0.3, 1)])
+    def test_channel_action(self, op):
+        """Test that the superoperator acts on the row-major vectorized density matrix like the
+        channel."""
+        rho = _random_density_matrix(2).reshape(4, 4)
+        expected = sum(
+            k @ rho @ k.conj().T
+            for k in (qml.math.expand_matrix(k, op.wires, [0, 1]) for k in op.kraus_matrices())
+        )
+        res = (superoperator(op, [0, 1]) @ rho.reshape(-1)).reshape(4, 4)
+        assert np.allclose(res, expected)
+
+
+class TestFuseChannels:
+    """Tests for fuse_channels."""
+
+    def test_none_returns_operations(self):
+        """Test that no fusion is performed if max_wires is None."""
+        ops = [qml.RX(0.1, 0), qml.BitFlip(0.2, 0)]
+        assert fuse_channels(ops, max_wires=None) == ops
+
+    def test_unitary_blocks(self):
+        """Test that blocks without channels are fused into a QubitUnitary."""
+        ops = [qml.RX(0.1, 0), qml.CNOT((0, 1)), qml.RZ(0.3, 1)]
+        new_ops = fuse_channels(ops, max_wires=2)
+
+        assert len(new_ops) == 1
+        assert isinstance(new_ops[0], qml.QubitUnitary)
+        expected = qml.matrix(qml.tape.QuantumScript(ops), wire_order=[0, 1])
+        assert np.allclose(new_ops[0].matrix(wire_order=[0, 1]), expected)
+
+    def test_channel_blocks(self):
+        """Test that blocks with channels are fused into a SuperOperator."""
+        ops = [qml.RX(0.1, 0), qml.DepolarizingChannel(0.1, 0), qml.CNOT((0, 1)), qml.RZ(0.3, 2)]
+        new_ops = fuse_channels(ops, max_wires=2)
+
+        assert len(new_ops) == 2
+        assert isinstance(new_ops[0], SuperOperator)
+        assert new_ops[0].wires == qml.wires.Wires([0, 1])
+        assert new_ops[1] is ops[-1]
+
+    @pytest.mark.parametrize(
+        "barrier",
+        [
+            qml.measurements.MidMeasureMP(0, id="m0"),
+            qml.Snapshot(),
+            qml.RX(np.array([0.1, 0.2]), 1),
+        ],
+    )
+    def test_barriers_not_fused(self, barrier):
+        """Test that operations that cannot be fused are kept and split the blocks."""
+        ops = [qml.RX(0.1, 0), qml.BitFlip(0.2, 0), barrier, qml.RX(0.3, 0), qml.BitFlip(0.4, 0)]
+        new_ops = fuse_channels(ops, max_wires=2)
+
+        assert len(new_ops) == 3
+        assert new_ops[1] is barrier
+
+    def test_no_queuing(self):
+        """Test that fused operations are not queued."""
+        ops = [qml.RX(0.1, 0), qml.BitFlip(0.2, 0)]
+        with qml.queuing.AnnotatedQueue() as q:
+            fuse_channels(ops)
+        assert len(q) == 0
+
+    @pytest.mark.parametrize("batch_size", [None, 2])
+    def test_apply_superoperator(self, batch_size):
+        """Test that applying the fused operations gives the same state as the original ones."""
+        ops = [
+            qml.RX(0.3, 0),
+            qml.DepolarizingChannel(0.1, 0),
+            qml.CNOT((0, 1)),
+            qml.AmplitudeDamping(0.2, 1),
+            qml.RY(0.4, 2),
+            qml.CRX(0.2, (2, 0)),
+        ]
+        is_state_batched = batch_size is not None
+        expected = state = _random_density_matrix(3, batch_size)
+        for op in ops:
+            expected = _apply_operation_default(op, expected, is_state_batched, None)
+        for op in fuse_channels(ops, max_wires=2):
+            state = apply_operation(op, state, is_state_batched=is_state_batched)
+        assert np.allclose(state, expected)
+
+
+class TestSimulateWithFusion:
+    """Tests that simulating with superoperator fusion gives the same results as without."""
+
+    @pytest.mark.parametrize("max_fused_wires", [1, 2, 3])
+    def test_final_state(self, max_fused_wires):
+        """Test that the final state is unchanged by superoperator fusion."""
+        params = np.random.random((2, 8))
+        qs = qml.tape.QuantumScript(_noisy_ops(params), [qml.state()])
+
+        expected, _ = get_final_state(qs)
+        state, is_state_batched = get_final_state(qs, max_fused_wires=max_fused_wires)
+        assert not is_state_batched
+        assert np.allclose(state, expected)
+
+    @pytest.mark.autograd
+    def test_autograd_backprop(self):
+        """Test that derivatives can be computed through fused superoperators with autograd."""
+        params = qml.numpy.array(np.random.random((2, 8)), requires_grad=True)
+
+        def f(x, max_fused_wires):
+            qs = qml.tape.QuantumScript(_noisy_ops(x), [qml.expval(qml.Z(0) @ qml.Z(3))])
+            return simulate(qs, max_fused_wires=max_fused_wires)
+
+        assert qml.math.allclose(f(params, 2), f(params, None))
+        assert qml.math.allclose(qml.grad(f)(params, 2), qml.grad(f)(params, None))
+
+    def test_device_option(self):
+        """Test that superoperator fusion can be enabled on default.mixed."""
+        params = np.random.random((2, 8))
+        qs = qml.tape.QuantumScript(_noisy_ops(params), [qml.expval(qml.Z(0) @ qml.Z(3))])
+
+        expected = qml.device("default.mixed").execute([qs])
+        assert qml.math.allclose(
+            qml.device("default.mixed", max_fused_wires=2).execute([qs]), expected
+        )
+
+        config = qml.devices.ExecutionConfig(device_options={"max_fused_wires": 3})
+        assert qml.math.allclose(qml.device("default.mixed").execute([qs], config), expected)
+
+    def test_device_invalid_max_fused_wires(self):
+        """Test that an error is raised for a non-positive number of fused wires."""
+        with pytest.raises(ValueError, match="max_fused_wires must be a positive integer"):
+            qml.device("default.mixed", max_fused_wires=0)
@@ -22,7 +22,7 @@ import scipy as sp
 from dummy_debugger import Debugger
 
 import pennylane as qml
-from pennylane.devices.default_clifford import _pl_op_to_stim
+from pennylane.devices.default_clifford import _PauliSampler, _pl_op_to_stim
 
 stim = pytest.importorskip("stim")
 
@@ -313,6 +313,47 @@ def test_meas_probs_large(seed):
         assert qnode_clfrd(meas_b) == [0.0, 0.25][basis_state[0]]
 
 
+def test_meas_probs_many_qubits():
+    """Test that probabilities of a few wires of a circuit with many qubits are computed from the
+    stabilizer tableau."""
+    ops = [qml.Hadamard(0)] + [qml.CNOT([i, i + 1]) for i in range(99)] + [qml.Hadamard(50)]
+    qs = qml.tape.QuantumScript(ops, [qml.probs(wires=[0, 50, 99]), qml.probs(op=qml.X(50))])
+    probs, probs_x = qml.device("default.clifford").execute(qs)
+
+    assert qml.math.allclose(probs, [0.25, 0.0, 0.25, 0.0, 0.0, 0.25, 0.0, 0.25])
+    assert qml.math.allclose(probs_x, [0.5, 0.5])
+
+
+def test_probability_support():
+    """Test that the support of the probabilities of a circuit with many qubits is an affine
+    subspace of the computational basis states."""
+    ops = [qml.Hadamard(0)] + [qml.CNOT([i, i + 1]) for i in range(99)] + [qml.X(99), qml.Hadamard(100)]
+    qs = qml.tape.QuantumScript(ops, [qml.probs(wires=range(101))])
+    offset, generators, prob = qml.device("default.clifford").probability_support(qs)
+
+    assert prob == 0.25
+    assert generators.shape == (2, 101)
+    assert np.all(np.argmax(generators, axis=1) == [0, 100])
+
+    expected_generators = np.zeros((2, 101), dtype=int)
+    expected_generators[0, :100] = expected_generators[1, 100] = 1
+    expected_offset = np.zeros(101, dtype=int)
+    expected_offset[99] = 1
+    reduced = offset ^ expected_offset
+    for generator in generators:
+        if reduced[np.argmax(generator)]:
+            reduced ^= generator
+    assert not np.any(reduced)
+    assert np.all(generators == expected_generators)
+
+
+def test_probability_support_error():
+    """Test that an error is raised if the circuit does not have a single probs measurement."""
+    qs = qml.tape.QuantumScript([qml.Hadamard(0)], [qml.expval(qml.Z(0))])
+    with pytest.raises(ValueError, match="must have a single probs measurement"):
+        qml.device("default.clifford").probability_support(qs)
+
+
 @pytest.mark.parametrize("shots", [1024, 4096])
 @pytest.mark.parametrize(
     "ops",
@@ -341,6 +382,48 @@ def test_meas_counts(shots, ops, seed):
         assert qml.math.abs(counts_clfrd[k1] - counts_qubit[k2]) / shots < 0.1  # 10% threshold
 
 
+def test_pauli_sampler_groups():
+    """Test that the Pauli words of all observables are sampled in qubit-wise commuting groups
+    with a single compiled sampler each."""
+    stim_circuit = stim.Circuit("H 0\nCNOT 0 1\nH 2\nS 2")
+    pauli_sampler = _PauliSampler(stim_circuit, shots=1000, seed=42)
+
+    terms = [
+        pauli_sampler.add(obs)
+        for obs in [
+            qml.X(0) @ qml.X(1) + qml.Y(2) - qml.Z(0) @ qml.Z(1),
+            qml.Z(1) + 2.0 * qml.Y(2) @ qml.X(0),
+            qml.Projector([0, 0], [0, 1]),
+        ]
+    ]
+    assert len(pauli_sampler._bases) == 2
+
+    assert np.isclose(pauli_sampler.expval(terms[0]), 1.0)
+    assert np.isclose(pauli_sampler.expval(terms[1]), 0.0, atol=0.2)
+    assert np.isclose(pauli_sampler.expval(terms[2]), 0.5, atol=0.1)
+    assert len(pauli_sampler._samples) == 2
+
+
+def test_meas_shared_samples(seed):
+    """Test that many measurements of a circuit with finite shots agree with `default.qubit`."""
+    words = list(qml.pauli.pauli_group(2))
+    hamiltonian = qml.Hamiltonian(np.linspace(-1, 1, len(words)), words)
+
+    def circuit_fn():
+        circuit_1()
+        return (
+            qml.expval(hamiltonian),
+            qml.var(qml.PauliZ(0) + qml.PauliX(1)),
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1)),
+            qml.probs(wires=[0, 1]),
+        )
+
+    res = qml.QNode(circuit_fn, qml.device("default.clifford", shots=100000, seed=seed))()
+    expected = qml.QNode(circuit_fn, qml.device("default.qubit"))()
+    for r, e in zip(res, expected):
+        assert qml.math.allclose(r, e, atol=3e-2)
+
+
 @pytest.mark.parametrize("shots", [1024, 10240])
 @pytest.mark.parametrize(
     "ops",
@@ -1327,6 +1327,133 @@ class TestParamShiftUsingBroadcasting:
         assert np.allclose(grad, -np.sin(x))
 
 
+class TestParamShiftFullBroadcasting:
+    """Tests for the `param_shift` function packing the shifts of all parameters into
+    broadcasted tapes with ``broadcast="full"``."""
+
+    @staticmethod
+    def _tape(measurements, shots=None):
+        ops = [
+            qml.RX(0.1, 0),
+            qml.Rot(0.2, 0.3, 0.4, 1),
+            qml.CNOT([0, 1]),
+            qml.CRX(0.5, [1, 2]),
+            qml.IsingXX(0.6, [0, 2]),
+        ]
+        return qml.tape.QuantumScript(
+            ops, measurements, shots=shots, trainable_params=[0, 1, 2, 4, 5]
+        )
+
+    @staticmethod
+    def _allclose(res, expected, atol=1e-8):
+        res, expected = qml.pytrees.flatten(res)[0], qml.pytrees.flatten(expected)[0]
+        return len(res) == len(expected) and all(
+            qml.math.allclose(r, e, atol=atol) for r, e in zip(res, expected)
+        )
+
+    @pytest.mark.parametrize(
+        "measurements",
+        [
+            [qml.expval(qml.PauliZ(0))],
+            [qml.expval(qml.PauliZ(0) @ qml.PauliZ(2)), qml.probs(wires=[1, 2])],
+            [qml.var(qml.PauliX(1)), qml.expval(qml.PauliY(2))],
+        ],
+    )
+    @pytest.mark.parametrize("max_batch_size", [None, 1, 3, 7])
+    def test_matches_default(self, measurements, max_batch_size):
+        """Test that the gradients computed from fully broadcasted tapes are the same as the
+        gradients computed from the default tapes."""
+        dev = qml.device("default.qubit")
+        tape = self._tape(measurements)
+
+        tapes, fn = qml.gradients.param_shift(tape)
+        expected = fn(dev.execute(tapes))
+        tapes, fn = qml.gradients.param_shift(tape, broadcast="full", max_batch_size=max_batch_size)
+        res = fn(dev.execute(tapes))
+
+        assert self._allclose(res, expected)
+
+    @pytest.mark.parametrize(
+        "max_batch_size, batch_sizes",
+        [(None, [12]), (1, [None] * 12), (5, [5, 5, 2]), (11, [11, None])],
+    )
+    def test_batch_sizes(self, max_batch_size, batch_sizes):
+        """Test that the shifted evaluations are distributed over tapes of at most
+        ``max_batch_size`` evaluations, and that a single remaining evaluation is not
+        broadcasted."""
+        tape = self._tape([qml.expval(qml.PauliZ(0))])
+        tapes, _ = qml.gradients.param_shift(tape, broadcast="full", max_batch_size=max_batch_size)
+
+        assert [t.batch_size for t in tapes] == batch_sizes
+
+    def test_memory_budget(self, monkeypatch):
+        """Test that the default batch size is limited by the memory budget of a state vector."""
+        monkeypatch.setattr(qml.gradients.parameter_shift, "FULL_BROADCAST_MEMORY", 16 * 8 * 4)
+        tape = self._tape([qml.expval(qml.PauliZ(0))])
+        tapes, _ = qml.gradients.param_shift(tape, broadcast="full")
+
+        assert [t.batch_size for t in tapes] == [4, 4, 4]
+
+    def test_recycled_unshifted_tape(self):
+        """Test that the unshifted tape is executed once and not broadcasted with the shifts."""
+        tape = qml.tape.QuantumScript(
+            [qml.RX(0.543, wires=[0]), qml.RY(-0.654, wires=[0])], [qml.expval(qml.PauliZ(0))]
+        )
+        gradient_recipes = ([[-1e7, 1, 0], [1e7, 1, 1e-7]],) * 2
+        dev = qml.device("default.qubit")
+
+        tapes, fn = qml.gradients.param_shift(tape, gradient_recipes=gradient_recipes)
+        expected = fn(dev.execute(tapes))
+        tapes, fn = qml.gradients.param_shift(
+            tape, gradient_recipes=gradient_recipes, broadcast="full"
+        )
+
+        assert [t.batch_size for t in tapes] == [None, 2]
+        assert qml.math.allclose(fn(dev.execute(tapes)), expected)
+
+    def test_shot_vector(self):
+        """Test that fully broadcasted tapes support shot vectors."""
+        tape = self._tape([qml.expval(qml.PauliZ(0)), qml.probs(wires=[1])], shots=(1000, 1000))
+        tapes, fn = qml.gradients.param_shift(tape, broadcast="full", max_batch_size=5)
+        res = fn(qml.device("default.qubit", seed=42).execute(tapes))
+
+        analytic_tapes, analytic_fn = qml.gradients.param_shift(self._tape(tape.measurements))
+        expected = analytic_fn(qml.device("default.qubit").execute(analytic_tapes))
+
+        assert len(res) == 2
+        for r in res:
+            assert self._allclose(r, expected, atol=0.15)
+
+    def test_invalid_max_batch_size(self):
+        """Test that an error is raised for a non-positive maximum batch size."""
+        tape = self._tape([qml.expval(qml.PauliZ(0))])
+        with pytest.raises(ValueError, match="max_batch_size must be a positive integer"):
+            qml.gradients.param_shift(tape, broadcast="full", max_batch_size=0)
+
+    def test_qnode(self):
+        """Test that full broadcasting can be requested through the gradient keyword arguments of
+        a QNode."""
+        dev = qml.device("default.qubit")
+
+        def circuit(x):
+            qml.RX(x[0], 0)
+            qml.RY(x[1], 1)
+            qml.CNOT([0, 1])
+            qml.RZ(x[2], 1)
+            qml.RX(x[0], 1)
+            return qml.expval(qml.PauliZ(1))
+
+        x = np.array([0.1, 0.2, 0.3], requires_grad=True)
+        expected = qml.jacobian(qml.QNode(circuit, dev, diff_method="parameter-shift"))(x)
+        qnode = qml.QNode(
+            circuit,
+            dev,
+            diff_method="parameter-shift",
+            gradient_kwargs={"broadcast": "full", "max_batch_size": 4},
+        )
+        assert qml.math.allclose(qml.jacobian(qnode)(x), expected)
+
+
 # The first of the pylint disable is for cost1 through cost6
 # pylint: disable=no-self-argument, not-an-iterable
 # pylint: disable=too-many-public-methods
@@ -14,6 +14,7 @@
 """
 Unit tests for the :mod:`pennylane` kernels module.
 """
+
 # pylint: disable=import-outside-toplevel
 import math
 import sys
@@ -270,6 +271,157 @@ class TestKernelMatrix:
         assert qml.math.allclose(dK3, self.expected_dK3)
 
 
+class TestBatchedKernelMatrix:
+    """Tests kernel matrix computations with kernels evaluated on batches of pairs."""
+
+    X1 = TestKernelMatrix.X1
+    X2 = TestKernelMatrix.X2
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 5, 100])
+    @pytest.mark.parametrize("assume_normalized_kernel", [False, True])
+    def test_matches_pairwise(self, batch_size, assume_normalized_kernel):
+        """Test that the batched kernel matrices are the same as the pairwise ones and that the
+        kernel is called once per chunk of pairs."""
+        calls = []
+
+        def kernel(x1, x2):
+            calls.append(len(x1))
+            return _diffable_kernel(x1, x2)
+
+        K1 = kern.square_kernel_matrix(
+            self.X1, kernel, assume_normalized_kernel, batch_size=batch_size
+        )
+        num_pairs = 3 if assume_normalized_kernel else 6
+        assert len(calls) == math.ceil(num_pairs / batch_size)
+        assert max(calls) <= batch_size
+
+        calls.clear()
+        K2 = kern.kernel_matrix(self.X1, self.X2, kernel, batch_size=batch_size)
+        assert len(calls) == math.ceil(12 / batch_size)
+
+        expected_K1 = kern.square_kernel_matrix(self.X1, _diffable_kernel, assume_normalized_kernel)
+        assert np.allclose(K1, expected_K1)
+        assert np.allclose(K2, kern.kernel_matrix(self.X1, self.X2, _diffable_kernel))
+
+    def test_kernel_with_batch_dimension(self):
+        """Test that kernels returning several values per pair are supported."""
+
+        def kernel(x1, x2):
+            return np.stack([_diffable_kernel(x1, x2), 2 * _diffable_kernel(x1, x2)], axis=-1)
+
+        K1 = kern.square_kernel_matrix(self.X1, kernel, batch_size=4)
+        K2 = kern.kernel_matrix(self.X1, self.X2, kernel, batch_size=4)
+
+        assert K1.shape == (2, 3, 3)
+        assert K2.shape == (2, 3, 4)
+        assert np.allclose(K1[1], 2 * TestKernelMatrix.expected_K1)
+        assert np.allclose(K2[0], TestKernelMatrix.expected_K2)
+
+    def test_broadcasted_qnode(self):
+        """Test that a kernel based on a broadcasted QNode gives the same kernel matrix."""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x1, x2):
+            qml.AngleEmbedding(x1, wires=[0, 1])
+            qml.adjoint(qml.AngleEmbedding)(x2, wires=[0, 1])
+            return qml.probs(wires=[0, 1])
+
+        X = np.random.default_rng(42).random((4, 2))
+        K = kern.square_kernel_matrix(X, lambda x1, x2: circuit(x1, x2)[0], True)
+        K_batched = kern.square_kernel_matrix(
+            X, lambda x1, x2: circuit(x1, x2)[..., 0], True, batch_size=10
+        )
+        assert np.allclose(K, K_batched)
+
+    @pytest.mark.autograd
+    def test_autograd(self):
+        """Test differentiability of the batched kernel matrix methods with Autograd."""
+        X1 = pnp.array(self.X1, requires_grad=True)
+        X2 = pnp.array(self.X2, requires_grad=True)
+
+        dK1 = qml.jacobian(kern.square_kernel_matrix, argnum=0)(X1, _diffable_kernel, False, 4)
+        assert qml.math.allclose(dK1, TestKernelMatrix.expected_dK1)
+        dK2 = qml.jacobian(kern.kernel_matrix, argnum=(0, 1))(X1, X2, _diffable_kernel, 5)
+        assert qml.math.allclose(dK2[0], TestKernelMatrix.expected_dK2[0])
+        assert qml.math.allclose(dK2[1], TestKernelMatrix.expected_dK2[1])
+        dK3 = qml.jacobian(kern.square_kernel_matrix, argnum=0)(X1, _diffable_kernel, True, 2)
+        assert qml.math.allclose(dK3, TestKernelMatrix.expected_dK3)
+
+    @pytest.mark.torch
+    def test_torch(self):
+        """Test differentiability of the batched kernel matrix methods with PyTorch."""
+        import torch
+
+        X1 = torch.tensor(self.X1, requires_grad=True)
+        jac = torch.autograd.functional.jacobian
+        dK1 = jac(
+            partial(kern.square_kernel_matrix, kernel=_diffable_kernel, batch_size=4),
+            X1,
+        )
+        assert qml.math.allclose(dK1, TestKernelMatrix.expected_dK1)
+
+
+class TestStateKernelMatrix:
+    """Tests kernel matrices computed from embedded states."""
+
+    @staticmethod
+    def _circuits(device_name):
+        dev = qml.device(device_name, wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x1, x2):
+            qml.AngleEmbedding(x1, wires=[0, 1])
+            qml.adjoint(qml.AngleEmbedding)(x2, wires=[0, 1])
+            return qml.probs(wires=[0, 1])
+
+        @qml.qnode(dev)
+        def embedding(x):
+            qml.AngleEmbedding(x, wires=[0, 1])
+            return qml.state()
+
+        return (lambda x1, x2: circuit(x1, x2)[0]), embedding
+
+    @pytest.mark.parametrize("device_name", ["default.qubit", "default.mixed"])
+    @pytest.mark.parametrize("batch_size", [None, 3])
+    def test_matches_overlap_kernel(self, device_name, batch_size):
+        """Test that the fidelity kernel matrix of the embedded states is the same as the
+        kernel matrix of the corresponding overlap circuit."""
+        kernel, embedding = self._circuits(device_name)
+        rng = np.random.default_rng(42)
+        X1, X2 = rng.random((4, 2)), rng.random((3, 2))
+
+        K1 = kern.state_kernel_matrix(X1, None, embedding, batch_size=batch_size)
+        K2 = kern.state_kernel_matrix(X1, X2, embedding, batch_size=batch_size)
+
+        assert np.allclose(K1, kern.square_kernel_matrix(X1, kernel))
+        assert np.allclose(K2, kern.kernel_matrix(X1, X2, kernel))
+
+    def test_one_execution_per_datapoint(self):
+        """Test that the embedding is evaluated once per datapoint."""
+        calls = []
+
+        def state_fn(x):
+            calls.append(x)
+            return np.array([np.cos(x), np.sin(x)])
+
+        X = [0.1, 0.4, 0.2]
+        K = kern.state_kernel_matrix(X, None, state_fn)
+
+        assert calls == X
+        assert np.allclose(K, np.cos(np.subtract.outer(X, X)) ** 2)
+
+    @pytest.mark.autograd
+    def test_autograd(self):
+        """Test differentiability of the state kernel matrix with Autograd."""
+        kernel, embedding = self._circuits("default.qubit")
+        X = pnp.array(np.random.default_rng(42).random((3, 2)), requires_grad=True)
+
+        grad = qml.grad(lambda X: pnp.sum(kern.state_kernel_matrix(X, None, embedding)))(X)
+        expected = qml.grad(lambda X: pnp.sum(kern.square_kernel_matrix(X, kernel)))(X)
+        assert np.allclose(grad, expected)
+
+
 class TestKernelPolarity:
     """Tests kernel methods to compute polarity."""
 
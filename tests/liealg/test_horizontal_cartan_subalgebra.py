@@ -16,6 +16,7 @@ import numpy as np
 
 # pylint: disable=no-self-use,too-few-public-methods,missing-class-docstring, too-many-positional-arguments, too-many-arguments
 import pytest
+from scipy import sparse as sp
 from scipy.linalg import sqrtm
 
 import pennylane as qml
@@ -36,7 +37,7 @@ class TestCartanSubalgebra:
     """Tests for qml.liealg.horizontal_cartan_subalgebra"""
 
     @pytest.mark.parametrize("n, len_g, len_h, len_mtilde", [(2, 6, 2, 2), (3, 15, 2, 6)])
-    @pytest.mark.parametrize("provide_adj", [True, False])
+    @pytest.mark.parametrize("provide_adj", [True, "sparse", False])
     def test_horizontal_cartan_subalgebra_Ising(self, n, len_g, len_h, len_mtilde, provide_adj):
         """Test Cartan subalgebra of 2 qubit Ising model"""
         gens = [X(w) @ X(w + 1) for w in range(n - 1)] + [Z(w) for w in range(n)]
@@ -49,7 +50,9 @@ class TestCartanSubalgebra:
         g = k + m
         assert len(g) == len_g
 
-        if provide_adj:
+        if provide_adj == "sparse":
+            adj = qml.structure_constants(g, sparse=True)
+        elif provide_adj:
             adj = qml.structure_constants(g)
         else:
             adj = None
@@ -122,6 +125,17 @@ class TestChangeBasisAdRep:
         new_adj = change_basis_ad_rep(adj, basis_change)
         assert np.allclose(new_adj, permuted_adj)
 
+    def test_sparse_adjoint_rep(self):
+        """Test that a sparse adjoint representation leads to the same result as a dense one."""
+        ops = [qml.X(0), qml.Y(1), qml.Y(0) @ qml.Z(1), qml.X(1)]
+        dla = qml.lie_closure(ops)
+        adj = qml.structure_constants(dla)
+        sparse_adj = qml.structure_constants(dla, sparse=True)
+        basis_change = np.random.random((len(dla), len(dla)))
+
+        new_adj = change_basis_ad_rep(sparse_adj, basis_change)
+        assert np.allclose(new_adj, change_basis_ad_rep(adj, basis_change))
+
     def test_tiny_skewed_basis(self):
         """Test that changing from a tiny orthonormal basis to a skewed basis works."""
         dla = [qml.X(0), qml.Y(0), qml.Z(0)]
@@ -298,6 +312,12 @@ class TestAdjvecToOp:
             assert qml.math.shape(out) == qml.math.shape(expected)
             assert np.allclose(out, expected)
 
+    @pytest.mark.parametrize("adj_vecs, basis, expected, is_ortho", dense_test_cases)
+    def test_with_sparse_adj_vecs(self, adj_vecs, basis, expected, is_ortho):
+        """Test ``adjvec_to_op`` with sparse adjoint vectors."""
+        out = adjvec_to_op(sp.csr_array(np.atleast_2d(adj_vecs)), basis, is_orthogonal=is_ortho)
+        assert np.allclose(out, expected)
+
 
 class TestOpToAdjvec:
     """Test op_to_adjvec. We reuse the test cases from adjvec_to_op and simply re-interpret which
@@ -75,6 +75,19 @@ class TestLieClosure:
         captured = capsys.readouterr()
         assert captured.out == ""
 
+    @pytest.mark.parametrize("matrix", [False, True])
+    def test_callback(self, matrix):
+        """Test that the callback receives the progress metrics after every epoch"""
+        gen11 = dla11[:-1]
+        metrics = []
+        _ = lie_closure(gen11, callback=metrics.append, matrix=matrix)
+
+        assert [m["epoch"] for m in metrics] == [1, 2]
+        assert [m["dim"] for m in metrics] == [4, 4]
+        assert [m["num_new"] for m in metrics] == [1, 0]
+        assert [m["num_commutators"] for m in metrics] == [9, 3]
+        assert metrics[0]["time"] <= metrics[1]["time"]
+
     def test_pauli_true_wrong_inputs(self):
         """Test that an error with a meaningful error message is raised when inputting the wrong types while using pauli=True"""
         gens = [X(0), X(1), Y(0) @ Y(1)]
@@ -14,6 +14,7 @@
 """Tests for pennylane/pauli/dla/structure_constants.py functionality"""
 import numpy as np
 import pytest
+from scipy import sparse as sp
 
 import pennylane as qml
 from pennylane import structure_constants
@@ -134,6 +135,51 @@ class TestAdjointRepr:
 
         assert np.allclose(adj, adj_m)
 
+    @pytest.mark.parametrize("dla", [Ising3, XXZ3])
+    @pytest.mark.parametrize("change_norms", [False, True])
+    def test_sparse_structure_constants(self, dla, change_norms):
+        """Test that the sparse structure constants match the dense ones"""
+        d = len(dla)
+        if change_norms:
+            coeffs = np.linspace(0.5, 1.5, d)
+            dla = [c * op for c, op in zip(coeffs, dla)]
+        ad_rep = structure_constants(dla, pauli=True)
+        sparse_ad_rep = structure_constants(dla, pauli=True, sparse=True)
+
+        assert sp.issparse(sparse_ad_rep)
+        assert sparse_ad_rep.shape == (d * d, d)
+        assert np.allclose(sparse_ad_rep.toarray().reshape(d, d, d), ad_rep)
+
+    def test_pauli_word_basis_with_coefficients(self):
+        """Test the structure constants of a basis of Pauli words with coefficients"""
+        dla = [2.0 * PauliSentence({pw: 1.0}) for ps in Ising3 for pw in ps]
+        dla[1] = 3.0 * dla[1]
+        dla[2] = -0.5 * dla[2]
+        d = len(dla)
+        ad_rep = structure_constants(dla, pauli=True)
+
+        for alpha in range(d):
+            for beta in range(d):
+                comm_res = 1j * dla[alpha].commutator(dla[beta])
+                res = sum(ad_rep[gamma, alpha, beta] * dla[gamma] for gamma in range(d))
+                res.simplify()
+                comm_res.simplify()
+                assert set(comm_res) == set(res)
+                assert all(np.isclose(comm_res[k], res[k]) for k in res)
+
+    def test_pauli_words_with_pauli_true(self):
+        """Test that Pauli words are accepted as they are with pauli=True"""
+        dla = [pw for ps in Ising3 for pw in ps]
+        ad_rep = structure_constants(dla, pauli=True)
+        ad_rep_ops = structure_constants([pw.operation() for pw in dla])
+        assert np.allclose(ad_rep, ad_rep_ops)
+
+    @pytest.mark.parametrize("kwargs", [{"matrix": True}, {"is_orthogonal": False}])
+    def test_sparse_raises_error(self, kwargs):
+        """Test that an error is raised for sparse outputs that are not supported"""
+        with pytest.raises(ValueError, match="sparse"):
+            structure_constants(Ising3, sparse=True, **kwargs)
+
     def test_raise_error_for_non_paulis(self):
         """Test that an error is raised when passing operators that do not have a pauli_rep"""
         generators = [qml.Hadamard(0), qml.X(0)]
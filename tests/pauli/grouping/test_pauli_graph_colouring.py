@@ -17,7 +17,14 @@ Unit tests for heuristic Pauli graph colouring functions in ``/pauli/grouping/gr
 import numpy as np
 import pytest
 
-from pennylane.pauli.grouping.graph_colouring import largest_first, recursive_largest_first
+from pennylane.pauli.grouping import graph_colouring
+from pennylane.pauli.grouping.graph_colouring import (
+    dsatur,
+    largest_first,
+    recursive_largest_first,
+    sorted_insertion,
+)
+from pennylane.pauli.grouping.group_observables import _adj_matrix_from_symplectic
 
 
 class TestGraphcolouringFunctions:
@@ -90,3 +97,88 @@ class TestGraphcolouringFunctions:
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+
+
+class TestPackedGraphColouring:
+    """Tests for the graph colouring functions working on packed Pauli words."""
+
+    @staticmethod
+    def verify_colouring(binary_observables, grouping_type, colouring):
+        """Verifies that every Pauli word is coloured once and that Pauli words of the same
+        colour satisfy the binary relation."""
+        adj = _adj_matrix_from_symplectic(binary_observables, grouping_type)
+        coloured = [term.tolist() for terms in colouring.values() for term in terms]
+        assert sorted(coloured) == sorted(binary_observables.tolist())
+
+        index = {tuple(term): i for i, term in enumerate(binary_observables.tolist())}
+        for terms in colouring.values():
+            indices = [index[tuple(term.tolist())] for term in terms]
+            assert not adj[np.ix_(indices, indices)][~np.eye(len(indices), dtype=bool)].any()
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("n_qubits", [1, 4, 70])
+    def test_valid_colouring(self, grouping_type, n_qubits):
+        """Test that DSATUR and sorted insertion give valid colourings of random Pauli words."""
+        rng = np.random.default_rng(n_qubits)
+        binary_observables = np.unique(rng.integers(0, 2, (40, 2 * n_qubits)), axis=0)
+
+        self.verify_colouring(
+            binary_observables, grouping_type, dsatur(binary_observables, grouping_type)
+        )
+        self.verify_colouring(
+            binary_observables, grouping_type, sorted_insertion(binary_observables, grouping_type)
+        )
+        order = rng.permutation(len(binary_observables))
+        self.verify_colouring(
+            binary_observables,
+            grouping_type,
+            sorted_insertion(binary_observables, grouping_type, order=order),
+        )
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("colouring_fn", [largest_first, recursive_largest_first])
+    def test_largest_first_without_adjacency_matrix(self, grouping_type, colouring_fn, monkeypatch):
+        """Test that the Largest First heuristics give the same colouring from the packed Pauli
+        words as from the adjacency matrix."""
+        monkeypatch.setattr(graph_colouring, "_BLOCK_WORDS", 16)
+        rng = np.random.default_rng(5)
+        binary_observables = np.unique(rng.integers(0, 2, (40, 8)), axis=0)
+        adj = _adj_matrix_from_symplectic(binary_observables, grouping_type)
+        np.fill_diagonal(adj, False)
+
+        colouring = colouring_fn(binary_observables, grouping_type=grouping_type)
+        self.verify_colouring(binary_observables, grouping_type, colouring)
+        expected = colouring_fn(binary_observables, adj)
+        assert [[t.tolist() for t in terms] for terms in colouring.values()] == [
+            [t.tolist() for t in terms] for terms in expected.values()
+        ]
+
+    def test_sorted_insertion_order(self):
+        """Test that the Pauli words are inserted in the given order."""
+        binary_observables = np.array([[1, 1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [1, 0, 1, 0]])
+
+        colouring = sorted_insertion(binary_observables, "qwc")
+        assert [[t.tolist() for t in terms] for terms in colouring.values()] == [
+            [[1, 1, 0, 0], [1, 0, 0, 0]],
+            [[0, 0, 1, 0]],
+            [[1, 0, 1, 0]],
+        ]
+
+        colouring = sorted_insertion(binary_observables, "qwc", order=[3, 2, 1, 0])
+        assert colouring[1][0].tolist() == [1, 0, 1, 0]
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_degrees_in_blocks(self, grouping_type, monkeypatch):
+        """Test that the degrees computed in small blocks match the adjacency matrix."""
+        monkeypatch.setattr(graph_colouring, "_BLOCK_WORDS", 16)
+        binary_observables = np.random.default_rng(3).integers(0, 2, (25, 6))
+        adj = _adj_matrix_from_symplectic(binary_observables, grouping_type)
+        np.fill_diagonal(adj, False)
+
+        degrees = graph_colouring._degrees(binary_observables, grouping_type)
+        assert np.array_equal(degrees, adj.sum(axis=1))
+
+    def test_no_pauli_words(self):
+        """Test that an empty set of Pauli words has no colours."""
+        assert not dsatur(np.zeros((0, 4)), "qwc")
+        assert not sorted_insertion(np.zeros((0, 4)), "commuting")
@@ -34,7 +34,7 @@ from pennylane.pauli.grouping.group_observables import (
 class TestOldRX:
     """Test PauliGroupingStrategy behaves correctly when versions of rx older than 0.15 are used"""
 
-    @pytest.mark.parametrize("new_colourer", ["dsatur", "gis"])
+    @pytest.mark.parametrize("new_colourer", ["gis"])
     def test_new_strategies_with_old_rx_raise_error(self, monkeypatch, new_colourer):
         """Test that an error is raised if a new strategy is used with old rx"""
         # Monkey patch the new_rx variable to False
@@ -112,6 +112,46 @@ class TestPauliGroupingStrategy:
         grouping_instance = PauliGroupingStrategy(observables, "anticommuting")
         assert (grouping_instance.adj_matrix == anticommuting_complement_adjacency_matrix).all()
 
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_complement_graph_edges(self, grouping_type, monkeypatch):
+        """Test that the edges of the complement graph computed block by block match the
+        adjacency matrix."""
+        monkeypatch.setattr(qml.pauli.grouping.graph_colouring, "_BLOCK_WORDS", 40)
+        rng = np.random.default_rng(1)
+        paulis = [PauliX, PauliY, PauliZ]
+        observables = [
+            qml.prod(*(paulis[p](w) for w, p in enumerate(rng.integers(0, 3, 4))))
+            for _ in range(15)
+        ]
+
+        grouping_instance = PauliGroupingStrategy(observables, grouping_type)
+        adj = grouping_instance.adj_matrix
+        edges = set(grouping_instance.complement_graph.edge_list())
+
+        assert adj.dtype == bool
+        assert edges == set(zip(*np.nonzero(np.triu(adj, k=1))))
+
+    @pytest.mark.parametrize("graph_colourer", ["lf", "rlf", "dsatur", "gis", "si"])
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_partition_observables_valid(self, grouping_type, graph_colourer, monkeypatch):
+        """Test that every colouring strategy partitions the observables into groups that
+        satisfy the binary relation."""
+        monkeypatch.setattr(qml.pauli.grouping.graph_colouring, "_BLOCK_WORDS", 40)
+        rng = np.random.default_rng(2)
+        paulis = [Identity, PauliX, PauliY, PauliZ]
+        words = {tuple(rng.integers(0, 4, 4)) for _ in range(30)} - {(0, 0, 0, 0)}
+        observables = [qml.prod(*(paulis[p](w) for w, p in enumerate(word))) for word in words]
+
+        grouping_instance = PauliGroupingStrategy(observables, grouping_type, graph_colourer)
+        partitions = grouping_instance.partition_observables()
+
+        assert sorted(map(str, sum(partitions, []))) == sorted(map(str, observables))
+        adj = grouping_instance.adj_matrix
+        index = {str(obs): i for i, obs in enumerate(observables)}
+        for partition in partitions:
+            indices = [index[str(obs)] for obs in partition]
+            assert not adj[np.ix_(indices, indices)][~np.eye(len(indices), dtype=bool)].any()
+
     trivial_ops = [
         [Identity(0), Identity(0), Identity(7)],
         [Identity("a") @ Identity(1), Identity("b"), Identity("b") @ Identity("c")],
@@ -497,6 +537,20 @@ class TestGroupObservables:
         assert groups == [[qml.X(0), 2 * qml.I(), qml.I() @ qml.I()], [qml.Z(0)]]
         assert out_coeffs == [[1, 3, 4], [2]]
 
+    def test_sorted_insertion_by_coefficients(self):
+        """Test that sorted insertion inserts the observables by decreasing magnitude of their
+        coefficients, and observables on no wires are skipped."""
+        observables = [qml.Z(0) @ qml.Z(1), qml.Y(0), qml.I(), qml.Z(0), qml.Y(1)]
+        coeffs = [0.1, 0.2, 5.0, -0.3, 1.0]
+
+        assert group_observables(observables, method="si") == [
+            [qml.Z(0) @ qml.Z(1), qml.Z(0), qml.I()],
+            [qml.Y(0), qml.Y(1)],
+        ]
+        groups, out_coeffs = group_observables(observables, coeffs, method="si")
+        assert groups == [[qml.Z(0) @ qml.Z(1), qml.I()], [qml.Y(0)], [qml.Z(0), qml.Y(1)]]
+        assert out_coeffs == [[0.1, 5.0], [0.2], [-0.3, 1.0]]
+
 
 class TestComputePartitionIndices:
     """Tests for ``compute_partition_indices``"""
@@ -578,7 +632,7 @@ class TestComputePartitionIndices:
                 for exp_partition in anticom_partitions_sol
             )
 
-    @pytest.mark.parametrize("method", ("rlf", "lf", "dsatur", "gis"))
+    @pytest.mark.parametrize("method", ("rlf", "lf", "dsatur", "gis", "si"))
     def test_colouring_methods(self, method):
         """Test that all colouring methods return the correct results."""
         observables = [qml.X(0) @ qml.Z(1), qml.Z(0), qml.X(1)]
@@ -0,0 +1,162 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the cache of the matrices of Pauli sentences."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+import pennylane as qml
+from pennylane.devices.qubit.measure import full_dot_products
+from pennylane.devices.qubit_mixed.measure import csr_dot_products_density_matrix
+from pennylane.pauli import MatrixCache, PauliSentence, PauliWord, get_matrix_cache
+
+H = PauliSentence(
+    {PauliWord({0: "X", 1: "X"}): 0.5, PauliWord({1: "Z"}): -1.2, PauliWord({0: "Y"}): 0.3}
+)
+
+
+@pytest.fixture(name="cache")
+def fixture_cache():
+    """Use a fresh matrix cache and restore the previous one afterwards."""
+    old_cache = get_matrix_cache()
+    cache = MatrixCache()
+    qml.pauli.set_matrix_cache(cache)
+    yield cache
+    qml.pauli.set_matrix_cache(old_cache)
+
+
+class TestMatrixCache:
+    """Tests for the MatrixCache class."""
+
+    @pytest.mark.parametrize("format", ["dense", "csr", "coo"])
+    def test_to_mat_is_cached(self, cache, format):
+        """Test that the matrix of a Pauli sentence is computed once and a copy is returned."""
+        expected = H.to_mat(wire_order=[0, 1, 2], format=format)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        mat = H.to_mat(wire_order=[0, 1, 2], format=format)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert mat is not expected
+        mat = mat.toarray() if sparse.issparse(mat) else mat
+        expected = expected.toarray() if sparse.issparse(expected) else expected
+        assert np.allclose(mat, expected)
+
+        # modifying the returned matrix does not modify the cached one
+        mat[0, 0] = 10.0
+        new_mat = H.to_mat(wire_order=[0, 1, 2], format=format)
+        new_mat = new_mat.toarray() if sparse.issparse(new_mat) else new_mat
+        assert np.allclose(new_mat, expected)
+
+    def test_key_includes_coefficients_wires_and_format(self, cache):
+        """Test that different coefficients, wire orders or formats are cached separately."""
+        H.to_mat(wire_order=[0, 1])
+        H.to_mat(wire_order=[1, 0])
+        H.to_mat(wire_order=[0, 1], format="csr")
+        (2 * H).to_mat(wire_order=[0, 1])
+        assert (cache.hits, cache.misses) == (0, 4)
+        assert len(cache) == 4
+
+        mat = H.to_mat(wire_order=[1, 0])
+        assert cache.hits == 1
+        assert np.allclose(mat, qml.matrix(H.operation(), [1, 0]))
+
+    def test_trainable_coefficients_are_not_cached(self, cache):
+        """Test that sentences with trainable coefficients are not cached."""
+        ps = PauliSentence({PauliWord({0: "X"}): qml.numpy.array(0.5, requires_grad=True)})
+        ps.to_mat()
+        ps.to_mat()
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_memory_limit(self):
+        """Test that the least recently used matrices are evicted when the cache is full, and that
+        matrices larger than the whole cache are not cached."""
+        ps = PauliSentence({PauliWord({0: "X"}): 1.0})
+        size = ps.to_mat(wire_order=[0, 1]).nbytes
+        cache = MatrixCache(max_bytes=2 * size)
+        old_cache = get_matrix_cache()
+        qml.pauli.set_matrix_cache(cache)
+        try:
+            for c in [1.0, 2.0, 3.0]:
+                (c * ps).to_mat(wire_order=[0, 1])
+            assert len(cache) == 2
+            assert cache.evictions == 1
+            assert cache.currsize == 2 * size
+
+            ps.to_mat(wire_order=[0, 1, 2])
+            assert len(cache) == 2
+        finally:
+            qml.pauli.set_matrix_cache(old_cache)
+
+        assert repr(cache) == (
+            f"MatrixCache(currsize={2 * size}, max_bytes={2 * size}, hits=0, misses=4, "
+            "evictions=1)"
+        )
+
+    def test_disable_cache(self):
+        """Test that caching is disabled by setting the cache to ``None``."""
+        old_cache = get_matrix_cache()
+        qml.pauli.set_matrix_cache(None)
+        try:
+            assert get_matrix_cache() is None
+            assert np.allclose(H.to_mat(wire_order=[0, 1]), qml.matrix(H.operation(), [0, 1]))
+        finally:
+            qml.pauli.set_matrix_cache(old_cache)
+
+    def test_threads(self):
+        """Test that the cache stays consistent when it is used from several threads."""
+        cache = MatrixCache(max_bytes=4 * 16 * 16)
+        matrices = [np.full((4, 4), i, dtype=complex) for i in range(8)]
+
+        def use_cache(i):
+            for j in range(1000):
+                k = (i + j) % len(matrices)
+                assert np.array_equal(cache.get_matrix(k, lambda k=k: matrices[k]), matrices[k])
+
+        # switch threads often to make races likely
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(use_cache, range(8)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert cache.hits + cache.misses == 8 * 1000
+        assert len(cache) == 4
+        assert cache.currsize == sum(m.nbytes for m in cache.values())
+        # a matrix computed by several threads at once is only cached once
+        assert cache.evictions <= cache.misses - len(cache)
+
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_devices_use_cache(self, cache, is_state_batched):
+        """Test that the expectation values of Pauli sentences computed with sparse matrices by
+        default.mixed use the cache."""
+        obs = H.operation()
+        rng = np.random.default_rng(42)
+        shape = (3, 2, 2) if is_state_batched else (2, 2)
+        state = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+        state /= np.linalg.norm(state)
+
+        mp = qml.expval(obs)
+        expected = full_dot_products(mp, state, is_state_batched)
+        hits, misses = cache.hits, cache.misses
+
+        rho = np.einsum("...ij,...kl->...ijkl", state, state.conj())
+        res = csr_dot_products_density_matrix(mp, rho, is_state_batched)
+        res = csr_dot_products_density_matrix(mp, rho, is_state_batched)
+        assert (cache.hits - hits, cache.misses - misses) == (1, 1)
+        assert np.allclose(res, expected)
@@ -0,0 +1,177 @@
+# Copyright 2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the packed symplectic representation of Pauli sentences."""
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.pauli import PackedPauliSentence, PauliSentence, PauliWord
+
+pw1 = PauliWord({0: "X", 1: "Y"})
+pw2 = PauliWord({1: "Z", "a": "X"})
+pw3 = PauliWord({0: "Y", 2: "Z"})
+pw4 = PauliWord({})
+
+ps1 = PauliSentence({pw1: 1.5, pw2: -0.5j, pw4: 2.0})
+ps2 = PauliSentence({pw3: 0.25, pw2: 1.0, pw1: 1j})
+ps3 = PauliSentence({PauliWord({0: "Z"}): 1.0, PauliWord({1: "X", 0: "X"}): -2.0})
+
+sentences = [ps1, ps2, ps3, PauliSentence({pw4: 3.0}), PauliSentence({})]
+
+
+def random_sentence(rng, n_terms, wires):
+    """Random Pauli sentence with complex coefficients."""
+    words = [
+        PauliWord({w: rng.choice(["I", "X", "Y", "Z"]) for w in wires}) for _ in range(n_terms)
+    ]
+    return PauliSentence({pw: rng.normal() + 1j * rng.normal() for pw in words})
+
+
+def assert_equal_sentences(ps, expected):
+    """Check that two Pauli sentences have the same non-zero terms."""
+    ps, expected = PauliSentence(ps), PauliSentence(expected)
+    ps.simplify()
+    expected.simplify()
+    assert set(ps) == set(expected)
+    for pw, coeff in ps.items():
+        assert np.isclose(coeff, expected[pw])
+
+
+class TestConversion:
+    """Tests for the conversion between the packed and dictionary representations."""
+
+    @pytest.mark.parametrize("ps", sentences)
+    def test_round_trip(self, ps):
+        """Test that converting to the packed representation and back is lossless."""
+        packed = PackedPauliSentence.from_pauli_sentence(ps)
+        assert len(packed) == len(ps)
+        assert packed.wires == ps.wires
+        assert packed.to_pauli_sentence() == ps
+
+    def test_pauli_word(self):
+        """Test that a Pauli word is converted to a sentence with coefficient one."""
+        packed = PackedPauliSentence.from_pauli_sentence(pw1)
+        assert packed.to_pauli_sentence() == PauliSentence({pw1: 1.0})
+
+    def test_symplectic_bits(self):
+        """Test the packed bits of a word with all Pauli operators."""
+        packed = PackedPauliSentence.from_pauli_sentence(
+            PauliWord({0: "X", 1: "Y", 2: "Z"}), wire_order=[0, 1, 2, 3]
+        )
+        assert packed.x.dtype == np.uint64
+        assert packed.x.tolist() == [[0b0011]]
+        assert packed.z.tolist() == [[0b0110]]
+
+    def test_many_wires(self):
+        """Test that more than 64 wires are stored in several words."""
+        ps = random_sentence(np.random.default_rng(12), 20, range(130))
+        packed = PackedPauliSentence.from_pauli_sentence(ps)
+        assert packed.x.shape == (20, 3)
+        assert packed.to_pauli_sentence() == ps
+
+    def test_wire_order_error(self):
+        """Test that an error is raised if the wire order misses wires of the sentence."""
+        with pytest.raises(ValueError, match="does not contain all the wires"):
+            PackedPauliSentence.from_pauli_sentence(ps1, wire_order=[0, 1])
+
+    def test_map_to_wires(self):
+        """Test that laying out a sentence along more wires keeps its terms."""
+        packed = PackedPauliSentence.from_pauli_sentence(ps1).map_to_wires([5, "a", 1, 0])
+        assert packed.wires.tolist() == [5, "a", 1, 0]
+        assert packed.to_pauli_sentence() == ps1
+
+
+class TestArithmetic:
+    """Tests that the packed arithmetic matches the dictionary representation."""
+
+    @pytest.mark.parametrize("ps_a", sentences)
+    @pytest.mark.parametrize("ps_b", sentences)
+    def test_matmul(self, ps_a, ps_b):
+        """Test the product of two sentences."""
+        res = PackedPauliSentence.from_pauli_sentence(
+            ps_a
+        ) @ PackedPauliSentence.from_pauli_sentence(ps_b)
+        assert_equal_sentences(res.to_pauli_sentence(), ps_a @ ps_b)
+
+    @pytest.mark.parametrize("ps_a", sentences)
+    @pytest.mark.parametrize("ps_b", sentences)
+    def test_commutator(self, ps_a, ps_b):
+        """Test the commutator of two sentences."""
+        res = PackedPauliSentence.from_pauli_sentence(ps_a).commutator(
+            PackedPauliSentence.from_pauli_sentence(ps_b)
+        )
+        assert_equal_sentences(res.to_pauli_sentence(), ps_a.commutator(ps_b))
+
+    @pytest.mark.parametrize("ps_a", sentences)
+    @pytest.mark.parametrize("ps_b", sentences)
+    def test_add_and_sub(self, ps_a, ps_b):
+        """Test the sum and difference of two sentences."""
+        packed_a = PackedPauliSentence.from_pauli_sentence(ps_a)
+        packed_b = PackedPauliSentence.from_pauli_sentence(ps_b)
+        assert_equal_sentences((packed_a + packed_b).to_pauli_sentence(), ps_a + ps_b)
+        assert_equal_sentences((packed_a - packed_b).to_pauli_sentence(), ps_a - ps_b)
+
+    def test_scalar_multiplication(self):
+        """Test multiplying the coefficients by a scalar."""
+        packed = PackedPauliSentence.from_pauli_sentence(ps1)
+        assert_equal_sentences((0.5j * packed).to_pauli_sentence(), 0.5j * ps1)
+        assert_equal_sentences((packed * 2).to_pauli_sentence(), 2 * ps1)
+
+        with pytest.raises(ValueError, match="array of dimension 1"):
+            _ = packed * np.array([1.0, 2.0])
+
+    def test_random_sentences(self):
+        """Test the arithmetic of larger sentences spanning more than one word."""
+        rng = np.random.default_rng(42)
+        ps_a = random_sentence(rng, 30, range(70))
+        ps_b = random_sentence(rng, 30, range(5, 75))
+        packed_a = PackedPauliSentence.from_pauli_sentence(ps_a)
+        packed_b = PackedPauliSentence.from_pauli_sentence(ps_b)
+
+        assert_equal_sentences((packed_a @ packed_b).to_pauli_sentence(), ps_a @ ps_b)
+        assert_equal_sentences(
+            packed_a.commutator(packed_b).to_pauli_sentence(), ps_a.commutator(ps_b)
+        )
+
+    @pytest.mark.parametrize("pairs_per_chunk", [1, 7, 64])
+    def test_chunked_products(self, pairs_per_chunk, monkeypatch):
+        """Test that products and commutators computed in several chunks match the dictionary
+        representation."""
+        monkeypatch.setattr(qml.pauli.packed_pauli, "_PAIRS_PER_CHUNK", pairs_per_chunk)
+        rng = np.random.default_rng(7)
+        ps_a = random_sentence(rng, 20, range(4))
+        ps_b = random_sentence(rng, 15, range(2, 6))
+        packed_a = PackedPauliSentence.from_pauli_sentence(ps_a)
+        packed_b = PackedPauliSentence.from_pauli_sentence(ps_b)
+
+        assert_equal_sentences((packed_a @ packed_b).to_pauli_sentence(), ps_a @ ps_b)
+        assert_equal_sentences(
+            packed_a.commutator(packed_b).to_pauli_sentence(), ps_a.commutator(ps_b)
+        )
+
+    def test_merge_and_simplify(self):
+        """Test that repeated words are merged and small coefficients removed."""
+        packed = PackedPauliSentence.from_pauli_sentence(ps1)
+        doubled = PackedPauliSentence(
+            np.concatenate([packed.x, packed.x]),
+            np.concatenate([packed.z, packed.z]),
+            np.concatenate([packed.coeffs, -packed.coeffs]),
+            packed.wires,
+        )
+        assert len(doubled.merge()) == 3
+        assert np.allclose(doubled.merge().coeffs, 0)
+
+        doubled.simplify()
+        assert len(doubled) == 0
+        assert doubled.to_pauli_sentence() == PauliSentence({})
@@ -309,3 +309,46 @@ class TestPauliVSpace:
         assert v1._pw_to_idx == vcopy._pw_to_idx
         assert v1._rank == vcopy._rank
         assert v1._num_pw == vcopy._num_pw
+
+    def test_echelon_form(self):
+        """Test that the rows of the echelon form have a unit pivot, do not contain the pivots of
+        the earlier rows and span the same space as the basis."""
+        rng = np.random.default_rng(5)
+        words = [PauliWord({0: p0, 1: p1}) for p0 in "IXYZ" for p1 in "XYZ"]
+        ops = [
+            PauliSentence({pw: rng.normal() for pw in rng.choice(words, size=3, replace=False)})
+            for _ in range(20)
+        ]
+        vspace = PauliVSpace(ops)
+
+        assert len(vspace._echelon) == len(vspace) == vspace._rank
+        for row_idx, (pivot, row) in enumerate(vspace._echelon):
+            assert vspace._pivots[pivot] == row_idx
+            assert np.isclose(row[pivot], 1.0)
+            assert all(abs(value) <= 1 + 1e-12 for value in row.values())
+            assert not any(other in row for other, _ in vspace._echelon[:row_idx])
+
+        rows = np.zeros((vspace._num_pw, len(vspace)))
+        for i, (_, row) in enumerate(vspace._echelon):
+            for pw, value in row.items():
+                rows[vspace._pw_to_idx[pw], i] = value
+        assert np.linalg.matrix_rank(np.concatenate([vspace._M, rows], axis=1)) == len(vspace)
+
+    def test_add_many_dependent_ops(self):
+        """Test that random linear combinations of the basis are linearly dependent and that
+        the rank matches the rank of the coefficient matrix."""
+        rng = np.random.default_rng(6)
+        words = [PauliWord({0: p0, 1: p1, 2: p2}) for p0 in "XYZ" for p1 in "XYZ" for p2 in "IZ"]
+        ops = [
+            PauliSentence({pw: rng.normal() for pw in rng.choice(words, size=4, replace=False)})
+            for _ in range(8)
+        ]
+        vspace = PauliVSpace(ops)
+        assert len(vspace) == np.linalg.matrix_rank(vspace._M) == 8
+
+        for _ in range(10):
+            weights = rng.normal(size=len(ops))
+            combination = sum((w * op for w, op in zip(weights, ops[1:])), weights[0] * ops[0])
+            assert not vspace.is_independent(combination)
+            vspace.add(combination)
+        assert len(vspace) == 8
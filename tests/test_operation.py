@@ -27,6 +27,7 @@ from pennylane.operation import (
     Operation,
     Operator,
     StatePrepBase,
+    _operator_key,
     operation_derivative,
 )
 from pennylane.ops import Prod, SProd, Sum
@@ -1809,6 +1810,57 @@ class TestHamiltonianLinearCombinationAlias:
         assert isinstance(op, qml.Hamiltonian)
 
 
+class TestOperatorKey:
+    """Tests for the exact hashable key of operators"""
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.RX(0.5, wires=0),
+            qml.QubitUnitary(np.eye(2), wires=0),
+            qml.PauliRot(0.1, "XY", wires=[0, 1]),
+            qml.ctrl(qml.RX(0.2, wires=1), control=0, control_values=[0]),
+            qml.adjoint(qml.RY(0.3, wires=0)),
+            qml.X(0) + 0.5 * qml.Y(1),
+            qml.TrotterProduct(qml.X(0) + qml.Z(1), 1.0, n=2),
+        ],
+    )
+    def test_equal_operators(self, op):
+        """Test that copies of an operator have the same key"""
+        assert hash(_operator_key(op)) == hash(_operator_key(copy.copy(op)))
+        assert _operator_key(op) == _operator_key(copy.copy(op))
+
+    @pytest.mark.parametrize(
+        "op1, op2",
+        [
+            (qml.RX(0.5, wires=0), qml.RX(0.5 + 1e-12, wires=0)),
+            (qml.RX(0.5, wires=0), qml.RX(0.5 + 2 * np.pi, wires=0)),
+            (qml.PauliRot(0.1, "XY", wires=[0, 1]), qml.PauliRot(0.1, "YX", wires=[0, 1])),
+            (qml.adjoint(qml.RX(0.3, wires=0)), qml.adjoint(qml.RY(0.3, wires=0))),
+            (qml.X(0) + qml.Y(1), qml.Y(0) + qml.X(1)),
+            (
+                qml.TrotterProduct(qml.X(0) + qml.Z(1), 1.0, n=2),
+                qml.TrotterProduct(qml.X(0) + qml.Z(1), 1.0, n=3),
+            ),
+            (
+                qml.QubitUnitary(np.eye(2), wires=0),
+                qml.QubitUnitary(np.eye(2, dtype=np.complex64), wires=0),
+            ),
+        ],
+    )
+    def test_different_operators(self, op1, op2):
+        """Test that operators differing in their exact parameters or hyperparameters have
+        different keys"""
+        assert _operator_key(op1) != _operator_key(op2)
+
+    def test_data_key(self):
+        """Test that the parameters are keyed with the given function"""
+        x, y = pnp.array(0.5), pnp.array(0.5)
+        key = _operator_key(qml.RX(x, wires=0), data_key=id)
+        assert key == _operator_key(qml.RX(x, wires=0), data_key=id)
+        assert key != _operator_key(qml.RX(y, wires=0), data_key=id)
+
+
 @pytest.mark.parametrize(
     "op",
     [
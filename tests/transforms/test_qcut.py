@@ -14,6 +14,7 @@
 """
 Unit tests for the `pennylane.qcut` package.
 """
+
 # pylint: disable=protected-access, too-few-public-methods, too-many-arguments, too-many-public-methods, comparison-with-callable, unused-argument, no-value-for-parameter, no-member, not-callable, use-implicit-booleaness-not-comparison
 import copy
 import itertools
@@ -3436,6 +3437,19 @@ class TestContractTensors:
         assert eqn == expected_eqn
         assert np.allclose(res, np.einsum(eqn, *t))
 
+    def test_contraction_path_cached(self, mocker):
+        """Test that the contraction path is only planned once for repeated contractions of the
+        same communication graph."""
+        opt_einsum = pytest.importorskip("opt_einsum")
+        qcut.processing._contraction_path.cache_clear()
+        spy = mocker.spy(opt_einsum, "contract_path")
+
+        for _ in range(3):
+            res = qcut.contract_tensors(self.t, self.g, self.p, self.m, use_opt_einsum=True)
+            assert np.allclose(res, self.expected_result)
+
+        assert spy.call_count == 1
+
 
 class TestQCutProcessingFn:
     """Tests for the qcut_processing_fn and contained functions"""
@@ -4469,6 +4483,63 @@ class TestCutCircuitTransform:
         assert np.isclose(res, res_expected, atol=atol)
 
 
+class TestCutCircuitFragmentDeduplication:
+    """Tests that identical circuit fragments are only executed once by cut_circuit"""
+
+    @staticmethod
+    def _block(w, x):
+        qml.RX(0.3, w)
+        qml.RY(0.4, w + 1)
+        qml.CNOT([w, w + 1])
+        qml.RX(x, w + 1)
+
+    def _circuit(self, x, y):
+        for w in range(3):
+            self._block(w, x)
+            qml.WireCut(wires=w + 1)
+        self._block(3, y)
+        return qml.expval(qml.Z(4))
+
+    def test_identical_fragments_executed_once(self):
+        """Test that fragments that are identical up to a relabelling of their wires are expanded
+        once and that the result is unchanged."""
+        tape = qml.tape.make_qscript(self._circuit)(0.5, 0.7)
+        tapes, fn = qcut.cut_circuit(tape, device_wires=Wires([0, 1]))
+
+        # the two middle fragments are identical, so only one of them is expanded into 12 tapes
+        assert len(tapes) == 3 + 12 + 4
+        res = fn(qml.device("default.qubit").execute(tapes))
+        expected = qml.QNode(self._circuit, qml.device("default.qubit"))(0.5, 0.7)
+        assert np.isclose(res, expected)
+
+    def test_grad_shared_and_distinct_parameters(self):
+        """Test that the derivatives are correct when identical fragments share a trainable
+        parameter, and when fragments have distinct trainable parameters with the same value."""
+        x = np.array(0.5, requires_grad=True)
+        y = np.array(0.5, requires_grad=True)
+        dev = qml.device("default.qubit", wires=2)
+
+        cut_circuit = qcut.cut_circuit(qml.QNode(self._circuit, dev))
+        circuit = qml.QNode(self._circuit, qml.device("default.qubit", wires=5))
+
+        assert np.allclose(cut_circuit(x, y), circuit(x, y))
+        assert np.allclose(qml.grad(cut_circuit)(x, y), qml.grad(circuit)(x, y))
+
+    def test_processing_fn_fragment_indices(self):
+        """Test that the results of a unique fragment are reused for all its occurrences in the
+        tensor network."""
+        m = [[qcut.MeasureNode(wires=0)] for _ in range(3)] + [[]]
+        p = [[]] + [[qcut.PrepareNode(wires=0)] for _ in range(3)]
+        g = MultiDiGraph(
+            [(i, i + 1, {"pair": (WrappedObj(m[i][0]), WrappedObj(p[i + 1][0]))}) for i in range(3)]
+        )
+        first, middle, last = np.linspace(-1, 1, 4), np.linspace(0, 1, 16), np.linspace(1, 2, 4)
+
+        res = qcut.qcut_processing_fn([first, middle, last], g, p, m, fragment_indices=[0, 1, 1, 2])
+        expected = qcut.qcut_processing_fn([first, middle, middle, last], g, p, m)
+        assert np.allclose(res, expected)
+
+
 class TestCutCircuitTransformValidation:
     """Tests of validation checks in the cut_circuit function"""
 
@@ -12,17 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """
-Unit tests for the :func:`_cache_transform` transform function.
+Unit tests for the :func:`_cache_transform` transform function and the ``ExecutionCache``.
 """
+
 # pylint: disable=protected-access,redefined-outer-name
 from collections.abc import MutableMapping
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 import pennylane as qml
 from pennylane.tape import QuantumScript
-from pennylane.workflow import _cache_transform
+from pennylane.workflow import ExecutionCache, _cache_transform
 
 
 @pytest.fixture
@@ -112,3 +114,142 @@ def test_finite_shots_with_persistent_cache_warning(cache):
 
     with pytest.warns(UserWarning, match=r"Cached execution with finite shots detected!"):
         batch_fns(((1.23,),))
+
+
+def test_tracker_records_hits_and_misses(cache):
+    """Tests that cache hits and misses are reported to an active tracker."""
+    tape = QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.Z(0))])
+    tracker = qml.Tracker()
+
+    with tracker:
+        _, miss_fn = _cache_transform(tape, cache=cache, tracker=tracker)
+        miss_fn(((1.23,),))
+        _, hit_fn = _cache_transform(tape, cache=cache, tracker=tracker)
+        hit_fn(((),))
+
+    assert tracker.totals == {"cache_misses": 1, "cache_hits": 1}
+
+
+def test_tracker_callback_not_called(cache):
+    """Tests that cache events update the tracker without recording, so that the callback of the
+    tracker is only called by the device."""
+    tape = QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.Z(0))])
+    callback = MagicMock()
+
+    with qml.Tracker(callback=callback) as tracker:
+        _cache_transform(tape, cache=cache, tracker=tracker)
+
+    callback.assert_not_called()
+    assert tracker.totals == {"cache_misses": 1}
+
+
+class TestExecutionCache:
+    """Tests for the memory-bounded ``ExecutionCache``."""
+
+    def test_bounded_by_bytes(self):
+        """Tests that the least recently used results are evicted once the size of the
+        results exceeds the memory budget."""
+        cache = ExecutionCache(max_bytes=3 * 8 * 4)
+        for i in range(3):
+            cache[i] = np.zeros(4)
+        assert cache.currsize == 96
+
+        _ = cache[0]
+        cache[3] = np.zeros(4)
+
+        assert set(cache) == {0, 2, 3}
+        assert cache.evictions == 1
+
+    def test_bounded_by_number_of_results(self):
+        """Tests that the number of results can be bounded as well."""
+        cache = ExecutionCache(maxsize=2)
+        for i in range(3):
+            cache[i] = 1.0
+        assert set(cache) == {1, 2}
+        assert cache.evictions == 1
+
+    @pytest.mark.parametrize(
+        "result, nbytes",
+        [
+            (None, 0),
+            (1.0, 8),
+            (np.zeros(8, dtype=np.complex128), 128),
+            ((np.zeros(2), np.float64(1.0)), 24),
+            ({"00": 3, "11": 7}, 20),
+        ],
+    )
+    def test_result_sizes(self, result, nbytes):
+        """Tests the size estimate of results."""
+        cache = ExecutionCache()
+        cache["key"] = result
+        assert cache.currsize == nbytes
+
+    def test_result_larger_than_cache_not_stored(self):
+        """Tests that a result larger than the whole cache is not stored in memory."""
+        cache = ExecutionCache(max_bytes=8)
+        cache[0] = None
+        cache[0] = np.zeros(2)
+        assert 0 not in cache
+
+    @pytest.mark.parametrize("max_bytes", [200, 20])
+    def test_results_of_batch_not_evicted(self, max_bytes):
+        """Tests that the results of a batch are available to the duplicate tapes of the batch,
+        even if the cache evicts them or they are larger than the whole cache."""
+        tape_1 = QuantumScript([qml.RX(0.1, 0)], [qml.state()])
+        tape_2 = QuantumScript([qml.RX(0.2, 1)], [qml.state()])
+        cache = ExecutionCache(max_bytes=max_bytes)
+
+        res = qml.execute(
+            [tape_1, tape_2, tape_1], qml.device("default.qubit", wires=3), cache=cache
+        )
+        assert qml.math.allclose(res[2], res[0])
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_disk_tier(self, tmp_path):
+        """Tests that evicted results are written to disk and loaded back memory-mapped."""
+        cache = ExecutionCache(max_bytes=8 * 5, directory=str(tmp_path))
+        cache[0] = (np.arange(4.0), np.float64(0.5))
+        cache[1] = np.ones(4)
+
+        assert cache.evictions == 1
+        assert 0 in cache
+        assert len(list(tmp_path.iterdir())) == 2
+
+        res = cache[0]
+        assert isinstance(res[0], np.memmap)
+        assert np.allclose(res[0], np.arange(4.0))
+        assert res[1] == 0.5
+
+        del cache[0]
+        assert 0 not in cache
+        assert not list(tmp_path.iterdir())
+
+    def test_clear_removes_disk_files(self, tmp_path):
+        """Tests that clearing the cache removes the files of the disk tier."""
+        cache = ExecutionCache(max_bytes=8, directory=str(tmp_path))
+        cache[0] = np.ones(2)
+        assert list(tmp_path.iterdir())
+
+        cache.clear()
+        assert 0 not in cache
+        assert not list(tmp_path.iterdir())
+
+    def test_qnode_statistics(self):
+        """Tests that the statistics of the cache are reported through the device tracker."""
+        dev = qml.device("default.qubit")
+        cache = ExecutionCache(max_bytes=2**10)
+
+        @qml.qnode(dev, cache=cache)
+        def circuit(x):
+            qml.RX(x, 0)
+            return qml.state()
+
+        with qml.Tracker(dev) as tracker:
+            circuit(0.1)
+            circuit(0.1)
+            circuit(0.2)
+
+        assert tracker.totals["cache_hits"] == 1
+        assert tracker.totals["cache_misses"] == 2
+        assert tracker.totals["executions"] == 2
+        assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 0)
@@ -0,0 +1,185 @@
+# Copyright 2018-2025 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the structural fingerprint and the execution plan cache of the QNode.
+"""
+# pylint: disable=protected-access
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.tape import QuantumScript
+from pennylane.workflow._plan_cache import ExecutionPlan, structural_fingerprint
+
+
+class TestStructuralFingerprint:
+    """Tests for the structural fingerprint of a tape."""
+
+    def test_independent_of_parameter_values(self):
+        """Test that tapes which only differ in their parameters have the same fingerprint."""
+        tape1 = QuantumScript(
+            [qml.RX(0.1, 0), qml.Rot(1, 2, 3, 1)], [qml.expval(0.5 * qml.Z(0) + qml.X(1))]
+        )
+        tape2 = QuantumScript(
+            [qml.RX(0.4, 0), qml.Rot(4, 5, 6, 1)], [qml.expval(1.5 * qml.Z(0) + qml.X(1))]
+        )
+        assert structural_fingerprint(tape1) == structural_fingerprint(tape2)
+        assert tape1.hash != tape2.hash
+
+    @pytest.mark.parametrize(
+        "tape2",
+        [
+            QuantumScript([qml.RY(0.1, 0)], [qml.expval(qml.Z(0))]),
+            QuantumScript([qml.RX(0.1, 1)], [qml.expval(qml.Z(0))]),
+            QuantumScript([qml.RX(np.array([0.1, 0.2]), 0)], [qml.expval(qml.Z(0))]),
+            QuantumScript([qml.RX(0.1, 0)], [qml.var(qml.Z(0))]),
+            QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.X(0))]),
+            QuantumScript([qml.RX(0.1, 0)], [qml.expval(qml.Z(0))], shots=10),
+            QuantumScript([qml.PauliRot(0.1, "X", 0)], [qml.expval(qml.Z(0))]),
+        ],
+    )
+    def test_structural_differences(self, tape2):
+        """Test that the operators, wires, parameter shapes, measurements and shots
+        change the fingerprint."""
+        tape1 = QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.Z(0))])
+        assert structural_fingerprint(tape1) != structural_fingerprint(tape2)
+
+    def test_hyperparameters(self):
+        """Test that hyperparameters are part of the fingerprint."""
+        tape1 = QuantumScript([qml.PauliRot(0.1, "XY", (0, 1))])
+        tape2 = QuantumScript([qml.PauliRot(0.1, "YX", (0, 1))])
+        assert structural_fingerprint(tape1) != structural_fingerprint(tape2)
+
+
+def circuit(x, y):
+    """A circuit with operators, a decomposition and a parametrized observable."""
+    qml.Rot(x[0], x[1], y, wires=0)
+    qml.CNOT((0, 1))
+    qml.IsingXX(x[2], wires=(0, 1))
+    return qml.expval(qml.Z(0) @ qml.X(1) + 0.5 * qml.Y(1)), qml.probs(wires=1)
+
+
+class TestQNodePlanCache:
+    """Integration tests for QNodes with ``plan_cache=True``."""
+
+    def test_disabled_by_default(self):
+        """Test that no plan cache is created by default."""
+        assert qml.QNode(circuit, qml.device("default.qubit")).plan_cache is None
+
+    @pytest.mark.parametrize("diff_method", ["backprop", "parameter-shift", "finite-diff"])
+    def test_results_match(self, diff_method):
+        """Test that rebinding the parameters of a cached plan gives the same results
+        as executing the QNode without the cache."""
+        dev = qml.device("default.qubit")
+        cached = qml.QNode(circuit, dev, diff_method=diff_method, plan_cache=True)
+        uncached = qml.QNode(circuit, dev, diff_method=diff_method)
+
+        for x, y in [([0.1, 0.2, 0.3], 0.4), ([1.1, -0.2, 2.3], -0.7)]:
+            x = qml.numpy.array(x)
+            for res1, res2 in zip(cached(x, y), uncached(x, y)):
+                assert qml.math.allclose(res1, res2)
+
+        assert len(cached.plan_cache) == 1
+        assert isinstance(next(iter(cached.plan_cache.values())), ExecutionPlan)
+
+    def test_transforms_are_applied_once(self, mocker):
+        """Test that the transform program is only applied on the first call."""
+        dev = qml.device("default.qubit")
+        qn = qml.transforms.decompose(
+            qml.QNode(circuit, dev, plan_cache=True), gate_set={"RX", "RY", "RZ", "CNOT"}
+        )
+        spy = mocker.spy(qml.transforms.core.TransformProgram, "__call__")
+
+        expected = qml.QNode(circuit, dev)(np.array([0.5, 0.6, 0.7]), 0.8)
+        spy.reset_mock()
+
+        qn(np.array([0.1, 0.2, 0.3]), 0.4)
+        n_calls = spy.call_count
+        res = qn(np.array([0.5, 0.6, 0.7]), 0.8)
+
+        assert spy.call_count - n_calls < n_calls
+        for res1, res2 in zip(res, expected):
+            assert qml.math.allclose(res1, res2)
+
+    @pytest.mark.autograd
+    def test_autograd_gradient(self):
+        """Test that the gradient is correct when the plan is reused."""
+        dev = qml.device("default.qubit")
+        cached = qml.QNode(circuit, dev, plan_cache=True)
+        uncached = qml.QNode(circuit, dev)
+
+        def cost(qn, x, y):
+            return qn(x, y)[0]
+
+        x = qml.numpy.array([0.1, 0.2, 0.3])
+        y = qml.numpy.array(0.4)
+        qml.grad(cost, argnum=[1, 2])(cached, x, y)
+
+        x = qml.numpy.array([0.7, -0.2, 1.3])
+        y = qml.numpy.array(-0.1)
+        grad1 = qml.grad(cost, argnum=[1, 2])(cached, x, y)
+        grad2 = qml.grad(cost, argnum=[1, 2])(uncached, x, y)
+        assert qml.math.allclose(grad1[0], grad2[0])
+        assert qml.math.allclose(grad1[1], grad2[1])
+
+    def test_different_structures(self):
+        """Test that a plan is stored for every circuit structure."""
+
+        @qml.qnode(qml.device("default.qubit"), plan_cache=True)
+        def qn(x, n_layers):
+            for _ in range(n_layers):
+                qml.RX(x, 0)
+            return qml.expval(qml.Z(0))
+
+        assert qml.math.allclose(qn(0.3, 1), np.cos(0.3))
+        assert qml.math.allclose(qn(0.3, 2), np.cos(0.6))
+        assert qml.math.allclose(qn(0.4, 2), np.cos(0.8))
+        assert len(qn.plan_cache) == 2
+
+    def test_value_dependent_preprocessing_is_not_reused(self):
+        """Test that preprocessing which computes new parameters is not reused."""
+
+        @qml.transforms.merge_rotations
+        @qml.qnode(qml.device("default.qubit"), plan_cache=True)
+        def qn(x, y):
+            qml.RX(x, 0)
+            qml.RX(y, 0)
+            return qml.expval(qml.Z(0))
+
+        assert qml.math.allclose(qn(0.1, 0.2), np.cos(0.3))
+        assert qml.math.allclose(qn(0.5, 0.2), np.cos(0.7))
+        assert list(qn.plan_cache.values()) == [None]
+
+    def test_copy_and_transform_reset_cache(self):
+        """Test that applying a transform to a QNode does not share its plans."""
+        qn = qml.QNode(circuit, qml.device("default.qubit"), plan_cache=True)
+        qn(np.array([0.1, 0.2, 0.3]), 0.4)
+        assert len(qn.plan_cache) == 1
+
+        new_qn = qml.transforms.cancel_inverses(qn)
+        assert new_qn.plan_cache is not qn.plan_cache
+        assert len(new_qn.plan_cache) == 0
+
+    def test_mid_circuit_measurements_not_cached(self):
+        """Test that circuits with mid-circuit measurements are executed without the cache."""
+
+        @qml.qnode(qml.device("default.qubit"), plan_cache=True)
+        def qn(x):
+            qml.RX(x, 0)
+            m = qml.measure(0)
+            qml.cond(m, qml.X)(1)
+            return qml.expval(qml.Z(1))
+
+        assert qml.math.allclose(qn(0.4), np.cos(0.4))
+        assert len(qn.plan_cache) == 0